@@ -18,6 +18,8 @@ import uvicorn
 
 # Import our custom AI GM Brain implementation
 from ai_gm_brain_custom import AIGMBrainCustom, ProcessingMode, InputComplexity
+from ai_gm_session_manager import SessionManager, SessionPoolSaturated, DEFAULT_SNAPSHOT_DIR
+from backend.src.shared.metrics import instrument_app
 
 # Configure logging
 logging.basicConfig(
@@ -26,8 +28,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger("advanced_ai_gm_server")
 
-# Player sessions store
-player_sessions: Dict[str, AIGMBrainCustom] = {}
+# Player sessions store: bounded in memory, idle sessions hibernated to disk
+session_manager = SessionManager(
+    brain_class=AIGMBrainCustom,
+    max_sessions=int(os.environ.get("AI_GM_MAX_SESSIONS", 500)),
+    idle_ttl=float(os.environ.get("AI_GM_SESSION_IDLE_TTL", 1800)),
+    snapshot_dir=os.environ.get("AI_GM_SESSION_DIR", DEFAULT_SNAPSHOT_DIR),
+    max_workers=int(os.environ.get("AI_GM_WORKERS", 8)),
+    max_queue_depth=int(os.environ.get("AI_GM_MAX_QUEUE_DEPTH", 64))
+)
 
 # Request/Response models
 class PlayerContext(BaseModel):
@@ -66,8 +75,8 @@ async def lifespan(app: FastAPI):
     
     # Shutdown: Cleanup resources
     logger.info("Shutting down Advanced AI GM Brain Server")
-    # Close sessions and resources
-    player_sessions.clear()
+    # Finish in-flight brain calls and hibernate sessions so they survive a restart
+    session_manager.shutdown()
 
 # Create FastAPI application
 app = FastAPI(
@@ -86,6 +95,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request latency histograms and the /metrics exposition endpoint
+instrument_app(app, subsystem="ai_gm_server")
+
 @app.get("/")
 async def root():
     """Root endpoint providing service information."""
@@ -101,17 +113,6 @@ async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "ai_gm_available": True}
 
-def get_or_create_session(player_id: str, game_id: Optional[str] = None) -> AIGMBrainCustom:
-    """Get existing player session or create a new one."""
-    if player_id not in player_sessions:
-        session_id = game_id or f"game_{player_id}"
-        logger.info(f"Creating new AI GM Brain session for player {player_id}, game {session_id}")
-        player_sessions[player_id] = AIGMBrainCustom(
-            game_id=session_id,
-            player_id=player_id
-        )
-    return player_sessions[player_id]
-
 @app.post("/api/ai-gm/process-input", response_model=AIGMResponse)
 async def process_player_input(input_data: PlayerInput, background_tasks: BackgroundTasks):
     """Process player input through the AI GM Brain."""
@@ -121,11 +122,11 @@ async def process_player_input(input_data: PlayerInput, background_tasks: Backgr
         
         logger.info(f"Processing input from {player_id}: '{input_text}'")
         
-        # Get or create AI GM Brain session for this player
-        ai_gm_brain = get_or_create_session(player_id, input_data.game_id)
-        
-        # Process the input with our advanced AI GM Brain
-        result = ai_gm_brain.process_player_input(input_text)
+        # Process the input with this player's AI GM Brain on the worker pool
+        result = await session_manager.run(
+            player_id, input_data.game_id,
+            lambda ai_gm_brain: ai_gm_brain.process_player_input(input_text)
+        )
         
         # Convert processing mode and complexity enums to strings for JSON serialization
         if 'metadata' in result and result['metadata']:
@@ -138,13 +139,18 @@ async def process_player_input(input_data: PlayerInput, background_tasks: Backgr
         # Schedule background processing if needed
         if result.get('requires_background_processing'):
             background_tasks.add_task(
-                ai_gm_brain.process_background_tasks,
-                input_text,
-                player_id
+                session_manager.run,
+                player_id,
+                input_data.game_id,
+                lambda ai_gm_brain: ai_gm_brain.process_background_tasks(input_text, player_id)
             )
         
         return result
     
+    except SessionPoolSaturated as e:
+        logger.warning(f"Rejecting input from {input_data.player_id}: {e}")
+        raise HTTPException(status_code=503, detail="AI GM is at capacity, please retry shortly",
+                            headers={"Retry-After": "1"})
     except Exception as e:
         logger.error(f"Error processing input: {e}", exc_info=True)
         return {
@@ -156,21 +162,14 @@ async def process_player_input(input_data: PlayerInput, background_tasks: Backgr
 @app.post("/api/ai-gm/clear-session")
 async def clear_session(player_id: str):
     """Clear a player's AI GM Brain session."""
-    if player_id in player_sessions:
-        del player_sessions[player_id]
+    if session_manager.clear(player_id):
         return {"success": True, "message": f"Session cleared for player {player_id}"}
     return {"success": False, "message": f"No session found for player {player_id}"}
 
 @app.get("/api/ai-gm/sessions")
 async def list_sessions():
     """List active AI GM Brain sessions (admin endpoint)."""
-    return {
-        "sessions": [
-            {"player_id": player_id, "interaction_count": brain.interaction_count}
-            for player_id, brain in player_sessions.items()
-        ],
-        "count": len(player_sessions)
-    }
+    return session_manager.list_sessions()
 
 if __name__ == "__main__":
     port = int(os.environ.get("AI_GM_PORT", 8000))
@@ -44,7 +44,24 @@ class AIGMBrainCustom:
         # Logging
         self.logger = logging.getLogger(f"AIGMBrain_{game_id}")
         self.logger.info(f"Custom AI GM Brain initialized for game {game_id}")
-    
+
+    def to_snapshot(self) -> Dict[str, Any]:
+        """Get the JSON-serializable state needed to rebuild this brain."""
+        return {
+            "game_id": self.game_id,
+            "player_id": self.player_id,
+            "interaction_count": self.interaction_count,
+            "player_sessions": self.player_sessions
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> "AIGMBrainCustom":
+        """Rebuild a brain from a snapshot produced by to_snapshot."""
+        brain = cls(game_id=snapshot["game_id"], player_id=snapshot["player_id"])
+        brain.interaction_count = snapshot.get("interaction_count", 0)
+        brain.player_sessions = snapshot.get("player_sessions", {})
+        return brain
+
     def process_player_input(self, input_string: str) -> Dict[str, Any]:
         """
         Process player input and generate appropriate response.
@@ -0,0 +1,291 @@
+"""
+AI GM Session Manager
+Bounded store of AI GM Brain sessions for the advanced AI GM server.
+
+Brains are kept in memory up to a session limit and an idle TTL; evicted
+brains are hibernated to small JSON snapshots on disk and rehydrated the
+next time their player sends input. Brain calls run on a bounded worker
+pool so the event loop stays free, requests for the same player are
+serialized, and requests beyond the pool's queue depth are rejected so the
+server can answer 503 instead of queueing without limit.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from ai_gm_brain_custom import AIGMBrainCustom
+
+T = TypeVar("T")
+
+DEFAULT_SNAPSHOT_DIR = os.path.join("data", "ai_gm_sessions")
+
+logger = logging.getLogger("ai_gm_session_manager")
+
+
+class SessionPoolSaturated(Exception):
+    """Raised when the worker pool and its queue are full."""
+
+
+@dataclass
+class _SessionEntry:
+    brain: Any
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class SessionManager:
+    """
+    LRU/idle-TTL bounded AI GM Brain sessions with hibernation to disk.
+
+    Brain classes must provide ``brain_class(game_id=..., player_id=...)``,
+    ``brain.to_snapshot()`` returning a JSON-serializable dict, and
+    ``brain_class.from_snapshot(snapshot)``.
+    """
+
+    def __init__(self,
+                 brain_class=AIGMBrainCustom,
+                 max_sessions: int = 500,
+                 idle_ttl: float = 1800.0,
+                 snapshot_dir: str = DEFAULT_SNAPSHOT_DIR,
+                 max_workers: int = 8,
+                 max_queue_depth: int = 64,
+                 sweep_interval: float = 30.0):
+        """
+        Initialize the session manager.
+
+        Args:
+            brain_class: Brain implementation to create and rehydrate
+            max_sessions: Brains kept in memory before the least recently used are hibernated
+            idle_ttl: Seconds without input after which a brain is hibernated
+            snapshot_dir: Directory for hibernated brain snapshots
+            max_workers: Threads running brain calls
+            max_queue_depth: Admitted requests allowed to wait beyond the running ones
+            sweep_interval: Minimum seconds between idle sweeps
+        """
+        self.brain_class = brain_class
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.snapshot_dir = snapshot_dir
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.sweep_interval = sweep_interval
+
+        self._sessions: "OrderedDict[str, _SessionEntry]" = OrderedDict()
+        # Brains being written to disk, so a request arriving mid-write reclaims them
+        self._hibernating: Dict[str, Any] = {}
+        self._table_lock = threading.Lock()
+        # Requests holding or waiting for each player's session; busy sessions are never evicted
+        self._busy: Dict[str, int] = {}
+        self._session_locks: Dict[str, asyncio.Lock] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ai-gm-session")
+        self._admitted = 0
+        self._last_sweep = time.monotonic()
+        self.stats = {"created": 0, "rehydrated": 0, "hibernated": 0, "rejected": 0}
+
+        os.makedirs(snapshot_dir, exist_ok=True)
+
+    async def run(self, player_id: str, game_id: Optional[str], call: Callable[[Any], T]) -> T:
+        """
+        Run ``call(brain)`` for a player's brain on the worker pool.
+
+        Calls for the same player run one at a time, in arrival order.
+
+        Raises:
+            SessionPoolSaturated: If max_workers + max_queue_depth requests are already admitted
+        """
+        if self._admitted >= self.max_workers + self.max_queue_depth:
+            self.stats["rejected"] += 1
+            raise SessionPoolSaturated(f"{self._admitted} AI GM requests already in progress")
+
+        self._admitted += 1
+        lock = self._session_locks.get(player_id)
+        if lock is None:
+            lock = self._session_locks[player_id] = asyncio.Lock()
+        with self._table_lock:
+            self._busy[player_id] = self._busy.get(player_id, 0) + 1
+        try:
+            async with lock:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._executor, self._call, player_id, game_id, call)
+        finally:
+            self._admitted -= 1
+            with self._table_lock:
+                remaining = self._busy[player_id] - 1
+                if remaining:
+                    self._busy[player_id] = remaining
+                else:
+                    del self._busy[player_id]
+            if not remaining:
+                self._session_locks.pop(player_id, None)
+
+    def clear(self, player_id: str) -> bool:
+        """Drop a player's session from memory and disk; returns whether one existed."""
+        with self._table_lock:
+            existed = self._sessions.pop(player_id, None) is not None
+            existed = self._hibernating.pop(player_id, None) is not None or existed
+        path = self._snapshot_path(player_id)
+        if os.path.exists(path):
+            os.remove(path)
+            existed = True
+        return existed
+
+    def list_sessions(self) -> Dict[str, Any]:
+        """Describe the in-memory sessions and count the hibernated ones."""
+        with self._table_lock:
+            sessions = [
+                {"player_id": player_id, "interaction_count": getattr(entry.brain, "interaction_count", 0)}
+                for player_id, entry in self._sessions.items()
+            ]
+        hibernated = sum(1 for name in os.listdir(self.snapshot_dir) if name.endswith(".json"))
+        return {"sessions": sessions, "count": len(sessions), "hibernated": hibernated}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get session and worker pool counters."""
+        with self._table_lock:
+            active = len(self._sessions)
+        return {
+            **self.stats,
+            "active_sessions": active,
+            "admitted_requests": self._admitted,
+            "max_workers": self.max_workers,
+            "max_queue_depth": self.max_queue_depth
+        }
+
+    def evict_idle(self) -> int:
+        """Hibernate sessions idle for longer than the TTL; returns how many."""
+        cutoff = time.monotonic() - self.idle_ttl
+        with self._table_lock:
+            self._last_sweep = time.monotonic()
+            idle = [player_id for player_id, entry in self._sessions.items()
+                    if player_id not in self._busy and entry.last_used < cutoff]
+            evicted = self._detach_locked(idle)
+        self._write_snapshots(evicted)
+        return len(evicted)
+
+    def hibernate_all(self) -> int:
+        """Hibernate every idle in-memory session (server shutdown)."""
+        with self._table_lock:
+            evicted = self._detach_locked([player_id for player_id in self._sessions
+                                           if player_id not in self._busy])
+        self._write_snapshots(evicted)
+        return len(evicted)
+
+    def shutdown(self) -> None:
+        """Stop the worker pool and hibernate every session."""
+        self._executor.shutdown(wait=True)
+        self.hibernate_all()
+
+    def _call(self, player_id: str, game_id: Optional[str], call: Callable[[Any], T]) -> T:
+        """Worker thread: load the brain, run the call, then enforce the bounds."""
+        brain = self._get_brain(player_id, game_id)
+        try:
+            return call(brain)
+        finally:
+            with self._table_lock:
+                entry = self._sessions.get(player_id)
+                if entry is not None:
+                    entry.last_used = time.monotonic()
+            self._enforce_bounds()
+
+    def _get_brain(self, player_id: str, game_id: Optional[str]) -> Any:
+        with self._table_lock:
+            entry = self._sessions.get(player_id)
+            if entry is not None:
+                self._sessions.move_to_end(player_id)
+                return entry.brain
+            brain = self._hibernating.pop(player_id, None)
+
+        if brain is None:
+            brain = self._load_snapshot(player_id)
+        if brain is None:
+            session_id = game_id or f"game_{player_id}"
+            logger.info(f"Creating new AI GM Brain session for player {player_id}, game {session_id}")
+            brain = self.brain_class(game_id=session_id, player_id=player_id)
+            self.stats["created"] += 1
+
+        with self._table_lock:
+            entry = self._sessions.setdefault(player_id, _SessionEntry(brain))
+            self._sessions.move_to_end(player_id)
+            return entry.brain
+
+    def _enforce_bounds(self) -> None:
+        now = time.monotonic()
+        with self._table_lock:
+            overflow = len(self._sessions) - self.max_sessions
+            victims: List[str] = []
+            if overflow > 0:
+                # Least recently used first
+                for player_id in self._sessions:
+                    if len(victims) >= overflow:
+                        break
+                    if player_id not in self._busy:
+                        victims.append(player_id)
+            evicted = self._detach_locked(victims)
+            sweep_due = now - self._last_sweep >= self.sweep_interval
+        self._write_snapshots(evicted)
+        if sweep_due:
+            self.evict_idle()
+
+    def _detach_locked(self, player_ids: List[str]) -> Dict[str, Any]:
+        evicted = {}
+        for player_id in player_ids:
+            entry = self._sessions.pop(player_id)
+            evicted[player_id] = self._hibernating[player_id] = entry.brain
+        return evicted
+
+    def _write_snapshots(self, brains: Dict[str, Any]) -> None:
+        for player_id, brain in brains.items():
+            path = self._snapshot_path(player_id)
+            temp_path = f"{path}.tmp"
+            try:
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(brain.to_snapshot(), f, separators=(",", ":"))
+                with self._table_lock:
+                    # Reclaimed by a request while being written: keep it in memory only
+                    if self._hibernating.get(player_id) is not brain:
+                        os.remove(temp_path)
+                        continue
+                    os.replace(temp_path, path)
+                    del self._hibernating[player_id]
+                self.stats["hibernated"] += 1
+            except (OSError, TypeError, ValueError) as e:
+                logger.error(f"Failed to hibernate AI GM session for {player_id}: {e}")
+                with self._table_lock:
+                    # Keep the brain rather than lose its state
+                    if self._hibernating.pop(player_id, None) is brain:
+                        self._sessions.setdefault(player_id, _SessionEntry(brain))
+
+    def _load_snapshot(self, player_id: str) -> Optional[Any]:
+        path = self._snapshot_path(player_id)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.error(f"Ignoring unreadable AI GM session snapshot {path}: {e}")
+            return None
+        try:
+            brain = self.brain_class.from_snapshot(snapshot)
+        except Exception as e:
+            # Keep the hibernated state for inspection instead of losing it
+            logger.error(f"Could not rebuild AI GM session from {path}, kept as {path}.bad: {e}")
+            os.replace(path, path + ".bad")
+            return None
+        os.remove(path)
+        self.stats["rehydrated"] += 1
+        return brain
+
+    def _snapshot_path(self, player_id: str) -> str:
+        safe_id = re.sub(r"[^A-Za-z0-9_-]", "_", player_id)[:48]
+        digest = hashlib.sha1(player_id.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.snapshot_dir, f"{safe_id}-{digest}.json")
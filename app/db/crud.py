@@ -3,12 +3,13 @@ CRUD operations for the Time System.
 This module provides functions for interacting with the time-related database models.
 """
 
-from typing import Dict, List, Optional, Any, Type, TypeVar, Generic, Union
+from typing import Dict, List, Optional, Any, Tuple, Type, TypeVar, Generic, Union
 from uuid import uuid4
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.db.models import DBGameTimeState, DBScheduledGameEvent
-from app.models.time_models import GameDateTime, ScheduledGameEvent, GameTimeSettings
+from app.models.time_models import GameDateTime, ScheduledGameEvent, GameTimeSettings, CatchUpPolicy
 
 # Generic type for database models
 ModelType = TypeVar("ModelType", bound=Any)
@@ -217,7 +218,18 @@ class CRUDScheduledGameEvent(CRUDBase[DBScheduledGameEvent]):
             DBScheduledGameEvent.game_time_state_id == game_time_state.id
         ).all()
     
-    def create_event(self, db: Session, *, game_id: str, event: ScheduledGameEvent) -> DBScheduledGameEvent:
+    def _get_game_time_state_id(self, db: Session, game_id: str) -> Optional[str]:
+        row = db.query(DBGameTimeState.id).filter(DBGameTimeState.game_id == game_id).first()
+        return row[0] if row else None
+    
+    def create_event(
+        self,
+        db: Session,
+        *,
+        game_id: str,
+        event: ScheduledGameEvent,
+        settings: Optional[GameTimeSettings] = None
+    ) -> DBScheduledGameEvent:
         """
         Create a new scheduled event.
         
@@ -225,10 +237,13 @@ class CRUDScheduledGameEvent(CRUDBase[DBScheduledGameEvent]):
             db: Database session
             game_id: Game ID
             event: Event details
+            settings: Calendar used for the trigger ordinal (defaults to GameTimeSettings())
             
         Returns:
             The created scheduled event
         """
+        settings = settings or GameTimeSettings()
+
         # Get game time state
         game_time_state = db.query(DBGameTimeState).filter(DBGameTimeState.game_id == game_id).first()
         
@@ -253,50 +268,175 @@ class CRUDScheduledGameEvent(CRUDBase[DBScheduledGameEvent]):
             "trigger_day": event.trigger_datetime.day,
             "trigger_hour": event.trigger_datetime.hour,
             "trigger_minute": event.trigger_datetime.minute,
+            "trigger_ordinal": event.trigger_datetime.to_minutes(settings),
             "event_type": event.event_type,
             "event_context": event.event_context,
             "character_id": event.character_id,
             "is_recurring": event.is_recurring,
-            "recurrence_interval_minutes": event.recurrence_interval_minutes
+            "recurrence_interval_minutes": event.recurrence_interval_minutes,
+            "catch_up_policy": CatchUpPolicy(event.catch_up_policy).value
         })
     
-    def get_events_due(self, db: Session, game_id: str, current_datetime: GameDateTime) -> List[DBScheduledGameEvent]:
+    def backfill_trigger_ordinals(
+        self,
+        db: Session,
+        game_id: str,
+        settings: Optional[GameTimeSettings] = None
+    ) -> int:
+        """
+        Compute trigger ordinals for events stored before the column existed.
+        
+        Run once when a game's time state is loaded (see TimeService); the
+        due-event queries rely on every row having an ordinal.
+        
+        Args:
+            db: Database session
+            game_id: Game ID
+            settings: Calendar used for the ordinals (defaults to GameTimeSettings())
+            
+        Returns:
+            Number of events updated
+        """
+        settings = settings or GameTimeSettings()
+        game_time_state_id = self._get_game_time_state_id(db, game_id)
+        
+        if not game_time_state_id:
+            return 0
+        
+        legacy_events = db.query(DBScheduledGameEvent).filter(
+            DBScheduledGameEvent.game_time_state_id == game_time_state_id,
+            DBScheduledGameEvent.trigger_ordinal.is_(None)
+        ).all()
+        
+        if not legacy_events:
+            return 0
+        
+        db.bulk_update_mappings(DBScheduledGameEvent, [
+            {"id": event.id, "trigger_ordinal": self._trigger_datetime(event).to_minutes(settings)}
+            for event in legacy_events
+        ])
+        db.commit()
+        return len(legacy_events)
+    
+    def get_events_due(
+        self,
+        db: Session,
+        game_id: str,
+        current_datetime: GameDateTime,
+        settings: Optional[GameTimeSettings] = None
+    ) -> List[DBScheduledGameEvent]:
         """
         Get all scheduled events that are due to be triggered.
         
+        Uses the (game_time_state_id, trigger_ordinal) index, so only due rows are read.
+        
         Args:
             db: Database session
             game_id: Game ID
             current_datetime: Current game datetime
+            settings: Calendar used for the trigger ordinals (defaults to GameTimeSettings())
             
         Returns:
-            List of scheduled events that are due
+            List of scheduled events that are due, earliest first
         """
-        game_time_state = db.query(DBGameTimeState).filter(DBGameTimeState.game_id == game_id).first()
+        settings = settings or GameTimeSettings()
+        game_time_state_id = self._get_game_time_state_id(db, game_id)
         
-        if not game_time_state:
+        if not game_time_state_id:
             return []
         
-        # Get all events for this game
-        all_events = db.query(DBScheduledGameEvent).filter(
-            DBScheduledGameEvent.game_time_state_id == game_time_state.id
-        ).all()
+        return db.query(DBScheduledGameEvent).filter(
+            DBScheduledGameEvent.game_time_state_id == game_time_state_id,
+            DBScheduledGameEvent.trigger_ordinal <= current_datetime.to_minutes(settings)
+        ).order_by(DBScheduledGameEvent.trigger_ordinal).all()
+    
+    def get_next_trigger_ordinal(self, db: Session, game_id: str) -> Optional[int]:
+        """
+        Get the earliest pending trigger ordinal for a game in one indexed query.
         
-        # Filter for events that are due
-        due_events = []
-        for event in all_events:
-            event_datetime = GameDateTime(
-                year=event.trigger_year,
-                month=event.trigger_month,
-                day=event.trigger_day,
-                hour=event.trigger_hour,
-                minute=event.trigger_minute
-            )
+        Args:
+            db: Database session
+            game_id: Game ID
+            
+        Returns:
+            The earliest trigger ordinal, or None if no events are pending
+        """
+        return db.query(func.min(DBScheduledGameEvent.trigger_ordinal)).join(
+            DBGameTimeState, DBScheduledGameEvent.game_time_state_id == DBGameTimeState.id
+        ).filter(DBGameTimeState.game_id == game_id).scalar()
+    
+    def get_upcoming_trigger_ordinals(
+        self,
+        db: Session,
+        game_id: str,
+        limit: int
+    ) -> List[Tuple[int, str]]:
+        """
+        Get the earliest pending trigger ordinals for a game.
+        
+        Args:
+            db: Database session
+            game_id: Game ID
+            limit: Maximum number of events to return
             
-            if event_datetime <= current_datetime:
-                due_events.append(event)
+        Returns:
+            List of (trigger ordinal, event ID) tuples, earliest first
+        """
+        game_time_state_id = self._get_game_time_state_id(db, game_id)
+        
+        if not game_time_state_id:
+            return []
         
-        return due_events
+        rows = db.query(DBScheduledGameEvent.trigger_ordinal, DBScheduledGameEvent.event_id).filter(
+            DBScheduledGameEvent.game_time_state_id == game_time_state_id
+        ).order_by(DBScheduledGameEvent.trigger_ordinal).limit(limit).all()
+        
+        return [(trigger_ordinal, event_id) for trigger_ordinal, event_id in rows]
+    
+    def apply_triggered_events(
+        self,
+        db: Session,
+        *,
+        reschedules: List[Tuple[str, GameDateTime, int]],
+        removals: List[str]
+    ) -> None:
+        """
+        Reschedule and remove triggered events in bulk with a single commit.
+        
+        Args:
+            db: Database session
+            reschedules: (row ID, next trigger datetime, next trigger ordinal) for recurring events
+            removals: Row IDs of one-time events to delete
+        """
+        if reschedules:
+            db.bulk_update_mappings(DBScheduledGameEvent, [
+                {
+                    "id": row_id,
+                    "trigger_year": next_datetime.year,
+                    "trigger_month": next_datetime.month,
+                    "trigger_day": next_datetime.day,
+                    "trigger_hour": next_datetime.hour,
+                    "trigger_minute": next_datetime.minute,
+                    "trigger_ordinal": next_ordinal
+                }
+                for row_id, next_datetime, next_ordinal in reschedules
+            ])
+        
+        if removals:
+            db.query(DBScheduledGameEvent).filter(
+                DBScheduledGameEvent.id.in_(removals)
+            ).delete(synchronize_session=False)
+        
+        db.commit()
+    
+    def _trigger_datetime(self, db_event: DBScheduledGameEvent) -> GameDateTime:
+        return GameDateTime(
+            year=db_event.trigger_year,
+            month=db_event.trigger_month,
+            day=db_event.trigger_day,
+            hour=db_event.trigger_hour,
+            minute=db_event.trigger_minute
+        )
     
     def convert_to_model(self, db_event: DBScheduledGameEvent) -> ScheduledGameEvent:
         """
@@ -310,18 +450,13 @@ class CRUDScheduledGameEvent(CRUDBase[DBScheduledGameEvent]):
         """
         return ScheduledGameEvent(
             event_id=db_event.event_id,
-            trigger_datetime=GameDateTime(
-                year=db_event.trigger_year,
-                month=db_event.trigger_month,
-                day=db_event.trigger_day,
-                hour=db_event.trigger_hour,
-                minute=db_event.trigger_minute
-            ),
+            trigger_datetime=self._trigger_datetime(db_event),
             event_type=db_event.event_type,
             event_context=db_event.event_context or {},
             character_id=db_event.character_id,
             is_recurring=db_event.is_recurring,
-            recurrence_interval_minutes=db_event.recurrence_interval_minutes
+            recurrence_interval_minutes=db_event.recurrence_interval_minutes,
+            catch_up_policy=db_event.catch_up_policy or CatchUpPolicy.FIRE_ALL
         )
 
 
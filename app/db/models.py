@@ -5,7 +5,7 @@ These models represent the database tables for storing time-related information.
 
 import json
 import uuid
-from sqlalchemy import Column, String, Integer, Boolean, Text, JSON, ForeignKey
+from sqlalchemy import Column, String, Integer, BigInteger, Boolean, Text, JSON, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -58,16 +58,23 @@ class DBScheduledGameEvent(Base):
     trigger_day = Column(Integer, nullable=False)
     trigger_hour = Column(Integer, nullable=False)
     trigger_minute = Column(Integer, nullable=False)
+    # Absolute trigger time in minutes since year zero (see GameCalendar), for indexed due-event queries
+    trigger_ordinal = Column(BigInteger, nullable=True)
     
     event_type = Column(String, nullable=False)
     event_context = Column(JSON, nullable=True)
     character_id = Column(String, nullable=True)
     is_recurring = Column(Boolean, default=False)
     recurrence_interval_minutes = Column(Integer, nullable=True)
+    catch_up_policy = Column(String, nullable=False, default="FIRE_ALL")  # CatchUpPolicy value
     
     # Relationships
     game_time_state = relationship("DBGameTimeState", back_populates="scheduled_events")
     
+    __table_args__ = (
+        Index("ix_scheduled_game_events_state_ordinal", "game_time_state_id", "trigger_ordinal"),
+    )
+    
     def to_dict(self):
         """Convert the model to a dictionary."""
         return {
@@ -79,9 +86,11 @@ class DBScheduledGameEvent(Base):
             "trigger_day": self.trigger_day,
             "trigger_hour": self.trigger_hour,
             "trigger_minute": self.trigger_minute,
+            "trigger_ordinal": self.trigger_ordinal,
             "event_type": self.event_type,
             "event_context": self.event_context,
             "character_id": self.character_id,
             "is_recurring": self.is_recurring,
-            "recurrence_interval_minutes": self.recurrence_interval_minutes
+            "recurrence_interval_minutes": self.recurrence_interval_minutes,
+            "catch_up_policy": self.catch_up_policy
         }
\ No newline at end of file
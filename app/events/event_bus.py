@@ -23,6 +23,7 @@ class EventType(str, Enum):
     SEASONAL_WEATHER_UPDATE = "SEASONAL_WEATHER_UPDATE"
     SCHEDULED_EVENT_TRIGGERED = "SCHEDULED_EVENT_TRIGGERED"
     WEATHER_CHANGED = "WEATHER_CHANGED"
+    WEATHER_CHANGE = "WEATHER_CHANGED"  # Alias used by the weather system
     SPELL_EXPIRED = "SPELL_EXPIRED"
     BUFF_EXPIRED = "BUFF_EXPIRED"
     RITUAL_COMPLETED = "RITUAL_COMPLETED"
@@ -5,10 +5,11 @@ This module defines Pydantic models for the game's time system, which tracks
 and manages the passage of time in the game world.
 """
 
+from bisect import bisect_right
 from enum import Enum, auto
 from typing import Dict, Any, Optional, Tuple, List
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
 class TimeBlock(str, Enum):
     """Time blocks representing different parts of the day."""
@@ -28,6 +29,11 @@ class Season(str, Enum):
     AUTUMN = "AUTUMN"
     WINTER = "WINTER"
 
+class CatchUpPolicy(str, Enum):
+    """How a recurring event behaves when a time skip covers several of its recurrences."""
+    FIRE_ALL = "FIRE_ALL"  # Trigger once for every recurrence in the skipped window
+    COALESCE = "COALESCE"  # Trigger once, reporting how many recurrences were folded together
+
 class GameDateTime(BaseModel):
     """
     Model representing a specific date and time in the game world.
@@ -61,6 +67,9 @@ class GameDateTime(BaseModel):
         """
         Add the specified number of minutes to this GameDateTime.
         
+        Runs in constant time regardless of the size of the jump. Out-of-range
+        days (e.g. day 31 of a 30-day month) are normalized into the next month.
+        
         Args:
             minutes: Number of minutes to add (can be negative)
             settings: Game time settings to use for calendar calculations
@@ -68,48 +77,8 @@ class GameDateTime(BaseModel):
         Returns:
             A new GameDateTime instance with the added time
         """
-        result = self.copy(deep=True)
-        
-        # Handle adding minutes
-        result.minute += minutes
-        
-        # Handle minute overflow
-        while result.minute >= settings.minutes_per_hour:
-            result.minute -= settings.minutes_per_hour
-            result.hour += 1
-        
-        # Handle hour overflow
-        while result.hour >= settings.hours_per_day:
-            result.hour -= settings.hours_per_day
-            result.day += 1
-        
-        # Handle day overflow - simplified version
-        while result.day > settings.days_per_month.get(result.month, 30):
-            result.day -= settings.days_per_month.get(result.month, 30)
-            result.month += 1
-            
-            # Handle month overflow
-            if result.month > settings.months_per_year:
-                result.month = 1
-                result.year += 1
-        
-        # Handle negative time (going backward)
-        while result.minute < 0:
-            result.minute += settings.minutes_per_hour
-            result.hour -= 1
-        
-        while result.hour < 0:
-            result.hour += settings.hours_per_day
-            result.day -= 1
-        
-        while result.day < 1:
-            result.month -= 1
-            if result.month < 1:
-                result.month = settings.months_per_year
-                result.year -= 1
-            result.day += settings.days_per_month.get(result.month, 30)
-        
-        return result
+        calendar = settings.calendar
+        return calendar.from_ordinal(calendar.to_ordinal(self) + minutes)
     
     def to_minutes(self, settings: 'GameTimeSettings') -> int:
         """
@@ -122,27 +91,28 @@ class GameDateTime(BaseModel):
         Returns:
             Total minutes from year zero
         """
-        total_minutes = 0
-        
-        # Add minutes from years
-        for y in range(self.year):
-            for m in range(1, settings.months_per_year + 1):
-                total_minutes += settings.days_per_month.get(m, 30) * settings.hours_per_day * settings.minutes_per_hour
-        
-        # Add minutes from months in current year
-        for m in range(1, self.month):
-            total_minutes += settings.days_per_month.get(m, 30) * settings.hours_per_day * settings.minutes_per_hour
-        
-        # Add minutes from days in current month
-        total_minutes += (self.day - 1) * settings.hours_per_day * settings.minutes_per_hour
-        
-        # Add minutes from hours in current day
-        total_minutes += self.hour * settings.minutes_per_hour
-        
-        # Add minutes in current hour
-        total_minutes += self.minute
+        return settings.calendar.to_ordinal(self)
+    
+    @classmethod
+    def from_minutes(cls, total_minutes: int, settings: 'GameTimeSettings') -> 'GameDateTime':
+        """
+        Create a GameDateTime from a total minute count from year zero.
         
-        return total_minutes
+        Args:
+            total_minutes: Minutes since year zero (as returned by to_minutes)
+            settings: Game time settings to use for calendar calculations
+            
+        Returns:
+            The corresponding GameDateTime
+        """
+        return settings.calendar.from_ordinal(total_minutes)
+    
+    def minutes_until(self, other: 'GameDateTime', settings: 'GameTimeSettings') -> int:
+        """
+        Get the number of minutes from this GameDateTime to another (negative if other is earlier).
+        """
+        calendar = settings.calendar
+        return calendar.to_ordinal(other) - calendar.to_ordinal(self)
     
     def __lt__(self, other: 'GameDateTime') -> bool:
         """Less than comparison."""
@@ -192,18 +162,23 @@ class GameDateTime(BaseModel):
     
     def get_time_description(self, settings: 'GameTimeSettings') -> str:
         """Get a narrative description of the current time of day."""
-        for time_block, (start_hour, end_hour) in settings.time_block_definitions.items():
-            if start_hour <= self.hour < end_hour:
-                return time_block.value
-        return "Unknown time of day"
+        time_block = settings.calendar.time_block_for_hour(self.hour)
+        return time_block.value if time_block else "Unknown time of day"
     
     def get_season(self, settings: 'GameTimeSettings') -> Season:
-        """Get the current season based on the date."""
-        for season, (start_month, start_day) in settings.season_definitions.items():
-            # This is a simplified version, a more complex implementation would handle year wrapping
-            if self.month > start_month or (self.month == start_month and self.day >= start_day):
-                return season
-        return Season.WINTER  # Default to winter if no match found
+        """
+        Get the current season based on the date.
+        
+        The season is the one that started most recently; dates before the
+        first season start of the year belong to the previous year's last season.
+        """
+        return settings.calendar.season_for(self)
+
+# GameTimeSettings fields a GameCalendar is built from
+CALENDAR_FIELDS = frozenset({
+    "minutes_per_hour", "hours_per_day", "days_per_month", "months_per_year",
+    "season_definitions", "time_block_definitions"
+})
 
 class GameTimeSettings(BaseModel):
     """
@@ -237,6 +212,8 @@ class GameTimeSettings(BaseModel):
         TimeBlock.EVENING: (20, 24)         # 8pm-12am
     })
     
+    _calendar: Optional['GameCalendar'] = PrivateAttr(default=None)
+    
     @validator('days_per_month')
     def validate_days_per_month(cls, v):
         """Validate that all months have a reasonable number of days."""
@@ -246,6 +223,154 @@ class GameTimeSettings(BaseModel):
             if days < 28 or days > 31:
                 raise ValueError(f"Invalid number of days for month {month}: {days}")
         return v
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in CALENDAR_FIELDS:
+            self._calendar = None
+    
+    @property
+    def calendar(self) -> 'GameCalendar':
+        """
+        The calendar engine for these settings.
+        
+        Built on first use and rebuilt after a calendar field is assigned.
+        Dictionaries edited in place must be assigned back to take effect.
+        """
+        calendar = self._calendar
+        if calendar is None:
+            calendar = self._calendar = GameCalendar(self)
+        return calendar
+
+class GameCalendar:
+    """
+    Arithmetic calendar engine for a GameTimeSettings configuration.
+    
+    Converts GameDateTime values to and from an absolute minute ordinal (minutes
+    since year zero) using precomputed cumulative month tables, so adding time,
+    taking differences and looking up time blocks and seasons are constant-time
+    operations however far apart the dates are.
+    
+    Obtain instances through GameTimeSettings.calendar.
+    """
+    
+    def __init__(self, settings: GameTimeSettings):
+        self.minutes_per_hour = settings.minutes_per_hour
+        self.hours_per_day = settings.hours_per_day
+        self.months_per_year = settings.months_per_year
+        self.minutes_per_day = settings.minutes_per_hour * settings.hours_per_day
+        
+        # month_start_days[m] = days in the year before month m (index 0 unused)
+        self.month_start_days: List[int] = [0, 0]
+        for month in range(1, settings.months_per_year + 1):
+            self.month_start_days.append(
+                self.month_start_days[-1] + settings.days_per_month.get(month, 30)
+            )
+        self.days_per_year = self.month_start_days[settings.months_per_year + 1]
+        self.minutes_per_year = self.days_per_year * self.minutes_per_day
+        
+        # Day of year (0-based) -> (month, day)
+        self._day_of_year_dates: List[Tuple[int, int]] = [
+            (month, day_of_year - self.month_start_days[month] + 1)
+            for month in range(1, settings.months_per_year + 1)
+            for day_of_year in range(self.month_start_days[month], self.month_start_days[month + 1])
+        ]
+        
+        # Hour -> time block; the first matching definition wins, as before
+        self._hour_time_blocks: List[Optional[TimeBlock]] = []
+        for hour in range(settings.hours_per_day):
+            self._hour_time_blocks.append(next(
+                (time_block for time_block, (start_hour, end_hour) in settings.time_block_definitions.items()
+                 if start_hour <= hour < end_hour),
+                None
+            ))
+        
+        # Season start days of year, sorted
+        season_starts = sorted(
+            (self.month_start_days[start_month] + start_day - 1, season)
+            for season, (start_month, start_day) in settings.season_definitions.items()
+        )
+        self._season_start_days: List[int] = [start_day for start_day, _ in season_starts]
+        self._seasons: List[Season] = [season for _, season in season_starts]
+    
+    def to_ordinal(self, dt: GameDateTime) -> int:
+        """Convert a GameDateTime to minutes since year zero."""
+        return (
+            dt.year * self.minutes_per_year
+            + (self.month_start_days[dt.month] + dt.day - 1) * self.minutes_per_day
+            + dt.hour * self.minutes_per_hour
+            + dt.minute
+        )
+    
+    def from_ordinal(self, ordinal: int) -> GameDateTime:
+        """
+        Convert minutes since year zero to a GameDateTime.
+        
+        Raises:
+            ValueError: If the ordinal is before year zero
+        """
+        if ordinal < 0:
+            raise ValueError(f"Minute ordinal {ordinal} is before year zero")
+        
+        year, minute_of_year = divmod(ordinal, self.minutes_per_year)
+        day_of_year, minute_of_day = divmod(minute_of_year, self.minutes_per_day)
+        hour, minute = divmod(minute_of_day, self.minutes_per_hour)
+        month, day = self._day_of_year_dates[day_of_year]
+        
+        return GameDateTime(year=year, month=month, day=day, hour=hour, minute=minute)
+    
+    def add_minutes(self, dt: GameDateTime, minutes: int) -> GameDateTime:
+        """Add minutes (possibly negative) to a GameDateTime."""
+        return self.from_ordinal(self.to_ordinal(dt) + minutes)
+    
+    def minutes_between(self, start: GameDateTime, end: GameDateTime) -> int:
+        """Get the minutes from start to end (negative if end is earlier)."""
+        return self.to_ordinal(end) - self.to_ordinal(start)
+    
+    def day_of_year(self, dt: GameDateTime) -> int:
+        """Get the 0-based day of the year, normalizing out-of-range days."""
+        return (self.to_ordinal(dt) % self.minutes_per_year) // self.minutes_per_day
+    
+    def time_block_for_hour(self, hour: int) -> Optional[TimeBlock]:
+        """Get the time block an hour falls in, or None if no block covers it."""
+        if 0 <= hour < self.hours_per_day:
+            return self._hour_time_blocks[hour]
+        return None
+    
+    def _season_index(self, day_of_year: int) -> int:
+        # -1 wraps to the last season, which carries over from the previous year
+        return bisect_right(self._season_start_days, day_of_year) - 1
+    
+    def season_for(self, dt: GameDateTime) -> Season:
+        """Get the season a GameDateTime falls in."""
+        if not self._seasons:
+            return Season.WINTER
+        return self._seasons[self._season_index(self.day_of_year(dt))]
+    
+    def season_bounds(self, dt: GameDateTime) -> Tuple[Season, int, Season, int]:
+        """
+        Get the season a GameDateTime falls in and the season after it.
+        
+        Returns:
+            Tuple of (season, season start ordinal, next season, next season start ordinal)
+        """
+        ordinal = self.to_ordinal(dt)
+        year_start = ordinal - ordinal % self.minutes_per_year
+        index = self._season_index((ordinal - year_start) // self.minutes_per_day)
+        
+        if index < 0:
+            index = len(self._seasons) - 1
+            year_start -= self.minutes_per_year
+        start = year_start + self._season_start_days[index] * self.minutes_per_day
+        
+        next_index = index + 1
+        next_year_start = year_start
+        if next_index == len(self._seasons):
+            next_index = 0
+            next_year_start += self.minutes_per_year
+        next_start = next_year_start + self._season_start_days[next_index] * self.minutes_per_day
+        
+        return self._seasons[index], start, self._seasons[next_index], next_start
 
 class ScheduledGameEvent(BaseModel):
     """
@@ -259,6 +384,7 @@ class ScheduledGameEvent(BaseModel):
     character_id: Optional[str] = None
     is_recurring: bool = False
     recurrence_interval_minutes: Optional[int] = None
+    catch_up_policy: CatchUpPolicy = CatchUpPolicy.FIRE_ALL
     
     @validator('recurrence_interval_minutes')
     def validate_recurrence(cls, v, values, **kwargs):
@@ -224,7 +224,7 @@ class WeatherConditionPydantic(BaseModel):
     expected_duration_hours: Optional[float] = None
     
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 class WeatherPatternPydantic(BaseModel):
     """Pydantic model for weather patterns."""
@@ -243,7 +243,7 @@ class WeatherPatternPydantic(BaseModel):
     transition_matrices: Dict[str, List[List[float]]]  # Markov chain transition probabilities
     
     class Config:
-        orm_mode = True
+        from_attributes = True
     
     @validator('weather_type_probabilities')
     def validate_probabilities(cls, v):
@@ -280,4 +280,4 @@ class ActiveWeatherEffectPydantic(BaseModel):
     calculated_end_time: datetime
     
     class Config:
-        orm_mode = True
\ No newline at end of file
+        from_attributes = True
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""
+Scheduled Event Queue
+
+This module provides an in-process min-heap of the earliest pending scheduled
+event trigger times for each game. TimeService consults it on every time
+advance so that due events are only fetched when one may actually be due.
+The heap only sees events scheduled through this process's TimeService, so a
+"nothing due" answer is confirmed with a cheap MIN(trigger_ordinal) query.
+"""
+
+import heapq
+import math
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Number of upcoming events held in memory per game
+DEFAULT_QUEUE_CAPACITY = 256
+
+
+class ScheduledEventQueue:
+    """
+    Min-heap of the next N (trigger ordinal, event ID) pairs for one game.
+
+    The heap is complete up to its horizon: every pending event triggering at
+    or before the horizon is in the heap, later ones are only in the database.
+    Cancelled events are not removed eagerly; a stale entry at worst causes one
+    extra due-event query before the queue is reloaded.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_QUEUE_CAPACITY):
+        """
+        Initialize an empty, unloaded queue.
+
+        Args:
+            capacity: Maximum number of upcoming events loaded from the database
+        """
+        self.capacity = capacity
+        self._heap: List[Tuple[int, str]] = []
+        self._horizon: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the queue has been loaded from the database."""
+        return self._horizon is not None
+
+    def load(self, upcoming: List[Tuple[int, str]]) -> None:
+        """
+        Replace the queue contents with the earliest pending events.
+
+        Args:
+            upcoming: Up to ``capacity`` (trigger ordinal, event ID) pairs, earliest first
+        """
+        heap = list(upcoming)
+        heapq.heapify(heap)
+        with self._lock:
+            self._heap = heap
+            # Fewer rows than asked for means the database holds nothing beyond them
+            self._horizon = math.inf if len(upcoming) < self.capacity else upcoming[-1][0]
+
+    def push(self, trigger_ordinal: int, event_id: str) -> None:
+        """Add a newly scheduled event if it falls within the loaded horizon."""
+        with self._lock:
+            if self._horizon is not None and trigger_ordinal <= self._horizon:
+                heapq.heappush(self._heap, (trigger_ordinal, event_id))
+
+    def invalidate(self) -> None:
+        """Forget the queue contents so the next check reloads them."""
+        with self._lock:
+            self._heap = []
+            self._horizon = None
+
+    def next_trigger_ordinal(self) -> Optional[int]:
+        """Get the earliest known trigger ordinal, or None if the queue is empty."""
+        with self._lock:
+            return self._heap[0][0] if self._heap else None
+
+    def may_have_due(self, current_ordinal: int) -> bool:
+        """
+        Check whether any event known to this queue may be due at ``current_ordinal``.
+
+        False means none of the events scheduled through this process is due;
+        events added elsewhere are not known here.
+        """
+        with self._lock:
+            if self._horizon is None:
+                return True
+            if self._heap and self._heap[0][0] <= current_ordinal:
+                return True
+            return current_ordinal > self._horizon
+
+
+_queues: Dict[str, ScheduledEventQueue] = {}
+_queues_lock = threading.Lock()
+
+
+def get_event_queue(game_id: str) -> ScheduledEventQueue:
+    """
+    Get the shared event queue for a game.
+
+    All TimeService instances for a game in this process share one queue.
+    """
+    with _queues_lock:
+        queue = _queues.get(game_id)
+        if queue is None:
+            queue = _queues[game_id] = ScheduledEventQueue()
+        return queue
+
+
+def reset_event_queues() -> None:
+    """Drop all queues (e.g. after the database was changed outside TimeService)."""
+    with _queues_lock:
+        _queues.clear()
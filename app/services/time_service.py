@@ -13,14 +13,19 @@ from redis import Redis
 from sqlalchemy.orm import Session
 
 from app.models.time_models import (
-    GameDateTime, TimeBlock, Season, GameTimeSettings, ScheduledGameEvent
+    GameDateTime, TimeBlock, Season, GameTimeSettings, ScheduledGameEvent, CatchUpPolicy
 )
 from app.models.season_models import SeasonChangeEventData, SeasonChangeEvent
 from app.db.crud import game_time_state_crud, scheduled_game_event_crud
 from app.events.event_bus import event_bus, GameEvent, EventType
+from app.services.scheduled_event_queue import get_event_queue
 
 logger = logging.getLogger(__name__)
 
+# Recurrences of one FIRE_ALL event triggered individually per advance; any
+# further recurrences in the same skip are coalesced into one final trigger
+MAX_CATCH_UP_OCCURRENCES = 1000
+
 class TimeService:
     """
     Service for managing the game's time system.
@@ -44,6 +49,9 @@ class TimeService:
         self.game_id = game_id
         self.redis_client = redis_client
         
+        # Upcoming scheduled events, shared by every TimeService for this game
+        self._event_queue = get_event_queue(game_id)
+        
         # Initialize time state from database or create new
         self._initialize_time_state()
     
@@ -70,6 +78,11 @@ class TimeService:
             logger.info(f"Created new time state for game {self.game_id}: {current_datetime.format()}")
         else:
             logger.info(f"Loaded time state for game {self.game_id}: {current_datetime.format()}")
+            
+            # Events stored before trigger ordinals existed need one before they can be found as due
+            backfilled = scheduled_game_event_crud.backfill_trigger_ordinals(self.db, self.game_id, self.settings)
+            if backfilled:
+                logger.info(f"Computed trigger ordinals for {backfilled} scheduled events of game {self.game_id}")
     
     def get_current_datetime(self) -> GameDateTime:
         """
@@ -95,14 +108,20 @@ class TimeService:
         Returns:
             The current time block
         """
-        current_datetime = self.get_current_datetime()
-        
-        for time_block, (start_hour, end_hour) in self.settings.time_block_definitions.items():
-            if start_hour <= current_datetime.hour < end_hour:
-                return time_block
+        return self._get_time_block_for_datetime(self.get_current_datetime())
+    
+    def _get_time_block_for_datetime(self, dt: GameDateTime) -> TimeBlock:
+        """
+        Get the time block for a specific datetime.
         
-        # Default fallback - should not reach here if time blocks cover all hours
-        return TimeBlock.MORNING
+        Args:
+            dt: The datetime to check
+            
+        Returns:
+            The time block for the given datetime
+        """
+        # Default fallback - should not be needed if time blocks cover all hours
+        return self.settings.calendar.time_block_for_hour(dt.hour) or TimeBlock.MORNING
     
     def get_current_season(self) -> Season:
         """
@@ -130,18 +149,18 @@ class TimeService:
         
         # Get current state
         current_datetime = self.get_current_datetime()
-        current_time_block = self.get_current_time_block()
-        current_season = self.get_current_season()
+        current_time_block = self._get_time_block_for_datetime(current_datetime)
+        current_season = self._get_season_for_datetime(current_datetime)
         
-        # Calculate new datetime
+        # Calculate new datetime (constant time however large the jump)
         new_datetime = current_datetime.add_minutes(minutes_to_advance, self.settings)
         
         # Persist the new datetime
         game_time_state_crud.create_or_update(self.db, game_id=self.game_id, datetime=new_datetime)
         
         # Determine if time block or season changed
-        new_time_block = self.get_current_time_block()
-        new_season = self.get_current_season()
+        new_time_block = self._get_time_block_for_datetime(new_datetime)
+        new_season = self._get_season_for_datetime(new_datetime)
         
         # Check for seasonal change and publish event FIRST (before other events)
         if current_season != new_season:
@@ -283,7 +302,8 @@ class TimeService:
         event_context: Dict[str, Any],
         character_id: Optional[str] = None,
         is_recurring: bool = False,
-        recurrence_interval_minutes: Optional[int] = None
+        recurrence_interval_minutes: Optional[int] = None,
+        catch_up_policy: CatchUpPolicy = CatchUpPolicy.FIRE_ALL
     ) -> str:
         """
         Schedule a game event to occur at a specific time.
@@ -295,6 +315,8 @@ class TimeService:
             character_id: Optional character ID if the event is character-specific
             is_recurring: Whether the event repeats
             recurrence_interval_minutes: How often the event repeats (in minutes)
+            catch_up_policy: How a recurring event handles several recurrences
+                falling within one time advance
             
         Returns:
             The event ID of the scheduled event
@@ -310,11 +332,15 @@ class TimeService:
             event_context=event_context,
             character_id=character_id,
             is_recurring=is_recurring,
-            recurrence_interval_minutes=recurrence_interval_minutes
+            recurrence_interval_minutes=recurrence_interval_minutes,
+            catch_up_policy=catch_up_policy
         )
         
         # Store the event
-        scheduled_game_event_crud.create_event(self.db, game_id=self.game_id, event=event)
+        db_event = scheduled_game_event_crud.create_event(
+            self.db, game_id=self.game_id, event=event, settings=self.settings
+        )
+        self._event_queue.push(db_event.trigger_ordinal, event_id)
         
         logger.info(f"Scheduled event {event_id} of type {event_type} for {trigger_datetime.format()}")
         
@@ -341,54 +367,107 @@ class TimeService:
         
         return True
     
+    def _reload_event_queue(self) -> None:
+        """Load the earliest pending events into the in-process queue."""
+        self._event_queue.load(scheduled_game_event_crud.get_upcoming_trigger_ordinals(
+            self.db, self.game_id, self._event_queue.capacity
+        ))
+    
     def _check_and_trigger_scheduled_events(self, current_datetime: GameDateTime) -> None:
         """
         Check for scheduled events that should be triggered and trigger them.
         
+        Every recurrence of a recurring event that falls within the advance is
+        handled according to its catch-up policy, and all database changes are
+        applied in one bulk write before the triggers are published, earliest first.
+        
         Args:
             current_datetime: Current game datetime
         """
-        # Get all due events
-        due_events = scheduled_game_event_crud.get_events_due(self.db, self.game_id, current_datetime)
+        calendar = self.settings.calendar
+        current_ordinal = calendar.to_ordinal(current_datetime)
+        
+        if not self._event_queue.loaded:
+            self._reload_event_queue()
+        if not self._event_queue.may_have_due(current_ordinal):
+            # Events scheduled by other processes, or straight through the crud, never reach
+            # this process's queue; one indexed MIN query catches them
+            next_ordinal = scheduled_game_event_crud.get_next_trigger_ordinal(self.db, self.game_id)
+            if next_ordinal is None or next_ordinal > current_ordinal:
+                return
+        
+        due_events = scheduled_game_event_crud.get_events_due(
+            self.db, self.game_id, current_datetime, settings=self.settings
+        )
+        
+        # (trigger ordinal, event, occurrence count) for every trigger to publish
+        triggers: List[Tuple[int, ScheduledGameEvent, int]] = []
+        reschedules = []
+        removals = []
         
         for db_event in due_events:
-            # Convert to Pydantic model
             event = scheduled_game_event_crud.convert_to_model(db_event)
+            first_ordinal = db_event.trigger_ordinal
             
-            # Trigger the event
-            self._trigger_scheduled_event(event)
+            if not (event.is_recurring and event.recurrence_interval_minutes):
+                # One-time events are removed after they trigger
+                triggers.append((first_ordinal, event, 1))
+                removals.append(db_event.id)
+                continue
             
-            # Handle recurring events
-            if event.is_recurring and event.recurrence_interval_minutes:
-                # Calculate next trigger time
-                next_trigger_datetime = event.trigger_datetime.add_minutes(
-                    event.recurrence_interval_minutes, self.settings
-                )
-                
-                # Update the event with the new trigger time
-                scheduled_game_event_crud.update(self.db, db_obj=db_event, obj_in={
-                    "trigger_year": next_trigger_datetime.year,
-                    "trigger_month": next_trigger_datetime.month,
-                    "trigger_day": next_trigger_datetime.day,
-                    "trigger_hour": next_trigger_datetime.hour,
-                    "trigger_minute": next_trigger_datetime.minute
-                })
-                
-                logger.info(
-                    f"Rescheduled recurring event {event.event_id} for {next_trigger_datetime.format()}"
-                )
+            interval = event.recurrence_interval_minutes
+            due_count = (current_ordinal - first_ordinal) // interval + 1
+            last_ordinal = first_ordinal + (due_count - 1) * interval
+            
+            if event.catch_up_policy == CatchUpPolicy.COALESCE:
+                triggers.append((last_ordinal, event, due_count))
             else:
-                # Remove one-time events after they've triggered
-                scheduled_game_event_crud.remove(self.db, id=db_event.id)
-                logger.info(f"Removed one-time event {event.event_id} after triggering")
+                individual = min(due_count, MAX_CATCH_UP_OCCURRENCES) - 1
+                triggers.extend(
+                    (first_ordinal + index * interval, event, 1) for index in range(individual)
+                )
+                # The final trigger absorbs any recurrences beyond the cap
+                triggers.append((last_ordinal, event, due_count - individual))
+                if due_count > MAX_CATCH_UP_OCCURRENCES:
+                    logger.warning(
+                        f"Recurring event {event.event_id} had {due_count} recurrences due; "
+                        f"coalesced the last {due_count - individual}"
+                    )
+            
+            next_ordinal = last_ordinal + interval
+            reschedules.append((db_event.id, calendar.from_ordinal(next_ordinal), next_ordinal))
+        
+        scheduled_game_event_crud.apply_triggered_events(
+            self.db, reschedules=reschedules, removals=removals
+        )
+        self._reload_event_queue()
+        
+        triggers.sort(key=lambda trigger: trigger[0])
+        for trigger_ordinal, event, occurrence_count in triggers:
+            self._trigger_scheduled_event(event, calendar.from_ordinal(trigger_ordinal), occurrence_count)
+        
+        if due_events:
+            logger.info(
+                f"Triggered {len(triggers)} occurrences of {len(due_events)} scheduled events "
+                f"({len(reschedules)} rescheduled, {len(removals)} removed)"
+            )
     
-    def _trigger_scheduled_event(self, event: ScheduledGameEvent) -> None:
+    def _trigger_scheduled_event(
+        self,
+        event: ScheduledGameEvent,
+        trigger_datetime: Optional[GameDateTime] = None,
+        occurrence_count: int = 1
+    ) -> None:
         """
         Trigger a scheduled event by publishing it on the event bus.
         
         Args:
             event: The event to trigger
+            trigger_datetime: The occurrence being triggered (defaults to the event's trigger time)
+            occurrence_count: Number of recurrences this trigger stands for (more than
+                one when recurrences were coalesced)
         """
+        trigger_datetime = trigger_datetime or event.trigger_datetime
         game_event = GameEvent(
             event_type=EventType.SCHEDULED_EVENT_TRIGGERED,
             context={
@@ -397,21 +476,22 @@ class TimeService:
                 "event_type": event.event_type,
                 "event_context": event.event_context,
                 "trigger_datetime": {
-                    "year": event.trigger_datetime.year,
-                    "month": event.trigger_datetime.month,
-                    "day": event.trigger_datetime.day,
-                    "hour": event.trigger_datetime.hour,
-                    "minute": event.trigger_datetime.minute
+                    "year": trigger_datetime.year,
+                    "month": trigger_datetime.month,
+                    "day": trigger_datetime.day,
+                    "hour": trigger_datetime.hour,
+                    "minute": trigger_datetime.minute
                 },
                 "is_recurring": event.is_recurring,
-                "recurrence_interval_minutes": event.recurrence_interval_minutes
+                "recurrence_interval_minutes": event.recurrence_interval_minutes,
+                "occurrence_count": occurrence_count
             },
             source_id=None,
             target_id=event.character_id
         )
         
         event_bus.publish(game_event)
-        logger.info(f"Triggered scheduled event {event.event_id} of type {event.event_type}")
+        logger.debug(f"Triggered scheduled event {event.event_id} of type {event.event_type}")
     
     def calculate_time_until_block(self, target_block: TimeBlock, current_dt: Optional[GameDateTime] = None) -> int:
         """
@@ -427,46 +507,17 @@ class TimeService:
         if current_dt is None:
             current_dt = self.get_current_datetime()
         
-        # Get the target block's start hour
-        target_start_hour, _ = self.settings.time_block_definitions[target_block]
-        
-        # If we're already in the target block, we need to calculate time until the next occurrence
-        current_block = self.get_current_time_block()
-        
-        if current_block == target_block:
-            # We're already in this block, so calculate time until the next day's occurrence
-            target_dt = GameDateTime(
-                year=current_dt.year,
-                month=current_dt.month,
-                day=current_dt.day + 1,  # Next day
-                hour=target_start_hour,
-                minute=0
-            )
-        elif current_dt.hour < target_start_hour:
-            # Target block is later today
-            target_dt = GameDateTime(
-                year=current_dt.year,
-                month=current_dt.month,
-                day=current_dt.day,
-                hour=target_start_hour,
-                minute=0
-            )
-        else:
-            # Target block is tomorrow
-            target_dt = GameDateTime(
-                year=current_dt.year,
-                month=current_dt.month,
-                day=current_dt.day + 1,
-                hour=target_start_hour,
-                minute=0
-            )
+        calendar = self.settings.calendar
+        current_minutes = calendar.to_ordinal(current_dt)
         
-        # Handle date overflow
-        target_dt = target_dt.add_minutes(0, self.settings)
+        # Start of the target block on the current day
+        target_start_hour, _ = self.settings.time_block_definitions[target_block]
+        day_start = current_minutes - current_minutes % calendar.minutes_per_day
+        target_minutes = day_start + target_start_hour * calendar.minutes_per_hour
         
-        # Calculate minutes between the current time and target time
-        current_minutes = current_dt.to_minutes(self.settings)
-        target_minutes = target_dt.to_minutes(self.settings)
+        # If we're already in the target block or past its start, use the next day's occurrence
+        if self._get_time_block_for_datetime(current_dt) == target_block or target_minutes <= current_minutes:
+            target_minutes += calendar.minutes_per_day
         
         return target_minutes - current_minutes
     
@@ -484,11 +535,7 @@ class TimeService:
         if current_dt is None:
             current_dt = self.get_current_datetime()
         
-        # Calculate minutes between the current time and target time
-        current_minutes = current_dt.to_minutes(self.settings)
-        target_minutes = target_dt.to_minutes(self.settings)
-        
-        minutes_until = target_minutes - current_minutes
+        minutes_until = self.settings.calendar.minutes_between(current_dt, target_dt)
         
         # Return 0 if the target is in the past
         return max(0, minutes_until)
@@ -541,48 +588,12 @@ class TimeService:
         if dt is None:
             dt = self.get_current_datetime()
         
-        current_season = self._get_season_for_datetime(dt)
+        calendar = self.settings.calendar
+        current_season, season_start, next_season, next_season_start = calendar.season_bounds(dt)
         
         # Calculate how far through the season we are
-        season_start_month, season_start_day = self.settings.season_definitions[current_season]
-        
-        # Find the next season
-        seasons = list(Season)
-        current_index = seasons.index(current_season)
-        next_season = seasons[(current_index + 1) % len(seasons)]
-        next_season_start_month, next_season_start_day = self.settings.season_definitions[next_season]
-        
-        # Handle year wrapping for winter -> spring transition
-        if next_season_start_month < season_start_month:
-            if dt.month >= season_start_month:
-                # We're in the current year, next season is next year
-                next_year = dt.year + 1
-            else:
-                # We're early in the year, next season is this year
-                next_year = dt.year
-        else:
-            next_year = dt.year
-        
-        # Create datetime objects for comparison
-        current_season_start = GameDateTime(
-            year=dt.year if dt.month >= season_start_month else dt.year - 1,
-            month=season_start_month,
-            day=season_start_day,
-            hour=0,
-            minute=0
-        )
-        
-        next_season_start = GameDateTime(
-            year=next_year,
-            month=next_season_start_month,
-            day=next_season_start_day,
-            hour=0,
-            minute=0
-        )
-        
-        # Calculate progress
-        total_season_minutes = next_season_start.to_minutes(self.settings) - current_season_start.to_minutes(self.settings)
-        elapsed_minutes = dt.to_minutes(self.settings) - current_season_start.to_minutes(self.settings)
+        total_season_minutes = next_season_start - season_start
+        elapsed_minutes = calendar.to_ordinal(dt) - season_start
         
         progress = elapsed_minutes / total_season_minutes if total_season_minutes > 0 else 0.0
         progress = max(0.0, min(1.0, progress))  # Clamp between 0 and 1
@@ -591,7 +602,7 @@ class TimeService:
             "current_season": current_season,
             "next_season": next_season,
             "progress": progress,
-            "days_remaining": max(0, int((total_season_minutes - elapsed_minutes) / (self.settings.hours_per_day * self.settings.minutes_per_hour)))
+            "days_remaining": max(0, int((total_season_minutes - elapsed_minutes) / calendar.minutes_per_day))
         }
     
     def format_datetime(self, dt: Optional[GameDateTime] = None) -> str:
@@ -0,0 +1,421 @@
+"""
+Weather Batch Engine
+
+This module provides the WeatherBatchEngine, which generates the next weather
+condition for many regions at once. Weather patterns are compiled into NumPy
+arrays, and the Markov transition and every derived quantity (temperature,
+wind, precipitation, humidity, cloud cover, visibility, duration) are sampled
+for all regions with a handful of vector operations, following the same rules
+as the scalar helpers in WeatherService.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from app.models.weather_models import (
+    WeatherType, PrecipitationType, WindDirection, VisibilityLevel
+)
+from app.models.time_models import TimeBlock
+
+# Index orders used by all weather arrays
+WEATHER_TYPES = [weather_type.value for weather_type in WeatherType]
+WEATHER_TYPE_INDEX = {weather_type: index for index, weather_type in enumerate(WEATHER_TYPES)}
+WIND_DIRECTIONS = [direction.value for direction in WindDirection]
+WIND_DIRECTION_INDEX = {direction: index for index, direction in enumerate(WIND_DIRECTIONS)}
+PRECIPITATION_TYPES = [precip_type.value for precip_type in PrecipitationType]
+PRECIPITATION_TYPE_INDEX = {precip_type: index for index, precip_type in enumerate(PRECIPITATION_TYPES)}
+VISIBILITY_LEVELS = [level.value for level in VisibilityLevel]
+
+PRECIP_NONE = PRECIPITATION_TYPE_INDEX["NONE"]
+PRECIP_RAIN = PRECIPITATION_TYPE_INDEX["RAIN"]
+PRECIP_SNOW = PRECIPITATION_TYPE_INDEX["SNOW"]
+PRECIP_HAIL = PRECIPITATION_TYPE_INDEX["HAIL"]
+
+# Chance of a thunderstorm producing hail instead of rain
+THUNDERSTORM_HAIL_CHANCE = 0.15
+
+
+def _per_type(values: Dict[str, Any], default: Any) -> np.ndarray:
+    """Build a lookup table indexed by weather type."""
+    return np.array([values.get(weather_type, default) for weather_type in WEATHER_TYPES], dtype=float)
+
+
+def _expand(groups: Dict[tuple, Any]) -> Dict[str, Any]:
+    return {weather_type: value for group, value in groups.items() for weather_type in group}
+
+
+# Temperature modifier range, as multiples of the time block variation
+_TEMPERATURE_MODIFIER = _per_type(_expand({
+    ("CLEAR", "PARTLY_CLOUDY"): (-1.0, 1.0),
+    ("CLOUDY", "LIGHT_RAIN", "LIGHT_SNOW"): (-0.7, 0.5),
+    ("HEAVY_RAIN", "HEAVY_SNOW", "THUNDERSTORM", "BLIZZARD"): (-1.2, 0.0),
+}), (-0.5, 0.5))
+
+# Temperature base and variation, as fractions of the pattern's range
+_TIME_BLOCK_TEMPERATURE = {
+    TimeBlock.MORNING: (0.25, 0.15),
+    TimeBlock.AFTERNOON: (0.75, 0.15),
+    TimeBlock.EVENING: (0.5, 0.15),
+}
+_NIGHT_TEMPERATURE = (0.0, 0.1)
+
+# Wind range bounds as (min weight, max weight) of the pattern's wind speeds
+_WIND_RANGE = _per_type(_expand({
+    ("CLEAR", "PARTLY_CLOUDY", "LIGHT_RAIN", "LIGHT_SNOW"): (1.0, 0.0, 0.5, 0.5),
+    ("CLOUDY", "FOG", "HEAVY_RAIN", "HEAVY_SNOW"): (0.8, 0.2, 0.0, 1.0),
+    ("THUNDERSTORM", "BLIZZARD", "GALE", "WINDY", "DUST_STORM"): (0.0, 0.7, 0.0, 1.2),
+}), (1.0, 0.0, 0.0, 1.0))
+
+_PRECIPITATION_TYPE = _per_type(_expand({
+    ("LIGHT_RAIN", "HEAVY_RAIN", "THUNDERSTORM"): PRECIP_RAIN,
+    ("LIGHT_SNOW", "HEAVY_SNOW", "BLIZZARD"): PRECIP_SNOW,
+    ("HAIL",): PRECIP_HAIL,
+}), PRECIP_NONE).astype(np.int64)
+
+_PRECIPITATION_INTENSITY = _per_type(_expand({
+    ("LIGHT_RAIN", "LIGHT_SNOW"): (0.1, 0.3),
+    ("HEAVY_RAIN", "HEAVY_SNOW"): (0.5, 0.8),
+    ("THUNDERSTORM", "BLIZZARD"): (0.7, 1.0),
+    ("HAIL",): (0.4, 0.9),
+}), (0.0, 0.0))
+
+# Humidity base as a fraction of the pattern's range, without precipitation
+_HUMIDITY_FRACTION = _per_type(_expand({
+    ("FOG", "CLOUDY"): 0.6,
+    ("PARTLY_CLOUDY",): 0.4,
+    ("CLEAR",): 0.2,
+}), 0.5)
+
+_CLOUD_COVER = _per_type(_expand({
+    ("CLEAR",): (0.0, 0.1),
+    ("PARTLY_CLOUDY",): (0.4, 0.2),
+    ("CLOUDY",): (0.8, 0.15),
+    ("LIGHT_RAIN", "LIGHT_SNOW"): (0.7, 0.15),
+    ("HEAVY_RAIN", "HEAVY_SNOW", "THUNDERSTORM", "BLIZZARD"): (0.9, 0.1),
+    ("FOG",): (0.6, 0.2),
+}), (0.5, 0.3))
+
+_DURATION = _per_type(_expand({
+    ("CLEAR", "CLOUDY"): (6.0, 4.0),
+    ("PARTLY_CLOUDY", "LIGHT_RAIN", "LIGHT_SNOW"): (4.0, 2.0),
+    ("HEAVY_RAIN", "HEAVY_SNOW"): (3.0, 1.5),
+    ("THUNDERSTORM", "BLIZZARD", "HAIL"): (1.5, 1.0),
+    ("FOG",): (3.0, 2.0),
+}), (4.0, 2.0))
+
+_IS_FOG = _per_type({"FOG": True}, False).astype(bool)
+_IS_THUNDERSTORM = _per_type({"THUNDERSTORM": True}, False).astype(bool)
+_OBSCURING = _per_type({"DUST_STORM": True, "BLIZZARD": True}, False).astype(bool)
+
+
+@dataclass
+class WeatherBatch:
+    """
+    Weather conditions for a batch of regions, one array element per region.
+
+    Categorical fields hold indices into WEATHER_TYPES, WIND_DIRECTIONS,
+    PRECIPITATION_TYPES and VISIBILITY_LEVELS. Rows where ``present`` is False
+    hold no condition (a region without weather history).
+    """
+    present: np.ndarray
+    weather_type: np.ndarray
+    temperature: np.ndarray
+    temperature_feels_like: np.ndarray
+    wind_speed: np.ndarray
+    wind_direction: np.ndarray
+    precipitation_type: np.ndarray
+    precipitation_intensity: np.ndarray
+    humidity: np.ndarray
+    cloud_cover: np.ndarray
+    visibility: np.ndarray
+    expected_duration_hours: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.present)
+
+    @classmethod
+    def empty(cls, size: int) -> "WeatherBatch":
+        """Create a batch of regions without any condition."""
+        values = {field.name: np.zeros(size) for field in fields(cls)}
+        for name in ("weather_type", "wind_direction", "precipitation_type", "visibility"):
+            values[name] = np.zeros(size, dtype=np.int64)
+        values["present"] = np.zeros(size, dtype=bool)
+        return cls(**values)
+
+    @classmethod
+    def from_conditions(cls, conditions: Sequence[Optional[Any]]) -> "WeatherBatch":
+        """
+        Build a batch from weather condition objects (or None for missing rows).
+
+        Args:
+            conditions: DBWeatherCondition-like objects, one per region
+        """
+        batch = cls.empty(len(conditions))
+        for index, condition in enumerate(conditions):
+            if condition is None:
+                continue
+            batch.present[index] = True
+            batch.weather_type[index] = WEATHER_TYPE_INDEX[_enum_value(condition.weather_type)]
+            batch.wind_direction[index] = WIND_DIRECTION_INDEX[_enum_value(condition.wind_direction)]
+            batch.precipitation_type[index] = PRECIPITATION_TYPE_INDEX[_enum_value(condition.precipitation_type)]
+            batch.precipitation_intensity[index] = condition.precipitation_intensity
+            batch.humidity[index] = condition.humidity
+            batch.cloud_cover[index] = condition.cloud_cover
+            batch.temperature[index] = condition.temperature
+            batch.temperature_feels_like[index] = condition.temperature_feels_like
+            batch.wind_speed[index] = condition.wind_speed
+            batch.visibility[index] = VISIBILITY_LEVELS.index(_enum_value(condition.visibility))
+            batch.expected_duration_hours[index] = condition.expected_duration_hours or 0.0
+        return batch
+
+    def condition_data(self, index: int) -> Dict[str, Any]:
+        """Get one region's condition as plain Python values (enum values as strings)."""
+        return {
+            "weather_type": WEATHER_TYPES[self.weather_type[index]],
+            "temperature": float(self.temperature[index]),
+            "temperature_feels_like": float(self.temperature_feels_like[index]),
+            "wind_speed": float(self.wind_speed[index]),
+            "wind_direction": WIND_DIRECTIONS[self.wind_direction[index]],
+            "precipitation_type": PRECIPITATION_TYPES[self.precipitation_type[index]],
+            "precipitation_intensity": float(self.precipitation_intensity[index]),
+            "humidity": float(self.humidity[index]),
+            "cloud_cover": float(self.cloud_cover[index]),
+            "visibility": VISIBILITY_LEVELS[self.visibility[index]],
+            "expected_duration_hours": float(self.expected_duration_hours[index])
+        }
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _uniform(rng: np.random.Generator, low: Any, high: Any) -> np.ndarray:
+    """Sample between ``low`` and ``high`` like random.uniform (bounds may be in either order)."""
+    low, high = np.broadcast_arrays(np.asarray(low, dtype=float), np.asarray(high, dtype=float))
+    return low + (high - low) * rng.random(low.shape)
+
+
+class WeatherBatchEngine:
+    """
+    Generates next weather conditions for a fixed set of regions.
+
+    The engine is built from one weather pattern per region (all for the same
+    season) and can be stepped repeatedly, each step taking the previous
+    batch as the current conditions.
+    """
+
+    def __init__(self, patterns: Sequence[Any]):
+        """
+        Compile weather patterns into arrays.
+
+        Args:
+            patterns: DBWeatherPattern-like objects, one per region, in batch order
+        """
+        size = len(patterns)
+        type_count = len(WEATHER_TYPES)
+
+        self.base_cdf = np.zeros((size, type_count))
+        self.transition_cdf = np.zeros((size, type_count, type_count))
+        self.temperature_min = np.zeros(size)
+        self.temperature_max = np.zeros(size)
+        self.humidity_min = np.zeros(size)
+        self.humidity_max = np.zeros(size)
+        self.wind_min = np.zeros(size)
+        self.wind_max = np.zeros(size)
+        self.gust_chance = np.zeros(size)
+        self.gust_multiplier = np.ones(size)
+
+        for index, pattern in enumerate(patterns):
+            base, transitions = self._compile_probabilities(pattern)
+            self.base_cdf[index] = np.cumsum(base)
+            self.transition_cdf[index] = np.cumsum(transitions, axis=1)
+
+            self.temperature_min[index] = pattern.temperature_base_min
+            self.temperature_max[index] = pattern.temperature_base_max
+            self.humidity_min[index] = pattern.humidity_range_min
+            self.humidity_max[index] = pattern.humidity_range_max
+            wind = pattern.default_wind_speeds or {}
+            self.wind_min[index] = wind.get("min", 0)
+            self.wind_max[index] = wind.get("max", 10)
+            self.gust_chance[index] = wind.get("gust_chance", 0.1)
+            self.gust_multiplier[index] = wind.get("gust_max_multiplier", 1.5)
+
+    def __len__(self) -> int:
+        return len(self.base_cdf)
+
+    @staticmethod
+    def _compile_probabilities(pattern: Any):
+        """Get a pattern's base distribution and full transition matrix over WEATHER_TYPES."""
+        type_count = len(WEATHER_TYPES)
+        pattern_types = list((pattern.weather_type_probabilities or {}).keys())
+        columns = [WEATHER_TYPE_INDEX.get(weather_type) for weather_type in pattern_types]
+
+        base = np.zeros(type_count)
+        for column, probability in zip(columns, pattern.weather_type_probabilities.values()):
+            if column is not None:
+                base[column] += probability
+        base = base / base.sum() if base.sum() > 0 else np.full(type_count, 1.0 / type_count)
+
+        # Types without a usable transition row fall back to the base distribution
+        transitions = np.tile(base, (type_count, 1))
+        for from_type, row in (pattern.transition_matrices or {}).items():
+            from_index = WEATHER_TYPE_INDEX.get(from_type)
+            if from_index is None or len(row) != len(pattern_types):
+                continue
+            transition = np.zeros(type_count)
+            for column, probability in zip(columns, row):
+                if column is not None:
+                    transition[column] += probability
+            if transition.sum() > 0:
+                transitions[from_index] = transition / transition.sum()
+
+        return base, transitions
+
+    def step(
+        self,
+        previous: WeatherBatch,
+        time_block: TimeBlock,
+        rng: np.random.Generator
+    ) -> WeatherBatch:
+        """
+        Generate the next condition for every region.
+
+        Args:
+            previous: Current conditions, in the same region order as the patterns
+            time_block: Time block the new conditions start in
+            rng: Random generator to sample from
+
+        Returns:
+            The new conditions (every row present)
+        """
+        size = len(self)
+        rows = np.arange(size)
+        had_condition = previous.present
+
+        # Markov transition from the current type, base distribution otherwise
+        cdf = np.where(
+            had_condition[:, None],
+            self.transition_cdf[rows, previous.weather_type],
+            self.base_cdf
+        )
+        weather_type = np.minimum((cdf < rng.random(size)[:, None]).sum(axis=1), len(WEATHER_TYPES) - 1)
+
+        # Temperature
+        temperature_range = self.temperature_max - self.temperature_min
+        base_fraction, variation_fraction = _TIME_BLOCK_TEMPERATURE.get(time_block, _NIGHT_TEMPERATURE)
+        variation = temperature_range * variation_fraction
+        modifier_low, modifier_high = _TEMPERATURE_MODIFIER[weather_type].T
+        temperature = np.round(
+            self.temperature_min + temperature_range * base_fraction
+            + _uniform(rng, modifier_low * variation, modifier_high * variation),
+            1
+        )
+
+        # Wind speed, with occasional gusts
+        low_min, low_max, high_min, high_max = _WIND_RANGE[weather_type].T
+        wind_speed = _uniform(
+            rng,
+            low_min * self.wind_min + low_max * self.wind_max,
+            high_min * self.wind_min + high_max * self.wind_max
+        )
+        gusting = rng.random(size) < self.gust_chance
+        wind_speed = np.round(
+            np.where(gusting, wind_speed * _uniform(rng, 1.0, self.gust_multiplier), wind_speed), 1
+        )
+
+        # Wind direction drifts by at most one step from the current one 70% of the time
+        direction_count = len(WIND_DIRECTIONS)
+        drifting = had_condition & (rng.random(size) < 0.7)
+        wind_direction = np.where(
+            drifting,
+            (previous.wind_direction + rng.integers(-1, 2, size)) % direction_count,
+            rng.integers(0, direction_count, size)
+        )
+
+        # Precipitation
+        precipitation_type = _PRECIPITATION_TYPE[weather_type].copy()
+        hailing = _IS_THUNDERSTORM[weather_type] & (rng.random(size) < THUNDERSTORM_HAIL_CHANCE)
+        precipitation_type[hailing] = PRECIP_HAIL
+        precipitation_type[(precipitation_type == PRECIP_SNOW) & (temperature > 0)] = PRECIP_RAIN
+        intensity_low, intensity_high = _PRECIPITATION_INTENSITY[weather_type].T
+        continuing = (
+            had_condition
+            & (previous.precipitation_type == precipitation_type)
+            & (previous.precipitation_intensity > 0)
+        )
+        intensity_low = np.where(
+            continuing, np.maximum(intensity_low, previous.precipitation_intensity * 0.7), intensity_low
+        )
+        intensity_high = np.where(
+            continuing, np.minimum(intensity_high, previous.precipitation_intensity * 1.3), intensity_high
+        )
+        precipitating = precipitation_type != PRECIP_NONE
+        precipitation_intensity = np.where(
+            precipitating, np.round(_uniform(rng, intensity_low, intensity_high), 2), 0.0
+        )
+
+        # Humidity
+        humidity_range = self.humidity_max - self.humidity_min
+        wet_humidity = self.humidity_min + humidity_range * 0.7
+        wet_humidity = wet_humidity + (self.humidity_max - wet_humidity) * precipitation_intensity
+        humidity = np.where(
+            precipitating, wet_humidity, self.humidity_min + humidity_range * _HUMIDITY_FRACTION[weather_type]
+        )
+        humidity_variation = humidity_range * 0.1
+        humidity = np.clip(
+            humidity + _uniform(rng, -humidity_variation, humidity_variation), self.humidity_min, self.humidity_max
+        )
+        humidity = np.round(np.where(had_condition, previous.humidity * 0.6 + humidity * 0.4, humidity), 2)
+
+        # Cloud cover
+        cloud_base, cloud_variation = _CLOUD_COVER[weather_type].T
+        cloud_cover = np.clip(cloud_base + _uniform(rng, -cloud_variation, cloud_variation), 0.0, 1.0)
+        cloud_cover = np.round(
+            np.where(had_condition, previous.cloud_cover * 0.7 + cloud_cover * 0.3, cloud_cover), 2
+        )
+
+        # Visibility score (0-100) mapped onto visibility levels
+        visibility_score = (
+            100.0
+            - 70.0 * _IS_FOG[weather_type]
+            - np.where(precipitating, precipitation_intensity * 50, 0.0)
+            - np.where(cloud_cover > 0.5, (cloud_cover - 0.5) * 20, 0.0)
+            - 60.0 * _OBSCURING[weather_type]
+            - np.where(wind_speed > 20, (wind_speed - 20) * 2, 0.0)
+        )
+        visibility_score = np.clip(visibility_score, 0, 100)
+        visibility = np.searchsorted(np.array([20, 40, 60, 80]), visibility_score, side="right")
+        visibility = len(VISIBILITY_LEVELS) - 1 - visibility
+
+        # "Feels like" temperature: wind chill when cold, heat index when hot
+        wind_factor = np.power(wind_speed, 0.16)
+        wind_chill = np.round(13.12 + 0.6215 * temperature - 11.37 * wind_factor + 0.3965 * temperature * wind_factor, 1)
+        heat_index = np.round(temperature + (humidity * 0.5) * (temperature - 24), 1)
+        temperature_feels_like = np.select(
+            [(temperature <= 10) & (wind_speed >= 5), (temperature >= 25) & (humidity >= 0.4)],
+            [wind_chill, heat_index],
+            temperature
+        )
+
+        # Expected duration
+        duration_base, duration_variation = _DURATION[weather_type].T
+        expected_duration_hours = np.round(
+            np.maximum(0.5, duration_base + _uniform(rng, -duration_variation, duration_variation)), 1
+        )
+
+        return WeatherBatch(
+            present=np.ones(size, dtype=bool),
+            weather_type=weather_type,
+            temperature=temperature,
+            temperature_feels_like=temperature_feels_like,
+            wind_speed=wind_speed,
+            wind_direction=wind_direction,
+            precipitation_type=precipitation_type,
+            precipitation_intensity=precipitation_intensity,
+            humidity=humidity,
+            cloud_cover=cloud_cover,
+            visibility=visibility,
+            expected_duration_hours=expected_duration_hours
+        )
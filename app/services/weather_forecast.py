@@ -0,0 +1,364 @@
+"""
+Weather Forecast
+
+This module provides the WeatherForecaster, which precomputes seeded weather
+trajectories for every region several days ahead, one step per time block,
+with the WeatherBatchEngine. Trajectories are stored column by column in
+compact NumPy arrays (in process, and optionally in Redis), so the current or
+any future condition of a region is an O(1) array lookup. NPC and travel
+planners can query forecasts without touching the database.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import threading
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import numpy as np
+
+from app.models.time_models import GameDateTime, TimeBlock
+from app.models.weather_models import DBWeatherPattern
+from app.services.weather_batch_engine import WeatherBatch, WeatherBatchEngine
+
+if TYPE_CHECKING:
+    from app.services.weather_service import WeatherService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FORECAST_DAYS = 7
+
+# Redis cache key for a game's forecast
+WEATHER_FORECAST_CACHE_KEY = "weather_system:forecast:{game_id}"
+WEATHER_FORECAST_CACHE_TTL = 86400
+
+# Storage types of the forecast columns
+_COLUMN_DTYPES = {
+    "present": np.bool_,
+    "weather_type": np.int8,
+    "wind_direction": np.int8,
+    "precipitation_type": np.int8,
+    "visibility": np.int8,
+}
+_FLOAT_DTYPE = np.float32
+
+
+@dataclass
+class WeatherForecast:
+    """
+    Weather trajectories of a set of regions, one step per time block.
+
+    ``columns`` maps each WeatherBatch field to a (steps, regions) array.
+    ``hour_steps`` maps each hour after ``start_ordinal`` to its step.
+    """
+    region_ids: List[str]
+    start_ordinal: int
+    minutes_per_hour: int
+    step_ordinals: np.ndarray
+    hour_steps: np.ndarray
+    columns: Dict[str, np.ndarray]
+    fingerprint: str
+    region_index: Dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.region_index = {region_id: index for index, region_id in enumerate(self.region_ids)}
+
+    @property
+    def end_ordinal(self) -> int:
+        """First minute ordinal after the forecast horizon."""
+        return self.start_ordinal + len(self.hour_steps) * self.minutes_per_hour
+
+    def covers(self, ordinal: int) -> bool:
+        """Whether the forecast has a step for a minute ordinal."""
+        return self.start_ordinal <= ordinal < self.end_ordinal
+
+    def step_for(self, ordinal: int) -> Optional[int]:
+        """Get the step covering a minute ordinal, or None outside the horizon."""
+        if not self.covers(ordinal):
+            return None
+        return int(self.hour_steps[(ordinal - self.start_ordinal) // self.minutes_per_hour])
+
+    def batch_at(self, step: int, region_ids: Optional[List[str]] = None) -> WeatherBatch:
+        """
+        Get one step as a WeatherBatch.
+
+        Args:
+            step: The step
+            region_ids: Regions to include, in order (defaults to all forecast regions)
+        """
+        indices = slice(None) if region_ids is None else [self.region_index[region_id] for region_id in region_ids]
+        values = {}
+        for name, column in self.columns.items():
+            row = column[step, indices]
+            if name in _COLUMN_DTYPES:
+                values[name] = row.astype(bool if name == "present" else np.int64)
+            else:
+                # Every stored quantity was rounded to at most two decimals
+                values[name] = np.round(row.astype(np.float64), 2)
+        return WeatherBatch(**values)
+
+    def condition_at(self, region_id: str, ordinal: int) -> Optional[Dict[str, Any]]:
+        """Get a region's forecast condition at a minute ordinal, or None if not forecast."""
+        step = self.step_for(ordinal)
+        index = self.region_index.get(region_id)
+        if step is None or index is None:
+            return None
+        return self.batch_at(step, [region_id]).condition_data(0)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the forecast for Redis."""
+        buffer = io.BytesIO()
+        metadata = {
+            "region_ids": self.region_ids,
+            "start_ordinal": self.start_ordinal,
+            "minutes_per_hour": self.minutes_per_hour,
+            "fingerprint": self.fingerprint
+        }
+        np.savez_compressed(
+            buffer,
+            metadata=np.frombuffer(json.dumps(metadata).encode("utf-8"), dtype=np.uint8),
+            step_ordinals=self.step_ordinals,
+            hour_steps=self.hour_steps,
+            **{f"column_{name}": column for name, column in self.columns.items()}
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "WeatherForecast":
+        """Deserialize a forecast produced by to_bytes."""
+        with np.load(io.BytesIO(data)) as arrays:
+            metadata = json.loads(arrays["metadata"].tobytes().decode("utf-8"))
+            return cls(
+                region_ids=metadata["region_ids"],
+                start_ordinal=metadata["start_ordinal"],
+                minutes_per_hour=metadata["minutes_per_hour"],
+                step_ordinals=arrays["step_ordinals"],
+                hour_steps=arrays["hour_steps"],
+                columns={
+                    name[len("column_"):]: arrays[name] for name in arrays.files if name.startswith("column_")
+                },
+                fingerprint=metadata["fingerprint"]
+            )
+
+
+def pattern_fingerprint(patterns: List[DBWeatherPattern]) -> str:
+    """Hash the content of a set of weather patterns."""
+    digest = hashlib.sha256()
+    for pattern in sorted(patterns, key=lambda pattern: (pattern.region_id, pattern.season, pattern.id)):
+        digest.update(json.dumps(pattern.to_dict(), sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+_forecasts: Dict[str, WeatherForecast] = {}
+_forecasts_lock = threading.Lock()
+
+
+class WeatherForecaster:
+    """
+    Precomputes and serves weather forecasts for a game.
+
+    Forecasts are shared by all forecasters of a game in this process and are
+    regenerated only when invalidated (patterns or season changed) or when the
+    requested time falls outside the forecast horizon. Generation is seeded
+    from the start time and the patterns, so the same world state always
+    produces the same trajectories.
+    """
+
+    def __init__(self, weather_service: "WeatherService", days: int = DEFAULT_FORECAST_DAYS, seed: int = 0):
+        """
+        Initialize the forecaster.
+
+        Args:
+            weather_service: WeatherService providing the database session, time and patterns
+            days: Number of days each forecast covers
+            seed: Base seed of the trajectories
+        """
+        self.weather_service = weather_service
+        self.days = days
+        self.seed = seed
+
+    @property
+    def game_id(self) -> str:
+        return self.weather_service.time_service.game_id
+
+    @property
+    def _calendar(self):
+        return self.weather_service.time_service.settings.calendar
+
+    def _now_ordinal(self) -> int:
+        return self._calendar.to_ordinal(self.weather_service.time_service.get_current_datetime())
+
+    def _ordinal(self, at: Optional[GameDateTime]) -> int:
+        return self._now_ordinal() if at is None else self._calendar.to_ordinal(at)
+
+    def get_forecast(self, at: Optional[GameDateTime] = None) -> WeatherForecast:
+        """
+        Get a forecast covering a time, generating it if needed.
+
+        Args:
+            at: Time that must be covered (defaults to the current game time)
+        """
+        ordinal = self._ordinal(at)
+        with _forecasts_lock:
+            forecast = _forecasts.get(self.game_id)
+        if forecast is not None and forecast.covers(ordinal):
+            return forecast
+
+        forecast = self._load_from_redis(ordinal)
+        if forecast is None:
+            # Start at the current time unless the requested time is outside that horizon
+            start = self._now_ordinal()
+            if not start <= ordinal < start + self.days * self._calendar.minutes_per_day:
+                start = ordinal
+            forecast = self.generate(self._calendar.from_ordinal(start))
+            self._store_in_redis(forecast)
+
+        with _forecasts_lock:
+            _forecasts[self.game_id] = forecast
+        return forecast
+
+    def condition_at(self, region_id: str, at: Optional[GameDateTime] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a region's forecast condition at a time.
+
+        Args:
+            region_id: The region ID
+            at: The time (defaults to the current game time)
+
+        Returns:
+            Condition data, or None if the region has no weather pattern
+        """
+        ordinal = self._ordinal(at)
+        return self.get_forecast(at).condition_at(region_id, ordinal)
+
+    def forecast_for_region(self, region_id: str, at: Optional[GameDateTime] = None) -> List[Dict[str, Any]]:
+        """
+        Get a region's forecast from a time to the end of the horizon, one entry per time block.
+
+        Each entry carries the ``start`` GameDateTime of its time block.
+        """
+        ordinal = self._ordinal(at)
+        forecast = self.get_forecast(at)
+        index = forecast.region_index.get(region_id)
+        if index is None:
+            return []
+
+        entries = []
+        for step in range(forecast.step_for(ordinal), len(forecast.step_ordinals)):
+            entry = forecast.batch_at(step, [region_id]).condition_data(0)
+            entry["start"] = self._calendar.from_ordinal(int(forecast.step_ordinals[step]))
+            entries.append(entry)
+        return entries
+
+    def invalidate(self) -> None:
+        """Drop the game's forecast so the next lookup regenerates it."""
+        with _forecasts_lock:
+            _forecasts.pop(self.game_id, None)
+        redis = self.weather_service.redis
+        if redis:
+            try:
+                redis.delete(WEATHER_FORECAST_CACHE_KEY.format(game_id=self.game_id))
+            except Exception as e:
+                logger.error(f"Error deleting cached weather forecast: {e}")
+
+    def generate(self, start: GameDateTime) -> WeatherForecast:
+        """
+        Generate trajectories for all configured regions from the time block containing ``start``.
+
+        The first step is sampled from the regions' latest recorded conditions.
+        """
+        calendar = self._calendar
+        service = self.weather_service
+        minutes_per_hour = calendar.minutes_per_hour
+
+        start_ordinal = calendar.to_ordinal(start) // minutes_per_hour * minutes_per_hour
+        hours = self.days * calendar.hours_per_day
+
+        # One step per time block within the horizon
+        step_ordinals = []
+        step_blocks = []
+        hour_steps = np.zeros(hours, dtype=np.int32)
+        for hour in range(hours):
+            ordinal = start_ordinal + hour * minutes_per_hour
+            block = calendar.time_block_for_hour((ordinal // minutes_per_hour) % calendar.hours_per_day) \
+                or TimeBlock.MORNING
+            if not step_blocks or block != step_blocks[-1]:
+                step_ordinals.append(ordinal)
+                step_blocks.append(block)
+            hour_steps[hour] = len(step_ordinals) - 1
+        step_seasons = [calendar.season_for(calendar.from_ordinal(ordinal)).value for ordinal in step_ordinals]
+
+        regions = service._get_all_configured_regions()
+        engines = {}
+        for season in dict.fromkeys(step_seasons):
+            season_patterns = service._get_weather_patterns_for_regions(regions, season) if regions else {}
+            engines[season] = WeatherBatchEngine([season_patterns[region_id] for region_id in regions])
+        fingerprint = pattern_fingerprint(service.db.query(DBWeatherPattern).all())
+
+        current_conditions = service._get_current_weather_for_regions(regions) if regions else {}
+        state = WeatherBatch.from_conditions([current_conditions.get(region_id) for region_id in regions])
+
+        rng = np.random.default_rng([self.seed, start_ordinal, int(fingerprint[:16], 16)])
+        columns = {
+            batch_field.name: np.zeros(
+                (len(step_ordinals), len(regions)), dtype=_COLUMN_DTYPES.get(batch_field.name, _FLOAT_DTYPE)
+            )
+            for batch_field in fields(WeatherBatch)
+        }
+        for step, (block, season) in enumerate(zip(step_blocks, step_seasons)):
+            state = engines[season].step(state, block, rng)
+            for name, column in columns.items():
+                column[step] = getattr(state, name)
+
+        logger.info(f"Generated {self.days}-day weather forecast for {len(regions)} regions "
+                    f"({len(step_ordinals)} steps)")
+        return WeatherForecast(
+            region_ids=regions,
+            start_ordinal=start_ordinal,
+            minutes_per_hour=minutes_per_hour,
+            step_ordinals=np.array(step_ordinals, dtype=np.int64),
+            hour_steps=hour_steps,
+            columns=columns,
+            fingerprint=fingerprint
+        )
+
+    def _load_from_redis(self, ordinal: int) -> Optional[WeatherForecast]:
+        redis = self.weather_service.redis
+        if not redis:
+            return None
+        try:
+            cached = redis.get(WEATHER_FORECAST_CACHE_KEY.format(game_id=self.game_id))
+            if not cached:
+                return None
+            forecast = WeatherForecast.from_bytes(cached)
+        except Exception as e:
+            logger.error(f"Error deserializing cached weather forecast: {e}")
+            return None
+
+        if not forecast.covers(ordinal):
+            return None
+        # Another process may have cached a forecast from patterns that have since changed
+        if pattern_fingerprint(self.weather_service.db.query(DBWeatherPattern).all()) != forecast.fingerprint:
+            return None
+        return forecast
+
+    def _store_in_redis(self, forecast: WeatherForecast) -> None:
+        redis = self.weather_service.redis
+        if not redis:
+            return
+        try:
+            redis.setex(
+                WEATHER_FORECAST_CACHE_KEY.format(game_id=self.game_id),
+                WEATHER_FORECAST_CACHE_TTL,
+                forecast.to_bytes()
+            )
+        except Exception as e:
+            logger.error(f"Error caching weather forecast: {e}")
+
+
+def reset_weather_forecasts() -> None:
+    """Drop all in-process forecasts."""
+    with _forecasts_lock:
+        _forecasts.clear()
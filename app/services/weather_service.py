@@ -11,6 +11,7 @@ import math
 import json
 from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime, timedelta
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 from redis import Redis
 
@@ -21,6 +22,7 @@ from app.models.weather_models import (
 )
 from app.models.time_models import GameDateTime, TimeBlock, Season
 from app.services.time_service import TimeService
+from app.services.weather_forecast import DEFAULT_FORECAST_DAYS, WeatherForecaster
 from app.events.event_bus import event_bus, EventType, GameEvent
 from app.db.crud import CRUDBase
 from app.async_tasks.celery_app import celery_app
@@ -37,12 +39,28 @@ crud_weather_effect = CRUDBase(DBActiveWeatherEffect)
 WEATHER_CONDITION_CACHE_KEY = "weather_system:condition:{region_id}"
 WEATHER_PATTERN_CACHE_KEY = "weather_system:pattern:{region_id}:{season}"
 
+# Conversions applied to cached weather condition fields
+_CACHED_CONDITION_CONVERTERS = {
+    "timestamp": datetime.fromisoformat,
+    "weather_type": WeatherType,
+    "wind_direction": WindDirection,
+    "precipitation_type": PrecipitationType,
+    "visibility": VisibilityLevel
+}
+
 class WeatherService:
     """
     Service class for managing weather in the game world.
     """
     
-    def __init__(self, db_session: Session, time_service: TimeService, redis_client: Optional[Redis] = None):
+    def __init__(
+        self,
+        db_session: Session,
+        time_service: TimeService,
+        redis_client: Optional[Redis] = None,
+        seed: int = 0,
+        forecast_days: int = DEFAULT_FORECAST_DAYS
+    ):
         """
         Initialize the WeatherService.
         
@@ -50,10 +68,13 @@ class WeatherService:
             db_session: SQLAlchemy database session
             time_service: TimeService instance for accessing game time
             redis_client: Optional Redis client for caching
+            seed: Seed of the precomputed weather trajectories
+            forecast_days: Number of days each weather forecast covers
         """
         self.db = db_session
         self.time_service = time_service
         self.redis = redis_client
+        self.forecaster = WeatherForecaster(self, days=forecast_days, seed=seed)
         
         # Subscribe to time-related events
         event_bus.subscribe(EventType.TIME_BLOCK_CHANGED, self._handle_time_block_changed)
@@ -63,6 +84,11 @@ class WeatherService:
         """
         Update weather for all configured regions.
         
+        All regions are updated as one batch: new conditions are read from the
+        precomputed forecast (generated with WeatherBatchEngine), current
+        conditions are loaded with one query, and conditions and effects are
+        bulk-inserted.
+        
         Returns:
             Dictionary of region IDs to their new weather conditions
         """
@@ -70,18 +96,163 @@ class WeatherService:
         
         # Get all regions from weather patterns
         regions = self._get_all_configured_regions()
+        if not regions:
+            return {}
         
-        # Update weather for each region
-        results = {}
-        for region_id in regions:
-            try:
-                new_condition = self._calculate_and_apply_new_weather_for_region(region_id)
-                results[region_id] = WeatherConditionPydantic.from_orm(new_condition)
-            except Exception as e:
-                logger.error(f"Error updating weather for region {region_id}: {e}")
+        try:
+            return self._update_weather_batch(regions)
+        except Exception as e:
+            logger.error(f"Error updating weather for {len(regions)} regions: {e}")
+            self.db.rollback()
+            return {}
+    
+    def _update_weather_batch(self, regions: List[str]) -> Dict[str, WeatherConditionPydantic]:
+        """
+        Generate, store and publish new weather for a batch of regions.
+        
+        Args:
+            regions: The region IDs
+            
+        Returns:
+            Dictionary of region IDs to their new weather conditions
+        """
+        current_time_block = self.time_service.get_current_time_block()
+        current_season = self.time_service.get_current_season()
+        current_game_time = self.time_service.get_current_datetime()
         
+        forecast = self.forecaster.get_forecast(current_game_time)
+        if any(region_id not in forecast.region_index for region_id in regions):
+            # A region got its first pattern after the forecast was made
+            self.forecaster.invalidate()
+            forecast = self.forecaster.get_forecast(current_game_time)
+        
+        step = forecast.step_for(current_game_time.to_minutes(self.time_service.settings))
+        batch = forecast.batch_at(step, regions)
+        # Converted now, as committing expires the loaded conditions
+        previous_conditions = {
+            region_id: WeatherConditionPydantic.from_orm(condition)
+            for region_id, condition in self._get_current_weather_for_regions(regions).items()
+        }
+        
+        timestamp = datetime.utcnow()  # Use current real time for simplicity
+        condition_rows = []
+        for index, region_id in enumerate(regions):
+            data = batch.condition_data(index)
+            data["region_id"] = region_id
+            data["timestamp"] = timestamp
+            data["generated_description"] = self._generate_weather_description(
+                data["weather_type"],
+                data["temperature"],
+                data["wind_speed"],
+                data["wind_direction"],
+                data["precipitation_type"],
+                data["precipitation_intensity"],
+                data["cloud_cover"],
+                current_time_block,
+                current_season
+            )
+            condition_rows.append(data)
+        
+        # End the previous conditions' effects and insert the new conditions
+        self._end_active_weather_effects_bulk(
+            [condition.id for condition in previous_conditions.values()], timestamp
+        )
+        condition_ids = self.db.execute(
+            insert(DBWeatherCondition).returning(DBWeatherCondition.id, sort_by_parameter_order=True),
+            condition_rows
+        ).scalars().all()
+        
+        effect_rows = []
+        for condition_id, data in zip(condition_ids, condition_rows):
+            data["id"] = condition_id
+            end_time = timestamp + timedelta(hours=data["expected_duration_hours"] or 4)
+            effect_rows.extend(build_regional_weather_effects(
+                condition_id,
+                timestamp,
+                end_time,
+                data["weather_type"],
+                data["precipitation_type"],
+                data["temperature"],
+                data["visibility"]
+            ))
+        if effect_rows:
+            self.db.execute(insert(DBActiveWeatherEffect), effect_rows)
+        self.db.commit()
+        
+        results = {}
+        for data in condition_rows:
+            region_id = data["region_id"]
+            new_condition = WeatherConditionPydantic(**data)
+            results[region_id] = new_condition
+            self._publish_weather_change(new_condition, previous_conditions.get(region_id))
+            if self.redis:
+                self._cache_weather_condition(region_id, DBWeatherCondition(**new_condition.dict()))
+        
+        logger.info(f"Updated weather for {len(results)} regions ({len(effect_rows)} effects)")
         return results
     
+    def _get_weather_patterns_for_regions(self, regions: List[str], season: str) -> Dict[str, DBWeatherPattern]:
+        """
+        Get the weather pattern of every region for a season, creating defaults where missing.
+        
+        Args:
+            regions: The region IDs
+            season: The season
+            
+        Returns:
+            Dictionary of region IDs to weather patterns
+        """
+        def load() -> Dict[str, DBWeatherPattern]:
+            patterns = {}
+            for pattern in self.db.query(DBWeatherPattern).filter(
+                DBWeatherPattern.region_id.in_(regions),
+                DBWeatherPattern.season == season
+            ).order_by(DBWeatherPattern.id.desc()):
+                # Keep the first pattern per region, as _get_weather_pattern does
+                patterns[pattern.region_id] = pattern
+            return patterns
+        
+        patterns = load()
+        missing = [region_id for region_id in regions if region_id not in patterns]
+        if missing:
+            logger.warning(f"No weather pattern found for {len(missing)} regions in season {season}. "
+                           f"Creating default patterns.")
+            self.db.bulk_insert_mappings(DBWeatherPattern, [
+                self._default_weather_pattern_data(region_id, season) for region_id in missing
+            ])
+            self.db.commit()
+            self.forecaster.invalidate()
+            patterns = load()
+        
+        return patterns
+    
+    def _get_current_weather_for_regions(self, regions: List[str]) -> Dict[str, DBWeatherCondition]:
+        """
+        Get the latest weather condition of every region in one query.
+        
+        Args:
+            regions: The region IDs
+            
+        Returns:
+            Dictionary of region IDs to their latest condition (regions without weather are absent)
+        """
+        latest = self.db.query(
+            DBWeatherCondition.region_id,
+            func.max(DBWeatherCondition.timestamp).label("timestamp")
+        ).filter(DBWeatherCondition.region_id.in_(regions))\
+            .group_by(DBWeatherCondition.region_id)\
+            .subquery()
+        
+        conditions = {}
+        for condition in self.db.query(DBWeatherCondition).join(
+            latest,
+            (DBWeatherCondition.region_id == latest.c.region_id)
+            & (DBWeatherCondition.timestamp == latest.c.timestamp)
+        ).order_by(DBWeatherCondition.id):
+            # On timestamp ties the most recently inserted condition wins
+            conditions[condition.region_id] = condition
+        return conditions
+    
     def _calculate_and_apply_new_weather_for_region(self, region_id: str) -> DBWeatherCondition:
         """
         Calculate and apply new weather for a specific region.
@@ -123,7 +294,7 @@ class WeatherService:
         # Save to database
         if current_condition:
             # Update end time for existing weather effects
-            self._end_active_weather_effects(current_condition.id, new_condition.timestamp)
+            self._end_active_weather_effects(current_condition.id, new_condition["timestamp"])
         
         # Create database record
         db_condition = crud_weather_condition.create(self.db, obj_in=new_condition)
@@ -164,6 +335,38 @@ class WeatherService:
         
         return latest
     
+    def get_weather_forecast(
+        self,
+        region_id: str,
+        at: Optional[GameDateTime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the forecast weather for a region, one entry per time block.
+        
+        Served from the precomputed forecast without querying the database.
+        
+        Args:
+            region_id: The region ID
+            at: Start of the forecast (defaults to the current game time)
+            
+        Returns:
+            Condition data per time block until the end of the forecast horizon
+        """
+        return self.forecaster.forecast_for_region(region_id, at)
+    
+    def get_forecast_condition(self, region_id: str, at: GameDateTime) -> Optional[Dict[str, Any]]:
+        """
+        Get the forecast weather for a region at a specific time.
+        
+        Args:
+            region_id: The region ID
+            at: The game time
+            
+        Returns:
+            Condition data, or None if the region has no weather pattern
+        """
+        return self.forecaster.condition_at(region_id, at)
+    
     def _apply_weather_effects(self, weather_condition: DBWeatherCondition) -> List[DBActiveWeatherEffect]:
         """
         Apply weather effects based on the weather condition.
@@ -291,6 +494,28 @@ class WeatherService:
         Returns:
             The created weather pattern
         """
+        pattern = crud_weather_pattern.create(
+            self.db, obj_in=self._default_weather_pattern_data(region_id, season)
+        )
+        self.forecaster.invalidate()
+        
+        # Cache the pattern
+        if self.redis:
+            self._cache_weather_pattern(region_id, season, pattern)
+        
+        return pattern
+    
+    def _default_weather_pattern_data(self, region_id: str, season: str) -> Dict[str, Any]:
+        """
+        Build the data for a default weather pattern.
+        
+        Args:
+            region_id: The region ID
+            season: The season
+            
+        Returns:
+            Weather pattern data dictionary
+        """
         # Create default probabilities based on season
         if season == "SUMMER":
             weather_probs = {
@@ -336,8 +561,7 @@ class WeatherService:
             temp_min, temp_max = 10.0, 25.0
             precip_chances = {"NONE": 0.5, "RAIN": 0.5, "SNOW": 0.0, "HAIL": 0.0}
         
-        # Create pattern object
-        pattern_data = {
+        return {
             "region_id": region_id,
             "season": season,
             "weather_type_probabilities": weather_probs,
@@ -356,14 +580,6 @@ class WeatherService:
             "cloud_cover_range_max": 1.0,
             "transition_matrices": self._create_default_transition_matrix(weather_probs)
         }
-        
-        pattern = crud_weather_pattern.create(self.db, obj_in=pattern_data)
-        
-        # Cache the pattern
-        if self.redis:
-            self._cache_weather_pattern(region_id, season, pattern)
-        
-        return pattern
     
     def _create_default_transition_matrix(self, weather_probs: Dict[str, float]) -> Dict[str, List[List[float]]]:
         """
@@ -1157,127 +1373,15 @@ class WeatherService:
         Returns:
             List of weather effect data dictionaries
         """
-        effects = []
-        weather_type = weather_condition.weather_type.value
-        
-        # Common effect data
-        base_effect = {
-            "weather_condition_id": weather_condition.id,
-            "start_time": weather_condition.timestamp,
-            "calculated_end_time": end_time,
-        }
-        
-        # Movement effects
-        if weather_type in ["HEAVY_RAIN", "HEAVY_SNOW", "BLIZZARD"]:
-            movement_modifier = {"multiplier": 0.5}  # 50% slower
-            if weather_type == "BLIZZARD":
-                movement_modifier = {"multiplier": 0.3}  # 70% slower
-            
-            effects.append({
-                **base_effect,
-                "effect_type": "MOVEMENT_PENALTY",
-                "modifier_value": movement_modifier,
-                "description": f"Movement slowed due to {weather_type.lower().replace('_', ' ')}"
-            })
-        
-        # Visibility effects
-        if weather_type in ["FOG", "HEAVY_RAIN", "HEAVY_SNOW", "BLIZZARD", "DUST_STORM"]:
-            visibility_modifier = {"range_reduction": 0.5}  # 50% reduction
-            if weather_type in ["BLIZZARD", "DUST_STORM"]:
-                visibility_modifier = {"range_reduction": 0.8}  # 80% reduction
-            
-            effects.append({
-                **base_effect,
-                "effect_type": "VISIBILITY_REDUCTION",
-                "modifier_value": visibility_modifier,
-                "description": f"Visibility reduced due to {weather_type.lower().replace('_', ' ')}"
-            })
-        
-        # Resource gathering effects
-        if weather_condition.precipitation_type.value != "NONE" or weather_type in ["WINDY", "GALE"]:
-            resource_modifier = {"difficulty_increase": 0.3}  # 30% harder
-            
-            effects.append({
-                **base_effect,
-                "effect_type": "RESOURCE_GATHERING_DIFFICULTY",
-                "modifier_value": resource_modifier,
-                "description": f"Resource gathering more difficult due to {weather_type.lower().replace('_', ' ')}"
-            })
-        
-        # Comfort/warmth effects for extreme temperatures
-        if weather_condition.temperature < 5:
-            # Cold weather
-            warmth_modifier = {"loss_rate": 0.2}
-            if weather_condition.temperature < 0:
-                warmth_modifier = {"loss_rate": 0.4}
-            
-            effects.append({
-                **base_effect,
-                "effect_type": "WARMTH_LOSS",
-                "modifier_value": warmth_modifier,
-                "description": "Warmth drains quickly in the cold temperature"
-            })
-        
-        elif weather_condition.temperature > 30:
-            # Hot weather
-            comfort_modifier = {"decrease_rate": 0.2}
-            
-            effects.append({
-                **base_effect,
-                "effect_type": "COMFORT_DECREASE",
-                "modifier_value": comfort_modifier,
-                "description": "Comfort decreases in the oppressive heat"
-            })
-        
-        # Combat advantage for certain weather types
-        if weather_type in ["THUNDERSTORM", "BLIZZARD", "DUST_STORM"]:
-            advantage_modifier = {"concealment_bonus": 0.3}
-            
-            effects.append({
-                **base_effect,
-                "effect_type": "COMBAT_ADVANTAGE",
-                "modifier_value": advantage_modifier,
-                "description": f"The {weather_type.lower().replace('_', ' ')} provides concealment in combat"
-            })
-        
-        # Spell effectiveness modifications
-        if weather_type in ["THUNDERSTORM", "HEAVY_RAIN", "HEAVY_SNOW", "BLIZZARD"]:
-            # Define which types of magic are enhanced or weakened
-            spell_modifier = {}
-            
-            if weather_type == "THUNDERSTORM":
-                spell_modifier = {
-                    "lightning_boost": 0.3,
-                    "fire_penalty": 0.2
-                }
-            elif weather_type in ["HEAVY_RAIN", "HEAVY_SNOW", "BLIZZARD"]:
-                spell_modifier = {
-                    "water_boost": 0.2,
-                    "ice_boost": 0.3 if weather_type in ["HEAVY_SNOW", "BLIZZARD"] else 0.1,
-                    "fire_penalty": 0.3
-                }
-            
-            effects.append({
-                **base_effect,
-                "effect_type": "SPELL_EFFECTIVENESS",
-                "modifier_value": spell_modifier,
-                "description": f"The {weather_type.lower().replace('_', ' ')} affects magical energies"
-            })
-        
-        # Perception penalties
-        if weather_condition.visibility in ["POOR", "VERY_POOR"]:
-            perception_modifier = {"penalty": 0.3}
-            if weather_condition.visibility == "VERY_POOR":
-                perception_modifier = {"penalty": 0.5}
-            
-            effects.append({
-                **base_effect,
-                "effect_type": "PERCEPTION_PENALTY",
-                "modifier_value": perception_modifier,
-                "description": "Poor visibility makes it difficult to notice details"
-            })
-        
-        return effects
+        return build_regional_weather_effects(
+            weather_condition.id,
+            weather_condition.timestamp,
+            end_time,
+            weather_condition.weather_type.value,
+            weather_condition.precipitation_type.value,
+            weather_condition.temperature,
+            weather_condition.visibility.value
+        )
     
     def _end_active_weather_effects(self, old_condition_id: int, new_timestamp: datetime) -> None:
         """
@@ -1300,6 +1404,26 @@ class WeatherService:
         
         self.db.commit()
     
+    def _end_active_weather_effects_bulk(self, old_condition_ids: List[int], new_timestamp: datetime) -> None:
+        """
+        End active weather effects from many previous conditions in one update.
+        
+        The caller commits.
+        
+        Args:
+            old_condition_ids: IDs of the previous weather conditions
+            new_timestamp: Timestamp when the new conditions begin
+        """
+        if not old_condition_ids:
+            return
+        
+        self.db.query(DBActiveWeatherEffect)\
+            .filter(
+                DBActiveWeatherEffect.weather_condition_id.in_(old_condition_ids),
+                DBActiveWeatherEffect.calculated_end_time > new_timestamp
+            )\
+            .update({DBActiveWeatherEffect.calculated_end_time: new_timestamp}, synchronize_session=False)
+    
     def _get_all_configured_regions(self) -> List[str]:
         """
         Get all regions that have weather patterns configured.
@@ -1336,7 +1460,8 @@ class WeatherService:
         """
         logger.info(f"Season changed to {event.context.get('new_season')}")
         
-        # Season changes always trigger weather updates
+        # Season changes always trigger weather updates, from a fresh forecast
+        self.forecaster.invalidate()
         self.update_weather_for_all_regions()
     
     def _publish_weather_change_event(
@@ -1352,18 +1477,30 @@ class WeatherService:
             previous_condition: The previous weather condition, if any
         """
         # Convert to Pydantic models for the event payload
-        new_pydantic = WeatherConditionPydantic.from_orm(new_condition)
-        previous_pydantic = None
-        if previous_condition:
-            previous_pydantic = WeatherConditionPydantic.from_orm(previous_condition)
+        self._publish_weather_change(
+            WeatherConditionPydantic.from_orm(new_condition),
+            WeatherConditionPydantic.from_orm(previous_condition) if previous_condition else None
+        )
+    
+    def _publish_weather_change(
+        self,
+        new_pydantic: WeatherConditionPydantic,
+        previous_pydantic: Optional[WeatherConditionPydantic]
+    ) -> None:
+        """
+        Publish a weather change event for already converted conditions.
         
+        Args:
+            new_pydantic: The new weather condition
+            previous_pydantic: The previous weather condition, if any
+        """
         # Create and publish the event
         event = GameEvent(
             event_type=EventType.WEATHER_CHANGE,
             source_id="weather_service",
-            target_id=new_condition.region_id,
+            target_id=new_pydantic.region_id,
             context={
-                "region_id": new_condition.region_id,
+                "region_id": new_pydantic.region_id,
                 "previous_weather_condition": previous_pydantic.dict() if previous_pydantic else None,
                 "current_weather_condition": new_pydantic.dict()
             }
@@ -1391,25 +1528,13 @@ class WeatherService:
         if cached:
             try:
                 data = json.loads(cached)
-                # Convert the dictionary back to a DBWeatherCondition
-                condition = DBWeatherCondition()
                 
-                # Set attributes from the cached data
-                for attr, value in data.items():
-                    if attr == "timestamp" and value:
-                        value = datetime.fromisoformat(value)
-                    elif attr == "weather_type" and value:
-                        value = WeatherType(value)
-                    elif attr == "wind_direction" and value:
-                        value = WindDirection(value)
-                    elif attr == "precipitation_type" and value:
-                        value = PrecipitationType(value)
-                    elif attr == "visibility" and value:
-                        value = VisibilityLevel(value)
-                    
-                    setattr(condition, attr, value)
+                # Convert the dictionary back to a DBWeatherCondition in one construction
+                for attr, convert in _CACHED_CONDITION_CONVERTERS.items():
+                    if data.get(attr):
+                        data[attr] = convert(data[attr])
                 
-                return condition
+                return DBWeatherCondition(**data)
             
             except Exception as e:
                 logger.error(f"Error deserializing cached weather condition: {e}")
@@ -1499,6 +1624,151 @@ class WeatherService:
         except Exception as e:
             logger.error(f"Error caching weather pattern: {e}")
             
+def build_regional_weather_effects(
+    weather_condition_id: int,
+    start_time: datetime,
+    end_time: datetime,
+    weather_type: str,
+    precipitation_type: str,
+    temperature: float,
+    visibility: str
+) -> List[Dict[str, Any]]:
+    """
+    Build the regional effect rows for a weather condition.
+    
+    Args:
+        weather_condition_id: ID of the weather condition
+        start_time: When the condition begins
+        end_time: When the effects should end
+        weather_type: The weather type
+        precipitation_type: The precipitation type
+        temperature: The temperature
+        visibility: The visibility level
+        
+    Returns:
+        List of weather effect data dictionaries
+    """
+    effects = []
+    
+    # Common effect data
+    base_effect = {
+        "weather_condition_id": weather_condition_id,
+        "start_time": start_time,
+        "calculated_end_time": end_time,
+    }
+    
+    # Movement effects
+    if weather_type in ["HEAVY_RAIN", "HEAVY_SNOW", "BLIZZARD"]:
+        movement_modifier = {"multiplier": 0.5}  # 50% slower
+        if weather_type == "BLIZZARD":
+            movement_modifier = {"multiplier": 0.3}  # 70% slower
+        
+        effects.append({
+            **base_effect,
+            "effect_type": "MOVEMENT_PENALTY",
+            "modifier_value": movement_modifier,
+            "description": f"Movement slowed due to {weather_type.lower().replace('_', ' ')}"
+        })
+    
+    # Visibility effects
+    if weather_type in ["FOG", "HEAVY_RAIN", "HEAVY_SNOW", "BLIZZARD", "DUST_STORM"]:
+        visibility_modifier = {"range_reduction": 0.5}  # 50% reduction
+        if weather_type in ["BLIZZARD", "DUST_STORM"]:
+            visibility_modifier = {"range_reduction": 0.8}  # 80% reduction
+        
+        effects.append({
+            **base_effect,
+            "effect_type": "VISIBILITY_REDUCTION",
+            "modifier_value": visibility_modifier,
+            "description": f"Visibility reduced due to {weather_type.lower().replace('_', ' ')}"
+        })
+    
+    # Resource gathering effects
+    if precipitation_type != "NONE" or weather_type in ["WINDY", "GALE"]:
+        resource_modifier = {"difficulty_increase": 0.3}  # 30% harder
+        
+        effects.append({
+            **base_effect,
+            "effect_type": "RESOURCE_GATHERING_DIFFICULTY",
+            "modifier_value": resource_modifier,
+            "description": f"Resource gathering more difficult due to {weather_type.lower().replace('_', ' ')}"
+        })
+    
+    # Comfort/warmth effects for extreme temperatures
+    if temperature < 5:
+        # Cold weather
+        warmth_modifier = {"loss_rate": 0.2}
+        if temperature < 0:
+            warmth_modifier = {"loss_rate": 0.4}
+        
+        effects.append({
+            **base_effect,
+            "effect_type": "WARMTH_LOSS",
+            "modifier_value": warmth_modifier,
+            "description": "Warmth drains quickly in the cold temperature"
+        })
+    
+    elif temperature > 30:
+        # Hot weather
+        comfort_modifier = {"decrease_rate": 0.2}
+        
+        effects.append({
+            **base_effect,
+            "effect_type": "COMFORT_DECREASE",
+            "modifier_value": comfort_modifier,
+            "description": "Comfort decreases in the oppressive heat"
+        })
+    
+    # Combat advantage for certain weather types
+    if weather_type in ["THUNDERSTORM", "BLIZZARD", "DUST_STORM"]:
+        advantage_modifier = {"concealment_bonus": 0.3}
+        
+        effects.append({
+            **base_effect,
+            "effect_type": "COMBAT_ADVANTAGE",
+            "modifier_value": advantage_modifier,
+            "description": f"The {weather_type.lower().replace('_', ' ')} provides concealment in combat"
+        })
+    
+    # Spell effectiveness modifications
+    if weather_type in ["THUNDERSTORM", "HEAVY_RAIN", "HEAVY_SNOW", "BLIZZARD"]:
+        # Define which types of magic are enhanced or weakened
+        spell_modifier = {}
+        
+        if weather_type == "THUNDERSTORM":
+            spell_modifier = {
+                "lightning_boost": 0.3,
+                "fire_penalty": 0.2
+            }
+        elif weather_type in ["HEAVY_RAIN", "HEAVY_SNOW", "BLIZZARD"]:
+            spell_modifier = {
+                "water_boost": 0.2,
+                "ice_boost": 0.3 if weather_type in ["HEAVY_SNOW", "BLIZZARD"] else 0.1,
+                "fire_penalty": 0.3
+            }
+        
+        effects.append({
+            **base_effect,
+            "effect_type": "SPELL_EFFECTIVENESS",
+            "modifier_value": spell_modifier,
+            "description": f"The {weather_type.lower().replace('_', ' ')} affects magical energies"
+        })
+    
+    # Perception penalties
+    if visibility in ["POOR", "VERY_POOR"]:
+        perception_modifier = {"penalty": 0.3}
+        if visibility == "VERY_POOR":
+            perception_modifier = {"penalty": 0.5}
+        
+        effects.append({
+            **base_effect,
+            "effect_type": "PERCEPTION_PENALTY",
+            "modifier_value": perception_modifier,
+            "description": "Poor visibility makes it difficult to notice details"
+        })
+    
+    return effects
+
 # Optional: Create Celery task for updating weather
 @celery_app.task
 def update_weather_task(game_id: str) -> Dict[str, Any]:
@@ -0,0 +1,104 @@
+"""
+Benchmark for hybrid BM25 + dense knowledge retrieval.
+
+Indexes the knowledge base, then runs two query sets against dense-only
+retrieval and the hybrid retriever: exact section names (item and recipe
+lookups) and lines quoted from section bodies (descriptive queries). Reports
+recall@1/@5 and p50/p95 latency per query set, plus a repeated pass served
+from the query cache. The offline hashing embedder is used unless --model is
+given; --embed-cost simulates a model's per-query encoding time.
+
+Usage:
+    python backend/scripts/benchmark_hybrid_retrieval.py [--model all-MiniLM-L6-v2] [--embed-cost 0.005]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.src.text_parser.hybrid_retriever import HybridRetriever, recall_at_k
+from backend.src.text_parser.knowledge_index import (
+    HashingEmbedder,
+    KnowledgeIndex,
+    KnowledgeIngestionEngine,
+    SentenceTransformerEmbedder,
+)
+
+
+class CostedEmbedder:
+    """Wraps an embedder, sleeping per text to stand in for model inference."""
+
+    def __init__(self, embedder, cost):
+        self.embedder = embedder
+        self.cost = cost
+        self.name = embedder.name
+
+    def encode(self, texts):
+        time.sleep(self.cost * len(texts))
+        return self.embedder.encode(texts)
+
+
+def build_queries(index, rng):
+    names, descriptions = [], []
+    for chunk_id, metadata, text in zip(index.ids, index.metadata, index.texts):
+        if metadata["heading"]:
+            names.append((metadata["heading"].split(" > ")[-1], chunk_id))
+        lines = [line.strip("-* ").strip() for line in text.splitlines()[2:]]
+        lines = [line for line in lines if len(line.split()) >= 5]
+        if lines:
+            descriptions.append((rng.choice(lines), chunk_id))
+    return {"section names": names, "descriptions": descriptions}
+
+
+def run(retrieve, queries):
+    results, latencies = [], []
+    for query, _ in queries:
+        started = time.perf_counter()
+        results.append(retrieve(query))
+        latencies.append(time.perf_counter() - started)
+    expected = [chunk_id for _, chunk_id in queries]
+    latencies = np.array(latencies) * 1000
+    return (recall_at_k(results, expected, 1), recall_at_k(results, expected, 5),
+            np.percentile(latencies, 50), np.percentile(latencies, 95))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default=None, help="sentence-transformers model (default: hashing stub)")
+    parser.add_argument("--embed-cost", type=float, default=0.0, help="simulated seconds per encoded query")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    base_embedder = SentenceTransformerEmbedder(args.model) if args.model else HashingEmbedder()
+
+    with tempfile.TemporaryDirectory(prefix="kb-hybrid-") as workdir:
+        index_path = Path(workdir) / "index.sqlite3"
+        KnowledgeIngestionEngine(base_embedder, index_path).ingest()
+        embedder = CostedEmbedder(base_embedder, args.embed_cost) if args.embed_cost else base_embedder
+        index = KnowledgeIndex.open(embedder, index_path)
+
+    retriever = HybridRetriever(index)
+    print(f"{len(index)} chunks, embedder {base_embedder.name}, simulated encode cost {args.embed_cost * 1000:.1f}ms")
+    print(f"{'query set':<16} {'path':<14} {'recall@1':>9} {'recall@5':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for name, queries in build_queries(index, random.Random(args.seed)).items():
+        rows = [("dense only", run(lambda q: retriever.retrieve_dense(q, 5), queries))]
+        retriever.clear_cache()
+        rows.append(("hybrid", run(lambda q: retriever.retrieve(q, 5), queries)))
+        rows.append(("hybrid cached", run(lambda q: retriever.retrieve(q, 5), queries)))
+        for path, (recall1, recall5, p50, p95) in rows:
+            print(f"{name:<16} {path:<14} {recall1:>9.3f} {recall5:>9.3f} {p50:>8.3f} {p95:>8.3f}")
+    print(f"retriever stats: {retriever.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Benchmark for IntelligentCache at large sizes.
+
+Fills the cache with N tagged entries (100,000 by default) and measures hit
+latency and traced memory for the current IntelligentCache and for the
+previous list-based implementation (reproduced below for comparison). The
+list-based cache spends O(n) per hit and insert, so it is filled directly
+and timed on fewer lookups. Fill times are measured under tracemalloc.
+
+Usage:
+    python backend/scripts/benchmark_intelligent_cache.py [--entries 100000] [--hits 100000] [--legacy-hits 2000]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.src.ai_gm.optimizations.performance_optimizer import IntelligentCache
+
+
+@dataclass
+class LegacyCacheEntry:
+    data: Any
+    timestamp: datetime
+    ttl_seconds: int
+    access_count: int = 0
+    last_accessed: datetime = field(default_factory=datetime.utcnow)
+
+    def is_expired(self) -> bool:
+        return datetime.utcnow() > (self.timestamp + timedelta(seconds=self.ttl_seconds))
+
+    def access(self) -> Any:
+        self.access_count += 1
+        self.last_accessed = datetime.utcnow()
+        return self.data
+
+
+class LegacyIntelligentCache:
+    """The list-based LRU IntelligentCache this benchmark compares against."""
+
+    def __init__(self, max_size: int = 1000, default_ttl: int = 300):
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.cache: Dict[str, LegacyCacheEntry] = {}
+        self.access_order: List[str] = []
+
+    def get(self, key: str) -> Optional[Any]:
+        if key not in self.cache:
+            return None
+        entry = self.cache[key]
+        if entry.is_expired():
+            del self.cache[key]
+            if key in self.access_order:
+                self.access_order.remove(key)
+            return None
+        if key in self.access_order:
+            self.access_order.remove(key)
+        self.access_order.append(key)
+        return entry.access()
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags=None) -> None:
+        if len(self.cache) >= self.max_size:
+            lru_key = self.access_order.pop(0)
+            self.cache.pop(lru_key, None)
+        if len(self.cache) % 100 == 0:
+            for expired in [k for k, e in self.cache.items() if e.is_expired()]:
+                del self.cache[expired]
+                if expired in self.access_order:
+                    self.access_order.remove(expired)
+        self.cache[key] = LegacyCacheEntry(data=value, timestamp=datetime.utcnow(), ttl_seconds=ttl or self.default_ttl)
+        if key in self.access_order:
+            self.access_order.remove(key)
+        self.access_order.append(key)
+
+
+def fill(cache_class, entries, tagged=True):
+    gc.collect()
+    tracemalloc.start()
+    cache = cache_class(max_size=entries, default_ttl=3600)
+    if cache_class is LegacyIntelligentCache:
+        # Its set() is O(n), so build the same structures set() would produce
+        for i in range(entries):
+            cache.cache[f"key-{i}"] = LegacyCacheEntry(data={"reaction": i}, timestamp=datetime.utcnow(),
+                                                       ttl_seconds=3600)
+            cache.access_order.append(f"key-{i}")
+    else:
+        for i in range(entries):
+            tags = (f"player:{i % 500}", f"entity:npc_{i % 2000}") if tagged else None
+            cache.set(f"key-{i}", {"reaction": i}, tags=tags)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cache, memory
+
+
+def time_hits(cache, entries, hits, rng):
+    keys = [f"key-{rng.randrange(entries)}" for _ in range(hits)]
+    started = time.perf_counter()
+    for key in keys:
+        cache.get(key)
+    return (time.perf_counter() - started) / hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--hits", type=int, default=100_000)
+    parser.add_argument("--legacy-hits", type=int, default=2_000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    for name, cache_class, hits, tagged in (("legacy", LegacyIntelligentCache, args.legacy_hits, False),
+                                            ("current (untagged)", IntelligentCache, args.hits, False),
+                                            ("current (2 tags)", IntelligentCache, args.hits, True)):
+        started = time.perf_counter()
+        cache, memory = fill(cache_class, args.entries, tagged)
+        fill_time = time.perf_counter() - started
+        per_hit = time_hits(cache, args.entries, hits, rng)
+        print(f"{name:<18} fill {fill_time:7.3f}s  hit {per_hit * 1e6:9.2f}us  memory {memory / 2**20:7.1f} MiB")
+
+    cache, _ = fill(IntelligentCache, args.entries)
+    started = time.perf_counter()
+    removed = cache.invalidate_tags(["player:7", "entity:npc_7"], match_all=True)
+    print(f"invalidate_tags(player:7 & entity:npc_7): {removed} entries in "
+          f"{(time.perf_counter() - started) * 1e6:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark for cold versus warm start of the knowledge base vector index.
+
+Cold start ingests the whole knowledge base into an empty store (every chunk
+embedded) and opens it; warm start re-runs ingestion against the existing
+store (nothing re-embedded) and opens it, as each parser worker does. A
+single-section edit is also timed. The offline hashing embedder is used
+unless --model is given; pass --embed-cost to simulate a model's per-chunk
+embedding time.
+
+Usage:
+    python backend/scripts/benchmark_knowledge_index.py [--model all-MiniLM-L6-v2] [--embed-cost 0.002]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.src.text_parser.knowledge_index import (
+    DEFAULT_KNOWLEDGE_BASE_DIR,
+    HashingEmbedder,
+    KnowledgeIndex,
+    KnowledgeIngestionEngine,
+    SentenceTransformerEmbedder,
+)
+
+
+class CostedEmbedder:
+    """Wraps an embedder, sleeping per text to stand in for model inference."""
+
+    def __init__(self, embedder, cost):
+        self.embedder = embedder
+        self.cost = cost
+        self.name = embedder.name
+
+    def encode(self, texts):
+        time.sleep(self.cost * len(texts))
+        return self.embedder.encode(texts)
+
+
+def start(embedder, index_path, kb_dir):
+    started = time.perf_counter()
+    report = KnowledgeIngestionEngine(embedder, index_path, kb_dir).ingest()
+    index = KnowledgeIndex.open(embedder, index_path)
+    index.query("smelt iron ingot")
+    return time.perf_counter() - started, report, len(index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default=None, help="sentence-transformers model (default: hashing stub)")
+    parser.add_argument("--embed-cost", type=float, default=0.0, help="simulated seconds per embedded chunk")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    embedder = SentenceTransformerEmbedder(args.model) if args.model else HashingEmbedder()
+    if args.embed_cost:
+        embedder = CostedEmbedder(embedder, args.embed_cost)
+
+    workdir = Path(tempfile.mkdtemp(prefix="kb-bench-"))
+    try:
+        kb_dir = workdir / "knowledge_base"
+        shutil.copytree(DEFAULT_KNOWLEDGE_BASE_DIR, kb_dir)
+        index_path = workdir / "index.sqlite3"
+
+        cold, report, chunks = start(embedder, index_path, kb_dir)
+        print(f"cold start: {cold:.3f}s ({report.embedded} chunks embedded, {chunks} indexed)")
+
+        warm, report, _ = start(embedder, index_path, kb_dir)
+        print(f"warm start: {warm:.3f}s ({report.embedded} chunks embedded)")
+
+        edited = next(kb_dir.rglob("*.md"))
+        edited.write_text(edited.read_text(encoding="utf-8") + "\n\n## Benchmark Addendum\n\nA new section.\n",
+                          encoding="utf-8")
+        edit, report, _ = start(embedder, index_path, kb_dir)
+        print(f"after one-section edit: {edit:.3f}s ({report.embedded} chunks embedded)")
+        print(f"warm/cold speedup: {cold / warm:.1f}x")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Micro-benchmark for the metrics registry.
+
+Measures the per-observation cost of counter increments, histogram
+observations, the timing context manager, and the timing decorator on sync
+and async functions (net of an undecorated call), in nanoseconds.
+
+Usage:
+    python backend/scripts/benchmark_metrics_overhead.py [--iterations 1000000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.src.shared.metrics import MetricsRegistry
+
+
+def per_call(func, iterations: int) -> float:
+    """Best-of-three nanoseconds per iteration of func(iterations)"""
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        func(iterations)
+        best = min(best, time.perf_counter() - started)
+    return best / iterations * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    registry = MetricsRegistry()
+    counter = registry.counter("bench_total", subsystem="bench")
+    histogram = registry.histogram("bench_seconds", subsystem="bench")
+
+    def plain(): return None
+    timed_plain = registry.timed("bench_call_seconds", subsystem="bench")(plain)
+
+    async def plain_async(): return None
+    timed_async = registry.timed("bench_async_seconds", subsystem="bench")(plain_async)
+
+    def loop_empty(n):
+        for _ in range(n):
+            pass
+
+    def loop_counter(n):
+        for _ in range(n):
+            counter.inc()
+
+    def loop_observe(n):
+        for i in range(n):
+            histogram.observe(i * 1e-7)
+
+    def loop_context(n):
+        timer = histogram.time()
+        for _ in range(n):
+            with timer:
+                pass
+
+    def loop_lookup(n):
+        for _ in range(n):
+            registry.histogram("bench_seconds", subsystem="bench")
+
+    def loop_plain(n):
+        for _ in range(n):
+            plain()
+
+    def loop_decorated(n):
+        for _ in range(n):
+            timed_plain()
+
+    def loop_plain_async(n):
+        async def run():
+            for _ in range(n):
+                await plain_async()
+        asyncio.run(run())
+
+    def loop_decorated_async(n):
+        async def run():
+            for _ in range(n):
+                await timed_async()
+        asyncio.run(run())
+
+    empty = per_call(loop_empty, args.iterations)
+    results = {
+        "counter.inc()": per_call(loop_counter, args.iterations) - empty,
+        "histogram.observe()": per_call(loop_observe, args.iterations) - empty,
+        "with histogram.time()": per_call(loop_context, args.iterations) - empty,
+        "registry.histogram() lookup": per_call(loop_lookup, args.iterations) - empty,
+        "@timed sync (net)": per_call(loop_decorated, args.iterations) - per_call(loop_plain, args.iterations),
+        "@timed async (net)": (per_call(loop_decorated_async, args.iterations)
+                               - per_call(loop_plain_async, args.iterations)),
+    }
+    for name, nanoseconds in results.items():
+        print(f"{name:<28} {nanoseconds:8.0f} ns")
+    print(f"observed p99 of histogram: {histogram.quantile(0.99):.6f}s over {histogram.count} observations")
+
+
+if __name__ == "__main__":
+    main()
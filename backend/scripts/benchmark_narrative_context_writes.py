@@ -0,0 +1,121 @@
+"""
+Benchmark for NarrativeContextManager persistence.
+
+Seeds contexts of realistic size (hundreds of events and player choices,
+dozens of characters, locations and relationships), then applies a mix of
+small updates (adding events, adjusting tension, recording choices)
+against a JSON-file storage service. Compares write-through, where every
+update saves the whole context as before (max_pending_updates=1), with
+the default write-behind settings, and reports updates per second and
+saves issued.
+
+Usage:
+    python backend/scripts/benchmark_narrative_context_writes.py [--contexts 200] [--events 300] [--updates 20000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.src.narrative_engine.narrative_context_manager import NarrativeContext, NarrativeContextManager
+
+
+class JsonFileStorage:
+    """One JSON file per context, replaced atomically on every save"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.saves = 0
+        self.bytes_written = 0
+
+    def _path(self, context_id: str) -> str:
+        return os.path.join(self.directory, f"{context_id}.json")
+
+    def save_narrative_context(self, context_id, context_dict):
+        data = json.dumps(context_dict)
+        tmp_path = self._path(context_id) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, self._path(context_id))
+        self.saves += 1
+        self.bytes_written += len(data)
+
+    def load_narrative_context(self, context_id):
+        try:
+            with open(self._path(context_id), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+
+def seed_context(context_id: str, events: int, rng: random.Random) -> dict:
+    context = NarrativeContext(context_id)
+    for i in range(30):
+        context.update_character(f"npc_{i}", {"name": f"Npc {i}", "mood": rng.choice(["calm", "wary"]),
+                                              "notes": "Keeps to the tavern after dark." * 2})
+    for i in range(20):
+        context.update_location(f"loc_{i}", {"name": f"Location {i}", "visited": rng.random() < 0.5})
+    for i in range(50):
+        context.update_relationship(f"npc_{i % 30}", f"npc_{(i * 7) % 30 + 30}", {"trust": rng.random()})
+    for i in range(events):
+        context.add_event({"type": "player_action", "description": f"The player did thing {i} in the market.",
+                           "location": f"loc_{i % 20}"})
+    for i in range(events // 3):
+        context.add_player_choice({"choice": f"option {i % 4}", "prompt": "What do you do?"})
+    return context.to_dict()
+
+
+def run(label: str, contexts: int, events: int, updates: int, seed: int, **manager_kwargs) -> None:
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory(prefix="narrative_bench_") as directory:
+        storage = JsonFileStorage(directory)
+        for i in range(contexts):
+            data = seed_context(f"ctx-{i}", events, rng)
+            storage.save_narrative_context(data["id"], data)
+        context_bytes = storage.bytes_written // contexts
+        storage.saves = storage.bytes_written = 0
+
+        manager = NarrativeContextManager(storage, **manager_kwargs)
+        context_ids = [f"ctx-{i}" for i in range(contexts)]
+        for context_id in context_ids:
+            manager.get_context(context_id)
+
+        started = time.perf_counter()
+        for i in range(updates):
+            context_id = rng.choice(context_ids)
+            kind = i % 3
+            if kind == 0:
+                manager.add_event_to_context(context_id, {"type": "player_action", "description": f"update {i}"})
+            elif kind == 1:
+                manager.update_context(context_id, lambda c: c.adjust_tension(rng.uniform(-0.05, 0.05)))
+            else:
+                manager.update_context(context_id, lambda c: c.add_player_choice({"choice": f"option {i % 4}"}))
+        update_time = time.perf_counter() - started
+        manager.close()
+        total_time = time.perf_counter() - started
+
+    print(f"{label:<14} {updates / update_time:10.0f} updates/s  ({updates / total_time:8.0f}/s incl. final flush)  "
+          f"saves {storage.saves:6d}  written {storage.bytes_written / 2 ** 20:8.1f} MiB  "
+          f"context ~{context_bytes / 1024:.0f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--contexts", type=int, default=200)
+    parser.add_argument("--events", type=int, default=300, help="Events already in each context")
+    parser.add_argument("--updates", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    run("write-through", args.contexts, args.events, args.updates, args.seed, max_pending_updates=1)
+    run("write-behind", args.contexts, args.events, args.updates, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Benchmark for the per-player reputation store.
+
+Simulates many players (2,000 by default) taking turns in scenes with
+hundreds of NPCs each, backed by a fake database that charges a fixed
+round-trip time per query. Compares the current ReputationManager (batched
+load_many, cached misses, bounded per-player partitions) with the previous
+flat-dict store (reproduced below), which issued one query per entity and
+never cached entities without a record. Reports turn latency, database
+queries and the number of entries each store keeps cached.
+
+Usage:
+    python backend/scripts/benchmark_reputation_store.py [--players 2000] [--npcs 300] [--turns 5000] [--round-trip-us 50]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.src.ai_gm.world_reaction.reputation_manager import (
+    ReputationEntry,
+    ReputationLevel,
+    ReputationManager,
+)
+
+
+def busy_wait(seconds: float) -> None:
+    # time.sleep() is far too coarse for tens of microseconds
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class FakeReputationDB:
+    """Reputation records per player; every query costs one round trip"""
+
+    def __init__(self, records: Dict[str, Dict[str, Dict[str, Any]]], round_trip: float):
+        self.records = records
+        self.round_trip = round_trip
+        self.queries = 0
+
+    def load_reputation(self, player_id: str, entity_id: str) -> Optional[Dict[str, Any]]:
+        self.queries += 1
+        busy_wait(self.round_trip)
+        return self.records.get(player_id, {}).get(entity_id)
+
+    def load_reputations(self, player_id: str, entity_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        self.queries += 1
+        busy_wait(self.round_trip)
+        stored = self.records.get(player_id, {})
+        return {entity_id: stored[entity_id] for entity_id in entity_ids if entity_id in stored}
+
+
+class LegacyReputationStore:
+    """The flat-dict lookup path of the previous ReputationManager"""
+
+    def __init__(self, db_service):
+        self.db_service = db_service
+        self.reputation_cache: Dict[str, ReputationEntry] = {}
+
+    def get_reputation_with_entity(self, player_id: str, entity_id: str) -> ReputationEntry:
+        cache_key = f"{player_id}_{entity_id}"
+        if cache_key in self.reputation_cache:
+            return self.reputation_cache[cache_key]
+        reputation_data = self.db_service.load_reputation(player_id, entity_id)
+        if reputation_data:
+            entry = ReputationEntry(**reputation_data)
+            self.reputation_cache[cache_key] = entry
+            return entry
+        return ReputationEntry(entity_id=entity_id, entity_name=entity_id.replace('_', ' ').title(),
+                               entity_type='unknown', reputation_level=ReputationLevel.NEUTRAL,
+                               reputation_score=0, last_updated=datetime.utcnow())
+
+    def get_relevant_reputations(self, player_id: str, context: Dict[str, Any]) -> List[ReputationEntry]:
+        relevant = [self.get_reputation_with_entity(player_id, 'global')]
+        entity_ids = [f"location_{context['current_location']}"]
+        entity_ids += [f"faction_{faction}" for faction in context['active_factions']]
+        entity_ids += [f"npc_{npc_id}" for npc_id in context['active_npcs']]
+        for entity_id in entity_ids:
+            rep = self.get_reputation_with_entity(player_id, entity_id)
+            if rep.reputation_level != ReputationLevel.NEUTRAL:
+                relevant.append(rep)
+        return relevant
+
+
+def build_world(players: int, world_npcs: int, known_per_player: int, rng: random.Random):
+    score_to_level = ReputationManager()._score_to_level
+    records = {}
+    for p in range(players):
+        known = {}
+        for npc in rng.sample(range(world_npcs), known_per_player):
+            score = rng.choice([-12, -7, 6, 11, 16])
+            known[f"npc_{npc}"] = {
+                "entity_id": f"npc_{npc}", "entity_name": f"Npc {npc}", "entity_type": "npc",
+                "reputation_level": score_to_level(score),
+                "reputation_score": score, "last_updated": datetime.utcnow()
+            }
+        records[f"player_{p}"] = known
+    return records
+
+
+def build_turns(players: int, world_npcs: int, scene_npcs: int, turns: int, rng: random.Random):
+    locations = [f"district_{i}" for i in range(40)]
+    factions = [f"faction_{i}" for i in range(12)]
+    # Each location has a fixed crowd; a turn sees most of it
+    crowds = {location: rng.sample(range(world_npcs), scene_npcs) for location in locations}
+    active_players = max(1, players // 4)
+    schedule = []
+    for _ in range(turns):
+        # A quarter of the players are active at a time, as in a busy evening
+        player = rng.randrange(active_players) if rng.random() < 0.8 else rng.randrange(players)
+        location = rng.choice(locations)
+        schedule.append((f"player_{player}", {
+            "current_location": location,
+            "active_factions": rng.sample(factions, 3),
+            "active_npcs": crowds[location],
+        }))
+    return schedule
+
+
+def cached_entries(store) -> int:
+    if isinstance(store, LegacyReputationStore):
+        return len(store.reputation_cache)
+    return sum(len(partition.entries) for partition in store._partitions.values())
+
+
+def run(store, db: FakeReputationDB, schedule) -> Dict[str, float]:
+    gc.collect()
+    db.queries = 0
+    latencies = []
+    for player_id, context in schedule:
+        started = time.perf_counter()
+        store.get_relevant_reputations(player_id, context)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return {
+        "mean_ms": sum(latencies) / len(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+        "queries_per_turn": db.queries / len(schedule),
+        "cached_entries": cached_entries(store),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--players", type=int, default=2000)
+    parser.add_argument("--npcs", type=int, default=300, help="NPCs present per scene")
+    parser.add_argument("--world-npcs", type=int, default=5000)
+    parser.add_argument("--known-per-player", type=int, default=40, help="NPCs each player has a record with")
+    parser.add_argument("--turns", type=int, default=5000)
+    parser.add_argument("--max-players", type=int, default=500, help="Partitions kept by the current store")
+    parser.add_argument("--round-trip-us", type=float, default=50.0, help="Simulated cost of one query")
+    parser.add_argument("--legacy-turns", type=int, default=500, help="Turns run against the legacy store")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    records = build_world(args.players, args.world_npcs, args.known_per_player, rng)
+    schedule = build_turns(args.players, args.world_npcs, args.npcs, args.turns, rng)
+    round_trip = args.round_trip_us / 1e6
+    print(f"{args.players} players, {args.npcs} NPCs per scene, {args.turns} turns, "
+          f"{args.round_trip_us:g}us per query")
+
+    for name, store_factory, turns in (
+            ("legacy (flat dict)", LegacyReputationStore, schedule[:args.legacy_turns]),
+            ("current (partitioned)",
+             lambda db: ReputationManager(db_service=db, max_players=args.max_players), schedule)):
+        db = FakeReputationDB(records, round_trip)
+        result = run(store_factory(db), db, turns)
+        print(f"{name:<22} turns {len(turns):6d}  mean {result['mean_ms']:8.3f}ms  p99 {result['p99_ms']:8.3f}ms  "
+              f"queries/turn {result['queries_per_turn']:7.2f}  cached entries {result['cached_entries']:8d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark for compiled narrative template rendering.
+
+Renders N combat and ambient narrations (100,000 by default) with
+TemplateProcessor's regex passes and with compiled templates, checking that
+both produce identical text for the same random seed.
+
+Usage:
+    python backend/scripts/benchmark_template_rendering.py [--renders 100000]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.src.narrative_engine.template_processor import TemplateProcessor
+
+COMBAT_TEMPLATES = [
+    "{actor.name} [[variation]]\nswings at\nlunges toward\ndrives forward against\n[[endvariation]] {target.name}. "
+    "[[if damage > 10]]The blow lands with brutal force, dealing {damage} damage![[else]]"
+    "The strike connects for {damage} damage.[[endif]]",
+    "[[if critical == \"true\"]]A perfect opening! {actor.name}'s {weapon} finds its mark.[[else]]"
+    "{actor.name} trades blows with {target.name}.[[endif]] [[if target_hp < 10]]{target.name} staggers, "
+    "barely standing.[[else]]{target.name} holds firm.[[endif]]",
+    "[[if exists ally]]{ally} covers {actor.name}'s flank as [[else]][[endif]]{actor.name} "
+    "[[variation]]\nparries\nsidesteps\nducks under\n[[endvariation]] the {target.weapon}.",
+]
+
+AMBIENT_TEMPLATES = [
+    "[[if weather == \"rain\"]]Rain drums on the rooftops of {location}.[[else]]"
+    "The {time_of_day} air over {location} is still.[[endif]] [[variation]]\nA dog barks in the distance.\n"
+    "Merchants call out their wares.\nA bell tolls somewhere to the north.\n[[endvariation]]",
+    "[[variation]]\nShadows lengthen across {location}.\nA cool breeze stirs the dust of {location}.\n"
+    "[[endvariation]] [[if danger_level > 5]]Something feels wrong here.[[else]]All seems calm.[[endif]]",
+]
+
+
+def make_variables(rng):
+    return {
+        "actor": {"name": rng.choice(["Kael", "Mira", "Ysolde", "Thorn"])},
+        "target": {"name": rng.choice(["the ogre", "a bandit", "the wraith"]),
+                   "weapon": rng.choice(["axe", "spear", "claws"])},
+        "damage": rng.randint(1, 20),
+        "target_hp": rng.randint(1, 40),
+        "critical": rng.choice(["true", "false"]),
+        "weapon": rng.choice(["blade", "mace", "bow"]),
+        "location": rng.choice(["Greyhaven", "the marsh", "the old keep"]),
+        "weather": rng.choice(["rain", "clear", "fog"]),
+        "time_of_day": rng.choice(["morning", "evening", "night"]),
+        "danger_level": rng.randint(0, 10),
+        **({"ally": "Bram"} if rng.random() < 0.3 else {})
+    }
+
+
+def render_all(render, jobs, seed):
+    random.seed(seed)
+    start = time.perf_counter()
+    output = [render(template, variables) for template, variables in jobs]
+    return output, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--renders", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    rng = random.Random(args.seed)
+    templates = COMBAT_TEMPLATES + AMBIENT_TEMPLATES
+    jobs = [(rng.choice(templates), make_variables(rng)) for _ in range(args.renders)]
+    processor = TemplateProcessor()
+
+    regex_output, regex_elapsed = render_all(processor._process_template_uncompiled, jobs, args.seed)
+    print(f"regex passes: {len(jobs)} renders in {regex_elapsed:.2f}s")
+
+    compiled_output, compiled_elapsed = render_all(processor.process_template, jobs, args.seed)
+    print(f"compiled: {len(jobs)} renders in {compiled_elapsed:.2f}s ({regex_elapsed / compiled_elapsed:.1f}x)")
+
+    identical = regex_output == compiled_output
+    print(f"identical output: {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
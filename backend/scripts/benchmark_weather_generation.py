@@ -0,0 +1,91 @@
+"""
+Benchmark for batched weather generation.
+
+Creates weather patterns for N regions (1,000 by default), then times one
+weather update per region through the per-region path and through the batched
+WeatherService.update_weather_for_all_regions.
+
+Usage:
+    python backend/scripts/benchmark_weather_generation.py [--regions 1000] [--ticks 3]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.models import DBGameTimeState, DBScheduledGameEvent
+from app.models.time_models import GameTimeSettings
+from app.models.weather_models import DBActiveWeatherEffect, DBWeatherCondition, DBWeatherPattern
+from app.services.time_service import TimeService
+from app.services.weather_service import WeatherService
+
+SEASONS = ("SPRING", "SUMMER", "AUTUMN", "WINTER")
+
+
+def create_service(path, regions):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine, tables=[
+        DBGameTimeState.__table__, DBScheduledGameEvent.__table__, DBWeatherPattern.__table__,
+        DBWeatherCondition.__table__, DBActiveWeatherEffect.__table__
+    ])
+    db = sessionmaker(bind=engine)()
+    service = WeatherService(db, TimeService(db, GameTimeSettings(), game_id="weather-benchmark"), seed=1)
+    db.bulk_insert_mappings(DBWeatherPattern, [
+        service._default_weather_pattern_data(f"region_{index:05d}", season)
+        for index in range(regions) for season in SEASONS
+    ])
+    db.commit()
+    return db, service
+
+
+def per_region_update(service):
+    updated = 0
+    for region_id in service._get_all_configured_regions():
+        service._calculate_and_apply_new_weather_for_region(region_id)
+        updated += 1
+    return updated
+
+
+def run(label, regions, ticks, update):
+    with tempfile.TemporaryDirectory() as tmp:
+        db, service = create_service(os.path.join(tmp, "weather.db"), regions)
+        timings = []
+        for _ in range(ticks):
+            start = time.perf_counter()
+            updated = update(service)
+            timings.append(time.perf_counter() - start)
+        conditions = db.query(DBWeatherCondition).count()
+        effects = db.query(DBActiveWeatherEffect).count()
+        db.close()
+
+    best = min(timings)
+    print(f"{label}: {updated} regions/tick, best {best * 1000:.0f} ms "
+          f"({updated / best:,.0f} regions/s); {conditions} conditions, {effects} effects")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--regions", type=int, default=1000)
+    parser.add_argument("--ticks", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    per_region = run("per-region", args.regions, args.ticks, per_region_update)
+    batched = run("batched", args.regions, args.ticks, lambda service: len(service.update_weather_for_all_regions()))
+    print(f"speedup: {per_region / batched:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""
+Incrementally ingest the markdown knowledge base into the persistent vector index.
+
+Chunks data/knowledge_base/**.md by heading and re-embeds only chunks whose
+content changed since the last run. Parser workers open the resulting index
+read-only at startup.
+
+Usage:
+    python backend/scripts/ingest_knowledge_base.py [--kb-dir data/knowledge_base]
+        [--index-path data/knowledge_index/knowledge_base.sqlite3] [--model all-MiniLM-L6-v2] [--stub-embedder]
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.src.text_parser.knowledge_index import (
+    DEFAULT_EMBEDDING_MODEL,
+    DEFAULT_INDEX_PATH,
+    DEFAULT_KNOWLEDGE_BASE_DIR,
+    HashingEmbedder,
+    KnowledgeIngestionEngine,
+    SentenceTransformerEmbedder,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--kb-dir", default=str(DEFAULT_KNOWLEDGE_BASE_DIR))
+    parser.add_argument("--index-path", default=str(DEFAULT_INDEX_PATH))
+    parser.add_argument("--model", default=DEFAULT_EMBEDDING_MODEL, help="sentence-transformers model name")
+    parser.add_argument("--stub-embedder", action="store_true",
+                        help="use the offline hashing embedder instead of a model")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    embedder = HashingEmbedder() if args.stub_embedder else SentenceTransformerEmbedder(args.model)
+    report = KnowledgeIngestionEngine(embedder, args.index_path, args.kb_dir).ingest()
+    print(f"added={report.added} updated={report.updated} unchanged={report.unchanged} "
+          f"removed={report.removed} embedded={report.embedded}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Offline load test for the FastAPI apps.
+
+Starts a stub LLM server, optionally launches the target app in a
+subprocess pointed at it (OPENROUTER_BASE_URL), drives it with scripted
+player sessions at an open-loop arrival rate, and writes a JSON report
+with throughput, error rate and latency percentiles per endpoint. Reports
+from different runs share one schema, so they can be diffed or plotted.
+
+Usage:
+    python backend/scripts/load_test.py --target ai_gm --serve [--players 50] [--rate 20] [--duration 30]
+    python backend/scripts/load_test.py --target game_api --base-url http://127.0.0.1:8000 [--report out.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict
+from datetime import datetime
+from typing import Tuple
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, REPO_ROOT)
+
+from backend.src.load_testing import StubLLMConfig, StubLLMServer, run_load_test
+
+# How to launch each target app with uvicorn
+SERVE_COMMANDS = {
+    "ai_gm": ["advanced_ai_gm_server:app"],
+    "game_api": ["backend.src.api.app:create_app", "--factory"],
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def serve_target(target: str, llm_base_url: str, workdir: str, log_file) -> Tuple[subprocess.Popen, str]:
+    """Launch the target app under uvicorn, logging to log_file; returns the process and its base URL"""
+    port = free_port()
+    env = dict(os.environ,
+               OPENROUTER_BASE_URL=llm_base_url,
+               OPENROUTER_API_KEY=os.environ.get("OPENROUTER_API_KEY", "stub-key"),
+               AI_GM_SESSION_DIR=os.path.join(workdir, "ai_gm_sessions"),
+               PYTHONPATH=REPO_ROOT)
+    command = [sys.executable, "-m", "uvicorn", *SERVE_COMMANDS[target],
+               "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"]
+    process = subprocess.Popen(command, cwd=REPO_ROOT, env=env, stdout=log_file, stderr=subprocess.STDOUT)
+    return process, f"http://127.0.0.1:{port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--target", choices=sorted(SERVE_COMMANDS), default="ai_gm")
+    parser.add_argument("--base-url", help="Test an already running app instead of --serve")
+    parser.add_argument("--serve", action="store_true", help="Launch the target app in a subprocess")
+    parser.add_argument("--players", type=int, default=50)
+    parser.add_argument("--rate", type=float, default=20.0, help="Offered requests per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="Load phase length in seconds")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--llm-ttft-median", type=float, default=0.4)
+    parser.add_argument("--llm-tokens-per-second", type=float, default=60.0)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--report", help="Report path (default load_test_reports/<target>_<timestamp>.json)")
+    args = parser.parse_args()
+    if not args.serve and not args.base_url:
+        parser.error("pass --serve or --base-url")
+
+    path = args.report or os.path.join(
+        "load_test_reports", f"{args.target}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    server_log = os.path.splitext(path)[0] + ".server.log"
+
+    stub = StubLLMServer(StubLLMConfig(ttft_median=args.llm_ttft_median,
+                                       tokens_per_second=args.llm_tokens_per_second,
+                                       error_rate=args.llm_error_rate,
+                                       seed=args.seed))
+    llm_base_url = stub.start_in_thread()
+    process = None
+    with tempfile.TemporaryDirectory(prefix="load_test_") as workdir, open(server_log, "wb") as log_file:
+        try:
+            base_url = args.base_url
+            if args.serve:
+                process, base_url = serve_target(args.target, llm_base_url, workdir, log_file)
+            report = run_load_test(base_url, args.target, players=args.players, rate=args.rate,
+                                   duration=args.duration, timeout=args.timeout, seed=args.seed)
+        except RuntimeError as e:
+            sys.exit(f"Load test failed: {e} (server output in {server_log})")
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait(timeout=30)
+            stub.stop_thread()
+
+    report["stub_llm"] = {**asdict(stub.config), "base_url": llm_base_url, **stub.stats}
+    report["environment"] = {
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "served_by_harness": bool(args.serve)
+    }
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    summary = report["summary"]
+    print(f"{args.target}: {summary['requests']} requests in {summary['elapsed_s']:.1f}s "
+          f"({summary['throughput_rps']:.1f} rps offered {args.rate:g}), "
+          f"error rate {summary['error_rate']:.2%}, "
+          f"p50 {summary['latency_ms']['p50']:.1f}ms p95 {summary['latency_ms']['p95']:.1f}ms "
+          f"p99 {summary['latency_ms']['p99']:.1f}ms")
+    for endpoint, stats in report["endpoints"].items():
+        print(f"  {endpoint:<55} n={stats['requests']:<6} err={stats['error_rate']:6.2%} "
+              f"p50={stats['latency_ms']['p50']:8.1f}ms p99={stats['latency_ms']['p99']:8.1f}ms")
+    print(f"Report written to {path}")
+
+
+if __name__ == "__main__":
+    main()
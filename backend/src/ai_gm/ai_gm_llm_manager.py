@@ -41,7 +41,7 @@ class LLMInteractionManager:
         
         # API configuration
         self.api_key = os.environ.get('OPENROUTER_API_KEY')
-        self.api_base_url = "https://openrouter.ai/api/v1"
+        self.api_base_url = os.environ.get('OPENROUTER_BASE_URL', "https://openrouter.ai/api/v1")
         self.default_model = "openai/gpt-4o"
         
         # Cost optimization
@@ -6,16 +6,20 @@ focusing on async processing, caching, batching, and concurrent execution strate
 """
 
 import asyncio
+import heapq
 import time
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple, Callable, Union
+import sys
+from datetime import datetime
+from typing import Dict, Any, FrozenSet, Iterable, List, Optional, Set, Tuple, Callable, Union
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 import hashlib
 from functools import wraps
 
+from ...shared.metrics import MetricsRegistry, get_metrics_registry
+
 # Performance metrics tracking
 @dataclass
 class PerformanceMetrics:
@@ -42,98 +46,227 @@ class PerformanceMetrics:
         return (self.successful_requests / total_requests * 100) if total_requests > 0 else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
-    """Cache entry with TTL and metadata"""
+    """Cache entry with TTL, tags and metadata"""
     data: Any
     timestamp: datetime
     ttl_seconds: int
     access_count: int = 0
-    last_accessed: datetime = field(default_factory=datetime.utcnow)
+    last_accessed: float = field(default_factory=time.monotonic)
+    tags: FrozenSet[str] = frozenset()
+    expires_at: float = 0.0
+    
+    def __post_init__(self):
+        if not self.expires_at:
+            self.expires_at = time.monotonic() + self.ttl_seconds
     
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """Check if cache entry has expired"""
-        return datetime.utcnow() > (self.timestamp + timedelta(seconds=self.ttl_seconds))
+        return (time.monotonic() if now is None else now) >= self.expires_at
     
-    def access(self) -> Any:
+    def access(self, now: Optional[float] = None) -> Any:
         """Access cache entry and update metadata"""
         self.access_count += 1
-        self.last_accessed = datetime.utcnow()
+        self.last_accessed = time.monotonic() if now is None else now
         return self.data
 
 
+class StubBatchBackend:
+    """
+    Local batch backend that answers without an upstream call (tests, offline runs)
+    """
+    
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+    
+    async def process_batch(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """Return a placeholder result per request after the simulated latency"""
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return [{'result': f'processed_{i}', 'request': request} for i, request in enumerate(requests)]
+
+
+class LLMRoleplayerBatchBackend:
+    """
+    Batch backend sending each unique prompt of a batch through an LLMRoleplayer
+    
+    Requests carry 'prompt' and optionally 'response_mode' (a ResponseMode) and
+    'complexity'; the calls of a batch are issued concurrently.
+    """
+    
+    def __init__(self, roleplayer: Any):
+        self.roleplayer = roleplayer
+    
+    async def process_batch(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """Generate one response per request"""
+        calls = []
+        for request in requests:
+            kwargs = {'complexity': request.get('complexity', 'standard')}
+            if request.get('response_mode') is not None:
+                kwargs['mode'] = request['response_mode']
+            calls.append(self.roleplayer.generate_response_async(request['prompt'], **kwargs))
+        return await asyncio.gather(*calls)
+
+
 class AsyncBatchProcessor:
     """
-    Advanced batching system for LLM API calls with intelligent grouping
+    Micro-batching system for LLM API calls with intelligent grouping
+    
+    Requests arriving within one window are queued and flushed together, either
+    when batch_size unique requests are pending or when the window's single
+    timer fires. Identical requests within a window share one upstream call.
+    Batch latency goes to the ai_gm_llm_batch_seconds histogram of the
+    metrics registry.
     """
     
     def __init__(self, 
                  batch_size: int = 5,
                  batch_timeout: float = 1.0,
-                 max_concurrent_batches: int = 3):
+                 max_concurrent_batches: int = 3,
+                 backend: Optional[Any] = None,
+                 registry: Optional[MetricsRegistry] = None):
         self.batch_size = batch_size
         self.batch_timeout = batch_timeout
         self.max_concurrent_batches = max_concurrent_batches
-        self.pending_requests = []
+        self.backend = backend or StubBatchBackend()
+        self.pending_requests: deque = deque()
+        self._pending_by_key: Dict[str, Dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: set = set()
         self.batch_semaphore = asyncio.Semaphore(max_concurrent_batches)
+        self.batch_latency = (registry or get_metrics_registry()).histogram(
+            "ai_gm_llm_batch_seconds", "LLM micro-batch latency", subsystem="ai_gm"
+        )
+        self.stats = {
+            'requests': 0,
+            'deduplicated_requests': 0,
+            'batches': 0,
+            'upstream_calls': 0,
+            'failed_batches': 0
+        }
         self.logger = logging.getLogger("AsyncBatchProcessor")
         
     async def add_request(self, request_data: Dict[str, Any]) -> Any:
-        """Add request to batch processing queue"""
-        future = asyncio.Future()
+        """Add request to batch processing queue and wait for its result"""
+        loop = asyncio.get_running_loop()
+        key = self._request_key(request_data)
+        future = loop.create_future()
+        
+        async with self._lock:
+            self.stats['requests'] += 1
+            request_item = self._pending_by_key.get(key)
+            if request_item is not None:
+                # Identical request already queued in this window
+                self.stats['deduplicated_requests'] += 1
+                request_item['futures'].append(future)
+            else:
+                self._enqueue_locked(loop, key, request_data, future)
+        
+        return await future
+    
+    def _enqueue_locked(self, loop, key: str, request_data: Dict[str, Any], future: asyncio.Future) -> None:
         request_item = {
+            'key': key,
             'data': request_data,
-            'future': future,
+            'futures': [future],
             'timestamp': time.time()
         }
-        
         self.pending_requests.append(request_item)
+        self._pending_by_key[key] = request_item
         
-        # Check if we should process batch immediately
         if len(self.pending_requests) >= self.batch_size:
-            asyncio.create_task(self._process_batch())
-        else:
-            # Schedule timeout processing
-            asyncio.create_task(self._schedule_timeout_batch())
-        
-        return await future
+            self._start_batch(self._take_batch_locked())
+            if not self.pending_requests:
+                self._cancel_timer_locked()
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(self.batch_timeout, self._on_flush_timer)
+    
+    async def flush(self) -> None:
+        """Dispatch everything pending now and wait for those batches"""
+        async with self._lock:
+            self._cancel_timer_locked()
+            tasks = []
+            while self.pending_requests:
+                tasks.append(self._start_batch(self._take_batch_locked()))
+        if tasks:
+            await asyncio.gather(*tasks)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching counters and batch latency percentiles"""
+        return {
+            **self.stats,
+            'pending_requests': len(self.pending_requests),
+            'batch_latency_seconds': self.batch_latency.summary()
+        }
+    
+    @staticmethod
+    def _request_key(request_data: Dict[str, Any]) -> str:
+        """Key identifying identical requests (same prompt for the same group)"""
+        key_data = json.dumps(request_data, sort_keys=True, default=str)
+        return hashlib.md5(key_data.encode()).hexdigest()
+    
+    def _take_batch_locked(self) -> List[Dict[str, Any]]:
+        batch = []
+        while self.pending_requests and len(batch) < self.batch_size:
+            request_item = self.pending_requests.popleft()
+            del self._pending_by_key[request_item['key']]
+            batch.append(request_item)
+        return batch
+    
+    def _cancel_timer_locked(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
     
-    async def _process_batch(self):
+    def _on_flush_timer(self) -> None:
+        self._flush_timer = None
+        self._track(asyncio.ensure_future(self.flush()))
+    
+    def _start_batch(self, batch: List[Dict[str, Any]]) -> asyncio.Task:
+        return self._track(asyncio.ensure_future(self._process_batch(batch)))
+    
+    def _track(self, task: asyncio.Task) -> asyncio.Task:
+        # Keep a reference so in-flight batches are not garbage collected
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+        return task
+    
+    async def _process_batch(self, batch: List[Dict]):
         """Process a batch of requests"""
-        if not self.pending_requests:
+        if not batch:
             return
         
         async with self.batch_semaphore:
-            # Extract batch from pending requests
-            batch = self.pending_requests[:self.batch_size]
-            self.pending_requests = self.pending_requests[self.batch_size:]
+            start_time = time.perf_counter()
+            self.stats['batches'] += 1
             
-            if not batch:
-                return
+            # Group similar requests for more efficient processing
+            grouped_requests = self._group_similar_requests(batch)
+            outcomes = await asyncio.gather(
+                *(self._process_request_group(group) for group in grouped_requests),
+                return_exceptions=True
+            )
             
-            try:
-                # Group similar requests for more efficient processing
-                grouped_requests = self._group_similar_requests(batch)
-                
-                # Process each group
-                for group in grouped_requests:
-                    results = await self._process_request_group(group)
-                    
-                    # Resolve futures with results
-                    for i, request_item in enumerate(group):
-                        if i < len(results):
-                            request_item['future'].set_result(results[i])
+            for group, results in zip(grouped_requests, outcomes):
+                if isinstance(results, Exception):
+                    self.stats['failed_batches'] += 1
+                    self.logger.error(f"Batch processing error: {results}")
+                for i, request_item in enumerate(group):
+                    for future in request_item['futures']:
+                        if future.done():
+                            continue
+                        if isinstance(results, Exception):
+                            future.set_exception(results)
+                        elif i < len(results):
+                            future.set_result(results[i])
                         else:
-                            request_item['future'].set_exception(
-                                Exception("Batch processing failed")
-                            )
-                            
-            except Exception as e:
-                self.logger.error(f"Batch processing error: {e}")
-                # Resolve all futures with error
-                for request_item in batch:
-                    if not request_item['future'].done():
-                        request_item['future'].set_exception(e)
+                            future.set_exception(Exception("Batch processing failed"))
+            
+            self.batch_latency.observe(time.perf_counter() - start_time)
     
     def _group_similar_requests(self, batch: List[Dict]) -> List[List[Dict]]:
         """Group similar requests for more efficient processing"""
@@ -151,29 +284,28 @@ class AsyncBatchProcessor:
         return list(groups.values())
     
     async def _process_request_group(self, group: List[Dict]) -> List[Any]:
-        """Process a group of similar requests"""
-        # This would be implemented to call the actual LLM API
-        # For now, we'll simulate the processing
-        await asyncio.sleep(0.1)  # Simulate API call
-        return [{'result': f'processed_{i}'} for i in range(len(group))]
-    
-    async def _schedule_timeout_batch(self):
-        """Schedule batch processing after timeout"""
-        await asyncio.sleep(self.batch_timeout)
-        if self.pending_requests:
-            asyncio.create_task(self._process_batch())
+        """Process a group of similar requests with one backend call"""
+        self.stats['upstream_calls'] += 1
+        return await self.backend.process_batch([request_item['data'] for request_item in group])
 
 
 class IntelligentCache:
     """
-    Advanced caching system with TTL, LRU eviction, and smart invalidation
+    Advanced caching system with TTL, LRU eviction, and tag-based invalidation
+    
+    Entries live in an insertion-ordered dict that doubles as the LRU list, so
+    hits, inserts and evictions are O(1). Expiry times are kept in a min-heap
+    and purged lazily. Entries may be tagged (e.g. "player:<id>",
+    "entity:<id>", "location:<id>") so that a change in game state can evict
+    exactly the results that depend on it.
     """
     
     def __init__(self, max_size: int = 1000, default_ttl: int = 300):
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self.cache: Dict[str, CacheEntry] = {}
-        self.access_order: List[str] = []
+        self.cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._tag_index: Dict[str, Set[str]] = defaultdict(set)
         self.logger = logging.getLogger("IntelligentCache")
         
     def _generate_key(self, 
@@ -194,89 +326,125 @@ class IntelligentCache:
         cache_str = json.dumps(cache_data, sort_keys=True)
         return hashlib.md5(cache_str.encode()).hexdigest()
     
+    @staticmethod
+    def _generate_tags(context: Dict[str, Any], target_entity: str = None) -> FrozenSet[str]:
+        """Generate invalidation tags for a world reaction result"""
+        tags = set()
+        if context.get('player_id') is not None:
+            tags.add(f"player:{context['player_id']}")
+        if context.get('current_location') is not None:
+            tags.add(f"location:{context['current_location']}")
+        if target_entity:
+            tags.add(f"entity:{target_entity}")
+        return frozenset(tags)
+    
     def get(self, key: str) -> Optional[Any]:
         """Get item from cache"""
-        if key not in self.cache:
+        entry = self.cache.get(key)
+        if entry is None:
             return None
         
-        entry = self.cache[key]
-        
-        # Check if expired
-        if entry.is_expired():
-            del self.cache[key]
-            if key in self.access_order:
-                self.access_order.remove(key)
+        now = time.monotonic()
+        if entry.is_expired(now):
+            self._remove(key)
             return None
         
         # Update access order (LRU)
-        if key in self.access_order:
-            self.access_order.remove(key)
-        self.access_order.append(key)
-        
-        return entry.access()
+        self.cache.move_to_end(key)
+        return entry.access(now)
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Set item in cache"""
-        # Evict if at capacity
-        if len(self.cache) >= self.max_size:
-            self._evict_lru()
-        
-        # Clean expired entries periodically
-        if len(self.cache) % 100 == 0:  # Every 100 insertions
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[Iterable[str]] = None) -> None:
+        """Set item in cache, optionally tagged for invalidate_tags"""
+        if key in self.cache:
+            self._remove(key)
+        elif len(self.cache) >= self.max_size:
+            # Expired entries go first, then the least recently used
             self._clean_expired()
+            if len(self.cache) >= self.max_size:
+                self._evict_lru()
         
         ttl = ttl or self.default_ttl
         entry = CacheEntry(
             data=value,
             timestamp=datetime.utcnow(),
-            ttl_seconds=ttl
+            ttl_seconds=ttl,
+            tags=frozenset(sys.intern(tag) for tag in tags) if tags else frozenset()
         )
         
         self.cache[key] = entry
-        
-        # Update access order
-        if key in self.access_order:
-            self.access_order.remove(key)
-        self.access_order.append(key)
+        heapq.heappush(self._expiry_heap, (entry.expires_at, key))
+        for tag in entry.tags:
+            self._tag_index[tag].add(key)
+        
+        # Drop heap records of replaced or evicted entries once they dominate
+        if len(self._expiry_heap) > 2 * len(self.cache) + 64:
+            self._expiry_heap = [(entry.expires_at, key) for key, entry in self.cache.items()]
+            heapq.heapify(self._expiry_heap)
+    
+    def _remove(self, key: str) -> None:
+        entry = self.cache.pop(key)
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
     
     def _evict_lru(self) -> None:
         """Evict least recently used item"""
-        if self.access_order:
-            lru_key = self.access_order.pop(0)
-            if lru_key in self.cache:
-                del self.cache[lru_key]
+        if self.cache:
+            self._remove(next(iter(self.cache)))
     
     def _clean_expired(self) -> None:
         """Remove expired entries"""
-        expired_keys = [
-            key for key, entry in self.cache.items()
-            if entry.is_expired()
-        ]
+        now = time.monotonic()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self.cache.get(key)
+            # Skip records left behind by entries that were replaced or removed
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+    
+    def invalidate_tags(self, tags: Iterable[str], match_all: bool = False) -> int:
+        """
+        Invalidate entries by tag
         
-        for key in expired_keys:
-            del self.cache[key]
-            if key in self.access_order:
-                self.access_order.remove(key)
+        Args:
+            tags: Tags to match
+            match_all: Only invalidate entries carrying every tag (default: any tag)
+            
+        Returns:
+            Number of entries removed
+        """
+        tags = list(tags)
+        if not tags:
+            return 0
+        key_sets = [self._tag_index.get(tag, set()) for tag in tags]
+        keys = set.intersection(*key_sets) if match_all else set().union(*key_sets)
+        for key in keys:
+            self._remove(key)
+        return len(keys)
     
     def invalidate_pattern(self, pattern: str) -> None:
-        """Invalidate cache entries matching pattern"""
+        """Invalidate cache entries whose key or any tag contains pattern"""
         keys_to_remove = [
-            key for key in self.cache.keys()
-            if pattern in key
+            key for key, entry in self.cache.items()
+            if pattern in key or any(pattern in tag for tag in entry.tags)
         ]
         
         for key in keys_to_remove:
-            del self.cache[key]
-            if key in self.access_order:
-                self.access_order.remove(key)
+            self._remove(key)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
+        now = time.monotonic()
         return {
             'size': len(self.cache),
             'max_size': self.max_size,
             'utilization': len(self.cache) / self.max_size * 100,
-            'expired_entries': sum(1 for entry in self.cache.values() if entry.is_expired())
+            'expired_entries': sum(1 for entry in self.cache.values() if entry.is_expired(now)),
+            'tags': len(self._tag_index)
         }
 
 
@@ -380,7 +548,8 @@ class PerformanceOptimizer:
         self.batch_processor = AsyncBatchProcessor(
             batch_size=self.config.get('batch_size', 5),
             batch_timeout=self.config.get('batch_timeout', 1.0),
-            max_concurrent_batches=self.config.get('max_concurrent_batches', 3)
+            max_concurrent_batches=self.config.get('max_concurrent_batches', 3),
+            backend=self.config.get('batch_backend')
         )
         self.concurrent_manager = ConcurrentProcessingManager(
             max_concurrent=self.config.get('max_concurrent', 5),
@@ -453,7 +622,8 @@ class PerformanceOptimizer:
                     cache_key = uncached_requests[i]['cache_key']
                     # Cache for varying durations based on result quality
                     ttl = self._calculate_cache_ttl(result)
-                    self.cache.set(cache_key, result, ttl)
+                    tags = self.cache._generate_tags(context, uncached_requests[i]['target_entity'])
+                    self.cache.set(cache_key, result, ttl, tags=tags)
                     self.metrics.successful_requests += 1
                 else:
                     self.metrics.failed_requests += 1
@@ -483,6 +653,37 @@ class PerformanceOptimizer:
         
         return all_results
     
+    def invalidate_cached_reactions(self,
+                                    player_id: Optional[str] = None,
+                                    entity_ids: Optional[List[str]] = None,
+                                    location: Optional[str] = None) -> int:
+        """
+        Evict cached world reactions that depend on changed game state
+        
+        All given criteria must match, so e.g. a reputation change between a
+        player and one NPC evicts only that player's reactions from that NPC.
+        
+        Args:
+            player_id: Player whose reactions are affected
+            entity_ids: Reacting entities affected (any of them)
+            location: Location whose reactions are affected
+            
+        Returns:
+            Number of cached reactions removed
+        """
+        required = []
+        if player_id is not None:
+            required.append(f"player:{player_id}")
+        if location is not None:
+            required.append(f"location:{location}")
+        
+        if not entity_ids:
+            return self.cache.invalidate_tags(required, match_all=True)
+        return sum(
+            self.cache.invalidate_tags(required + [f"entity:{entity_id}"], match_all=True)
+            for entity_id in entity_ids
+        )
+    
     def _determine_target_entities(self, context: Dict[str, Any]) -> List[str]:
         """Determine target entities for reaction assessment"""
         entities = []
@@ -598,18 +799,25 @@ class PerformanceOptimizer:
 def monitor_performance(optimizer: PerformanceOptimizer):
     """Decorator to monitor function performance"""
     def decorator(func):
+        latency = get_metrics_registry().timed(
+            "ai_gm_operation_seconds", "AI GM operation latency",
+            subsystem="ai_gm", operation=func.__name__
+        )
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
                 optimizer.metrics.successful_requests += 1
                 return result
             except Exception as e:
                 optimizer.metrics.failed_requests += 1
+                latency.errors.inc()
                 raise
             finally:
-                processing_time = time.time() - start_time
+                processing_time = time.perf_counter() - start_time
+                latency.histogram.observe(processing_time)
                 # Update average response time
                 if optimizer.metrics.total_requests == 0:
                     optimizer.metrics.avg_response_time = processing_time
@@ -89,6 +89,24 @@ if celery_available:
     celery_app.conf.task_time_limit = 300  # 5 minutes max
     celery_app.conf.task_soft_time_limit = 240  # 4 minutes warning
     
+    # Publish task completions so waiters resume without polling the backend
+    from celery.signals import task_failure, task_success
+    from backend.src.ai_gm.tasks.completion_channel import get_completion_channel
+
+    @task_success.connect
+    def _publish_task_success(sender=None, result=None, **kwargs):
+        try:
+            get_completion_channel().publish(sender.request.id, result)
+        except Exception as e:
+            logger.error(f"Failed to publish completion of task {sender.request.id}: {e}")
+
+    @task_failure.connect
+    def _publish_task_failure(sender=None, task_id=None, **kwargs):
+        try:
+            get_completion_channel().publish(task_id, None, status="FAILURE")
+        except Exception as e:
+            logger.error(f"Failed to publish failure of task {task_id}: {e}")
+
     logger.info("Celery application configured with Redis broker")
 else:
     # Create a mock Celery application for development
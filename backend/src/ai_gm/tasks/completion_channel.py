@@ -0,0 +1,383 @@
+"""
+Task completion notification channels for the AI GM Brain system.
+
+This module lets coroutines wait for a task result to be pushed to them
+instead of polling the result backend. A channel keeps one set of waiters
+per process, keyed by task ID, and resolves every waiter of a task the
+moment its completion is published. Two backends are provided:
+
+- InProcessCompletionChannel: completions are published in-process, with an
+  optional thread pool for running tasks locally (tests, single-node runs)
+- RedisCompletionChannel: completions are published over one Redis pub/sub
+  channel, which each process subscribes to once for all of its waiters
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+# Completions remembered for waiters that arrive after the result
+RECENT_COMPLETIONS_CAPACITY = 1024
+
+DEFAULT_REDIS_CHANNEL = "ai_gm:task_completions"
+
+# Longest a waiter blocks for the first subscription attempt to finish
+SUBSCRIBE_TIMEOUT = 5.0
+
+REDIS_URL_SCHEMES = ("redis://", "rediss://")
+
+
+def _resolve(future: asyncio.Future, result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+class TaskCompletionChannel:
+    """
+    Dispatches published task completions to asyncio waiters.
+
+    Waiters may live on any event loop; completions may be published from
+    any thread.
+    """
+
+    # Whether completions published by other processes reach this channel
+    sees_remote_completions = False
+
+    def __init__(self, recent_capacity: int = RECENT_COMPLETIONS_CAPACITY):
+        """
+        Initialize the channel.
+
+        Args:
+            recent_capacity: Number of recent completions kept for late waiters
+        """
+        self.recent_capacity = recent_capacity
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self._recent: "OrderedDict[str, Any]" = OrderedDict()
+        self._reprobe_requests: List[asyncio.Future] = []
+        self._lock = threading.Lock()
+
+    def publish(self, task_id: str, result: Any, status: str = "SUCCESS") -> None:
+        """
+        Announce that a task has finished.
+
+        Args:
+            task_id: The task ID
+            result: The task result (None for failed tasks)
+            status: Final task state
+        """
+        self._dispatch(task_id, result if status == "SUCCESS" else None)
+
+    async def wait(self,
+                   task_id: str,
+                   timeout: float,
+                   probe: Optional[Callable[[], Awaitable[Any]]] = None,
+                   poll_interval: Optional[float] = None,
+                   fallback_poll_interval: Optional[float] = None) -> Tuple[bool, Any]:
+        """
+        Wait for a task's completion to be published.
+
+        Args:
+            task_id: The task ID
+            timeout: Maximum time to wait in seconds
+            probe: Optional coroutine function returning the result from the
+                result backend, or None if it is not there yet. It is called
+                once after the waiter is registered, so completions published
+                before the wait began are not missed, and again whenever the
+                channel may have missed completions (e.g. after resubscribing).
+            poll_interval: If set, also re-run the probe at this interval
+                (for publishers that may not announce completions)
+            fallback_poll_interval: Probe interval used instead when poll_interval
+                is not set and the channel cannot currently see completions
+                published by other processes
+
+        Returns:
+            (True, result) once completed, or (False, None) on timeout
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if task_id in self._recent:
+                return True, self._recent[task_id]
+            self._waiters.setdefault(task_id, []).append(future)
+
+        deadline = loop.time() + timeout
+        reprobe = None
+        try:
+            await self._ensure_listening()
+            if poll_interval is None and not self.sees_remote_completions:
+                poll_interval = fallback_poll_interval
+            while True:
+                if probe is not None:
+                    if reprobe is not None:
+                        self._discard_reprobe(reprobe)
+                    with self._lock:
+                        reprobe = loop.create_future()
+                        self._reprobe_requests.append(reprobe)
+                    result = await probe()
+                    if result is not None:
+                        return True, result
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False, None
+                wait_time = remaining if poll_interval is None else min(remaining, poll_interval)
+                await asyncio.wait([f for f in (future, reprobe) if f is not None], timeout=wait_time,
+                                   return_when=asyncio.FIRST_COMPLETED)
+                if future.done():
+                    return True, future.result()
+                if reprobe is not None and reprobe.done():
+                    continue
+                if poll_interval is None:
+                    return False, None
+        finally:
+            self._discard_waiter(task_id, future)
+            if reprobe is not None:
+                self._discard_reprobe(reprobe)
+
+    def pending_waiters(self) -> int:
+        """Get the number of registered waiters."""
+        with self._lock:
+            return sum(len(futures) for futures in self._waiters.values())
+
+    def close(self) -> None:
+        """Release any resources held by the channel."""
+
+    async def _ensure_listening(self) -> None:
+        """Start receiving remote completions (no-op for in-process channels)."""
+
+    def _request_reprobe(self) -> None:
+        """Make every current waiter re-run its probe."""
+        with self._lock:
+            requests, self._reprobe_requests = self._reprobe_requests, []
+        for request in requests:
+            request.get_loop().call_soon_threadsafe(_resolve, request, None)
+
+    def _discard_reprobe(self, request: asyncio.Future) -> None:
+        with self._lock:
+            if request in self._reprobe_requests:
+                self._reprobe_requests.remove(request)
+
+    def _dispatch(self, task_id: str, result: Any) -> None:
+        with self._lock:
+            futures = self._waiters.pop(task_id, [])
+            self._recent[task_id] = result
+            self._recent.move_to_end(task_id)
+            while len(self._recent) > self.recent_capacity:
+                self._recent.popitem(last=False)
+
+        for future in futures:
+            future.get_loop().call_soon_threadsafe(_resolve, future, result)
+
+    def _discard_waiter(self, task_id: str, future: asyncio.Future) -> None:
+        with self._lock:
+            futures = self._waiters.get(task_id)
+            if futures and future in futures:
+                futures.remove(future)
+                if not futures:
+                    del self._waiters[task_id]
+
+
+class InProcessCompletionChannel(TaskCompletionChannel):
+    """
+    Completion channel for a single process, with a local task executor.
+    """
+
+    def __init__(self, max_workers: int = 4, recent_capacity: int = RECENT_COMPLETIONS_CAPACITY):
+        """
+        Initialize the channel.
+
+        Args:
+            max_workers: Worker threads for tasks submitted with submit()
+            recent_capacity: Number of recent completions kept for late waiters
+        """
+        super().__init__(recent_capacity)
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> str:
+        """
+        Run a task function in the local executor and publish its completion.
+
+        Args:
+            func: Task function
+            *args: Positional arguments for the task
+            **kwargs: Keyword arguments for the task
+
+        Returns:
+            The task ID
+        """
+        task_id = str(uuid4())
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ai-gm-task")
+            executor = self._executor
+
+        def run():
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Task {task_id} failed: {e}")
+                self.publish(task_id, None, status="FAILURE")
+            else:
+                self.publish(task_id, result)
+
+        executor.submit(run)
+        return task_id
+
+    def close(self) -> None:
+        """Shut down the local executor."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+class RedisCompletionChannel(TaskCompletionChannel):
+    """
+    Completion channel over Redis pub/sub.
+
+    Workers publish each completion to one channel; every process that waits
+    holds a single subscription, read by one background thread, and fans the
+    messages out to its local waiters. The first waiters wait for the
+    subscription attempt to finish; while the channel is not subscribed,
+    waiters fall back to polling, and every waiter probes again after each
+    resubscribe, so completions published while unsubscribed are not lost.
+    """
+
+    def __init__(self,
+                 redis_client: Any = None,
+                 redis_url: Optional[str] = None,
+                 channel_name: str = DEFAULT_REDIS_CHANNEL,
+                 recent_capacity: int = RECENT_COMPLETIONS_CAPACITY):
+        """
+        Initialize the channel.
+
+        Args:
+            redis_client: Redis client (created from redis_url if omitted)
+            redis_url: Redis connection URL
+            channel_name: Pub/sub channel carrying completions
+            recent_capacity: Number of recent completions kept for late waiters
+        """
+        super().__init__(recent_capacity)
+        if redis_client is None:
+            import redis
+            redis_client = redis.Redis.from_url(redis_url or os.environ.get('REDIS_URL', 'redis://localhost:6379/0'))
+        self.redis = redis_client
+        self.channel_name = channel_name
+        self._listener: Optional[threading.Thread] = None
+        self._pubsub = None
+        self._subscribed = threading.Event()
+        self._subscribe_attempted = threading.Event()
+        self._stopped = threading.Event()
+
+    @property
+    def sees_remote_completions(self) -> bool:
+        """Whether the completion subscription is currently in place."""
+        return self._subscribed.is_set()
+
+    def publish(self, task_id: str, result: Any, status: str = "SUCCESS") -> None:
+        """Publish a completion to every subscribed process."""
+        self.redis.publish(self.channel_name, json.dumps({
+            "task_id": task_id,
+            "status": status,
+            "result": result if status == "SUCCESS" else None
+        }, default=str))
+
+    def close(self) -> None:
+        """Stop the listener thread and drop the subscription."""
+        self._stopped.set()
+        pubsub = self._pubsub
+        if pubsub is not None:
+            try:
+                pubsub.close()
+            except Exception as e:
+                logger.debug(f"Error closing task completion subscription: {e}")
+        if self._listener is not None:
+            self._listener.join(timeout=2)
+
+    async def _ensure_listening(self) -> None:
+        with self._lock:
+            if self._stopped.is_set():
+                return
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, name="task-completion-listener", daemon=True)
+                self._listener.start()
+        if not self._subscribe_attempted.is_set():
+            loop = asyncio.get_running_loop()
+            if not await loop.run_in_executor(None, self._subscribe_attempted.wait, SUBSCRIBE_TIMEOUT):
+                logger.warning(f"Task completion subscription not ready after {SUBSCRIBE_TIMEOUT}s")
+
+    def _listen(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+                self._pubsub.subscribe(self.channel_name)
+                self._subscribed.set()
+                self._subscribe_attempted.set()
+                # Completions published before (re)subscribing never reach us
+                self._request_reprobe()
+                while not self._stopped.is_set():
+                    message = self._pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._handle_message(message["data"])
+            except Exception as e:
+                self._subscribed.clear()
+                self._subscribe_attempted.set()
+                if self._stopped.is_set():
+                    break
+                logger.error(f"Task completion subscription failed, resubscribing: {e}")
+                time.sleep(1.0)
+
+    def _handle_message(self, data: Any) -> None:
+        try:
+            payload = json.loads(data)
+            status = payload.get("status", "SUCCESS")
+            self._dispatch(payload["task_id"], payload.get("result") if status == "SUCCESS" else None)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed task completion message: {e}")
+
+
+_completion_channel: Optional[TaskCompletionChannel] = None
+_completion_channel_lock = threading.Lock()
+
+
+def get_completion_channel() -> TaskCompletionChannel:
+    """
+    Get the process-wide completion channel.
+
+    Uses Redis pub/sub when TASK_COMPLETION_BACKEND is "redis", or when it is
+    unset and REDIS_URL or CELERY_BROKER_URL is a redis:// or rediss:// URL,
+    since workers then publish from other processes. Otherwise an in-process
+    channel, whose waiters poll the result backend.
+    """
+    global _completion_channel
+    with _completion_channel_lock:
+        if _completion_channel is None:
+            redis_url = next((url for url in (os.environ.get('REDIS_URL'), os.environ.get('CELERY_BROKER_URL'))
+                              if url and url.startswith(REDIS_URL_SCHEMES)), None)
+            backend = os.environ.get('TASK_COMPLETION_BACKEND')
+            if backend is None:
+                backend = 'redis' if redis_url else 'in_process'
+            if backend == 'redis':
+                _completion_channel = RedisCompletionChannel(redis_url=redis_url)
+            else:
+                _completion_channel = InProcessCompletionChannel()
+        return _completion_channel
+
+
+def set_completion_channel(channel: Optional[TaskCompletionChannel]) -> None:
+    """Replace the process-wide completion channel (None restores the default)."""
+    global _completion_channel
+    with _completion_channel_lock:
+        previous, _completion_channel = _completion_channel, channel
+    if previous is not None and previous is not channel:
+        previous.close()
@@ -5,11 +5,12 @@ This module provides utilities for working with asynchronous Celery task
 results and integrating them back into the AI GM Brain workflow.
 """
 
-import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Callable
 
+from backend.src.ai_gm.tasks.completion_channel import get_completion_channel
+
 # Note: In a real implementation, would import this from Celery
 # For now, we'll create a mock implementation for compatibility
 class AsyncResult:
@@ -40,6 +41,10 @@ class AsyncResult:
 
 logger = logging.getLogger(__name__)
 
+# Result backend re-check interval when the completion channel cannot see
+# completions published by worker processes
+DEFAULT_CHECK_INTERVAL = 0.5
+
 class TaskResultHandler:
     """Handler for Celery task results."""
     
@@ -67,35 +72,51 @@ class TaskResultHandler:
         return None
     
     @staticmethod
-    async def wait_for_task_completion(task_id: str, max_wait: int = 30, check_interval: float = 0.5) -> Optional[Dict[str, Any]]:
+    async def wait_for_task_completion(task_id: str, max_wait: int = 30, check_interval: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
         Wait for a Celery task to complete.
         
+        Waiters are resumed by the completion channel as soon as the task's
+        completion is published; the result backend is only checked once up
+        front, in case the task finished before the wait began. While the
+        channel cannot see completions from other processes, the result
+        backend is also re-checked every DEFAULT_CHECK_INTERVAL seconds.
+        
         Args:
             task_id: The Celery task ID
             max_wait: Maximum time to wait in seconds
-            check_interval: How often to check in seconds
+            check_interval: Optional interval for also re-checking the result
+                backend, for tasks whose completion may not be published
             
         Returns:
             Task result or None if timeout or error
         """
-        task = AsyncResult(task_id)
-        waited = 0
+        completed, result = await get_completion_channel().wait(
+            task_id,
+            max_wait,
+            probe=lambda: TaskResultHandler.get_task_result(task_id, timeout=5),
+            poll_interval=check_interval,
+            fallback_poll_interval=DEFAULT_CHECK_INTERVAL
+        )
         
-        while not task.ready() and waited < max_wait:
-            await asyncio.sleep(check_interval)
-            waited += check_interval
-        
-        if task.ready():
-            try:
-                return task.get(timeout=5)
-            except Exception as e:
-                logger.error(f"Error getting task result: {e}")
-                return None
+        if completed:
+            return result
         
         logger.warning(f"Task {task_id} did not complete within {max_wait} seconds")
         return None
     
+    @staticmethod
+    def notify_task_completion(task_id: str, result: Any, status: str = "SUCCESS") -> None:
+        """
+        Publish a task's completion, resuming everyone waiting on it.
+        
+        Args:
+            task_id: The Celery task ID
+            result: The task result
+            status: Final task state
+        """
+        get_completion_channel().publish(task_id, result, status)
+    
     @staticmethod
     async def process_completed_tasks(task_ids: List[str], callback: Optional[Callable] = None) -> Dict[str, Any]:
         """
@@ -7,6 +7,7 @@ from datetime import datetime
 import logging
 
 from .reputation_manager import ReputationManager, ActionSignificance
+from .reputation_propagation import ReputationPropagationEngine
 
 
 class EnhancedContextManager:
@@ -14,15 +15,16 @@ class EnhancedContextManager:
     Enhanced context manager that includes reputation and world reaction context
     """
     
-    def __init__(self, db_service=None):
+    def __init__(self, db_service=None, propagation_engine: Optional[ReputationPropagationEngine] = None):
         """Initialize enhanced context manager"""
         # Initialize reputation manager
-        self.reputation_manager = ReputationManager(db_service=db_service)
+        self.reputation_manager = ReputationManager(db_service=db_service, propagation_engine=propagation_engine)
         self.logger = logging.getLogger("EnhancedContextManager")
         
         # Store references to game data
         self.db_service = db_service
         self.world_state = {}
+        self.propagation_time_budget = 0.005  # Seconds of propagation per prepared context
     
     def prepare_event_context(self, event, actor_id: str, location: str = None) -> Dict[str, Any]:
         """
@@ -36,6 +38,9 @@ class EnhancedContextManager:
         Returns:
             Enhanced context dictionary
         """
+        # Let earlier actions reach allies and rivals before reputations are read
+        self.reputation_manager.propagate_pending(self.propagation_time_budget)
+        
         # Prepare base context - this would normally come from the base NarrativeContextManager
         base_context = self._prepare_base_context(event, actor_id, location)
         
@@ -116,11 +121,12 @@ class EnhancedContextManager:
         present_npcs = context.get('present_npcs', [])
         all_npcs = list(set(active_npcs + present_npcs))
         npc_dispositions = {}
+        npc_reputations = self.reputation_manager.load_many(
+            player_id, [f"npc_{npc_id}" for npc_id in all_npcs]
+        )
         
         for npc_id in all_npcs:
-            npc_reputation = self.reputation_manager.get_reputation_with_entity(
-                player_id, f"npc_{npc_id}"
-            )
+            npc_reputation = npc_reputations[f"npc_{npc_id}"]
             npc_dispositions[npc_id] = {
                 'reputation_level': npc_reputation.reputation_level.value,
                 'disposition': self._reputation_to_disposition(npc_reputation.reputation_level.value)
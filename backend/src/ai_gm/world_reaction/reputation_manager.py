@@ -2,13 +2,18 @@
 Reputation and Recent Actions Manager for World Reaction System
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from collections import OrderedDict, deque
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import logging
+import threading
+import time
 import uuid
 
+from .reputation_propagation import ReputationPropagationEngine
+
 
 class ReputationLevel(Enum):
     """Player reputation levels"""
@@ -87,49 +92,148 @@ class SignificantAction:
             return "recently"
 
 
+class PlayerReputationPartition:
+    """
+    Everything cached for one player: reputation entries and recent actions.
+    
+    Entries are kept in LRU order and capped at max_entries. An entity the
+    database has no record of is cached as None, so scenes full of neutral
+    NPCs are not looked up again on every turn.
+    """
+    
+    __slots__ = ('entries', 'recent_actions', 'actions_loaded', 'max_entries')
+    
+    def __init__(self, max_entries: int, max_recent_actions: int):
+        self.entries: "OrderedDict[str, Optional[ReputationEntry]]" = OrderedDict()
+        self.recent_actions: deque = deque(maxlen=max_recent_actions)
+        self.actions_loaded = False
+        self.max_entries = max_entries
+    
+    def get(self, entity_id: str) -> Tuple[bool, Optional[ReputationEntry]]:
+        """Return (cached, entry); entry is None for a cached miss"""
+        if entity_id not in self.entries:
+            return False, None
+        self.entries.move_to_end(entity_id)
+        return True, self.entries[entity_id]
+    
+    def put(self, entity_id: str, entry: Optional[ReputationEntry]):
+        self.entries[entity_id] = entry
+        self.entries.move_to_end(entity_id)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
 class ReputationManager:
     """
     Manages player reputation with various entities and tracks significant actions
+    
+    Cached state is partitioned by player. Partitions are kept in LRU order
+    and, once more than max_players are cached, the least recently used
+    player's partition is dropped as a whole. Every change is written to
+    the database as it happens, so eviction never loses data.
+    
+    With a propagation engine, the reputation changes of each action are
+    also queued to spread to allied and rival entities on the next
+    propagate_pending() call.
     """
     
-    def __init__(self, db_service=None):
+    def __init__(self, db_service=None, max_players: int = 1000, max_entries_per_player: int = 512,
+                 max_recent_actions: int = 10,
+                 propagation_engine: Optional[ReputationPropagationEngine] = None):
         """
         Initialize reputation manager.
         
         Args:
             db_service: Database service for persistence
+            max_players: Number of player partitions kept in memory
+            max_entries_per_player: Reputation entries cached per player
+            max_recent_actions: Significant actions remembered per player
+            propagation_engine: Spreads changes to allies and rivals
         """
         self.db_service = db_service
+        self.propagation_engine = propagation_engine
+        self._unapplied_propagation: deque = deque()
         self.logger = logging.getLogger("ReputationManager")
         
-        # In-memory caches
-        self.reputation_cache: Dict[str, ReputationEntry] = {}
-        self.recent_actions_cache: List[SignificantAction] = []
+        # Per-player caches, least recently used first
+        self._partitions: "OrderedDict[str, PlayerReputationPartition]" = OrderedDict()
+        self._lock = threading.RLock()
         
         # Configuration
-        self.max_recent_actions = 10  # Keep last 10 significant actions
+        self.max_players = max_players
+        self.max_entries_per_player = max_entries_per_player
+        self.max_recent_actions = max_recent_actions  # Keep last 10 significant actions per player
         self.action_relevance_days = 30  # Actions older than 30 days are less relevant
         
         # Load from database if available
         if self.db_service:
             self._load_from_database()
     
-    def get_reputation_with_entity(self, player_id: str, entity_id: str) -> Optional[ReputationEntry]:
-        """Get player's reputation with a specific entity"""
-        cache_key = f"{player_id}_{entity_id}"
+    def _partition(self, player_id: str) -> PlayerReputationPartition:
+        """Get (or create) a player's partition and mark it most recently used"""
+        partition = self._partitions.get(player_id)
+        if partition is not None:
+            self._partitions.move_to_end(player_id)
+            return partition
+        
+        partition = PlayerReputationPartition(self.max_entries_per_player, self.max_recent_actions)
+        self._partitions[player_id] = partition
+        while len(self._partitions) > self.max_players:
+            evicted_id, _ = self._partitions.popitem(last=False)
+            self.logger.debug(f"Evicted reputation partition for player {evicted_id}")
+        return partition
+    
+    def load_many(self, player_id: str, entity_ids: Iterable[str]) -> Dict[str, ReputationEntry]:
+        """
+        Get a player's reputation with several entities at once.
         
-        if cache_key in self.reputation_cache:
-            return self.reputation_cache[cache_key]
+        Entities missing from the cache are fetched from the database in a
+        single batch; entities without a record get a neutral entry.
         
-        # Load from database if not cached
-        if self.db_service:
-            reputation_data = self._load_reputation_from_db(player_id, entity_id)
-            if reputation_data:
-                entry = ReputationEntry(**reputation_data)
-                self.reputation_cache[cache_key] = entry
-                return entry
+        Args:
+            player_id: Player identifier
+            entity_ids: Entities to look up
+            
+        Returns:
+            Dictionary of entity_id -> reputation entry, in request order
+        """
+        entity_ids = list(dict.fromkeys(entity_ids))
+        found: Dict[str, Optional[ReputationEntry]] = {}
+        missing: List[str] = []
+        
+        with self._lock:
+            partition = self._partition(player_id)
+            for entity_id in entity_ids:
+                cached, entry = partition.get(entity_id)
+                if cached:
+                    found[entity_id] = entry
+                else:
+                    missing.append(entity_id)
+        
+        if missing:
+            loaded = self._load_reputations_from_db(player_id, missing) if self.db_service else {}
+            with self._lock:
+                partition = self._partition(player_id)
+                for entity_id in missing:
+                    # Keep anything cached while we queried, it is newer than the database row
+                    cached, entry = partition.get(entity_id)
+                    if not cached:
+                        reputation_data = loaded.get(entity_id)
+                        entry = ReputationEntry(**reputation_data) if reputation_data else None
+                        partition.put(entity_id, entry)
+                    found[entity_id] = entry
         
-        # Return neutral reputation if not found
+        return {
+            entity_id: found[entity_id] or self._neutral_reputation(entity_id)
+            for entity_id in entity_ids
+        }
+    
+    def get_reputation_with_entity(self, player_id: str, entity_id: str) -> Optional[ReputationEntry]:
+        """Get player's reputation with a specific entity"""
+        return self.load_many(player_id, [entity_id])[entity_id]
+    
+    def _neutral_reputation(self, entity_id: str) -> ReputationEntry:
+        """Reputation with an entity the player has no history with"""
         return ReputationEntry(
             entity_id=entity_id,
             entity_name=entity_id.replace('_', ' ').title(),
@@ -145,33 +249,22 @@ class ReputationManager:
     
     def get_relevant_reputations(self, player_id: str, context: Dict[str, Any]) -> List[ReputationEntry]:
         """Get reputations relevant to current context"""
-        relevant_reputations = []
-        
-        # Always include global reputation
-        global_rep = self.get_global_reputation(player_id)
-        relevant_reputations.append(global_rep)
-        
-        # Include location-based reputation
+        # Location, active factions and NPCs in conversation, loaded in one batch
+        entity_ids = []
         current_location = context.get('current_location')
         if current_location:
-            location_rep = self.get_reputation_with_entity(player_id, f"location_{current_location}")
-            if location_rep.reputation_level != ReputationLevel.NEUTRAL:
-                relevant_reputations.append(location_rep)
-        
-        # Include faction reputations if relevant
-        active_factions = context.get('active_factions', [])
-        for faction in active_factions:
-            faction_rep = self.get_reputation_with_entity(player_id, f"faction_{faction}")
-            if faction_rep.reputation_level != ReputationLevel.NEUTRAL:
-                relevant_reputations.append(faction_rep)
-        
-        # Include NPC reputations if in conversation
-        active_npcs = context.get('active_npcs', [])
-        for npc_id in active_npcs:
-            npc_rep = self.get_reputation_with_entity(player_id, f"npc_{npc_id}")
-            if npc_rep.reputation_level != ReputationLevel.NEUTRAL:
-                relevant_reputations.append(npc_rep)
+            entity_ids.append(f"location_{current_location}")
+        entity_ids.extend(f"faction_{faction}" for faction in context.get('active_factions', []))
+        entity_ids.extend(f"npc_{npc_id}" for npc_id in context.get('active_npcs', []))
         
+        reputations = self.load_many(player_id, ['global'] + entity_ids)
+        
+        # Always include global reputation; the others only when not neutral
+        relevant_reputations = [reputations.pop('global')]
+        relevant_reputations.extend(
+            rep for rep in reputations.values()
+            if rep.reputation_level != ReputationLevel.NEUTRAL
+        )
         return relevant_reputations
     
     def record_significant_action(self, 
@@ -210,16 +303,15 @@ class ReputationManager:
             world_state_impact=world_state_impact or {}
         )
         
-        # Add to recent actions cache
-        self.recent_actions_cache.append(action)
+        # Add to the player's recent actions (the ring buffer drops the oldest)
+        with self._lock:
+            self._partition(player_id).recent_actions.append(action)
         
-        # Maintain cache size
-        if len(self.recent_actions_cache) > self.max_recent_actions:
-            self.recent_actions_cache.pop(0)
-        
-        # Apply reputation changes
+        # Apply reputation changes; allies and rivals follow on the next propagation tick
         for entity_id, change in (reputation_changes or {}).items():
             self._update_reputation(player_id, entity_id, change, action_description)
+        if self.propagation_engine and reputation_changes:
+            self.propagation_engine.submit(player_id, reputation_changes, action_description)
         
         # Save to database
         if self.db_service:
@@ -243,11 +335,21 @@ class ReputationManager:
         Returns:
             List of recent significant actions
         """
-        # Load from database if cache is empty
-        if not self.recent_actions_cache and self.db_service:
-            self._load_recent_actions_from_db(player_id)
-        
-        actions = self.recent_actions_cache.copy()
+        with self._lock:
+            partition = self._partition(player_id)
+            needs_load = not partition.actions_loaded and not partition.recent_actions
+            partition.actions_loaded = True
+        
+        # Load from database the first time this player's history is needed
+        if needs_load and self.db_service:
+            stored_actions = self._load_recent_actions_from_db(player_id)
+            with self._lock:
+                partition = self._partition(player_id)
+                if not partition.recent_actions:
+                    partition.recent_actions.extend(stored_actions[-self.max_recent_actions:])
+        
+        with self._lock:
+            actions = list(self._partition(player_id).recent_actions)
         
         if relevance_filter:
             # Filter by relevance (recent + significant actions have priority)
@@ -267,31 +369,93 @@ class ReputationManager:
     
     def _update_reputation(self, player_id: str, entity_id: str, change: int, reason: str):
         """Update reputation with an entity"""
-        current_rep = self.get_reputation_with_entity(player_id, entity_id)
-        
-        # Update score and level
-        new_score = current_rep.reputation_score + change
-        new_level = self._score_to_level(new_score)
+        updated_rep = self.apply_reputation_deltas(player_id, {entity_id: change}, reason)[entity_id]
+        self.logger.info(f"Updated reputation with {entity_id}: {change:+d} -> {updated_rep.reputation_level.value}")
+    
+    def apply_reputation_deltas(self, player_id: str, deltas: Dict[str, int], reason: str) -> Dict[str, ReputationEntry]:
+        """
+        Change a player's reputation with several entities at once.
         
-        # Update reputation entry
-        cache_key = f"{player_id}_{entity_id}"
-        updated_rep = ReputationEntry(
-            entity_id=entity_id,
-            entity_name=current_rep.entity_name,
-            entity_type=current_rep.entity_type,
-            reputation_level=new_level,
-            reputation_score=new_score,
-            last_updated=datetime.utcnow(),
-            reasons=current_rep.reasons + [reason]
-        )
+        Current entries are loaded with one load_many() call and the updated
+        entries are saved together.
         
-        self.reputation_cache[cache_key] = updated_rep
+        Args:
+            player_id: Player identifier
+            deltas: Reputation changes {entity_id: change_amount}
+            reason: Reason recorded on every updated entry
+            
+        Returns:
+            Dictionary of entity_id -> updated reputation entry
+        """
+        current = self.load_many(player_id, deltas)
+        now = datetime.utcnow()
+        updated: Dict[str, ReputationEntry] = {}
+        for entity_id, change in deltas.items():
+            current_rep = current[entity_id]
+            new_score = current_rep.reputation_score + change
+            updated[entity_id] = ReputationEntry(
+                entity_id=entity_id,
+                entity_name=current_rep.entity_name,
+                entity_type=current_rep.entity_type,
+                reputation_level=self._score_to_level(new_score),
+                reputation_score=new_score,
+                last_updated=now,
+                reasons=current_rep.reasons + [reason]
+            )
+        
+        with self._lock:
+            partition = self._partition(player_id)
+            for entity_id, entry in updated.items():
+                partition.put(entity_id, entry)
         
         # Save to database
         if self.db_service:
-            self._save_reputation_to_db(player_id, updated_rep)
+            self._save_reputations_to_db(player_id, list(updated.values()))
         
-        self.logger.info(f"Updated reputation with {entity_id}: {change:+d} -> {new_level.value}")
+        return updated
+    
+    def propagate_pending(self, time_budget: Optional[float] = None) -> int:
+        """
+        Spread queued reputation changes to allied and rival entities.
+        
+        Batches are propagated and their results applied player by player
+        until everything is applied or the time budget runs out. Results not
+        applied yet are kept for the next call.
+        
+        Args:
+            time_budget: Seconds to spend before leaving the rest for the next call
+            
+        Returns:
+            Number of reputation entries updated
+        """
+        engine = self.propagation_engine
+        if not engine:
+            return 0
+        
+        started = time.perf_counter()
+        updated = 0
+        while True:
+            # Concurrent callers share the queues; each action and result is taken by
+            # exactly one of them, and the propagation pass itself runs outside the lock
+            with self._lock:
+                if self._unapplied_propagation:
+                    result, batch = self._unapplied_propagation.popleft(), None
+                elif engine.pending_count:
+                    result, batch = None, engine.take_batch()
+                else:
+                    break
+            if batch is not None:
+                results = engine.propagate_batch(batch)
+                with self._lock:
+                    self._unapplied_propagation.extend(results)
+                continue
+            reason = f"Word spread of: {'; '.join(result.reasons)}"
+            updated += len(self.apply_reputation_deltas(result.player_id, result.deltas, reason))
+            if time_budget is not None and time.perf_counter() - started >= time_budget:
+                break
+        if updated:
+            self.logger.debug(f"Propagated {updated} reputation changes to allies and rivals")
+        return updated
     
     def _score_to_level(self, score: int) -> ReputationLevel:
         """Convert numeric score to reputation level"""
@@ -362,17 +526,41 @@ class ReputationManager:
         # This would query the database for reputation data
         return None
     
+    def _load_reputations_from_db(self, player_id: str, entity_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Load several reputations from database in one query"""
+        load_reputations = getattr(self.db_service, 'load_reputations', None)
+        if load_reputations is not None:
+            return load_reputations(player_id, entity_ids) or {}
+        
+        # Services without a batch query fall back to one lookup per entity
+        loaded = {}
+        for entity_id in entity_ids:
+            reputation_data = self._load_reputation_from_db(player_id, entity_id)
+            if reputation_data:
+                loaded[entity_id] = reputation_data
+        return loaded
+    
     def _save_reputation_to_db(self, player_id: str, reputation: ReputationEntry):
         """Save reputation to database"""
         # This would save reputation data to the database
         pass
     
+    def _save_reputations_to_db(self, player_id: str, reputations: List[ReputationEntry]):
+        """Save several reputations to database in one write"""
+        save_reputations = getattr(self.db_service, 'save_reputations', None)
+        if save_reputations is not None:
+            save_reputations(player_id, reputations)
+            return
+        
+        for reputation in reputations:
+            self._save_reputation_to_db(player_id, reputation)
+    
     def _save_action_to_db(self, player_id: str, action: SignificantAction):
         """Save action to database"""
         # This would save action data to the database
         pass
     
-    def _load_recent_actions_from_db(self, player_id: str):
-        """Load recent actions from database"""
+    def _load_recent_actions_from_db(self, player_id: str) -> List[SignificantAction]:
+        """Load recent actions from database, oldest first"""
         # This would load recent actions from the database
-        pass
\ No newline at end of file
+        return []
\ No newline at end of file
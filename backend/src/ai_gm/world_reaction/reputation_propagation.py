@@ -0,0 +1,252 @@
+"""
+Reputation Propagation Engine for World Reaction System
+
+Spreads reputation changes from the entities a player affected directly to
+their allies and rivals. Affinities between factions and NPCs are kept as
+a sparse matrix in CSR form (one row of outgoing edges per source entity,
+weights in [-1, 1]: positive for allies, negative for rivals). Deltas
+queued by many actions are applied together each tick, in one sparse
+matrix-vector pass per batch.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+import time
+
+import numpy as np
+
+
+@dataclass
+class PropagationResult:
+    """Spillover reputation changes for one player from one tick"""
+    player_id: str
+    deltas: Dict[str, int]
+    reasons: List[str]
+
+
+class AffinityMatrix:
+    """
+    Sparse affinity graph between factions, NPCs and other entities.
+
+    Edges are edited in a dictionary and compiled to CSR arrays the next
+    time the matrix is used.
+    """
+
+    def __init__(self):
+        self.entity_ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._edges: Dict[Tuple[int, int], float] = {}
+        self._compiled: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._entity_array: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edges)
+
+    def find(self, entity_id: str) -> Optional[int]:
+        """Index of an entity, or None if it has no affinities"""
+        return self._index.get(entity_id)
+
+    def index_of(self, entity_id: str) -> int:
+        """Index of an entity, registering it if it is new"""
+        index = self._index.get(entity_id)
+        if index is None:
+            index = len(self.entity_ids)
+            self._index[entity_id] = index
+            self.entity_ids.append(entity_id)
+            self._compiled = None
+            self._entity_array = None
+        return index
+
+    def entity_array(self) -> np.ndarray:
+        """Entity ids as an object array, for fancy indexing"""
+        if self._entity_array is None:
+            self._entity_array = np.array(self.entity_ids, dtype=object)
+        return self._entity_array
+
+    def set_affinity(self, source_id: str, target_id: str, weight: float, mutual: bool = True):
+        """
+        Set how much of a change towards source carries over to target.
+
+        Args:
+            source_id: Entity the change is made with
+            target_id: Ally (weight > 0) or rival (weight < 0) of the source
+            weight: Affinity in [-1, 1]; 0 removes the edge
+            mutual: Also set the same affinity from target to source
+        """
+        if not -1.0 <= weight <= 1.0:
+            raise ValueError(f"Affinity must be between -1 and 1, got {weight}")
+        if source_id == target_id:
+            raise ValueError("An entity cannot have an affinity with itself")
+
+        pairs = [(source_id, target_id), (target_id, source_id)] if mutual else [(source_id, target_id)]
+        for source, target in pairs:
+            key = (self.index_of(source), self.index_of(target))
+            if weight:
+                self._edges[key] = float(weight)
+            else:
+                self._edges.pop(key, None)
+        self._compiled = None
+
+    def set_affinities(self, affinities: Iterable[Tuple[str, str, float]], mutual: bool = True):
+        """Set many (source, target, weight) affinities"""
+        for source_id, target_id, weight in affinities:
+            self.set_affinity(source_id, target_id, weight, mutual)
+
+    def compile(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """CSR arrays (indptr, targets, weights) with one row per source entity"""
+        if self._compiled is None:
+            count = len(self.entity_ids)
+            if self._edges:
+                keys = np.array(list(self._edges.keys()), dtype=np.int64)
+                weights = np.fromiter(self._edges.values(), dtype=np.float64, count=len(self._edges))
+                order = np.lexsort((keys[:, 1], keys[:, 0]))
+                sources, targets, weights = keys[order, 0], keys[order, 1], weights[order]
+            else:
+                sources = targets = np.empty(0, dtype=np.int64)
+                weights = np.empty(0, dtype=np.float64)
+            indptr = np.zeros(count + 1, dtype=np.int64)
+            np.cumsum(np.bincount(sources, minlength=count), out=indptr[1:])
+            self._compiled = (indptr, targets, weights)
+        return self._compiled
+
+
+class ReputationPropagationEngine:
+    """
+    Queues reputation changes from player actions and spreads them to the
+    allies and rivals of the affected entities.
+
+    A change of d with an entity spills over to each neighbour as
+    damping * affinity * d. Spillovers smaller than min_delta are dropped and
+    the rest are rounded to whole reputation points. Only one hop is taken.
+    """
+
+    def __init__(self,
+                 affinities: Optional[AffinityMatrix] = None,
+                 damping: float = 0.5,
+                 min_delta: float = 0.5,
+                 max_actions_per_batch: int = 512):
+        """
+        Initialize the propagation engine.
+
+        Args:
+            affinities: Affinity graph (an empty one is created if omitted)
+            damping: Share of a change that reaches direct neighbours
+            min_delta: Smallest spillover (before rounding) that is applied
+            max_actions_per_batch: Actions combined into one matrix pass
+        """
+        self.affinities = affinities or AffinityMatrix()
+        self.damping = damping
+        self.min_delta = min_delta
+        self.max_actions_per_batch = max_actions_per_batch
+        self._pending: Deque[Tuple[str, Dict[str, int], str]] = deque()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def submit(self, player_id: str, reputation_changes: Dict[str, int], reason: str):
+        """Queue the direct reputation changes of one action for the next tick"""
+        if reputation_changes:
+            self._pending.append((player_id, dict(reputation_changes), reason))
+
+    def propagate(self, reputation_changes: Dict[str, int]) -> Dict[str, int]:
+        """Spillover of a single set of changes, without queueing"""
+        results = self.propagate_batch([("", reputation_changes, "")])
+        return results[0].deltas if results else {}
+
+    def take_batch(self) -> List[Tuple[str, Dict[str, int], str]]:
+        """Dequeue up to max_actions_per_batch queued actions, for propagate_batch()"""
+        batch_size = min(self.max_actions_per_batch, len(self._pending))
+        return [self._pending.popleft() for _ in range(batch_size)]
+
+    def next_batch(self) -> List[PropagationResult]:
+        """Propagate up to max_actions_per_batch queued actions in one pass"""
+        return self.propagate_batch(self.take_batch())
+
+    def tick(self, time_budget: Optional[float] = None) -> List[PropagationResult]:
+        """
+        Propagate queued actions in batches until the queue is empty or the
+        time budget (seconds) runs out. At least one batch is processed;
+        actions left over stay queued for the next tick.
+
+        Returns:
+            One result per player with spillover, for each processed batch
+        """
+        started = time.perf_counter()
+        results: List[PropagationResult] = []
+        while self._pending:
+            results.extend(self.next_batch())
+            if time_budget is not None and time.perf_counter() - started >= time_budget:
+                break
+        return results
+
+    def propagate_batch(self, batch: List[Tuple[str, Dict[str, int], str]]) -> List[PropagationResult]:
+        """Spread a batch of actions; actions by the same player are summed"""
+        affinities = self.affinities
+        players: Dict[str, int] = {}
+        reasons: List[List[str]] = []
+        columns, sources, values = [], [], []
+
+        for player_id, changes, reason in batch:
+            column = players.get(player_id)
+            if column is None:
+                column = players[player_id] = len(reasons)
+                reasons.append([])
+            if reason and reason not in reasons[column]:
+                reasons[column].append(reason)
+            for entity_id, change in changes.items():
+                source = affinities.find(entity_id)
+                if source is not None and change:
+                    columns.append(column)
+                    sources.append(source)
+                    values.append(change)
+        if not sources:
+            return []
+
+        indptr, targets, weights = affinities.compile()
+        sources = np.asarray(sources, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+
+        # Gather every outgoing edge of every changed entity
+        starts, ends = indptr[sources], indptr[sources + 1]
+        degrees = ends - starts
+        if not degrees.any():
+            return []
+        edge_owner = np.repeat(np.arange(len(sources)), degrees)
+        edge_offsets = np.arange(len(edge_owner)) - np.repeat(np.cumsum(degrees) - degrees, degrees)
+        edges = starts[edge_owner] + edge_offsets
+
+        # Sum spillover per (player, target entity)
+        count = len(affinities)
+        keys = columns[edge_owner] * count + targets[edges]
+        contributions = self.damping * weights[edges] * values[edge_owner]
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        totals = np.bincount(inverse, weights=contributions)
+
+        keep = np.abs(totals) >= self.min_delta
+        rounded = (np.sign(totals) * np.floor(np.abs(totals) + 0.5)).astype(np.int64)
+        keep &= rounded != 0
+        unique_keys, rounded = unique_keys[keep], rounded[keep]
+
+        if not len(unique_keys):
+            return []
+
+        # Keys are sorted, so each player's changes form one contiguous run
+        result_columns = unique_keys // count
+        names = affinities.entity_array()[unique_keys % count].tolist()
+        amounts = rounded.tolist()
+        bounds = [0] + (np.flatnonzero(np.diff(result_columns)) + 1).tolist() + [len(names)]
+        player_ids = list(players)
+        results = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            column = int(result_columns[start])
+            results.append(PropagationResult(player_id=player_ids[column],
+                                             deltas=dict(zip(names[start:end], amounts[start:end])),
+                                             reasons=reasons[column]))
+        return results
@@ -4,6 +4,8 @@ FastAPI application for the game engine's backend API.
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from ..shared.metrics import instrument_app
+
 from .characters import router as characters_router
 from .economy import router as economy_router
 from .combat_api import router as combat_router
@@ -34,6 +36,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Request latency histograms and the /metrics exposition endpoint
+    instrument_app(app, subsystem="game_api")
+
     # Include routers
     app.include_router(characters_router, prefix="/api")
     app.include_router(economy_router, prefix="/api")
@@ -4,6 +4,12 @@ Minimal FastAPI demo application for character creation.
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+try:
+    from ..shared.metrics import instrument_app
+except ImportError:
+    # Run with backend/src on sys.path, like demo_character_creation's imports
+    from shared.metrics import instrument_app
+
 from .demo_character_creation import router as character_creation_router
 
 def create_app() -> FastAPI:
@@ -28,6 +34,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Request latency histograms and the /metrics exposition endpoint
+    instrument_app(app, subsystem="demo_api")
+
     # Include character creation router
     app.include_router(character_creation_router, prefix="/api")
 
@@ -18,7 +18,8 @@ from backend.src.business.models.db_models import (
     DBBusinessFixtureOrUpgrade, DBResearchProject, DBConstructionProjectTracker,
     DBBusinessExpansionProposal, DBDailyBusinessSummary, DBStaffJobListing,
     DBCustomerInteraction, DBFinancialTransaction, 
-    BusinessType, PropertyType, BusinessLicenseStatus, CustomOrderStatus
+    BusinessType, PropertyType, BusinessLicenseStatus, CustomOrderStatus,
+    TransactionType as DBTransactionType, staff_contracts_association
 )
 
 from backend.src.business.models.pydantic_models import (
@@ -31,6 +32,9 @@ from backend.src.business.models.pydantic_models import (
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of IDs passed in a single IN (...) clause by the bulk helpers
+BULK_QUERY_CHUNK_SIZE = 500
+
 # Helper functions for converting between Pydantic and SQLAlchemy models
 def db_to_pydantic_player_business(db_business: DBPlayerBusinessProfile) -> PlayerBusinessProfile:
     """Convert a database player business model to a Pydantic model."""
@@ -163,11 +167,20 @@ def db_to_pydantic_custom_order(db_order: DBCustomOrderRequest) -> CustomOrderRe
         custom_data=db_order.custom_data or {}
     )
 
-def db_to_pydantic_staff_contract(db_contract: DBStaffMemberContract) -> StaffMemberContract:
-    """Convert a database staff contract model to a Pydantic model."""
+def db_to_pydantic_staff_contract(db_contract: DBStaffMemberContract,
+                                  business_id: Optional[str] = None) -> StaffMemberContract:
+    """
+    Convert a database staff contract model to a Pydantic model.
+
+    When the owning business ID is already known (e.g. from a joined bulk query),
+    pass it as ``business_id`` to avoid lazy-loading the business relationship.
+    """
+    if business_id is None and db_contract.business:
+        business_id = db_contract.business[0].id
+
     return StaffMemberContract(
         id=db_contract.id,
-        player_business_profile_id=db_contract.business[0].id if db_contract.business else None,
+        player_business_profile_id=business_id,
         npc_id=db_contract.npc_id,
         role_title=db_contract.role_title,
         agreed_wage_per_period=db_contract.agreed_wage_per_period,
@@ -1314,6 +1327,190 @@ def record_financial_transaction(
         logger.error(f"Error recording financial transaction: {str(e)}")
         raise
 
+def _chunked(items: List[Any], size: int = BULK_QUERY_CHUNK_SIZE):
+    """Yield successive slices of ``items`` no longer than ``size``."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def get_staff_contracts_for_businesses(
+    db: Session,
+    business_ids: List[str]
+) -> Dict[str, List[StaffMemberContract]]:
+    """
+    Get staff contracts for many businesses with one query per ID chunk.
+
+    Args:
+        db: Database session
+        business_ids: Business profile IDs
+
+    Returns:
+        Mapping of business ID to its staff contracts (businesses without staff map to [])
+    """
+    contracts_by_business: Dict[str, List[StaffMemberContract]] = {business_id: [] for business_id in business_ids}
+    try:
+        for chunk in _chunked(list(contracts_by_business.keys())):
+            rows = db.query(staff_contracts_association.c.player_business_id, DBStaffMemberContract).join(
+                DBStaffMemberContract,
+                DBStaffMemberContract.id == staff_contracts_association.c.contract_id
+            ).filter(
+                staff_contracts_association.c.player_business_id.in_(chunk)
+            ).all()
+
+            for business_id, db_contract in rows:
+                contracts_by_business[business_id].append(
+                    db_to_pydantic_staff_contract(db_contract, business_id=business_id)
+                )
+
+        return contracts_by_business
+    except SQLAlchemyError as e:
+        logger.error(f"Error retrieving staff contracts for {len(business_ids)} businesses: {str(e)}")
+        raise
+
+def get_business_inventories(db: Session, business_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Get the raw inventory JSON for many businesses without loading full profiles.
+
+    Args:
+        db: Database session
+        business_ids: Business profile IDs
+
+    Returns:
+        Mapping of business ID to its inventory dictionary (missing businesses are omitted)
+    """
+    inventories: Dict[str, Dict[str, Any]] = {}
+    try:
+        for chunk in _chunked(list(dict.fromkeys(business_ids))):
+            rows = db.query(DBPlayerBusinessProfile.id, DBPlayerBusinessProfile.inventory).filter(
+                DBPlayerBusinessProfile.id.in_(chunk)
+            ).all()
+            for business_id, inventory in rows:
+                inventories[business_id] = inventory or {}
+
+        return inventories
+    except SQLAlchemyError as e:
+        logger.error(f"Error retrieving inventories for {len(business_ids)} businesses: {str(e)}")
+        raise
+
+def record_financial_transactions_bulk(
+    db: Session,
+    transactions: List[Dict[str, Any]],
+    staff_contract_updates: Optional[Dict[str, Dict[str, Any]]] = None,
+    business_updates: Optional[Dict[str, Dict[str, Any]]] = None
+) -> List[FinancialTransaction]:
+    """
+    Post many financial transactions in a single database transaction.
+
+    Unlike ``record_financial_transaction``, which commits and refreshes once per
+    posting, this loads every affected business in one query, applies one
+    aggregated balance/revenue/expense delta per business, appends the ledger
+    entries, bulk-updates staff contracts and commits exactly once. Either all
+    postings are applied or none are.
+
+    Args:
+        db: Database session
+        transactions: Postings, each a dict with ``business_id``, ``transaction_type``,
+            ``amount``, ``description`` and ``is_income`` plus the optional
+            ``related_entity_id``, ``related_entity_name``, ``category`` and ``item_details``
+        staff_contract_updates: Optional mapping of contract ID to column updates
+        business_updates: Optional mapping of business ID to extra column updates
+            (e.g. ``inventory``) applied in the same transaction
+
+    Returns:
+        List of recorded transactions, in the order they were given
+    """
+    staff_contract_updates = staff_contract_updates or {}
+    business_updates = business_updates or {}
+
+    try:
+        business_ids = list(dict.fromkeys(
+            [posting["business_id"] for posting in transactions] + list(business_updates.keys())
+        ))
+
+        db_businesses: Dict[str, DBPlayerBusinessProfile] = {}
+        for chunk in _chunked(business_ids):
+            for db_business in db.query(DBPlayerBusinessProfile).filter(DBPlayerBusinessProfile.id.in_(chunk)).all():
+                db_businesses[db_business.id] = db_business
+
+        missing = [business_id for business_id in business_ids if business_id not in db_businesses]
+        if missing:
+            raise ValueError(f"Business with ID {missing[0]} not found")
+
+        timestamp = datetime.utcnow()
+        db_transactions = []
+        ledger_entries: Dict[str, List[Dict[str, Any]]] = {}
+        deltas: Dict[str, Dict[str, float]] = {}
+
+        for posting in transactions:
+            business_id = posting["business_id"]
+            transaction_type = DBTransactionType(TransactionType(posting["transaction_type"]).value)
+            amount = posting["amount"]
+            is_income = posting["is_income"]
+            transaction_id = f"transaction-{uuid4().hex[:8]}"
+
+            db_transactions.append(DBFinancialTransaction(
+                id=transaction_id,
+                player_business_profile_id=business_id,
+                transaction_type=transaction_type,
+                amount=amount,
+                description=posting["description"],
+                related_entity_id=posting.get("related_entity_id"),
+                related_entity_name=posting.get("related_entity_name"),
+                timestamp=timestamp,
+                is_income=is_income,
+                category=posting.get("category"),
+                item_details=posting.get("item_details")
+            ))
+
+            ledger_entries.setdefault(business_id, []).append({
+                "id": transaction_id,
+                "transaction_type": transaction_type.value,
+                "amount": amount,
+                "description": posting["description"],
+                "related_entity_id": posting.get("related_entity_id"),
+                "related_entity_name": posting.get("related_entity_name"),
+                "timestamp": timestamp.isoformat(),
+                "is_income": is_income,
+                "category": posting.get("category"),
+                "item_details": posting.get("item_details")
+            })
+
+            delta = deltas.setdefault(business_id, {"revenue": 0.0, "expenses": 0.0})
+            if is_income:
+                delta["revenue"] += amount
+            else:
+                delta["expenses"] += amount
+
+        # Apply one aggregated delta per business
+        for business_id, delta in deltas.items():
+            db_business = db_businesses[business_id]
+            db_business.current_balance = (db_business.current_balance or 0.0) + delta["revenue"] - delta["expenses"]
+            db_business.total_revenue = (db_business.total_revenue or 0.0) + delta["revenue"]
+            db_business.total_expenses = (db_business.total_expenses or 0.0) + delta["expenses"]
+            # Reassign rather than append so the JSON column change is detected
+            db_business.shop_ledger = list(db_business.shop_ledger or []) + ledger_entries[business_id]
+
+        for business_id, update_data in business_updates.items():
+            db_business = db_businesses[business_id]
+            for key, value in update_data.items():
+                if hasattr(db_business, key):
+                    setattr(db_business, key, value)
+
+        db.add_all(db_transactions)
+
+        if staff_contract_updates:
+            db.bulk_update_mappings(DBStaffMemberContract, [
+                {"id": contract_id, **update_data}
+                for contract_id, update_data in staff_contract_updates.items()
+            ])
+
+        db.commit()
+
+        return [db_to_pydantic_transaction(db_transaction) for db_transaction in db_transactions]
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error recording {len(transactions)} financial transactions in bulk: {str(e)}")
+        raise
+
 def record_customer_interaction(
     db: Session,
     business_id: str,
@@ -22,7 +22,8 @@ from backend.src.business.crud import (
     create_custom_order, update_custom_order, get_custom_order, get_custom_orders_by_business,
     get_staff_contract, update_staff_contract, get_staff_contracts_by_business,
     record_financial_transaction, record_customer_interaction, create_daily_business_summary,
-    create_staff_job_listing, close_staff_job_listing
+    create_staff_job_listing, close_staff_job_listing,
+    get_staff_contracts_for_businesses, get_business_inventories, record_financial_transactions_bulk
 )
 
 logger = logging.getLogger(__name__)
@@ -1172,40 +1173,63 @@ class PlayerBusinessDailyOperationsService:
         # Get all staff contracts
         staff_contracts = get_staff_contracts_by_business(db, business_id)
         
-        # Track payment results
+        payment_results, postings, contract_updates = self._build_wage_postings(
+            business_id, staff_contracts, payment_date
+        )
+        
+        # Post all wage transactions, contract updates and the balance delta at once
+        if postings:
+            record_financial_transactions_bulk(db, postings, staff_contract_updates=contract_updates)
+        
+        self.logger.info(f"Paid wages to {len(payment_results['staff_payments'])} staff members, total: {payment_results['total_wages_paid']}")
+        
+        return payment_results
+    
+    def _build_wage_postings(
+        self,
+        business_id: str,
+        staff_contracts: List[StaffMemberContract],
+        payment_date: datetime
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Work out which wages are due without touching the database.
+        
+        Args:
+            business_id: Business profile ID
+            staff_contracts: Staff contracts of the business
+            payment_date: Payment date
+            
+        Returns:
+            Tuple of (payment results, transaction postings, staff contract updates)
+        """
         payment_results = {
             "payment_date": payment_date.isoformat(),
             "total_wages_paid": 0.0,
             "staff_payments": [],
             "staff_count": len(staff_contracts)
         }
+        postings = []
+        contract_updates = {}
         
-        # Process each staff member
         for staff in staff_contracts:
             # Check if payment is due based on schedule
             if not self._is_wage_payment_due(staff, payment_date):
                 continue
                 
-            # Calculate payment amount
             payment_amount = staff.agreed_wage_per_period
             
-            # Record transaction
-            record_financial_transaction(
-                db=db,
-                business_id=business_id,
-                transaction_type=TransactionType.WAGE_PAYMENT,
-                amount=payment_amount,
-                description=f"Wage payment to {staff.npc_id} ({staff.role_title})",
-                is_income=False,
-                related_entity_id=staff.npc_id,
-                related_entity_name=staff.npc_id,  # Would be NPC name in a real system
-                category="staff_wages"
-            )
-            
-            # Update staff contract
-            update_staff_contract(db, staff.id, {"last_wage_payment_date": payment_date})
+            postings.append({
+                "business_id": business_id,
+                "transaction_type": TransactionType.WAGE_PAYMENT,
+                "amount": payment_amount,
+                "description": f"Wage payment to {staff.npc_id} ({staff.role_title})",
+                "is_income": False,
+                "related_entity_id": staff.npc_id,
+                "related_entity_name": staff.npc_id,  # Would be NPC name in a real system
+                "category": "staff_wages"
+            })
+            contract_updates[staff.id] = {"last_wage_payment_date": payment_date}
             
-            # Update payment results
             payment_results["total_wages_paid"] += payment_amount
             payment_results["staff_payments"].append({
                 "staff_id": staff.id,
@@ -1214,15 +1238,7 @@ class PlayerBusinessDailyOperationsService:
                 "payment_amount": payment_amount
             })
         
-        # Update business balance
-        update_business(db, business_id, {
-            "current_balance": business.current_balance - payment_results["total_wages_paid"],
-            "total_expenses": business.total_expenses + payment_results["total_wages_paid"]
-        })
-        
-        self.logger.info(f"Paid wages to {len(payment_results['staff_payments'])} staff members, total: {payment_results['total_wages_paid']}")
-        
-        return payment_results
+        return payment_results, postings, contract_updates
     
     def _is_wage_payment_due(self, staff: StaffMemberContract, payment_date: datetime) -> bool:
         """
@@ -1495,25 +1511,59 @@ class PlayerBusinessDailyOperationsService:
         if not business:
             raise ValueError(f"Business {business_id} not found")
             
-        inventory = business.inventory or {}
+        spoilage_results, updated_inventory = self._compute_spoilage(business.inventory or {}, datetime.utcnow())
+        
+        # Update inventory if there were any changes
+        if spoilage_results["expired_items"]:
+            update_business(db, business_id, {"inventory": updated_inventory})
+            
+            # Record spoilage loss transaction
+            if spoilage_results["total_value_lost"] > 0:
+                record_financial_transaction(
+                    db=db,
+                    business_id=business_id,
+                    transaction_type=TransactionType.OTHER,
+                    amount=spoilage_results["total_value_lost"],
+                    description="Inventory spoilage loss",
+                    is_income=False,
+                    category="inventory_loss"
+                )
         
-        # Track spoilage
+        self.logger.info(f"Checked for spoilage in business {business_id}, items expired: {len(spoilage_results['expired_items'])}")
+        
+        return spoilage_results
+    
+    def _compute_spoilage(
+        self,
+        inventory: Dict[str, Any],
+        check_time: datetime
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Work out expired and soon-expiring stock without touching the database.
+        
+        Args:
+            inventory: Raw business inventory (item ID -> item data)
+            check_time: Time to check expiration against
+            
+        Returns:
+            Tuple of (spoilage results, updated inventory)
+        """
         spoilage_results = {
-            "check_date": datetime.utcnow().isoformat(),
+            "check_date": check_time.isoformat(),
             "expired_items": [],
             "soon_expiring_items": [],
             "total_value_lost": 0.0
         }
         
         # Check each inventory item
-        updated_inventory = inventory.copy()
+        updated_inventory = {item_id: dict(item_data) for item_id, item_data in inventory.items()}
         for item_id, item_data in inventory.items():
             # Check if item has expiration date
             if "expiration_date" in item_data and item_data["expiration_date"] and item_data["quantity"] > 0:
                 expiration = datetime.fromisoformat(item_data["expiration_date"]) \
                              if isinstance(item_data["expiration_date"], str) else item_data["expiration_date"]
                 
-                if expiration <= datetime.utcnow():
+                if expiration <= check_time:
                     # Item has expired
                     value_lost = item_data["quantity"] * (item_data.get("purchase_price_per_unit", 0.0))
                     spoilage_results["total_value_lost"] += value_lost
@@ -1528,49 +1578,142 @@ class PlayerBusinessDailyOperationsService:
                     
                     # Remove from inventory
                     updated_inventory[item_id]["quantity"] = 0
-                elif (expiration - datetime.utcnow()).days <= 3:  # Expiring within 3 days
+                elif (expiration - check_time).days <= 3:  # Expiring within 3 days
                     # Flag for imminent expiration
                     spoilage_results["soon_expiring_items"].append({
                         "item_id": item_id,
                         "name": item_data.get("name", f"Item {item_id}"),
                         "quantity": item_data["quantity"],
                         "expiration_date": expiration.isoformat(),
-                        "days_until_expiry": (expiration - datetime.utcnow()).days,
+                        "days_until_expiry": (expiration - check_time).days,
                         "potential_value_at_risk": item_data["quantity"] * (item_data.get("purchase_price_per_unit", 0.0))
                     })
             
-            # Check for general degradation based on time since restocking
-            # This would be more sophisticated in a real system
-            # For now, just flag items that haven't been restocked in a long time
-            if "last_restocked" in item_data and item_data["last_restocked"] and item_data["quantity"] > 0:
-                last_restocked = datetime.fromisoformat(item_data["last_restocked"]) \
-                                if isinstance(item_data["last_restocked"], str) else item_data["last_restocked"]
-                
-                # If it's been more than 60 days since restocking, some degradation might occur
-                if (datetime.utcnow() - last_restocked).days > 60:
-                    # Simulate some degradation for certain item types
-                    # This would be more sophisticated in a real system
-                    pass
+            # General degradation based on time since restocking would be handled here
+            # in a more sophisticated system (e.g. items not restocked for 60+ days)
         
-        # Update inventory if there were any changes
-        if spoilage_results["expired_items"]:
-            update_business(db, business_id, {"inventory": updated_inventory})
+        return spoilage_results, updated_inventory
+    
+    # === BATCHED DAILY PROCESSING ===
+    
+    def process_daily_operations_batch(
+        self,
+        db: Session,
+        business_ids: List[str],
+        processing_date: Optional[datetime] = None,
+        scheduled_payments: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        include_spoilage: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Run one world tick of daily processing for many businesses as a single batched job.
+        
+        Payroll, rent/taxes and spoilage for every business are computed in memory from
+        a handful of bulk reads, then posted with one ``record_financial_transactions_bulk``
+        call, so the whole tick is one database transaction.
+        
+        Args:
+            db: Database session
+            business_ids: Business profile IDs to process
+            processing_date: Optional processing date (defaults to current date)
+            scheduled_payments: Optional mapping of business ID to rent/tax payments due this
+                tick, each a dict with ``payment_type`` ("rent" or "tax") and ``amount``
+            include_spoilage: Whether to expire perishable stock
             
-            # Record spoilage loss transaction
-            if spoilage_results["total_value_lost"] > 0:
-                record_financial_transaction(
-                    db=db,
-                    business_id=business_id,
-                    transaction_type=TransactionType.OTHER,
-                    amount=spoilage_results["total_value_lost"],
-                    description="Inventory spoilage loss",
-                    is_income=False,
-                    category="inventory_loss"
-                )
+        Returns:
+            Dictionary with per-business and aggregate results
+        """
+        processing_date = processing_date or datetime.utcnow()
+        scheduled_payments = scheduled_payments or {}
+        business_ids = list(dict.fromkeys(business_ids))
+        
+        staff_by_business = get_staff_contracts_for_businesses(db, business_ids)
+        inventories = get_business_inventories(db, business_ids) if include_spoilage else {}
+        
+        if include_spoilage:
+            missing = [business_id for business_id in business_ids if business_id not in inventories]
+            if missing:
+                raise ValueError(f"Business {missing[0]} not found")
+        
+        batch_results = {
+            "processing_date": processing_date.isoformat(),
+            "businesses_processed": len(business_ids),
+            "transactions_posted": 0,
+            "total_wages_paid": 0.0,
+            "total_rent_and_taxes_paid": 0.0,
+            "total_spoilage_loss": 0.0,
+            "businesses": {}
+        }
+        postings: List[Dict[str, Any]] = []
+        contract_updates: Dict[str, Dict[str, Any]] = {}
+        business_updates: Dict[str, Dict[str, Any]] = {}
+        
+        for business_id in business_ids:
+            # Payroll
+            wage_results, wage_postings, wage_contract_updates = self._build_wage_postings(
+                business_id, staff_by_business.get(business_id, []), processing_date
+            )
+            postings.extend(wage_postings)
+            contract_updates.update(wage_contract_updates)
+            
+            # Rent and taxes
+            property_payments = []
+            for payment in scheduled_payments.get(business_id, []):
+                payment_type = payment["payment_type"]
+                if payment_type not in ["rent", "tax"]:
+                    raise ValueError("Payment type must be 'rent' or 'tax'")
+                    
+                postings.append({
+                    "business_id": business_id,
+                    "transaction_type": TransactionType.RENT_PAYMENT if payment_type == "rent" else TransactionType.TAX_PAYMENT,
+                    "amount": payment["amount"],
+                    "description": "Rent payment" if payment_type == "rent" else "Property tax payment",
+                    "is_income": False,
+                    "related_entity_name": None if payment_type == "rent" else "Tax Authority",
+                    "category": payment_type
+                })
+                property_payments.append({"payment_type": payment_type, "payment_amount": payment["amount"]})
+            
+            # Spoilage
+            spoilage_results = None
+            if include_spoilage:
+                spoilage_results, updated_inventory = self._compute_spoilage(inventories[business_id], processing_date)
+                if spoilage_results["expired_items"]:
+                    business_updates[business_id] = {"inventory": updated_inventory}
+                    if spoilage_results["total_value_lost"] > 0:
+                        postings.append({
+                            "business_id": business_id,
+                            "transaction_type": TransactionType.OTHER,
+                            "amount": spoilage_results["total_value_lost"],
+                            "description": "Inventory spoilage loss",
+                            "is_income": False,
+                            "category": "inventory_loss"
+                        })
+            
+            rent_and_taxes = sum(payment["payment_amount"] for payment in property_payments)
+            batch_results["total_wages_paid"] += wage_results["total_wages_paid"]
+            batch_results["total_rent_and_taxes_paid"] += rent_and_taxes
+            batch_results["total_spoilage_loss"] += spoilage_results["total_value_lost"] if spoilage_results else 0.0
+            batch_results["businesses"][business_id] = {
+                "wages": wage_results,
+                "property_payments": property_payments,
+                "spoilage": spoilage_results
+            }
         
-        self.logger.info(f"Checked for spoilage in business {business_id}, items expired: {len(spoilage_results['expired_items'])}")
+        if postings or contract_updates or business_updates:
+            record_financial_transactions_bulk(
+                db,
+                postings,
+                staff_contract_updates=contract_updates,
+                business_updates=business_updates
+            )
+        batch_results["transactions_posted"] = len(postings)
         
-        return spoilage_results
+        self.logger.info(
+            f"Processed daily operations for {len(business_ids)} businesses, "
+            f"{len(postings)} transactions posted"
+        )
+        
+        return batch_results
     
     # === SHOP FRONT OPERATIONS METHODS ===
     
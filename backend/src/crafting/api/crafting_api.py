@@ -566,7 +566,7 @@ class CraftingAPI:
         )
     
     def get_popular_recipes(
-        self, db: Session, limit: int = 10
+        self, db: Session, limit: int = 10, window: str = "all_time"
     ) -> List[Dict[str, Any]]:
         """
         Get the most popular recipes based on crafting frequency.
@@ -574,11 +574,12 @@ class CraftingAPI:
         Args:
             db: Database session
             limit: Maximum number of recipes to return
+            window: Leaderboard window ("day", "week" or "all_time")
             
         Returns:
             List of popular recipes with crafting counts
         """
-        return crafting_service.get_popular_recipes(db=db, limit=limit)
+        return crafting_service.get_popular_recipes(db=db, limit=limit, window=window)
     
     # === Business Integration ===
     
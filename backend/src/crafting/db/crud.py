@@ -5,14 +5,17 @@ This module provides CRUD operations for the material and recipe system.
 """
 
 import uuid
-from typing import Dict, List, Optional, Any, Union, Type, TypeVar, Generic
+from typing import Dict, List, Optional, Any, Set, Union, Type, TypeVar, Generic
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, not_
+from sqlalchemy import or_, and_, not_, func, case
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 
 from backend.src.crafting.models.db_models import (
     DBMaterial, DBRecipe, DBRecipeIngredient, DBRecipeOutput,
-    DBSkillRequirement, DBPlayerKnownRecipe, DBCraftingLog
+    DBSkillRequirement, DBPlayerKnownRecipe, DBCraftingLog,
+    DBRecipeCraftingStats, DBRecipeCraftingDailyStats
 )
 from backend.src.crafting.models.pydantic_models import (
     Material, Recipe, RecipeIngredient, RecipeOutput,
@@ -286,6 +289,25 @@ class CRUDMaterial(CRUDBase[DBMaterial, Material, Material]):
         db.refresh(db_obj)
         return db_obj
 
+def _recipe_column_values(recipe_data: Recipe, exclude: set) -> Dict[str, Any]:
+    """
+    Get the DBRecipe column values for a Pydantic recipe.
+    
+    Fields without a column of their own are dropped, except the auto-learn
+    threshold, which is kept in ``unlock_conditions``.
+    """
+    recipe_dict = recipe_data.dict(exclude=exclude)
+    auto_learn = recipe_dict.pop("auto_learn_at_skill_level", None)
+    unlock_conditions = dict(recipe_dict.get("unlock_conditions") or {})
+    if auto_learn:
+        unlock_conditions["auto_learn_at_skill_level"] = auto_learn
+    else:
+        unlock_conditions.pop("auto_learn_at_skill_level", None)
+    recipe_dict["unlock_conditions"] = unlock_conditions
+    
+    columns = set(DBRecipe.__table__.columns.keys())
+    return {key: value for key, value in recipe_dict.items() if key in columns}
+
 class CRUDRecipe(CRUDBase[DBRecipe, Recipe, Recipe]):
     """
     CRUD operations for recipes.
@@ -462,7 +484,7 @@ class CRUDRecipe(CRUDBase[DBRecipe, Recipe, Recipe]):
             Created recipe with relationships
         """
         # Create recipe
-        recipe_dict = recipe_data.dict(exclude={"ingredients", "primary_output", "byproducts", "required_skills"})
+        recipe_dict = _recipe_column_values(recipe_data, exclude={"ingredients", "primary_output", "byproducts", "required_skills"})
         if not recipe_dict.get("id"):
             recipe_dict["id"] = str(uuid.uuid4())
         
@@ -530,8 +552,8 @@ class CRUDRecipe(CRUDBase[DBRecipe, Recipe, Recipe]):
             Updated recipe with relationships
         """
         # Update recipe basic fields
-        recipe_dict = obj_in.dict(
-            exclude={"id", "ingredients", "primary_output", "byproducts", "required_skills"}
+        recipe_dict = _recipe_column_values(
+            obj_in, exclude={"id", "ingredients", "primary_output", "byproducts", "required_skills"}
         )
         for field, value in recipe_dict.items():
             setattr(db_obj, field, value)
@@ -675,6 +697,70 @@ class CRUDPlayerKnownRecipe(CRUDBase[DBPlayerKnownRecipe, None, None]):
         db.refresh(db_obj)
         return db_obj
     
+    def get_known_recipe_ids(self, db: Session, *, player_id: str) -> Set[str]:
+        """
+        Get the IDs of all recipes known by a player.
+        
+        Args:
+            db: Database session
+            player_id: ID of the player
+            
+        Returns:
+            Set of known recipe IDs
+        """
+        rows = (
+            db.query(DBPlayerKnownRecipe.recipe_id)
+            .filter(DBPlayerKnownRecipe.player_id == player_id)
+            .all()
+        )
+        return {recipe_id for (recipe_id,) in rows}
+    
+    def add_recipes_to_player_bulk(
+        self, db: Session, *, player_id: str, recipe_ids: List[str]
+    ) -> List[DBPlayerKnownRecipe]:
+        """
+        Add many recipes to a player's known recipes with a single commit.
+        
+        Recipes the player already knows are skipped.
+        
+        Args:
+            db: Database session
+            player_id: ID of the player
+            recipe_ids: IDs of the recipes
+            
+        Returns:
+            Newly created player known recipe records
+        """
+        if not recipe_ids:
+            return []
+        
+        already_known = {
+            recipe_id for (recipe_id,) in (
+                db.query(DBPlayerKnownRecipe.recipe_id)
+                .filter(
+                    DBPlayerKnownRecipe.player_id == player_id,
+                    DBPlayerKnownRecipe.recipe_id.in_(recipe_ids)
+                )
+                .all()
+            )
+        }
+        
+        discovery_date = datetime.utcnow()
+        db_objs = [
+            DBPlayerKnownRecipe(
+                id=str(uuid.uuid4()),
+                player_id=player_id,
+                recipe_id=recipe_id,
+                discovery_date=discovery_date
+            )
+            for recipe_id in dict.fromkeys(recipe_ids)
+            if recipe_id not in already_known
+        ]
+        if db_objs:
+            db.add_all(db_objs)
+            db.commit()
+        return db_objs
+    
     def remove_recipe_from_player(
         self, db: Session, *, player_id: str, recipe_id: str
     ) -> Optional[DBPlayerKnownRecipe]:
@@ -878,12 +964,163 @@ class CRUDCraftingLog(CRUDBase[DBCraftingLog, None, None]):
             custom_data=custom_data
         )
         db.add(db_obj)
+        # Keep the popularity counters in step with the log, in the same transaction
+        if recipe_id:
+            recipe_crafting_stats.record_craft(
+                db=db,
+                recipe_id=recipe_id,
+                success=success,
+                quantity_produced=quantity_produced if success else 0,
+                timestamp=db_obj.timestamp
+            )
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+# Dialect INSERT constructs supporting ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+class CRUDRecipeCraftingStats(CRUDBase[DBRecipeCraftingStats, None, None]):
+    """
+    CRUD operations for the incrementally maintained per-recipe crafting counters.
+    """
+    def record_craft(
+        self, db: Session, *,
+        recipe_id: str,
+        success: bool,
+        quantity_produced: int,
+        timestamp: datetime
+    ) -> None:
+        """
+        Add one crafting attempt to the all-time and daily counters of a recipe.
+        
+        Each counter row is upserted with a single INSERT ... ON CONFLICT DO
+        UPDATE that adds to the stored values (``col = col + n``), so concurrent
+        writers neither lose increments nor collide when both create the first
+        row of a recipe or day. Databases without ON CONFLICT support retry the
+        UPDATE when a concurrent insert wins. The caller is responsible for
+        committing.
+        
+        Args:
+            db: Database session
+            recipe_id: ID of the recipe
+            success: Whether the attempt succeeded
+            quantity_produced: Quantity produced by the attempt
+            timestamp: When the attempt happened
+        """
+        increments = {
+            "attempts": 1,
+            "successes": 1 if success else 0,
+            "quantity_produced": quantity_produced
+        }
+        self._add_to_counters(db, DBRecipeCraftingStats, {"recipe_id": recipe_id}, increments,
+                              {"last_crafted_at": timestamp})
+        self._add_to_counters(db, DBRecipeCraftingDailyStats, {"recipe_id": recipe_id, "day": timestamp.date()},
+                              increments)
+    
+    def _add_to_counters(
+        self, db: Session, model: Type[ModelType],
+        key: Dict[str, Any],
+        increments: Dict[str, int],
+        assignments: Optional[Dict[str, Any]] = None
+    ) -> None:
+        assignments = assignments or {}
+        table = model.__table__
+        upsert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+        if upsert is not None:
+            stmt = upsert(table).values(**key, **increments, **assignments)
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=list(key),
+                set_={
+                    **{column: table.c[column] + stmt.excluded[column] for column in increments},
+                    **{column: stmt.excluded[column] for column in assignments}
+                }
+            ))
+            return
+        
+        values = {**{table.c[column]: table.c[column] + amount for column, amount in increments.items()},
+                  **{table.c[column]: value for column, value in assignments.items()}}
+        while True:
+            if db.query(model).filter_by(**key).update(values, synchronize_session=False):
+                return
+            try:
+                with db.begin_nested():
+                    db.add(model(**key, **increments, **assignments))
+                return
+            except IntegrityError:
+                # Another writer created the row first; add to it instead
+                continue
+    
+    def rebuild_from_logs(self, db: Session) -> int:
+        """
+        Recompute all counters from the crafting log with GROUP BY queries.
+        
+        Used to backfill counters for logs written before they existed.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            Number of recipes with counters
+        """
+        produced = func.coalesce(
+            func.sum(case((DBCraftingLog.success.is_(True), DBCraftingLog.quantity_produced), else_=0)), 0
+        )
+        successes = func.sum(case((DBCraftingLog.success.is_(True), 1), else_=0))
+        
+        db.query(DBRecipeCraftingDailyStats).delete(synchronize_session=False)
+        db.query(DBRecipeCraftingStats).delete(synchronize_session=False)
+        
+        totals = (
+            db.query(
+                DBCraftingLog.recipe_id,
+                func.count(DBCraftingLog.id),
+                successes,
+                produced,
+                func.max(DBCraftingLog.timestamp)
+            )
+            .filter(DBCraftingLog.recipe_id.isnot(None))
+            .group_by(DBCraftingLog.recipe_id)
+            .all()
+        )
+        db.add_all([
+            DBRecipeCraftingStats(
+                recipe_id=recipe_id,
+                attempts=attempts,
+                successes=success_count,
+                quantity_produced=quantity,
+                last_crafted_at=last_crafted_at
+            )
+            for recipe_id, attempts, success_count, quantity, last_crafted_at in totals
+        ])
+        
+        day = func.date(DBCraftingLog.timestamp)
+        daily = (
+            db.query(DBCraftingLog.recipe_id, day, func.count(DBCraftingLog.id), successes, produced)
+            .filter(DBCraftingLog.recipe_id.isnot(None))
+            .group_by(DBCraftingLog.recipe_id, day)
+            .all()
+        )
+        db.add_all([
+            DBRecipeCraftingDailyStats(
+                recipe_id=recipe_id,
+                day=bucket if not isinstance(bucket, str) else datetime.strptime(bucket, "%Y-%m-%d").date(),
+                attempts=attempts,
+                successes=success_count,
+                quantity_produced=quantity
+            )
+            for recipe_id, bucket, attempts, success_count, quantity in daily
+        ])
+        
+        db.commit()
+        return len(totals)
+
 # Create instances of CRUD classes
 material = CRUDMaterial(DBMaterial)
 recipe = CRUDRecipe(DBRecipe)
 player_known_recipe = CRUDPlayerKnownRecipe(DBPlayerKnownRecipe)
-crafting_log = CRUDCraftingLog(DBCraftingLog)
\ No newline at end of file
+crafting_log = CRUDCraftingLog(DBCraftingLog)
+recipe_crafting_stats = CRUDRecipeCraftingStats(DBRecipeCraftingStats)
\ No newline at end of file
@@ -9,7 +9,7 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from sqlalchemy import (
     Column, String, Integer, Float, Boolean, 
-    ForeignKey, DateTime, Text, JSON, Enum
+    ForeignKey, DateTime, Date, Text, JSON, Enum
 )
 from sqlalchemy.orm import relationship
 import enum
@@ -181,4 +181,32 @@ class DBCraftingLog(Base):
     recipe = relationship("DBRecipe", back_populates="crafting_logs")
     
     def __repr__(self):
-        return f"<CraftingLog {self.id} (Player: {self.player_id}, Recipe: {self.recipe_id}, Success: {self.success})>"
\ No newline at end of file
+        return f"<CraftingLog {self.id} (Player: {self.player_id}, Recipe: {self.recipe_id}, Success: {self.success})>"
+
+class DBRecipeCraftingStats(Base):
+    """Database model for all-time crafting counters per recipe, maintained as logs are written."""
+    
+    __tablename__ = "recipe_crafting_stats"
+    
+    recipe_id = Column(String(36), ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    successes = Column(Integer, nullable=False, default=0)
+    quantity_produced = Column(Integer, nullable=False, default=0, index=True)
+    last_crafted_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self):
+        return f"<RecipeCraftingStats {self.recipe_id} (Produced: {self.quantity_produced})>"
+
+class DBRecipeCraftingDailyStats(Base):
+    """Database model for per-day crafting counters per recipe, used for windowed leaderboards."""
+    
+    __tablename__ = "recipe_crafting_daily_stats"
+    
+    recipe_id = Column(String(36), ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    successes = Column(Integer, nullable=False, default=0)
+    quantity_produced = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<RecipeCraftingDailyStats {self.recipe_id} {self.day} (Produced: {self.quantity_produced})>"
@@ -0,0 +1,198 @@
+"""
+Crafting Analytics Service
+
+This module provides popularity and leaderboard queries for the crafting system.
+Leaderboards are served from per-recipe counters that are updated as crafting
+logs are written, so they never scan the crafting log itself. Counters missing
+logs written before they existed are rebuilt on first use.
+"""
+
+import logging
+from typing import Dict, List, Optional, Any
+from datetime import datetime, timedelta
+from sqlalchemy import func, case
+from sqlalchemy.orm import Session
+
+from backend.src.crafting.db.crud import recipe_crafting_stats as crud_recipe_crafting_stats
+from backend.src.crafting.models.db_models import (
+    DBRecipe, DBCraftingLog, DBRecipeCraftingStats, DBRecipeCraftingDailyStats
+)
+
+logger = logging.getLogger(__name__)
+
+# Leaderboard windows and the number of daily buckets they span (None = all time)
+LEADERBOARD_WINDOWS = {
+    "day": 1,
+    "week": 7,
+    "all_time": None,
+}
+
+
+class CraftingAnalyticsService:
+    """
+    Service for crafting popularity analytics and leaderboards.
+    """
+
+    def __init__(self):
+        self._counters_checked = False
+
+    def get_popular_recipes(
+        self,
+        db: Session,
+        limit: int = 10,
+        window: str = "all_time",
+        now: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the most crafted recipes over a time window.
+
+        Args:
+            db: Database session
+            limit: Maximum number of recipes to return
+            window: One of "day", "week" or "all_time"
+            now: Reference time for the window (defaults to current time)
+
+        Returns:
+            List of popular recipes with crafting counts, most crafted first
+        """
+        if window not in LEADERBOARD_WINDOWS:
+            raise ValueError(f"Unknown leaderboard window '{window}', expected one of {list(LEADERBOARD_WINDOWS)}")
+
+        days = LEADERBOARD_WINDOWS[window]
+        self._ensure_counters(db)
+
+        if days is None:
+            stats = DBRecipeCraftingStats
+            query = (
+                db.query(
+                    DBRecipe.id,
+                    DBRecipe.name,
+                    DBRecipe.recipe_category,
+                    DBRecipe.difficulty_level,
+                    stats.quantity_produced,
+                    stats.successes,
+                    stats.attempts
+                )
+                .join(stats, stats.recipe_id == DBRecipe.id)
+                .filter(stats.quantity_produced > 0)
+                .order_by(stats.quantity_produced.desc(), DBRecipe.name)
+            )
+        else:
+            stats = DBRecipeCraftingDailyStats
+            first_day = (now or datetime.utcnow()).date() - timedelta(days=days - 1)
+            produced = func.sum(stats.quantity_produced)
+            query = (
+                db.query(
+                    DBRecipe.id,
+                    DBRecipe.name,
+                    DBRecipe.recipe_category,
+                    DBRecipe.difficulty_level,
+                    produced,
+                    func.sum(stats.successes),
+                    func.sum(stats.attempts)
+                )
+                .join(stats, stats.recipe_id == DBRecipe.id)
+                .filter(stats.day >= first_day)
+                .group_by(DBRecipe.id, DBRecipe.name, DBRecipe.recipe_category, DBRecipe.difficulty_level)
+                .having(produced > 0)
+                .order_by(produced.desc(), DBRecipe.name)
+            )
+
+        return [
+            self._leaderboard_entry(*row)
+            for row in query.limit(limit).all()
+        ]
+
+    def get_popular_recipes_from_logs(
+        self,
+        db: Session,
+        limit: int = 10,
+        since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute recipe popularity directly from the crafting log with GROUP BY.
+
+        This does not depend on the counters and is meant for ad-hoc windows
+        and for verifying the counters against the log.
+
+        Args:
+            db: Database session
+            limit: Maximum number of recipes to return
+            since: Only count crafts at or after this time
+
+        Returns:
+            List of popular recipes with crafting counts, most crafted first
+        """
+        succeeded = DBCraftingLog.success.is_(True)
+        produced = func.sum(case((succeeded, DBCraftingLog.quantity_produced), else_=0))
+        query = (
+            db.query(
+                DBRecipe.id,
+                DBRecipe.name,
+                DBRecipe.recipe_category,
+                DBRecipe.difficulty_level,
+                produced,
+                func.sum(case((succeeded, 1), else_=0)),
+                func.count(DBCraftingLog.id)
+            )
+            .join(DBCraftingLog, DBCraftingLog.recipe_id == DBRecipe.id)
+        )
+        if since is not None:
+            query = query.filter(DBCraftingLog.timestamp >= since)
+
+        query = (
+            query.group_by(DBRecipe.id, DBRecipe.name, DBRecipe.recipe_category, DBRecipe.difficulty_level)
+            .having(produced > 0)
+            .order_by(produced.desc(), DBRecipe.name)
+            .limit(limit)
+        )
+
+        return [self._leaderboard_entry(*row) for row in query.all()]
+
+    def rebuild_counters(self, db: Session) -> int:
+        """
+        Rebuild all popularity counters from the crafting log.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of recipes with counters
+        """
+        recipe_count = crud_recipe_crafting_stats.rebuild_from_logs(db=db)
+        logger.info(f"Rebuilt crafting popularity counters for {recipe_count} recipes")
+        return recipe_count
+
+    def _ensure_counters(self, db: Session) -> None:
+        """Rebuild the counters once if they do not account for every logged craft."""
+        if self._counters_checked:
+            return
+        counted = db.query(func.coalesce(func.sum(DBRecipeCraftingStats.attempts), 0)).scalar()
+        logged = db.query(func.count(DBCraftingLog.id)).filter(DBCraftingLog.recipe_id.isnot(None)).scalar()
+        if counted != logged:
+            logger.info(f"Crafting counters cover {counted} of {logged} logged crafts, rebuilding them")
+            self.rebuild_counters(db)
+        self._counters_checked = True
+
+    def _leaderboard_entry(
+        self,
+        recipe_id: str,
+        name: str,
+        category: str,
+        difficulty_level: int,
+        quantity_produced: int,
+        successes: int,
+        attempts: int
+    ) -> Dict[str, Any]:
+        return {
+            "id": recipe_id,
+            "name": name,
+            "times_crafted": int(quantity_produced or 0),
+            "successful_crafts": int(successes or 0),
+            "attempts": int(attempts or 0),
+            "category": category,
+            "difficulty_level": difficulty_level
+        }
+
+# Create a singleton instance
+crafting_analytics_service = CraftingAnalyticsService()
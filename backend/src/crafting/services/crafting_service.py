@@ -16,6 +16,7 @@ from backend.src.crafting.db.crud import player_known_recipe as crud_player_know
 from backend.src.crafting.db.crud import crafting_log as crud_crafting_log
 from backend.src.crafting.models.pydantic_models import Recipe, CraftingResult
 from backend.src.crafting.services.recipe_service import recipe_service
+from backend.src.crafting.services.crafting_analytics_service import crafting_analytics_service
 
 # Import Celery integration for async processing
 try:
@@ -518,7 +519,8 @@ class CraftingService:
     def get_popular_recipes(
         self,
         db: Session,
-        limit: int = 10
+        limit: int = 10,
+        window: str = "all_time"
     ) -> List[Dict[str, Any]]:
         """
         Get the most popular recipes based on crafting frequency.
@@ -526,42 +528,12 @@ class CraftingService:
         Args:
             db: Database session
             limit: Maximum number of recipes to return
+            window: Leaderboard window ("day", "week" or "all_time")
             
         Returns:
             List of popular recipes with crafting counts
         """
-        # This would typically be a more complex query in a real system
-        # Here we're just counting crafting logs per recipe
-        recipe_counts = {}
-        
-        # Get all crafting logs
-        all_logs = db.query(crud_crafting_log.model).all()
-        
-        # Count successful crafts per recipe
-        for log in all_logs:
-            if log.success:
-                if log.recipe_id in recipe_counts:
-                    recipe_counts[log.recipe_id] += log.quantity_produced
-                else:
-                    recipe_counts[log.recipe_id] = log.quantity_produced
-        
-        # Sort by count (highest first)
-        sorted_recipes = sorted(recipe_counts.items(), key=lambda x: x[1], reverse=True)
-        
-        # Get recipe details for top recipes
-        result = []
-        for recipe_id, count in sorted_recipes[:limit]:
-            recipe = recipe_service.get_recipe(db=db, recipe_id=recipe_id)
-            if recipe:
-                result.append({
-                    "id": recipe_id,
-                    "name": recipe.name,
-                    "times_crafted": count,
-                    "category": recipe.recipe_category,
-                    "difficulty_level": recipe.difficulty_level
-                })
-        
-        return result
+        return crafting_analytics_service.get_popular_recipes(db=db, limit=limit, window=window)
 
     # Helper methods
     def _calculate_crafting_success_chance(
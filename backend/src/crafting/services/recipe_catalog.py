@@ -0,0 +1,307 @@
+"""
+Recipe Catalog
+
+This module provides a process-level, immutable index over all recipes in the
+crafting system. The catalog is built once from the database and shared by
+every request until a recipe (or one of its ingredients, outputs or skill
+requirements) is written, at which point it is invalidated and lazily rebuilt.
+
+Learnability is answered against per-skill sorted thresholds instead of
+re-checking every recipe for every player.
+"""
+
+import logging
+import threading
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session, selectinload
+
+from backend.src.crafting.models.db_models import (
+    DBRecipe, DBRecipeIngredient, DBRecipeOutput, DBSkillRequirement
+)
+from backend.src.crafting.models.pydantic_models import Recipe
+
+logger = logging.getLogger(__name__)
+
+# Pseudo-skill used for the ``min_character_level`` unlock condition
+CHARACTER_LEVEL_SKILL = "character_level"
+
+
+@dataclass(frozen=True)
+class SkillThresholds:
+    """Recipes requiring a skill, sorted by the level they require."""
+    levels: Tuple[int, ...]
+    recipe_ids: Tuple[str, ...]
+
+    def satisfied_by(self, level: int) -> Tuple[str, ...]:
+        """Return the IDs of recipes whose requirement is met at ``level``."""
+        return self.recipe_ids[:bisect_right(self.levels, level)]
+
+
+def _build_thresholds(pairs: Dict[str, List[Tuple[int, str]]]) -> Mapping[str, SkillThresholds]:
+    """Turn ``{skill: [(level, recipe_id), ...]}`` into sorted threshold tables."""
+    tables = {}
+    for skill_name, entries in pairs.items():
+        entries.sort()
+        tables[skill_name] = SkillThresholds(
+            levels=tuple(level for level, _ in entries),
+            recipe_ids=tuple(recipe_id for _, recipe_id in entries)
+        )
+    return MappingProxyType(tables)
+
+
+def _freeze_index(index: Dict[str, List[str]]) -> Mapping[str, Tuple[str, ...]]:
+    return MappingProxyType({key: tuple(values) for key, values in index.items()})
+
+
+class RecipeCatalog:
+    """
+    Immutable, in-memory index of all recipes.
+
+    Recipes are held as Pydantic models converted once at build time; treat them
+    as read-only. Lookups by skill requirement, ingredient, output item and
+    station type are dictionary hits.
+    """
+
+    def __init__(self, recipes: Iterable[Recipe], version: int = 0):
+        """
+        Build the catalog indexes.
+
+        Args:
+            recipes: Recipes to index
+            version: Invalidation generation this catalog was built for
+        """
+        self.version = version
+
+        by_id: Dict[str, Recipe] = {}
+        order: Dict[str, int] = {}
+        by_ingredient: Dict[str, List[str]] = defaultdict(list)
+        by_output: Dict[str, List[str]] = defaultdict(list)
+        by_station: Dict[str, List[str]] = defaultdict(list)
+        requirements: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+        auto_learn: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+        requirement_counts: Dict[str, int] = {}
+        unrestricted: List[str] = []
+
+        for recipe in recipes:
+            recipe_id = recipe.id
+            by_id[recipe_id] = recipe
+            order[recipe_id] = len(order)
+
+            for ingredient in recipe.ingredients:
+                by_ingredient[ingredient.item_id].append(recipe_id)
+            for output in [recipe.primary_output] + list(recipe.byproducts):
+                by_output[output.item_id].append(recipe_id)
+            if recipe.required_station_type:
+                by_station[recipe.required_station_type].append(recipe_id)
+
+            # A player must meet every requirement, so fold duplicates into the strictest one
+            recipe_requirements: Dict[str, int] = {}
+            for skill in recipe.required_skills:
+                recipe_requirements[skill.skill_name] = max(
+                    skill.level, recipe_requirements.get(skill.skill_name, skill.level)
+                )
+            min_level = (recipe.unlock_conditions or {}).get("min_character_level")
+            if min_level is not None:
+                recipe_requirements[CHARACTER_LEVEL_SKILL] = max(
+                    min_level, recipe_requirements.get(CHARACTER_LEVEL_SKILL, min_level)
+                )
+
+            for skill_name, level in recipe_requirements.items():
+                requirements[skill_name].append((level, recipe_id))
+            requirement_counts[recipe_id] = len(recipe_requirements)
+            if not recipe_requirements:
+                unrestricted.append(recipe_id)
+
+            if recipe.auto_learn_at_skill_level:
+                auto_learn[recipe.auto_learn_at_skill_level.skill_name].append(
+                    (recipe.auto_learn_at_skill_level.level, recipe_id)
+                )
+
+        self._by_id: Mapping[str, Recipe] = MappingProxyType(by_id)
+        self._order: Mapping[str, int] = MappingProxyType(order)
+        self._by_ingredient = _freeze_index(by_ingredient)
+        self._by_output = _freeze_index(by_output)
+        self._by_station = _freeze_index(by_station)
+        self._requirement_thresholds = _build_thresholds(requirements)
+        self._auto_learn_thresholds = _build_thresholds(auto_learn)
+        self._requirement_counts: Mapping[str, int] = MappingProxyType(requirement_counts)
+        self._unrestricted: Tuple[str, ...] = tuple(unrestricted)
+
+    @classmethod
+    def from_db(
+        cls, db: Session, converter: Callable[[DBRecipe], Recipe], version: int = 0
+    ) -> "RecipeCatalog":
+        """
+        Build a catalog from every recipe in the database.
+
+        Relationships are eager-loaded so the whole catalog costs a handful of
+        queries regardless of the number of recipes.
+
+        Args:
+            db: Database session
+            converter: Function converting a DB recipe to its Pydantic model
+            version: Invalidation generation this catalog is built for
+
+        Returns:
+            Newly built catalog
+        """
+        db_recipes = (
+            db.query(DBRecipe)
+            .options(
+                selectinload(DBRecipe.ingredients),
+                selectinload(DBRecipe.outputs),
+                selectinload(DBRecipe.required_skills),
+            )
+            .order_by(DBRecipe.name)
+            .all()
+        )
+        return cls((converter(db_recipe) for db_recipe in db_recipes), version=version)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, recipe_id: str) -> bool:
+        return recipe_id in self._by_id
+
+    def get(self, recipe_id: str) -> Optional[Recipe]:
+        """Get a recipe by ID."""
+        return self._by_id.get(recipe_id)
+
+    def _recipes(self, recipe_ids: Iterable[str]) -> List[Recipe]:
+        return [self._by_id[recipe_id] for recipe_id in recipe_ids]
+
+    def recipes_using_ingredient(self, item_id: str) -> List[Recipe]:
+        """Get recipes that consume a specific ingredient."""
+        return self._recipes(self._by_ingredient.get(item_id, ()))
+
+    def recipes_producing(self, item_id: str) -> List[Recipe]:
+        """Get recipes that produce a specific item (as primary output or byproduct)."""
+        return self._recipes(self._by_output.get(item_id, ()))
+
+    def recipes_for_station(self, station_type: str) -> List[Recipe]:
+        """Get recipes that require a specific station type."""
+        return self._recipes(self._by_station.get(station_type, ()))
+
+    def recipes_requiring_skill(self, skill_name: str, max_level: Optional[int] = None) -> List[Recipe]:
+        """
+        Get recipes that require a skill, optionally only those satisfiable at ``max_level``.
+
+        Results are ordered by the required level.
+        """
+        thresholds = self._requirement_thresholds.get(skill_name)
+        if not thresholds:
+            return []
+        recipe_ids = thresholds.recipe_ids if max_level is None else thresholds.satisfied_by(max_level)
+        return self._recipes(recipe_ids)
+
+    def learnable_recipe_ids(self, skills_data: Dict[str, int]) -> List[str]:
+        """
+        Get IDs of recipes whose skill and level requirements are all met.
+
+        For each required skill, a binary search over that skill's sorted
+        thresholds yields the recipes it satisfies; a recipe is learnable once
+        every one of its requirements has been counted.
+
+        Args:
+            skills_data: Player's skill levels (``character_level`` is treated as a skill)
+
+        Returns:
+            Recipe IDs in catalog order
+        """
+        satisfied: Dict[str, int] = defaultdict(int)
+        for skill_name, thresholds in self._requirement_thresholds.items():
+            for recipe_id in thresholds.satisfied_by(skills_data.get(skill_name, 0)):
+                satisfied[recipe_id] += 1
+
+        learnable = [
+            recipe_id for recipe_id, count in satisfied.items()
+            if count == self._requirement_counts[recipe_id]
+        ]
+        learnable.extend(self._unrestricted)
+        learnable.sort(key=self._order.__getitem__)
+        return learnable
+
+    def auto_learn_recipe_ids(self, skills_data: Dict[str, int]) -> List[str]:
+        """
+        Get IDs of recipes that are auto-learned at the given skill levels.
+
+        Args:
+            skills_data: Player's skill levels
+
+        Returns:
+            Recipe IDs in catalog order
+        """
+        recipe_ids: Set[str] = set()
+        for skill_name, thresholds in self._auto_learn_thresholds.items():
+            recipe_ids.update(thresholds.satisfied_by(skills_data.get(skill_name, 0)))
+        return sorted(recipe_ids, key=self._order.__getitem__)
+
+
+# === Process-level catalog cache ===
+
+_catalog_lock = threading.Lock()
+_catalog: Optional[RecipeCatalog] = None
+_catalog_version = 0
+
+
+def get_recipe_catalog(db: Session, converter: Callable[[DBRecipe], Recipe]) -> RecipeCatalog:
+    """
+    Get the shared recipe catalog, building it from the database if needed.
+
+    Args:
+        db: Database session used only when the catalog has to be (re)built
+        converter: Function converting a DB recipe to its Pydantic model
+
+    Returns:
+        Current recipe catalog
+    """
+    global _catalog
+    catalog = _catalog
+    if catalog is not None and catalog.version == _catalog_version:
+        return catalog
+
+    with _catalog_lock:
+        if _catalog is not None and _catalog.version == _catalog_version:
+            return _catalog
+        version = _catalog_version
+        catalog = RecipeCatalog.from_db(db, converter, version=version)
+        # Only publish if no write invalidated the catalog while it was being built
+        if version == _catalog_version:
+            _catalog = catalog
+        logger.info(f"Built recipe catalog with {len(catalog)} recipes (version {version})")
+        return catalog
+
+
+def invalidate_recipe_catalog() -> None:
+    """Discard the shared recipe catalog so the next lookup rebuilds it."""
+    global _catalog, _catalog_version
+    _catalog_version += 1
+    _catalog = None
+
+
+def _mark_recipe_write(mapper, connection, target) -> None:
+    """Invalidate on flush and remember to invalidate again once the write commits."""
+    invalidate_recipe_catalog()
+    session = object_session(target)
+    if session is not None:
+        session.info["recipe_catalog_dirty"] = True
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    # A catalog rebuilt from another session between flush and commit would still
+    # see the old rows, so invalidate again once the write is visible.
+    if session.info.pop("recipe_catalog_dirty", False):
+        invalidate_recipe_catalog()
+
+
+for _model in (DBRecipe, DBRecipeIngredient, DBRecipeOutput, DBSkillRequirement):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, _mark_recipe_write)
+
+event.listen(Session, "after_commit", _invalidate_after_commit)
@@ -10,7 +10,12 @@ from sqlalchemy.orm import Session
 
 from backend.src.crafting.db.crud import recipe as crud_recipe
 from backend.src.crafting.db.crud import player_known_recipe as crud_player_known_recipe
-from backend.src.crafting.models.pydantic_models import Recipe, RecipeIngredient, RecipeOutput, SkillRequirement
+from backend.src.crafting.models.pydantic_models import (
+    Recipe, RecipeIngredient, RecipeOutput, SkillRequirement, AutoLearnSkillLevel
+)
+from backend.src.crafting.services.recipe_catalog import (
+    RecipeCatalog, get_recipe_catalog, invalidate_recipe_catalog
+)
 
 class RecipeService:
     """
@@ -34,6 +39,7 @@ class RecipeService:
         
         # Create the recipe with all relationships
         db_recipe = crud_recipe.create_recipe_with_relationships(db=db, recipe_data=recipe_data)
+        invalidate_recipe_catalog()
         
         # Convert DB model to Pydantic model (this would need to handle relationships too)
         return self._db_recipe_to_pydantic(db_recipe)
@@ -216,6 +222,7 @@ class RecipeService:
         updated_recipe = crud_recipe.update_recipe_with_relationships(
             db=db, db_obj=db_recipe, obj_in=recipe_data
         )
+        invalidate_recipe_catalog()
         return self._db_recipe_to_pydantic(updated_recipe)
     
     def delete_recipe(self, db: Session, recipe_id: str) -> Optional[Recipe]:
@@ -238,9 +245,25 @@ class RecipeService:
         
         # Delete the recipe (this should cascade to related entities)
         crud_recipe.remove(db=db, id=recipe_id)
+        invalidate_recipe_catalog()
         
         return recipe
     
+    def get_catalog(self, db: Session) -> RecipeCatalog:
+        """
+        Get the shared in-memory recipe catalog.
+        
+        The catalog is built once per process and rebuilt only after recipes
+        are written. Recipes returned from it are shared and must not be mutated.
+        
+        Args:
+            db: Database session (used only if the catalog needs rebuilding)
+            
+        Returns:
+            Recipe catalog
+        """
+        return get_recipe_catalog(db, self._db_recipe_to_pydantic)
+    
     # === Player Recipe Knowledge Management ===
     
     def is_recipe_known_by_player(self, db: Session, player_id: str, recipe_id: str) -> bool:
@@ -376,69 +399,39 @@ class RecipeService:
         if skills_data is None:
             skills_data = {}
         
-        # Get all recipes
-        all_recipes = crud_recipe.get_multi(db=db)
-        
-        # Filter out already known recipes
-        known_recipes = set()
-        for record in crud_player_known_recipe.get_player_known_recipes(db=db, player_id=player_id):
-            known_recipes.add(record.recipe_id)
+        catalog = self.get_catalog(db)
+        known_recipes = crud_player_known_recipe.get_known_recipe_ids(db=db, player_id=player_id)
+        
+        # Auto-learn every recipe whose skill threshold has been reached in one write
+        if check_auto_learn:
+            auto_learned = [
+                recipe_id for recipe_id in catalog.auto_learn_recipe_ids(skills_data)
+                if recipe_id not in known_recipes
+            ]
+            crud_player_known_recipe.add_recipes_to_player_bulk(
+                db=db, player_id=player_id, recipe_ids=auto_learned
+            )
+            known_recipes.update(auto_learned)
         
         learnable_recipes = []
-        
-        for db_recipe in all_recipes:
+        for recipe_id in catalog.learnable_recipe_ids(skills_data):
             # Skip already known recipes
-            if db_recipe.id in known_recipes:
+            if recipe_id in known_recipes:
                 continue
             
-            recipe_data = self._db_recipe_to_pydantic(db_recipe)
-            
-            # Check if recipe should be auto-learned based on skill level
-            if check_auto_learn and recipe_data.auto_learn_at_skill_level:
-                skill_name = recipe_data.auto_learn_at_skill_level.skill_name
-                required_level = recipe_data.auto_learn_at_skill_level.level
-                
-                if skills_data.get(skill_name, 0) >= required_level:
-                    # Auto-learn the recipe
-                    crud_player_known_recipe.add_recipe_to_player(
-                        db=db, player_id=player_id, recipe_id=db_recipe.id
-                    )
-                    continue  # Skip adding to learnable list since it's now known
-            
-            # Check if player meets unlock conditions
-            meets_conditions = True
-            
-            # Check for character level requirement
-            if "min_character_level" in db_recipe.unlock_conditions:
-                required_level = db_recipe.unlock_conditions["min_character_level"]
-                # This would need to get the player's level from wherever it's stored
-                player_level = skills_data.get("character_level", 0)
-                if player_level < required_level:
-                    meets_conditions = False
-            
-            # Check for skill requirements
-            for skill_req in db_recipe.required_skills:
-                if skills_data.get(skill_req.skill_name, 0) < skill_req.level:
-                    meets_conditions = False
-                    break
-            
-            # Check other custom unlock conditions
-            # (These would depend on your specific game mechanics)
-            
-            if meets_conditions:
-                learnable_recipe = {
-                    "id": db_recipe.id,
-                    "name": db_recipe.name,
-                    "description": db_recipe.description,
-                    "category": db_recipe.recipe_category,
-                    "difficulty_level": db_recipe.difficulty_level,
-                    "required_skills": [
-                        {"skill_name": s.skill_name, "level": s.level}
-                        for s in recipe_data.required_skills
-                    ],
-                    "unlock_conditions": db_recipe.unlock_conditions
-                }
-                learnable_recipes.append(learnable_recipe)
+            recipe = catalog.get(recipe_id)
+            learnable_recipes.append({
+                "id": recipe.id,
+                "name": recipe.name,
+                "description": recipe.description,
+                "category": recipe.recipe_category,
+                "difficulty_level": recipe.difficulty_level,
+                "required_skills": [
+                    {"skill_name": s.skill_name, "level": s.level}
+                    for s in recipe.required_skills
+                ],
+                "unlock_conditions": recipe.unlock_conditions
+            })
         
         return learnable_recipes
     
@@ -495,6 +488,10 @@ class RecipeService:
             for skill in db_recipe.required_skills
         ]
         
+        # The auto-learn threshold has no column of its own and lives in unlock_conditions
+        unlock_conditions = db_recipe.unlock_conditions or {}
+        auto_learn = unlock_conditions.get("auto_learn_at_skill_level")
+        
         # Create and return the Pydantic model
         return Recipe(
             id=db_recipe.id,
@@ -505,12 +502,12 @@ class RecipeService:
             ingredients=ingredients,
             crafting_time_seconds=db_recipe.crafting_time_seconds,
             required_skills=required_skills,
-            required_tools=db_recipe.required_tools,
+            required_tools=getattr(db_recipe, "required_tools", None),
             required_station_type=db_recipe.required_station_type,
-            unlock_conditions=db_recipe.unlock_conditions,
+            unlock_conditions=unlock_conditions,
             experience_gained=db_recipe.experience_gained,
             is_discoverable=db_recipe.is_discoverable,
-            auto_learn_at_skill_level=None,  # This would need special handling
+            auto_learn_at_skill_level=AutoLearnSkillLevel(**auto_learn) if auto_learn else None,
             difficulty_level=db_recipe.difficulty_level,
             recipe_category=db_recipe.recipe_category,
             quality_range=db_recipe.quality_range,
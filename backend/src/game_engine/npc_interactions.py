@@ -147,7 +147,7 @@ def get_dynamic_npc_reply_openrouter(npc_name: str, dominant_domains: List[str],
     Returns:
         Generated NPC dialogue
     """
-    api_url = "https://openrouter.ai/api/v1/chat/completions"
+    api_url = f"{os.environ.get('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1')}/chat/completions"
     api_key = os.environ.get("OPENROUTER_API_KEY")
     
     if not api_key:
@@ -0,0 +1,22 @@
+"""
+Load Testing Package
+
+Offline load-generation tooling: a stub LLM server, scripted player
+sessions and an open-loop request scheduler producing JSON reports.
+See backend/scripts/load_test.py for the command-line entry point.
+"""
+
+from .scenarios import DEFAULT_COMMAND_MIX, PlayerSession, PlayerSessionGenerator, Step
+from .scheduler import OpenLoopScheduler, run_load_test
+from .stub_llm import StubLLMConfig, StubLLMServer
+
+__all__ = [
+    "DEFAULT_COMMAND_MIX",
+    "OpenLoopScheduler",
+    "PlayerSession",
+    "PlayerSessionGenerator",
+    "Step",
+    "StubLLMConfig",
+    "StubLLMServer",
+    "run_load_test",
+]
@@ -0,0 +1,189 @@
+"""
+Scripted Player Sessions
+
+Generators of player sessions for load tests. A session is a short setup
+script followed by an endless stream of gameplay steps drawn from a
+weighted command mix (movement, combat, crafting, economy, social). Each
+step is one HTTP request; steps can reference values captured from earlier
+responses of the same session, such as the character id.
+"""
+
+import random
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Share of gameplay steps per command category
+DEFAULT_COMMAND_MIX: Dict[str, float] = {
+    "movement": 0.35,
+    "combat": 0.25,
+    "crafting": 0.15,
+    "economy": 0.15,
+    "social": 0.10,
+}
+
+
+@dataclass
+class Step:
+    """One scripted request"""
+    name: str
+    method: str
+    path: str
+    body: Optional[Dict[str, Any]] = None
+    # Session variable -> dotted path into the JSON response to store it from
+    capture: Dict[str, str] = field(default_factory=dict)
+
+    def render(self, variables: Dict[str, Any]) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Substitute {variables} in the path and in string body values"""
+        return self.path.format(**variables), _render_value(self.body, variables)
+
+
+def _render_value(value: Any, variables: Dict[str, Any]) -> Any:
+    if isinstance(value, str):
+        return value.format(**variables)
+    if isinstance(value, dict):
+        return {key: _render_value(item, variables) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_render_value(item, variables) for item in value]
+    return value
+
+
+def extract(document: Any, dotted_path: str) -> Any:
+    """Follow a dotted path (keys or list indexes) into a decoded JSON document"""
+    for part in dotted_path.split("."):
+        if isinstance(document, list):
+            document = document[int(part)]
+        elif isinstance(document, dict):
+            document = document.get(part)
+        else:
+            return None
+    return document
+
+
+# Free-text commands for the AI GM server
+AI_GM_COMMANDS: Dict[str, List[str]] = {
+    "movement": ["look around", "go north", "walk to the market square", "where am i",
+                 "head down the forest path", "climb the watchtower stairs"],
+    "combat": ["attack the goblin", "fight the bandit leader", "draw my sword and battle the wolf",
+               "cast fire bolt at the skeleton"],
+    "crafting": ["craft an iron sword", "forge a steel helmet", "make a healing potion",
+                 "create a torch from the branch"],
+    "economy": ["check my inventory", "what items am i carrying", "ask the merchant about prices",
+                "tell the smith i want to sell my dagger"],
+    "social": ["talk to the innkeeper", "ask the guard about the bandits", "tell me about the old kingdom",
+               "speak with the apprentice mage"],
+}
+
+_CITIES = {
+    "Ashkar Vale": ["The Healing Hand", "Verdant Armory", "Nature's Bounty"],
+    "Skarport": ["The Arcane Spur", "Portside Outfitters", "The Golden Scale"],
+    "Thal-Zirad": ["Artificer's Workshop", "The Bubbling Cauldron", "Clockwork Emporium"],
+}
+_NPCS = ["Torim", "Captain Varrus", "Lyra", "Old Marta"]
+_ENVIRONMENTS = ["normal", "forest", "mountain", "desert", "swamp"]
+
+
+def _ai_gm_setup(rng: random.Random, player_id: str) -> List[Step]:
+    return []
+
+
+def _ai_gm_step(rng: random.Random, category: str) -> Step:
+    return Step(
+        name=f"process-input:{category}",
+        method="POST",
+        path="/api/ai-gm/process-input",
+        body={"player_id": "{player_id}", "game_id": "{game_id}", "input_text": rng.choice(AI_GM_COMMANDS[category])}
+    )
+
+
+def _game_api_setup(rng: random.Random, player_id: str) -> List[Step]:
+    return [
+        Step("create-character", "POST", "/api/characters/", {"name": "{player_id}"}, capture={"character_id": "id"}),
+        Step("create-survival-state", "POST", "/api/survival/state/create", {"character_id": "{character_id}"}),
+    ]
+
+
+def _game_api_step(rng: random.Random, category: str) -> Step:
+    if category == "movement":
+        return Step("movement", "POST", "/api/survival/action/{character_id}",
+                    {"action_type": rng.choice(["travel", "explore", "rest"]), "environment": rng.choice(_ENVIRONMENTS)})
+    if category == "combat":
+        return Step("combat", "POST", "/api/characters/{character_id}/actions",
+                    {"action_type": rng.choice(["attack", "parry", "dodge"]),
+                     "domain": rng.choice(["body", "awareness"]), "difficulty": rng.randint(8, 16)})
+    if category == "crafting":
+        return Step("crafting", "POST", "/api/characters/{character_id}/actions",
+                    {"action_type": rng.choice(["forge", "brew", "repair"]), "domain": "craft",
+                     "difficulty": rng.randint(8, 16)})
+    if category == "economy":
+        city = rng.choice(list(_CITIES))
+        if rng.random() < 0.5:
+            return Step("economy:enter-market", "POST", "/api/economy/enter-market",
+                        {"character_id": "{character_id}", "market_name": city})
+        return Step("economy:browse-shop", "POST", "/api/economy/browse-shop",
+                    {"character_id": "{character_id}", "shop_name": rng.choice(_CITIES[city])})
+    # Social steps reach the LLM through NPC dialogue
+    return Step("social:npc-reaction", "POST", "/api/characters/{character_id}/npc-reaction",
+                {"npc_name": rng.choice(_NPCS), "recent_action": rng.choice([None, "helped a stranger", "haggled"])})
+
+
+# Target name -> (health path, setup script factory, gameplay step factory)
+TARGETS: Dict[str, Tuple[str, Callable[[random.Random, str], List[Step]], Callable[[random.Random, str], Step]]] = {
+    "ai_gm": ("/health", _ai_gm_setup, _ai_gm_step),
+    "game_api": ("/health", _game_api_setup, _game_api_step),
+}
+
+
+class PlayerSession:
+    """One simulated player: setup steps, then gameplay steps drawn from the command mix"""
+
+    def __init__(self, target: str, player_id: str, rng: random.Random, command_mix: Dict[str, float]):
+        _, setup, step = TARGETS[target]
+        self.player_id = player_id
+        self.variables: Dict[str, Any] = {"player_id": player_id, "game_id": f"load_{player_id}"}
+        self._pending = list(setup(rng, player_id))
+        self._step = step
+        self._rng = rng
+        self._categories = list(command_mix)
+        self._weights = [command_mix[category] for category in self._categories]
+
+    def setup_steps(self) -> List[Step]:
+        """Steps to run in order before any gameplay step (e.g. creating the character)"""
+        steps, self._pending = self._pending, []
+        return steps
+
+    def next_step(self) -> Step:
+        """Draw the next gameplay step from the command mix"""
+        category = self._rng.choices(self._categories, self._weights)[0]
+        return self._step(self._rng, category)
+
+    def record_response(self, step: Step, document: Any) -> None:
+        for variable, path in step.capture.items():
+            value = extract(document, path)
+            if value is not None:
+                self.variables[variable] = value
+
+
+class PlayerSessionGenerator:
+    """Creates reproducible player sessions for a target app"""
+
+    def __init__(self, target: str, seed: int = 0, command_mix: Optional[Dict[str, float]] = None):
+        if target not in TARGETS:
+            raise ValueError(f"Unknown target {target}; expected one of {sorted(TARGETS)}")
+        self.target = target
+        self.seed = seed
+        self.command_mix = dict(command_mix or DEFAULT_COMMAND_MIX)
+        self._rng = random.Random(seed)
+
+    @property
+    def health_path(self) -> str:
+        return TARGETS[self.target][0]
+
+    def sessions(self, count: int) -> List[PlayerSession]:
+        # Fresh player ids per run so server-side state (e.g. hibernated sessions) never carries over
+        run_tag = uuid.uuid4().hex[:8]
+        return [
+            PlayerSession(self.target, f"loadtest_{run_tag}_{i}", random.Random(self._rng.getrandbits(64)),
+                          self.command_mix)
+            for i in range(count)
+        ]
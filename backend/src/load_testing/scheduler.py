@@ -0,0 +1,231 @@
+"""
+Open-Loop Load Scheduler
+
+Sends scripted player requests at a Poisson arrival rate that does not
+depend on how fast the server answers, so a slow server builds up a
+backlog instead of silently lowering the offered load. Latency is measured
+from each request's scheduled send time (not the moment the client got
+round to sending it), which keeps client-side queueing in the numbers.
+"""
+
+import asyncio
+import json
+import random
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from ..shared.metrics import Histogram
+from .scenarios import PlayerSession, PlayerSessionGenerator, Step
+
+REPORT_SCHEMA_VERSION = 1
+
+
+class RequestStats:
+    """Outcome counters and latency histograms for one endpoint or step"""
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.service_time = Histogram()
+        self.requests = 0
+        self.errors = 0
+        self.status_counts: Dict[str, int] = {}
+
+    def record(self, status: str, latency: float, service_time: float, error: bool) -> None:
+        self.requests += 1
+        self.errors += error
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        self.latency.observe(latency)
+        self.service_time.observe(service_time)
+
+    def summary(self, duration: float) -> Dict[str, Any]:
+        latency = self.latency.summary()
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": self.errors / self.requests if self.requests else 0.0,
+            "throughput_rps": self.requests / duration if duration > 0 else 0.0,
+            "status_counts": dict(sorted(self.status_counts.items())),
+            "latency_ms": {key: latency[key] * 1000 for key in ("mean", "p50", "p95", "p99", "max")},
+            "service_time_ms_p99": self.service_time.quantile(0.99) * 1000
+        }
+
+
+class OpenLoopScheduler:
+    """
+    Drive a target app with scripted player sessions.
+
+    Each session's setup steps run first, in order, outside the measured
+    window. The load phase then issues gameplay steps of randomly chosen
+    sessions at the configured arrival rate for the configured duration.
+    """
+
+    def __init__(self,
+                 base_url: str,
+                 generator: PlayerSessionGenerator,
+                 players: int = 50,
+                 rate: float = 20.0,
+                 duration: float = 30.0,
+                 timeout: float = 30.0,
+                 max_in_flight: int = 2000,
+                 seed: int = 0):
+        """
+        Initialize the scheduler.
+
+        Args:
+            base_url: Root URL of the app under test
+            generator: Session generator for the target app
+            players: Number of simulated players
+            rate: Offered load in requests per second
+            duration: Length of the load phase in seconds
+            timeout: Per-request timeout in seconds
+            max_in_flight: Outstanding requests beyond which new arrivals are dropped (and counted)
+            seed: Seed for arrival times and session choice
+        """
+        self.base_url = base_url.rstrip("/")
+        self.generator = generator
+        self.players = players
+        self.rate = rate
+        self.duration = duration
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self._endpoints: Dict[str, RequestStats] = {}
+        self._steps: Dict[str, RequestStats] = {}
+        self._setup = RequestStats()
+        self._total = RequestStats()
+        self._dropped = 0
+        self._max_lag = 0.0
+        self._setup_elapsed = 0.0
+
+    async def run(self) -> Dict[str, Any]:
+        """Run setup and the load phase; returns the JSON-serializable report"""
+        started_at = datetime.now(timezone.utc)
+        connector = aiohttp.TCPConnector(limit=0)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as http:
+            await self._wait_until_healthy(http)
+
+            loop = asyncio.get_running_loop()
+            sessions = self.generator.sessions(self.players)
+            setup_start = loop.time()
+            results = await asyncio.gather(*(self._run_setup(http, session) for session in sessions))
+            self._setup_elapsed = loop.time() - setup_start
+            ready = [session for session, ok in zip(sessions, results) if ok]
+            if not ready:
+                raise RuntimeError("Every player session failed its setup steps")
+
+            in_flight: set = set()
+            start = loop.time()
+            scheduled = start
+            while True:
+                scheduled += self._rng.expovariate(self.rate)
+                if scheduled - start >= self.duration:
+                    break
+                delay = scheduled - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    self._max_lag = max(self._max_lag, -delay)
+                if len(in_flight) >= self.max_in_flight:
+                    self._dropped += 1
+                    continue
+                session = self._rng.choice(ready)
+                task = asyncio.ensure_future(self._issue(http, session, session.next_step(), scheduled))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+
+            if in_flight:
+                await asyncio.wait(in_flight)
+            elapsed = loop.time() - start
+
+        return self._report(started_at, elapsed, len(ready))
+
+    async def _wait_until_healthy(self, http: aiohttp.ClientSession, attempts: int = 50) -> None:
+        url = self.base_url + self.generator.health_path
+        for _ in range(attempts):
+            try:
+                async with http.get(url) as response:
+                    if response.status < 500:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.2)
+        raise RuntimeError(f"{url} did not become healthy")
+
+    async def _run_setup(self, http: aiohttp.ClientSession, session: PlayerSession) -> bool:
+        loop = asyncio.get_running_loop()
+        for step in session.setup_steps():
+            if not await self._issue(http, session, step, loop.time(), setup=True):
+                return False
+        return True
+
+    async def _issue(self, http: aiohttp.ClientSession, session: PlayerSession, step: Step,
+                     scheduled: float, setup: bool = False) -> bool:
+        loop = asyncio.get_running_loop()
+        path, body = step.render(session.variables)
+        sent = loop.time()
+        document = None
+        try:
+            async with http.request(step.method, self.base_url + path, json=body) as response:
+                status = str(response.status)
+                error = response.status >= 400
+                payload = await response.read()
+            if step.capture and not error:
+                document = json.loads(payload)
+        except asyncio.TimeoutError:
+            status, error = "timeout", True
+        except (aiohttp.ClientError, ValueError) as e:
+            status, error = type(e).__name__, True
+        finished = loop.time()
+
+        if document is not None:
+            session.record_response(step, document)
+        latency, service_time = finished - scheduled, finished - sent
+        if setup:
+            self._setup.record(status, latency, service_time, error)
+        else:
+            endpoint = f"{step.method} {step.path}"
+            for stats, key in ((self._endpoints, endpoint), (self._steps, step.name)):
+                if key not in stats:
+                    stats[key] = RequestStats()
+                stats[key].record(status, latency, service_time, error)
+            self._total.record(status, latency, service_time, error)
+        return not error
+
+    def _report(self, started_at: datetime, elapsed: float, ready_players: int) -> Dict[str, Any]:
+        return {
+            "schema_version": REPORT_SCHEMA_VERSION,
+            "started_at": started_at.isoformat(),
+            "target": self.generator.target,
+            "base_url": self.base_url,
+            "config": {
+                "players": self.players,
+                "offered_rate_rps": self.rate,
+                "duration_s": self.duration,
+                "timeout_s": self.timeout,
+                "max_in_flight": self.max_in_flight,
+                "seed": self.seed,
+                "command_mix": self.generator.command_mix
+            },
+            "summary": {
+                **self._total.summary(elapsed),
+                "elapsed_s": elapsed,
+                "ready_players": ready_players,
+                "dropped_arrivals": self._dropped,
+                "max_scheduling_lag_ms": self._max_lag * 1000
+            },
+            "setup": self._setup.summary(self._setup_elapsed),
+            "endpoints": {key: stats.summary(elapsed) for key, stats in sorted(self._endpoints.items())},
+            "steps": {key: stats.summary(elapsed) for key, stats in sorted(self._steps.items())}
+        }
+
+
+def run_load_test(base_url: str, target: str, **kwargs: Any) -> Dict[str, Any]:
+    """Synchronous convenience wrapper: build sessions for a target and run the scheduler"""
+    seed = kwargs.pop("seed", 0)
+    command_mix: Optional[Dict[str, float]] = kwargs.pop("command_mix", None)
+    generator = PlayerSessionGenerator(target, seed=seed, command_mix=command_mix)
+    return asyncio.run(OpenLoopScheduler(base_url, generator, seed=seed, **kwargs).run())
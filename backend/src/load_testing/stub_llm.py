@@ -0,0 +1,225 @@
+"""
+Stub LLM Server
+
+A local OpenAI/OpenRouter-compatible chat completions endpoint for load
+tests. Each response waits for a sampled time-to-first-token and then for
+its completion tokens at a sampled token rate, so the apps under test see
+realistic upstream latency without any network access or API spend.
+Point the apps at it with OPENROUTER_BASE_URL=http://host:port/api/v1.
+
+Usage:
+    python -m backend.src.load_testing.stub_llm [--port 8199] [--ttft-median 0.4] [--tokens-per-second 60]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+from aiohttp import web
+
+COMPLETION_PATHS = ("/chat/completions", "/v1/chat/completions", "/api/v1/chat/completions")
+
+_FILLER_WORDS = ("the", "torchlight", "wavers", "as", "a", "distant", "bell", "tolls", "over", "wet",
+                 "cobblestones", "and", "the", "innkeeper", "eyes", "you", "with", "quiet", "suspicion")
+
+
+@dataclass
+class StubLLMConfig:
+    """Latency and token-rate distributions of the stub"""
+    # Time to first token: lognormal with this median (seconds) and shape
+    ttft_median: float = 0.4
+    ttft_sigma: float = 0.5
+    # Generation speed: normal distribution, clipped at min_tokens_per_second
+    tokens_per_second: float = 60.0
+    tokens_per_second_stddev: float = 15.0
+    min_tokens_per_second: float = 5.0
+    # Completion length: uniform between these, capped by the request's max_tokens
+    min_completion_tokens: int = 40
+    max_completion_tokens: int = 250
+    # Fraction of requests answered with HTTP 429 / 500
+    rate_limit_rate: float = 0.0
+    error_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+class StubLLMServer:
+    """
+    aiohttp server answering chat completion requests with synthetic text.
+
+    Supports plain JSON responses and ``"stream": true`` server-sent events,
+    where chunks are paced at the sampled token rate.
+    """
+
+    def __init__(self, config: Optional[StubLLMConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StubLLMConfig()
+        self.host = host
+        self.port = port
+        self._rng = random.Random(self.config.seed)
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats = {"requests": 0, "completion_tokens": 0, "rate_limited": 0, "errors": 0}
+
+    @property
+    def base_url(self) -> str:
+        """OpenRouter-style base URL (append /chat/completions)"""
+        return f"http://{self.host}:{self.port}/api/v1"
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        for path in COMPLETION_PATHS:
+            app.router.add_post(path, self._handle_completion)
+        app.router.add_get("/stats", self._handle_stats)
+        return app
+
+    async def start(self) -> None:
+        """Start serving on the current event loop"""
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        # Resolve port 0 to the port actually bound
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def start_in_thread(self) -> str:
+        """Serve from a daemon thread with its own event loop; returns the base URL"""
+        started = threading.Event()
+
+        def serve():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.start())
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self.stop())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=serve, name="stub-llm", daemon=True)
+        self._thread.start()
+        started.wait()
+        return self.base_url
+
+    def stop_thread(self) -> None:
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def sample_timing(self, max_tokens: Optional[int] = None) -> Dict[str, float]:
+        """Draw a time to first token, token rate and completion length"""
+        config = self.config
+        tokens = self._rng.randint(config.min_completion_tokens, config.max_completion_tokens)
+        if max_tokens:
+            tokens = min(tokens, int(max_tokens))
+        rate = max(config.min_tokens_per_second,
+                   self._rng.gauss(config.tokens_per_second, config.tokens_per_second_stddev))
+        return {
+            "ttft": self._rng.lognormvariate(0.0, config.ttft_sigma) * config.ttft_median,
+            "tokens_per_second": rate,
+            "completion_tokens": tokens
+        }
+
+    async def _handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({**self.stats, "config": asdict(self.config)})
+
+    async def _handle_completion(self, request: web.Request) -> web.StreamResponse:
+        self.stats["requests"] += 1
+        try:
+            body = await request.json()
+        except (json.JSONDecodeError, ValueError):
+            return web.json_response({"error": {"message": "Invalid JSON body"}}, status=400)
+
+        roll = self._rng.random()
+        if roll < self.config.rate_limit_rate:
+            self.stats["rate_limited"] += 1
+            return web.json_response({"error": {"message": "Rate limited (stub)"}}, status=429,
+                                     headers={"Retry-After": "1"})
+        if roll < self.config.rate_limit_rate + self.config.error_rate:
+            self.stats["errors"] += 1
+            return web.json_response({"error": {"message": "Upstream error (stub)"}}, status=500)
+
+        timing = self.sample_timing(body.get("max_tokens"))
+        tokens = int(timing["completion_tokens"])
+        self.stats["completion_tokens"] += tokens
+        prompt_tokens = sum(len(str(message.get("content", "")).split()) for message in body.get("messages", []))
+        model = body.get("model", "stub/model")
+        completion_id = f"chatcmpl-stub-{uuid.uuid4().hex[:12]}"
+        words = [_FILLER_WORDS[i % len(_FILLER_WORDS)] for i in range(tokens)]
+
+        await asyncio.sleep(timing["ttft"])
+        if body.get("stream"):
+            return await self._stream(request, completion_id, model, words, timing["tokens_per_second"])
+
+        await asyncio.sleep(tokens / timing["tokens_per_second"])
+        return web.json_response({
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": " ".join(words).capitalize() + "."},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": tokens,
+                "total_tokens": prompt_tokens + tokens
+            }
+        })
+
+    async def _stream(self, request: web.Request, completion_id: str, model: str,
+                      words, tokens_per_second: float) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        interval = 1.0 / tokens_per_second
+        started = time.perf_counter()
+        for i, word in enumerate(words):
+            # Pace against the start time so sleep overshoot does not accumulate
+            delay = started + i * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": (" " if i else "") + word}, "finish_reason": None}]
+            }
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stub LLM server for load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8199)
+    parser.add_argument("--ttft-median", type=float, default=0.4)
+    parser.add_argument("--ttft-sigma", type=float, default=0.5)
+    parser.add_argument("--tokens-per-second", type=float, default=60.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = StubLLMConfig(ttft_median=args.ttft_median, ttft_sigma=args.ttft_sigma,
+                           tokens_per_second=args.tokens_per_second, error_rate=args.error_rate,
+                           rate_limit_rate=args.rate_limit_rate, seed=args.seed)
+    server = StubLLMServer(config, args.host, args.port)
+    print(f"Stub LLM listening on {server.base_url}/chat/completions")
+    web.run_app(server.create_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,13 +13,35 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Tuple
 from sqlalchemy.orm import Session
 
-from world_generation.world_model import (
+from backend.src.world_generation.world_model import (
     DBPointOfInterest, DBGeneratedLocationDetails, DBBiome,
     POIType, RACIAL_CHARACTERISTICS, MAJOR_CITIES
 )
 
 logger = logging.getLogger(__name__)
 
+
+def build_biome_context(biome: DBBiome) -> Dict[str, Any]:
+    """
+    Build the generation context for a biome.
+    
+    Everything except the "biome" entry itself is plain data, so the context
+    can be shared by all POIs of the biome and sent to worker processes.
+    """
+    region = biome.region
+    return {
+        "biome": biome,
+        "biome_type": biome.biome_type,
+        "flora_fauna": biome.flora_fauna or [],
+        "atmospheric_tags": biome.atmospheric_tags or [],
+        "hazards": biome.hazards or [],
+        "resources": biome.available_resources or {},
+        "magical_phenomena": biome.magical_phenomena or [],
+        "leyline_intensity": biome.leyline_intensity,
+        # None when the biome has no region
+        "dominant_races": (region.dominant_races or []) if region else None
+    }
+
 class BaseLocationGenerator(ABC):
     """
     Abstract base class for all location generators.
@@ -75,7 +97,6 @@ class BaseLocationGenerator(ABC):
             }
         }
     
-    @abstractmethod
     def generate_location_details(
         self,
         db: Session,
@@ -83,7 +104,7 @@ class BaseLocationGenerator(ABC):
         generation_context: Optional[Dict[str, Any]] = None
     ) -> DBGeneratedLocationDetails:
         """
-        Generate detailed content for a specific POI.
+        Generate detailed content for a specific POI and save it.
         
         Args:
             db: Database session
@@ -93,6 +114,31 @@ class BaseLocationGenerator(ABC):
         Returns:
             Generated location details object
         """
+        biome_context = self.get_biome_context(db, poi)
+        details_data = self.build_location_details(poi, biome_context, generation_context)
+        return self.save_generated_details(db, poi, details_data)
+    
+    @abstractmethod
+    def build_location_details(
+        self,
+        poi: DBPointOfInterest,
+        biome_context: Dict[str, Any],
+        generation_context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate detailed content for a specific POI without touching the database.
+        
+        Implementations draw only from the module-level ``random`` generator, so
+        seeding it before the call makes the output reproducible.
+        
+        Args:
+            poi: The POI to generate details for (any object with the POI's attributes)
+            biome_context: Context from build_biome_context
+            generation_context: Additional context for generation
+            
+        Returns:
+            Details data as accepted by save_generated_details
+        """
         pass
     
     def get_biome_context(self, db: Session, poi: DBPointOfInterest) -> Dict[str, Any]:
@@ -103,16 +149,7 @@ class BaseLocationGenerator(ABC):
         if not biome:
             return {}
         
-        return {
-            "biome": biome,
-            "biome_type": biome.biome_type,
-            "flora_fauna": biome.flora_fauna or [],
-            "atmospheric_tags": biome.atmospheric_tags or [],
-            "hazards": biome.hazards or [],
-            "resources": biome.available_resources or {},
-            "magical_phenomena": biome.magical_phenomena or [],
-            "leyline_intensity": biome.leyline_intensity
-        }
+        return build_biome_context(biome)
     
     def determine_racial_influence(
         self,
@@ -125,13 +162,9 @@ class BaseLocationGenerator(ABC):
         Returns:
             Tuple of (dominant_race, influence_strength)
         """
-        biome = biome_context.get("biome")
-        if not biome or not biome.region:
-            return "human", 0.5  # Default fallback
-        
-        # Check if we're near any major cities and their racial influence
-        region = biome.region
-        regional_races = getattr(region, 'dominant_races', []) or []
+        regional_races = biome_context.get("dominant_races")
+        if regional_races is None:
+            return "human", 0.5  # Default fallback (no biome or region)
         
         if not regional_races:
             # Fallback to biome-based racial preferences
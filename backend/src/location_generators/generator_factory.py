@@ -7,12 +7,13 @@ content generation across different location types.
 """
 
 import logging
+import zlib
 from typing import Dict, Type, Optional, List
 from abc import ABC
 
 from .base_generator import BaseLocationGenerator
 from .village_generator import VillageGenerator
-from world_generation.world_model import POIType
+from backend.src.world_generation.world_model import POIType
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +21,7 @@ logger = logging.getLogger(__name__)
 class RuinGenerator(BaseLocationGenerator):
     """Generator for ruins and ancient sites."""
 
-    def generate_location_details(self, db, poi, generation_context=None):
-        biome_context = self.get_biome_context(db, poi)
+    def build_location_details(self, poi, biome_context, generation_context=None):
         racial_influence = self.determine_racial_influence(biome_context, poi)
 
         # Generate ruin-specific content
@@ -33,7 +33,7 @@ class RuinGenerator(BaseLocationGenerator):
         hidden_secrets = self._generate_ruin_secrets(biome_context,
                                                      racial_influence)
 
-        details_data = {
+        return {
             "description":
             description,
             "detailed_features":
@@ -53,8 +53,6 @@ class RuinGenerator(BaseLocationGenerator):
             self.get_generation_prompt(poi, biome_context, racial_influence)
         }
 
-        return self.save_generated_details(db, poi, details_data)
-
     def _generate_ruin_description(self, poi, biome_context, racial_influence):
         dominant_race, influence_strength = racial_influence
         base_desc = self.generate_base_description(poi, biome_context,
@@ -122,15 +120,14 @@ class RuinGenerator(BaseLocationGenerator):
 class CaveGenerator(BaseLocationGenerator):
     """Generator for caves and underground locations."""
 
-    def generate_location_details(self, db, poi, generation_context=None):
-        biome_context = self.get_biome_context(db, poi)
+    def build_location_details(self, poi, biome_context, generation_context=None):
         racial_influence = self.determine_racial_influence(biome_context, poi)
 
         description = self._generate_cave_description(poi, biome_context)
         detailed_features = self._generate_cave_features(biome_context)
         quest_hooks = self._generate_cave_quest_hooks(poi, biome_context)
 
-        details_data = {
+        return {
             "description":
             description,
             "detailed_features":
@@ -149,20 +146,18 @@ class CaveGenerator(BaseLocationGenerator):
             self.get_generation_prompt(poi, biome_context, racial_influence)
         }
 
-        return self.save_generated_details(db, poi, details_data)
-
     def _generate_cave_description(self, poi, biome_context):
         entrance_types = [
             "narrow opening", "yawning mouth", "concealed entrance",
             "natural archway"
         ]
-        entrance = f"The {poi.generated_name} opens through a {entrance_types[hash(poi.id) % len(entrance_types)]}"
+        entrance = f"The {poi.generated_name} opens through a {entrance_types[zlib.crc32((poi.generation_seed or poi.id).encode()) % len(entrance_types)]}"
 
         depth_desc = [
             "extends deep into the earth", "winds through natural passages",
             "descends into darkness"
         ]
-        depth = depth_desc[hash(poi.generated_name) % len(depth_desc)]
+        depth = depth_desc[zlib.crc32(poi.generated_name.encode()) % len(depth_desc)]
 
         return f"{entrance} that {depth}. The air carries hints of minerals and deep earth."
 
@@ -346,6 +341,35 @@ class LocationGeneratorFactory:
             traceback.print_exc()
             return None
 
+    def build_location_details(self,
+                               poi,
+                               biome_context: Dict,
+                               generation_context: Optional[Dict] = None
+                               ) -> Optional[Dict]:
+        """
+        Generate location details data without touching the database.
+
+        Args:
+            poi: POI (or POI snapshot) to generate details for
+            biome_context: Context of the POI's biome
+            generation_context: Optional context for generation
+
+        Returns:
+            Details data or None if generation fails
+        """
+        try:
+            generator = self.get_generator(POIType(poi.poi_type))
+            if not generator:
+                return None
+            return generator.build_location_details(poi, biome_context,
+                                                    generation_context)
+
+        except Exception as e:
+            self.logger.error(
+                f"Error generating location details for {poi.generated_name}: {e}"
+            )
+            return None
+
 
 # Global factory instance
 location_generator_factory = LocationGeneratorFactory()
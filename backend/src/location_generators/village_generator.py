@@ -12,7 +12,7 @@ from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 
 from .base_generator import BaseLocationGenerator
-from world_generation.world_model import (
+from backend.src.world_generation.world_model import (
     DBPointOfInterest, DBGeneratedLocationDetails,
     POIType, RACIAL_CHARACTERISTICS
 )
@@ -123,19 +123,18 @@ class VillageGenerator(BaseLocationGenerator):
             ]
         }
     
-    def generate_location_details(
+    def build_location_details(
         self,
-        db: Session,
         poi: DBPointOfInterest,
+        biome_context: Dict[str, Any],
         generation_context: Optional[Dict[str, Any]] = None
-    ) -> DBGeneratedLocationDetails:
+    ) -> Dict[str, Any]:
         """
         Generate detailed content for a village POI.
         """
-        self.logger.info(f"Generating village details for {poi.generated_name}")
+        self.logger.debug(f"Generating village details for {poi.generated_name}")
         
-        # Get biome and racial context
-        biome_context = self.get_biome_context(db, poi)
+        # Get racial context
         racial_influence = self.determine_racial_influence(biome_context, poi)
         
         # Determine village type based on biome and context
@@ -180,8 +179,7 @@ class VillageGenerator(BaseLocationGenerator):
         # Create generation prompt for AI enhancement
         generation_prompt = self.get_generation_prompt(poi, biome_context, racial_influence)
         
-        # Prepare details data
-        details_data = {
+        return {
             "description": description,
             "detailed_features": detailed_features,
             "generated_npcs": generated_npcs,
@@ -193,9 +191,6 @@ class VillageGenerator(BaseLocationGenerator):
             "local_economy": local_economy,
             "generation_prompt": generation_prompt
         }
-        
-        # Save and return details
-        return self.save_generated_details(db, poi, details_data)
     
     def _determine_village_type(
         self,
@@ -432,7 +427,7 @@ class VillageGenerator(BaseLocationGenerator):
         motivations = self._generate_npc_motivations(role, village_type)
         
         npc = {
-            "id": str(uuid.uuid4()),
+            "id": str(uuid.UUID(int=random.getrandbits(128), version=4)),  # Reproducible under a seeded random
             "name": name,
             "race": npc_race,
             "role": role.replace("_", " ").title(),
@@ -6,13 +6,15 @@ and other game systems to communicate through events. It supports event
 publishing, subscription, and asynchronous processing.
 """
 
-from typing import Dict, Any, List, Optional, Set, Union, Callable
+from typing import Dict, Any, Deque, Iterator, List, Optional, Set, Union, Callable
 import logging
 import json
+import os
 from datetime import datetime
+from itertools import islice
 import uuid
 import asyncio
-from collections import defaultdict
+from collections import defaultdict, deque
 import threading
 import queue
 
@@ -77,6 +79,170 @@ class Event:
         return f"Event({self.type}, id={self.id}, source={self.source})"
 
 
+class EventSpillLog:
+    """
+    Append-only JSON-lines log of events evicted from the in-memory history.
+    
+    Lines are grouped into fixed-size blocks, and the smallest and largest
+    timestamp of each block are kept in memory, so a time range query only
+    reads the blocks that can contain matching events.
+    """
+    
+    def __init__(self, path: str, block_size: int = 256):
+        """
+        Open (or create) a spill log.
+        
+        Args:
+            path: Log file path
+            block_size: Events per indexed block
+        """
+        self.path = path
+        self.block_size = block_size
+        # [first timestamp, last timestamp, byte offset, event count] per block
+        self._blocks: List[List[Any]] = []
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(path):
+            self._index_existing()
+        self._file = open(path, "ab")
+    
+    def _index_existing(self) -> None:
+        """Rebuild the block index of a log left by an earlier run"""
+        with open(self.path, "rb") as f:
+            offset = 0
+            for line in f:
+                try:
+                    timestamp = json.loads(line)["timestamp"]
+                except (ValueError, KeyError):
+                    logger.warning(f"Skipping unreadable line in event spill log {self.path}")
+                else:
+                    self._add_to_index(timestamp, offset)
+                offset += len(line)
+    
+    def _add_to_index(self, timestamp: str, offset: int) -> None:
+        if not self._blocks or self._blocks[-1][3] >= self.block_size:
+            self._blocks.append([timestamp, timestamp, offset, 0])
+        block = self._blocks[-1]
+        block[0] = min(block[0], timestamp)
+        block[1] = max(block[1], timestamp)
+        block[3] += 1
+    
+    def append(self, event: Event) -> None:
+        """Write one evicted event to the end of the log"""
+        line = (json.dumps(event.to_dict(), default=str) + "\n").encode("utf-8")
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write(line)
+            self._file.flush()
+            self._add_to_index(event.timestamp, offset)
+    
+    def query(self, start: str, end: str) -> Iterator[Event]:
+        """Yield logged events with start <= timestamp <= end, oldest first"""
+        with self._lock:
+            blocks = [(offset, count) for first, last, offset, count in self._blocks
+                      if first <= end and last >= start]
+        if not blocks:
+            return
+        with open(self.path, "rb") as f:
+            for offset, count in blocks:
+                f.seek(offset)
+                for line in islice(f, count):
+                    data = json.loads(line)
+                    if start <= data["timestamp"] <= end:
+                        yield Event.from_dict(data)
+    
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class EventHistory:
+    """
+    Bounded, indexed history of published events.
+    
+    Events sit in a ring buffer in publish order, alongside per-type and
+    per-source deques and an id lookup table. Because every deque is in
+    publish order, the oldest event is always at the left of each one and
+    eviction is O(1); lookups by id are O(1), and the newest k events of a
+    type or source are O(k). Evicted events go to an optional spill log.
+    """
+    
+    def __init__(self, max_size: int = 1000, spill_log: Optional[EventSpillLog] = None):
+        self.max_size = max_size
+        self.spill_log = spill_log
+        self._events: Deque[Event] = deque()
+        self._by_id: Dict[str, Event] = {}
+        self._by_type: Dict[str, Deque[Event]] = defaultdict(deque)
+        self._by_source: Dict[Optional[str], Deque[Event]] = defaultdict(deque)
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._events)
+    
+    def __iter__(self) -> Iterator[Event]:
+        """Iterate over a snapshot of the history, oldest first"""
+        with self._lock:
+            return iter(list(self._events))
+    
+    def append(self, event: Event) -> None:
+        evicted = []
+        with self._lock:
+            self._events.append(event)
+            self._by_id[event.id] = event
+            self._by_type[event.type].append(event)
+            self._by_source[event.source].append(event)
+            while len(self._events) > self.max_size:
+                evicted.append(self._evict_oldest())
+        
+        if self.spill_log:
+            for old_event in evicted:
+                self.spill_log.append(old_event)
+    
+    def _evict_oldest(self) -> Event:
+        event = self._events.popleft()
+        if self._by_id.get(event.id) is event:
+            del self._by_id[event.id]
+        for index, key in ((self._by_type, event.type), (self._by_source, event.source)):
+            bucket = index[key]
+            bucket.popleft()
+            if not bucket:
+                del index[key]
+        return event
+    
+    def get(self, event_id: str) -> Optional[Event]:
+        return self._by_id.get(event_id)
+    
+    def newest(self, limit: Optional[int] = None) -> List[Event]:
+        """Newest events first"""
+        with self._lock:
+            return list(islice(reversed(self._events), limit))
+    
+    def newest_of_type(self, event_type: str, limit: Optional[int] = None) -> List[Event]:
+        """Newest events of one type first"""
+        with self._lock:
+            return list(islice(reversed(self._by_type.get(event_type, ())), limit))
+    
+    def newest_from_source(self, source: Optional[str], limit: Optional[int] = None) -> List[Event]:
+        """Newest events from one source first"""
+        with self._lock:
+            return list(islice(reversed(self._by_source.get(source, ())), limit))
+    
+    def in_range(self, start: str, end: str) -> List[Event]:
+        """In-memory events with start <= timestamp <= end, oldest first"""
+        with self._lock:
+            return [event for event in self._events if start <= event.timestamp <= end]
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._by_id.clear()
+            self._by_type.clear()
+            self._by_source.clear()
+
+
 class EventBus:
     """
     Central event bus for the system.
@@ -85,12 +251,18 @@ class EventBus:
     events are properly routed to interested subscribers.
     """
     
-    def __init__(self):
-        """Initialize the event bus."""
+    def __init__(self, max_history_size: int = 1000, history_spill_path: Optional[str] = None):
+        """
+        Initialize the event bus.
+        
+        Args:
+            max_history_size: Maximum number of events to keep in history
+            history_spill_path: Append-only log for events evicted from history
+        """
         self.subscribers = defaultdict(list)
         self.global_subscribers = []
-        self.event_history = []
-        self.max_history_size = 1000  # Maximum number of events to keep in history
+        spill_log = EventSpillLog(history_spill_path) if history_spill_path else None
+        self.event_history = EventHistory(max_history_size, spill_log)
         
         # Set up asynchronous processing
         self.async_enabled = True
@@ -191,12 +363,8 @@ class EventBus:
                 source=event.get("source")
             )
             
-        # Add to event history
+        # Add to event history (evicting the oldest event once full)
         self.event_history.append(event)
-        
-        # Trim history if needed
-        if len(self.event_history) > self.max_history_size:
-            self.event_history = self.event_history[-self.max_history_size:]
             
         # Process event
         if async_processing and self.async_enabled:
@@ -303,11 +471,7 @@ class EventBus:
         Returns:
             Event or None if not found
         """
-        for event in self.event_history:
-            if event.id == event_id:
-                return event
-                
-        return None
+        return self.event_history.get(event_id)
     
     def get_events_by_type(self, event_type: str, limit: int = None) -> List[Event]:
         """
@@ -318,18 +482,9 @@ class EventBus:
             limit: Maximum number of events to return
             
         Returns:
-            List of events
+            List of events, newest first
         """
-        events = [e for e in self.event_history if e.type == event_type]
-        
-        # Sort by timestamp (newest first)
-        events.sort(key=lambda e: e.timestamp, reverse=True)
-        
-        # Apply limit if specified
-        if limit is not None:
-            events = events[:limit]
-            
-        return events
+        return self.event_history.newest_of_type(event_type, limit)
     
     def get_events_by_source(self, source: str, limit: int = None) -> List[Event]:
         """
@@ -340,18 +495,9 @@ class EventBus:
             limit: Maximum number of events to return
             
         Returns:
-            List of events
+            List of events, newest first
         """
-        events = [e for e in self.event_history if e.source == source]
-        
-        # Sort by timestamp (newest first)
-        events.sort(key=lambda e: e.timestamp, reverse=True)
-        
-        # Apply limit if specified
-        if limit is not None:
-            events = events[:limit]
-            
-        return events
+        return self.event_history.newest_from_source(source, limit)
     
     def get_recent_events(self, limit: int = 10) -> List[Event]:
         """
@@ -361,16 +507,44 @@ class EventBus:
             limit: Maximum number of events to return
             
         Returns:
-            List of recent events
+            List of recent events, newest first
+        """
+        return self.event_history.newest(limit)
+    
+    def get_events_in_range(self, start: Union[datetime, str], end: Union[datetime, str]) -> List[Event]:
         """
-        # Sort by timestamp (newest first)
-        events = sorted(self.event_history, key=lambda e: e.timestamp, reverse=True)
+        Get events published between two times, including events already
+        evicted from the in-memory history to the spill log.
         
-        return events[:limit]
+        Args:
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+            
+        Returns:
+            List of events, oldest first
+        """
+        start = start.isoformat() if isinstance(start, datetime) else start
+        end = end.isoformat() if isinstance(end, datetime) else end
+        
+        events = []
+        if self.event_history.spill_log:
+            events.extend(self.event_history.spill_log.query(start, end))
+        events.extend(self.event_history.in_range(start, end))
+        return events
+    
+    @property
+    def max_history_size(self) -> int:
+        """Maximum number of events kept in the in-memory history"""
+        return self.event_history.max_size
+    
+    @max_history_size.setter
+    def max_history_size(self, size: int) -> None:
+        # Takes effect from the next published event
+        self.event_history.max_size = size
     
     def clear_history(self) -> None:
-        """Clear the event history."""
-        self.event_history = []
+        """Clear the in-memory event history (the spill log is kept)."""
+        self.event_history.clear()
 
 
 # Singleton instance for global use
@@ -7,8 +7,14 @@ and past events.
 """
 
 from typing import Dict, Any, List, Optional, Set, Union
+import atexit
+import functools
 import logging
 import json
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from datetime import datetime
 import uuid
 
@@ -352,24 +358,62 @@ class NarrativeContext:
         self.updated_at = datetime.utcnow().isoformat()
 
 
+def _flush_on_exit(manager_ref) -> None:
+    manager = manager_ref()
+    if manager is not None:
+        manager.close()
+
+
 class NarrativeContextManager:
     """
     Manager for narrative contexts.
     
     Provides functionality for creating, loading, saving, and updating
     narrative contexts, as well as accessing specific aspects of the context.
+    
+    Persistence is write-behind: updates only mark a context dirty, and
+    dirty contexts are saved together, once each, after max_pending_updates
+    updates, every flush_interval seconds (from a background thread), and
+    on close() or interpreter exit. After a flush, contexts idle for longer than
+    idle_ttl are dropped from memory and reloaded from storage on demand.
     """
     
-    def __init__(self, storage_service=None):
+    def __init__(self,
+                 storage_service=None,
+                 flush_interval: float = 5.0,
+                 max_pending_updates: int = 1000,
+                 idle_ttl: float = 900.0,
+                 max_active_contexts: int = 1000):
         """
         Initialize the narrative context manager.
         
         Args:
             storage_service: Optional service for persisting contexts
+            flush_interval: Longest time (seconds) an update waits to be saved
+            max_pending_updates: Number of unsaved updates that triggers an immediate flush
+            idle_ttl: Seconds without access after which a saved context is evicted
+            max_active_contexts: Contexts kept in memory before the least recently used are evicted
         """
         self.logger = logging.getLogger("NarrativeContextManager")
         self.storage_service = storage_service
-        self.active_contexts = {}  # In-memory cache of active contexts
+        self.active_contexts = OrderedDict()  # In-memory cache of active contexts, least recently used first
+        
+        # Write-behind state
+        self.flush_interval = flush_interval
+        self.max_pending_updates = max_pending_updates
+        self.idle_ttl = idle_ttl
+        self.max_active_contexts = max_active_contexts
+        self._dirty: Set[str] = set()
+        self._pending_updates = 0
+        self._last_used: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._flush_thread = None
+        self._stop_flushing = threading.Event()
+        self.stats = {"updates": 0, "flushes": 0, "contexts_saved": 0, "save_errors": 0, "evicted": 0}
+        
+        self._exit_hook = None
+        if storage_service:
+            self._register_exit_hook()
     
     def create_context(self, context_id: str = None) -> NarrativeContext:
         """
@@ -382,10 +426,11 @@ class NarrativeContextManager:
             New narrative context
         """
         context = NarrativeContext(context_id)
-        self.active_contexts[context.id] = context
+        with self._lock:
+            self._cache(context)
         
-        # Save to storage if available
-        self._save_context(context)
+        # Save to storage with the next flush
+        self.mark_dirty(context)
         
         return context
     
@@ -400,12 +445,159 @@ class NarrativeContextManager:
             Narrative context or None if not found
         """
         # Check in-memory cache first
-        if context_id in self.active_contexts:
-            return self.active_contexts[context_id]
+        with self._lock:
+            context = self.active_contexts.get(context_id)
+            if context is not None:
+                self._touch(context_id)
+                return context
             
         # Try to load from storage
         return self._load_context(context_id)
     
+    def _cache(self, context: NarrativeContext) -> None:
+        self.active_contexts[context.id] = context
+        self._touch(context.id)
+    
+    def _touch(self, context_id: str) -> None:
+        self.active_contexts.move_to_end(context_id)
+        self._last_used[context_id] = time.monotonic()
+    
+    def mark_dirty(self, context: NarrativeContext) -> None:
+        """
+        Record that a context changed and needs saving.
+        
+        The context is cached again, in case it was evicted while it was
+        being changed. Flushes at once when max_pending_updates updates are
+        waiting; otherwise the background flusher saves it within
+        flush_interval seconds.
+        
+        Args:
+            context: The changed narrative context
+        """
+        if not self.storage_service:
+            return
+        
+        with self._lock:
+            pending = self._record_dirty(context)
+        self._schedule_flush(pending)
+    
+    def _record_dirty(self, context: NarrativeContext) -> int:
+        self._cache(context)
+        self._dirty.add(context.id)
+        self._pending_updates += 1
+        return self._pending_updates
+    
+    def _schedule_flush(self, pending: int) -> None:
+        if pending >= self.max_pending_updates:
+            self.flush()
+        elif self._flush_thread is None or not self._flush_thread.is_alive():
+            self._start_flush_thread()
+    
+    def flush(self) -> int:
+        """
+        Save every dirty context, then evict idle contexts.
+        
+        Returns:
+            Number of contexts saved
+        """
+        with self._lock:
+            dirty_ids = list(self._dirty)
+            self._pending_updates = 0
+        
+        saved = 0
+        for context_id in dirty_ids:
+            # Hold the lock per context so updates to other contexts are not blocked by the whole flush
+            with self._lock:
+                if context_id not in self._dirty:
+                    continue
+                context = self.active_contexts.get(context_id)
+                if context is None:
+                    # Dirty contexts are never evicted; keep it dirty rather than lose the update
+                    self.logger.error(f"Dirty narrative context {context_id} is not cached; cannot save it")
+                    self.stats["save_errors"] += 1
+                    continue
+                if self._save_context(context):
+                    self._dirty.discard(context_id)
+                    saved += 1
+                else:
+                    self.stats["save_errors"] += 1
+        
+        with self._lock:
+            self.stats["flushes"] += 1
+            self.stats["contexts_saved"] += saved
+        self.evict_idle()
+        return saved
+    
+    def evict_idle(self) -> int:
+        """
+        Drop saved contexts that have been idle longer than idle_ttl, and the
+        least recently used saved contexts beyond max_active_contexts. Dirty
+        contexts are never evicted, and nothing is evicted without storage.
+        
+        Returns:
+            Number of contexts evicted
+        """
+        if not self.storage_service:
+            return 0
+        
+        cutoff = time.monotonic() - self.idle_ttl
+        evicted = 0
+        with self._lock:
+            excess = len(self.active_contexts) - self.max_active_contexts
+            for context_id in list(self.active_contexts):
+                if context_id in self._dirty:
+                    continue
+                if excess > 0 or self._last_used.get(context_id, 0.0) < cutoff:
+                    del self.active_contexts[context_id]
+                    self._last_used.pop(context_id, None)
+                    excess -= 1
+                    evicted += 1
+                else:
+                    # Least recently used first: nothing after this is idle
+                    break
+            self.stats["evicted"] += evicted
+        
+        if evicted:
+            self.logger.debug(f"Evicted {evicted} idle narrative contexts")
+        return evicted
+    
+    def _register_exit_hook(self) -> None:
+        with self._lock:
+            if self._exit_hook is None:
+                self._exit_hook = functools.partial(_flush_on_exit, weakref.ref(self))
+                atexit.register(self._exit_hook)
+    
+    def _start_flush_thread(self) -> None:
+        with self._lock:
+            if self._flush_thread is not None and self._flush_thread.is_alive():
+                return
+            # Updates after close() restart flushing, and need flushing at exit again
+            self._register_exit_hook()
+            self._stop_flushing.clear()
+            self._flush_thread = threading.Thread(target=self._flush_worker, name="narrative-context-flush",
+                                                  daemon=True)
+            self._flush_thread.start()
+    
+    def _flush_worker(self) -> None:
+        while not self._stop_flushing.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                self.logger.error(f"Error in narrative context flush: {e}")
+    
+    def close(self) -> None:
+        """Stop the background flusher and save every dirty context."""
+        with self._lock:
+            exit_hook, self._exit_hook = self._exit_hook, None
+        if exit_hook is not None:
+            atexit.unregister(exit_hook)
+        self._stop_flushing.set()
+        thread = self._flush_thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=self.flush_interval + 5.0)
+        self._flush_thread = None
+        self.flush()
+    
     def _save_context(self, context: NarrativeContext) -> bool:
         """
         Save a context to persistent storage.
@@ -450,8 +642,11 @@ class NarrativeContextManager:
                 
             context = NarrativeContext.from_dict(context_dict)
             
-            # Add to active contexts cache
-            self.active_contexts[context.id] = context
+            # Add to active contexts cache (unless another thread loaded it first)
+            with self._lock:
+                if context.id in self.active_contexts:
+                    context = self.active_contexts[context.id]
+                self._cache(context)
             
             return context
         except Exception as e:
@@ -469,21 +664,28 @@ class NarrativeContextManager:
         Returns:
             Updated context or None if error
         """
-        context = self.get_context(context_id)
-        
-        if not context:
-            self.logger.warning(f"Attempted to update non-existent context: {context_id}")
-            return None
-            
-        # Apply the update function
-        try:
-            update_func(context)
-        except Exception as e:
-            self.logger.error(f"Error updating context {context_id}: {e}")
-            return None
+        # Hold the lock from lookup to marking dirty, so the context cannot be
+        # evicted while it is being changed
+        with self._lock:
+            context = self.get_context(context_id)
             
-        # Save the updated context
-        self._save_context(context)
+            if not context:
+                self.logger.warning(f"Attempted to update non-existent context: {context_id}")
+                return None
+                
+            # Apply the update function
+            try:
+                update_func(context)
+                self.stats["updates"] += 1
+            except Exception as e:
+                self.logger.error(f"Error updating context {context_id}: {e}")
+                return None
+                
+            # Save the updated context with the next flush
+            pending = self._record_dirty(context) if self.storage_service else 0
+        
+        if self.storage_service:
+            self._schedule_flush(pending)
         
         return context
     
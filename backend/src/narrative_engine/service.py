@@ -837,6 +837,10 @@ class NarrativeService:
         
         self.context_manager.update_context(context_id, add_dialogue)
     
+    def shutdown(self) -> None:
+        """Save pending narrative context changes and stop background flushing."""
+        self.context_manager.close()
+    
     def _handle_player_action(self, event: Event) -> None:
         """
         Handle a player action event.
@@ -0,0 +1,205 @@
+"""
+Template Compiler Module
+
+This module compiles narrative templates into a small node tree so that
+rendering is a single pass with no regex matching or condition parsing.
+Compiled templates render exactly as TemplateProcessor's regex passes do,
+including the order in which variations draw random choices.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+import random
+import re
+
+logger = logging.getLogger(__name__)
+
+VARIABLE_PATTERN = re.compile(r'\{([^{}]*)\}')
+CONDITIONAL_PATTERN = re.compile(r'\[\[if\s+([^]]*?)\]\](.*?)\[\[else\]\](.*?)\[\[endif\]\]', re.DOTALL)
+VARIATION_PATTERN = re.compile(r'\[\[variation\]\](.*?)\[\[endvariation\]\]', re.DOTALL)
+
+# Node kinds
+_TEXT = 0
+_VARIABLE = 1
+_PATH = 2
+_VARIATION = 3
+_CONDITIONAL = 4
+
+Node = Tuple[Any, ...]
+Condition = Callable[[Dict[str, Any]], bool]
+
+
+class UncompilableTemplate(Exception):
+    """Raised when a template's sections overlap in a way the node tree cannot express."""
+
+
+class CompiledTemplate:
+    """
+    A template parsed once into text, variable, variation and conditional nodes.
+    """
+
+    __slots__ = ("source", "_nodes")
+
+    def __init__(self, source: str, nodes: List[Node]):
+        self.source = source
+        self._nodes = nodes
+
+    def render(self, variables: Dict[str, Any], choice: Callable[[List[Any]], Any] = random.choice) -> str:
+        """
+        Render the template.
+
+        Args:
+            variables: Variables to substitute
+            choice: Function picking one variation (defaults to random.choice)
+
+        Returns:
+            Rendered text
+        """
+        out: List[str] = []
+        _render_nodes(self._nodes, variables, choice, out)
+        return "".join(out)
+
+
+def _render_nodes(nodes: List[Node], variables: Dict[str, Any], choice, out: List[str]) -> None:
+    for node in nodes:
+        kind = node[0]
+        if kind == _TEXT:
+            out.append(node[1])
+        elif kind == _VARIABLE:
+            name = node[1]
+            if name in variables:
+                out.append(str(variables[name]))
+        elif kind == _PATH:
+            value = variables
+            for part in node[1]:
+                if isinstance(value, dict) and part in value:
+                    value = value[part]
+                else:
+                    break
+            else:
+                out.append(str(value))
+        elif kind == _VARIATION:
+            if node[1]:
+                _render_nodes(choice(node[1]), variables, choice, out)
+        else:
+            _render_nodes(node[2] if node[1](variables) else node[3], variables, choice, out)
+
+
+def compile_template(source: str) -> CompiledTemplate:
+    """
+    Compile a template.
+
+    Args:
+        source: Template string
+
+    Returns:
+        Compiled template
+
+    Raises:
+        UncompilableTemplate: If a variation or variable straddles a conditional
+            or variation boundary (the regex passes would join them after the
+            earlier pass, which a node tree cannot reproduce)
+    """
+    nodes: List[Node] = []
+    position = 0
+    for match in CONDITIONAL_PATTERN.finditer(source):
+        nodes.extend(_compile_variations(source[position:match.start()]))
+        nodes.append((
+            _CONDITIONAL,
+            compile_condition(match.group(1).strip()),
+            _compile_variations(match.group(2)),
+            _compile_variations(match.group(3))
+        ))
+        position = match.end()
+    nodes.extend(_compile_variations(source[position:]))
+    return CompiledTemplate(source, nodes)
+
+
+def _compile_variations(text: str) -> List[Node]:
+    nodes: List[Node] = []
+    position = 0
+    for match in VARIATION_PATTERN.finditer(text):
+        nodes.extend(_compile_variables(text[position:match.start()]))
+        lines = [line.strip() for line in match.group(1).strip().split('\n') if line.strip()]
+        nodes.append((_VARIATION, [_compile_variables(line) for line in lines]))
+        position = match.end()
+    nodes.extend(_compile_variables(text[position:]))
+    return nodes
+
+
+def _compile_variables(text: str) -> List[Node]:
+    nodes: List[Node] = []
+    position = 0
+    for match in VARIABLE_PATTERN.finditer(text):
+        _append_text(nodes, text[position:match.start()])
+        name = match.group(1).strip()
+        if '.' in name:
+            nodes.append((_PATH, tuple(name.split('.'))))
+        else:
+            nodes.append((_VARIABLE, name))
+        position = match.end()
+    _append_text(nodes, text[position:])
+    return nodes
+
+
+def _append_text(nodes: List[Node], text: str) -> None:
+    if not text:
+        return
+    if '{' in text or '}' in text or '[[variation]]' in text or '[[endvariation]]' in text:
+        raise UncompilableTemplate(f"Unbalanced section in template text: {text[:40]!r}")
+    nodes.append((_TEXT, text))
+
+
+def compile_condition(condition: str) -> Condition:
+    """
+    Parse a condition string once into a predicate over the variables.
+
+    Supports the same forms as TemplateProcessor._evaluate_condition, checked
+    in the same order: "exists name", "==", ">", "<" and "!=".
+    """
+    if condition.startswith('exists '):
+        name = condition[7:].strip()
+        return lambda variables: name in variables
+
+    if ' == ' in condition:
+        left, right = _split_operands(condition, ' == ')
+        right_value = _operand_value(right)
+        return lambda variables: str(variables.get(left, left)) == right_value(variables)
+
+    if ' > ' in condition:
+        left, right = _split_operands(condition, ' > ')
+        return lambda variables: float(variables.get(left, left)) > float(variables.get(right, right))
+
+    if ' < ' in condition:
+        left, right = _split_operands(condition, ' < ')
+        return lambda variables: float(variables.get(left, left)) < float(variables.get(right, right))
+
+    if ' != ' in condition:
+        left, right = _split_operands(condition, ' != ')
+        right_value = _operand_value(right)
+        return lambda variables: str(variables.get(left, left)) != right_value(variables)
+
+    logger.warning(f"Unknown condition: {condition}")
+    return lambda variables: False
+
+
+def _split_operands(condition: str, operator: str) -> Tuple[str, str]:
+    left, right = condition.split(operator, 1)
+    return left.strip(), right.strip()
+
+
+def _operand_value(operand: str) -> Callable[[Dict[str, Any]], str]:
+    """Quoted operands are literals; anything else is a variable name, or itself if unset."""
+    if operand.startswith('"') and operand.endswith('"'):
+        literal = operand[1:-1]
+        return lambda variables: literal
+    return lambda variables: str(variables.get(operand, operand))
+
+
+def try_compile_template(source: str) -> Optional[CompiledTemplate]:
+    """Compile a template, or return None if it needs the regex passes."""
+    try:
+        return compile_template(source)
+    except UncompilableTemplate as e:
+        logger.debug(f"Template not compiled: {e}")
+        return None
@@ -10,30 +10,84 @@ import logging
 import json
 import random
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime
 import uuid
 
+from backend.src.narrative_engine.template_compiler import (
+    CompiledTemplate, try_compile_template,
+    VARIABLE_PATTERN, CONDITIONAL_PATTERN, VARIATION_PATTERN
+)
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of compiled templates kept per processor
+COMPILED_CACHE_SIZE = 2048
+
 class TemplateProcessor:
     """
     Processes narrative templates with variable substitution and conditional logic.
     
     Supports basic variable substitution (e.g., {character_name}), as well as
-    conditional sections and template variations.
+    conditional sections and template variations. Templates are compiled once
+    and the compiled form is cached by template text, so repeated renders of
+    the same template skip all parsing.
     """
     
     def __init__(self):
         """Initialize the template processor."""
-        self.variable_pattern = re.compile(r'\{([^{}]*)\}')
-        self.conditional_pattern = re.compile(r'\[\[if\s+([^]]*?)\]\](.*?)\[\[else\]\](.*?)\[\[endif\]\]', re.DOTALL)
-        self.variation_pattern = re.compile(r'\[\[variation\]\](.*?)\[\[endvariation\]\]', re.DOTALL)
+        self.variable_pattern = VARIABLE_PATTERN
+        self.conditional_pattern = CONDITIONAL_PATTERN
+        self.variation_pattern = VARIATION_PATTERN
         self.template_cache = {}
+        self._compiled_cache: "OrderedDict[str, Optional[CompiledTemplate]]" = OrderedDict()
+        self._compiled_lock = threading.Lock()
     
     def process_template(self, template: str, variables: Dict[str, Any]) -> str:
         """
         Process a template with variables.
         
+        Args:
+            template: Template string
+            variables: Variables to substitute
+            
+        Returns:
+            Processed template
+        """
+        compiled = self.compile_template(template)
+        if compiled is None:
+            return self._process_template_uncompiled(template, variables)
+        return compiled.render(variables)
+    
+    def compile_template(self, template: str) -> Optional[CompiledTemplate]:
+        """
+        Get the compiled form of a template, compiling it on first use.
+        
+        Args:
+            template: Template string
+            
+        Returns:
+            Compiled template, or None if the template can only be processed
+            by the regex passes (sections straddling each other)
+        """
+        with self._compiled_lock:
+            if template in self._compiled_cache:
+                self._compiled_cache.move_to_end(template)
+                return self._compiled_cache[template]
+        
+        compiled = try_compile_template(template)
+        
+        with self._compiled_lock:
+            self._compiled_cache[template] = compiled
+            if len(self._compiled_cache) > COMPILED_CACHE_SIZE:
+                self._compiled_cache.popitem(last=False)
+        return compiled
+    
+    def _process_template_uncompiled(self, template: str, variables: Dict[str, Any]) -> str:
+        """
+        Process a template with one regex pass per construct.
+        
         Args:
             template: Template string
             variables: Variables to substitute
@@ -35,7 +35,7 @@ def create_npc(db: Session, npc: NpcData) -> DBNpc:
         economic_role=npc.economic_role,
         skills=npc.skills,
         currency=npc.currency,
-        inventory=npc.inventory,
+        inventory={item_id: slot.dict() for item_id, slot in npc.inventory.items()},
         needs=npc.needs.dict(),
         current_business_id=npc.current_business_id,
         faction_id=npc.faction_id,
@@ -15,8 +15,13 @@ import enum
 from sqlalchemy.ext.declarative import declarative_base
 Base = declarative_base()
 
+
+def _enum_values(enum_class):
+    """Store enum values (as written by the Pydantic models) rather than member names."""
+    return [member.value for member in enum_class]
+
 # Enum for economic roles
-class EconomicRole(enum.Enum):
+class EconomicRole(str, enum.Enum):
     SHOPKEEPER = "shopkeeper"
     ARTISAN_BLACKSMITH = "artisan_blacksmith"
     ARTISAN_TAILOR = "artisan_tailor"
@@ -40,7 +45,7 @@ class EconomicRole(enum.Enum):
     ENTERTAINER = "entertainer"
 
 # Enum for gender
-class Gender(enum.Enum):
+class Gender(str, enum.Enum):
     MALE = "male"
     FEMALE = "female"
     NON_BINARY = "non_binary"
@@ -53,11 +58,11 @@ class DBNpc(Base):
     id = Column(String, primary_key=True, index=True)
     name = Column(String, nullable=False)
     age = Column(Integer, nullable=False)
-    gender = Column(Enum(Gender), default=Gender.UNSPECIFIED)
+    gender = Column(Enum(Gender, values_callable=_enum_values), default=Gender.UNSPECIFIED)
     personality_tags = Column(JSON, default=list)
     backstory_hook = Column(Text, nullable=False)
     current_location_id = Column(String, ForeignKey("locations.id"), nullable=False)
-    economic_role = Column(Enum(EconomicRole), nullable=False)
+    economic_role = Column(Enum(EconomicRole, values_callable=_enum_values), nullable=False)
     skills = Column(JSON, default=dict)
     currency = Column(Float, default=0.0)
     inventory = Column(JSON, default=dict)
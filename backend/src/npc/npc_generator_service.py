@@ -13,6 +13,8 @@ import os
 from typing import Dict, Any, List, Optional, Union, Tuple
 from datetime import datetime
 from uuid import uuid4
+import numpy as np
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 # Import models
@@ -25,6 +27,7 @@ from backend.src.npc.crud import (
     create_npc, get_npc, get_npcs, get_npcs_by_location, 
     get_archetype, get_archetypes, update_npc, delete_npc
 )
+from backend.src.npc.npc_population_engine import NpcPopulationEngine
 
 # Import integration with economy system
 # This is to demonstrate how we'd integrate with other systems
@@ -33,6 +36,15 @@ from backend.src.npc.crud import (
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT statement when bulk-populating a location
+BULK_INSERT_BATCH_SIZE = 1000
+
+DEFAULT_PERSONALITY_TRAITS = [
+    "friendly", "shy", "bold", "cautious", "curious", "stubborn",
+    "generous", "greedy", "honest", "deceitful", "loyal", "fickle",
+    "patient", "impatient", "serious", "playful", "optimistic", "pessimistic"
+]
+
 class NpcGeneratorService:
     """
     Service for generating NPCs with different attributes based on various parameters.
@@ -64,6 +76,7 @@ class NpcGeneratorService:
         # Initialize with basic archetypes if not yet loaded
         self.archetypes = {}
         self._ensure_basic_archetypes_loaded()
+        self._population_engine: Optional[NpcPopulationEngine] = None
         
         self.logger.info("NPC Generator Service initialized")
     
@@ -372,7 +385,9 @@ class NpcGeneratorService:
                         db: Session, 
                         location_id: str, 
                         population_count: int,
-                        role_distribution: Optional[Dict[str, float]] = None) -> List[DBNpc]:
+                        role_distribution: Optional[Dict[str, float]] = None,
+                        bulk: bool = False,
+                        seed: Optional[int] = None) -> List[DBNpc]:
         """
         Populate a location with NPCs based on specified distribution.
         
@@ -381,12 +396,101 @@ class NpcGeneratorService:
             location_id: Location identifier
             population_count: Number of NPCs to generate
             role_distribution: Optional dictionary mapping roles to proportions
+            bulk: Generate all NPCs in vectorized batches and bulk-insert them
+                (intended for seeding large settlements)
+            seed: Random seed for bulk generation
             
         Returns:
             List of generated NPC database objects
         """
         self.logger.info(f"Populating location {location_id} with {population_count} NPCs")
         
+        role_counts = self._get_role_counts(population_count, role_distribution)
+        
+        if bulk:
+            npc_ids = self.populate_location_bulk(db, location_id, role_counts, seed)
+            npcs = []
+            for start in range(0, len(npc_ids), BULK_INSERT_BATCH_SIZE):
+                batch_ids = npc_ids[start:start + BULK_INSERT_BATCH_SIZE]
+                npcs.extend(db.query(DBNpc).filter(DBNpc.id.in_(batch_ids)).all())
+            return npcs
+        
+        # Generate NPCs for each role
+        generation_requests = []
+        
+        for role, count in role_counts.items():
+            for _ in range(count):
+                # Select appropriate archetype for this role
+                archetype_name = self._get_archetype_for_role(role)
+                
+                # Create generation parameters
+                params = NpcGenerationParams(
+                    target_location_id=location_id,
+                    requested_role=self._resolve_role(role),
+                    archetype_name=archetype_name
+                )
+                
+                generation_requests.append(params)
+        
+        # Generate all NPCs
+        return self.generate_multiple_npcs(db, generation_requests)
+    
+    def populate_location_bulk(self, 
+                             db: Session, 
+                             location_id: str, 
+                             role_counts: Dict[str, int],
+                             seed: Optional[int] = None) -> List[str]:
+        """
+        Generate and bulk-insert NPCs for a location.
+        
+        All attributes are sampled per archetype in vectorized batches, and
+        the rows are written with batched INSERT statements in one transaction.
+        
+        Args:
+            db: Database session
+            location_id: Location identifier
+            role_counts: Dictionary mapping roles to the number of NPCs to generate
+            seed: Random seed; the same seed produces the same population content
+            
+        Returns:
+            IDs of the generated NPCs
+        """
+        rng = np.random.default_rng(seed)
+        archetype_names = list(self.archetypes.keys())
+        role_to_archetype = self._get_role_archetypes()
+        
+        roles = []
+        archetypes = []
+        for role, count in role_counts.items():
+            roles.extend([self._resolve_role(role).value] * count)
+            if role in role_to_archetype:
+                archetypes.extend([role_to_archetype[role]] * count)
+            else:
+                # Roles without a dedicated archetype get a random one per NPC
+                archetypes.extend(archetype_names[i] for i in rng.integers(0, len(archetype_names), count))
+        
+        rows = self._get_population_engine().generate_rows(location_id, roles, archetypes, rng)
+        
+        for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+            db.execute(insert(DBNpc), rows[start:start + BULK_INSERT_BATCH_SIZE])
+        db.commit()
+        
+        self.logger.info(f"Bulk-generated {len(rows)} NPCs for location {location_id}")
+        return [row["id"] for row in rows]
+    
+    def _get_role_counts(self, 
+                       population_count: int, 
+                       role_distribution: Optional[Dict[str, float]] = None) -> Dict[str, int]:
+        """
+        Split a population count across roles.
+        
+        Args:
+            population_count: Number of NPCs to generate
+            role_distribution: Optional dictionary mapping roles to proportions
+            
+        Returns:
+            Dictionary mapping roles to NPC counts, summing to population_count
+        """
         # Default role distribution if none provided
         if not role_distribution:
             role_distribution = {
@@ -408,9 +512,10 @@ class NpcGeneratorService:
         # Calculate counts for each role
         role_counts = {}
         remaining = population_count
+        last_role = list(normalized_distribution.keys())[-1]
         
         for role, proportion in normalized_distribution.items():
-            if role == list(normalized_distribution.keys())[-1]:
+            if role == last_role:
                 # Last role gets the remainder to ensure we hit exactly population_count
                 role_counts[role] = remaining
             else:
@@ -418,25 +523,35 @@ class NpcGeneratorService:
                 role_counts[role] = count
                 remaining -= count
         
-        # Generate NPCs for each role
-        generation_requests = []
-        
-        for role, count in role_counts.items():
-            for _ in range(count):
-                # Select appropriate archetype for this role
-                archetype_name = self._get_archetype_for_role(role)
-                
-                # Create generation parameters
-                params = NpcGenerationParams(
-                    target_location_id=location_id,
-                    requested_role=role,
-                    archetype_name=archetype_name
-                )
-                
-                generation_requests.append(params)
+        return role_counts
+    
+    def _resolve_role(self, role: Union[str, EconomicRole]) -> EconomicRole:
+        """
+        Resolve a role given by enum name (e.g. "GUARD") or value (e.g. "guard").
         
-        # Generate all NPCs
-        return self.generate_multiple_npcs(db, generation_requests)
+        Args:
+            role: Economic role name, value or enum member
+            
+        Returns:
+            Economic role
+        """
+        if isinstance(role, EconomicRole):
+            return role
+        if role in EconomicRole.__members__:
+            return EconomicRole[role]
+        return EconomicRole(role)
+    
+    def _get_population_engine(self) -> NpcPopulationEngine:
+        """Get the compiled population engine, building it on first use."""
+        if self._population_engine is None:
+            self._population_engine = NpcPopulationEngine(
+                self.archetypes,
+                self.first_names,
+                self.last_names,
+                self.personality_traits or DEFAULT_PERSONALITY_TRAITS,
+                self._apply_need_modifiers
+            )
+        return self._population_engine
     
     def _get_archetype_for_role(self, role: str) -> str:
         """
@@ -448,8 +563,17 @@ class NpcGeneratorService:
         Returns:
             Archetype name
         """
-        # Map roles to suitable archetypes
-        role_to_archetype = {
+        # Return matching archetype or default to a random one
+        return self._get_role_archetypes().get(role, random.choice(list(self.archetypes.keys())))
+    
+    def _get_role_archetypes(self) -> Dict[str, str]:
+        """
+        Get the mapping of roles to suitable archetypes.
+        
+        Returns:
+            Dictionary mapping role names to archetype names
+        """
+        return {
             "SHOPKEEPER": "innkeeper",
             "ARTISAN_BLACKSMITH": "blacksmith",
             "MERCHANT": "merchant",
@@ -457,9 +581,6 @@ class NpcGeneratorService:
             "FARMER": "farmer",
             "GUARD": "guard"
         }
-        
-        # Return matching archetype or default to a random one
-        return role_to_archetype.get(role, random.choice(list(self.archetypes.keys())))
     
     def _generate_npc_from_params_and_archetype(self, 
                                              params: NpcGenerationParams, 
@@ -494,7 +615,7 @@ class NpcGeneratorService:
             economic_role = params.requested_role
         else:
             possible_roles = archetype_data.get("possible_roles", ["UNEMPLOYED_DRIFTER"])
-            economic_role = random.choice(possible_roles)
+            economic_role = self._resolve_role(random.choice(possible_roles))
         
         # Generate personality traits
         personality_weights = archetype_data.get("personality_weights", {})
@@ -632,11 +753,7 @@ class NpcGeneratorService:
         
         # Otherwise use random selection from default list
         if not self.personality_traits:
-            self.personality_traits = [
-                "friendly", "shy", "bold", "cautious", "curious", "stubborn",
-                "generous", "greedy", "honest", "deceitful", "loyal", "fickle",
-                "patient", "impatient", "serious", "playful", "optimistic", "pessimistic"
-            ]
+            self.personality_traits = list(DEFAULT_PERSONALITY_TRAITS)
         
         return random.sample(self.personality_traits, min(count, len(self.personality_traits)))
     
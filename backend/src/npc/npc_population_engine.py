@@ -0,0 +1,246 @@
+"""
+NPC Population Engine
+
+This module provides vectorized, seeded generation of large NPC populations.
+Archetype data is compiled once into weight and range tables, and every
+attribute is then sampled for all NPCs of an archetype in a single NumPy
+call, producing row dictionaries ready for a bulk insert into DBNpc.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from backend.src.npc.models.pydantic_models import Gender, NpcNeeds
+
+# Number of personality traits given to each NPC
+TRAIT_COUNT = 3
+
+# Pronoun substitutions for backstory templates
+PRONOUNS = {
+    Gender.MALE.value: {"their": "his", "them": "him", "they": "he"},
+    Gender.FEMALE.value: {"their": "her", "them": "her", "they": "she"},
+    Gender.NON_BINARY.value: {"their": "their", "them": "them", "they": "they"},
+    Gender.UNSPECIFIED.value: {"their": "their", "them": "them", "they": "they"}
+}
+
+
+@dataclass
+class CompiledArchetype:
+    """Sampling tables for one archetype."""
+    name: str
+    age_range: Tuple[int, int]
+    genders: List[str]
+    gender_cdf: np.ndarray
+    traits: List[str]
+    trait_weights: Optional[np.ndarray]
+    skill_names: List[str]
+    skill_low: np.ndarray
+    skill_high: np.ndarray
+    currency_range: Tuple[float, float]
+    inventory_items: List[Dict[str, Any]]
+    backstories: Dict[str, List[str]]
+    needs: Dict[str, float]
+
+
+def _cdf(weights: Sequence[float]) -> np.ndarray:
+    cdf = np.cumsum(np.asarray(weights, dtype=np.float64))
+    return cdf / cdf[-1]
+
+
+def _backstories_by_gender(templates: List[str]) -> Dict[str, List[str]]:
+    """Apply pronoun substitution ahead of time, leaving only {name} to fill."""
+    by_gender = {}
+    for gender, pronouns in PRONOUNS.items():
+        substituted = []
+        for template in templates:
+            for placeholder, value in pronouns.items():
+                template = template.replace("{" + placeholder + "}", value)
+            substituted.append(template)
+        by_gender[gender] = substituted
+    return by_gender
+
+
+class NpcPopulationEngine:
+    """
+    Samples NPC attributes for whole populations at once.
+
+    Output for a given seed is deterministic, except for the NPC IDs, which
+    stay unique so the same seed can populate several locations.
+    """
+
+    def __init__(self,
+                 archetypes: Dict[str, Dict[str, Any]],
+                 first_names: Dict[str, List[str]],
+                 last_names: Dict[str, List[str]],
+                 default_traits: List[str],
+                 need_modifier_fn):
+        """
+        Compile the sampling tables.
+
+        Args:
+            archetypes: Archetype data keyed by archetype name
+            first_names: First names keyed by cultural group
+            last_names: Last names keyed by cultural group
+            default_traits: Traits used for archetypes without personality weights
+            need_modifier_fn: Callable applying need modifiers to base NpcNeeds
+        """
+        self.first_names = self._compile_names(first_names)
+        self.last_names = self._compile_names(last_names)
+        self.default_traits = list(default_traits)
+        self.archetypes = {
+            name: self._compile_archetype(name, data, need_modifier_fn)
+            for name, data in archetypes.items()
+        }
+
+    @staticmethod
+    def _compile_names(names_by_culture: Dict[str, List[str]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        cultures = [names for names in names_by_culture.values() if names]
+        flat = np.array([name for names in cultures for name in names], dtype=object)
+        lengths = np.array([len(names) for names in cultures], dtype=np.int64)
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        return flat, offsets, lengths
+
+    def _compile_archetype(self, name: str, data: Dict[str, Any], need_modifier_fn) -> CompiledArchetype:
+        gender_weights = data.get("gender_weights") or {"male": 0.5, "female": 0.5}
+        trait_weights = data.get("personality_weights") or {}
+        skill_ranges = data.get("skill_ranges", {})
+        templates = data.get("backstory_templates") or ["{name} is just trying to make a living."]
+
+        return CompiledArchetype(
+            name=name,
+            age_range=tuple(data.get("age_range", (20, 60))),
+            genders=list(gender_weights.keys()),
+            gender_cdf=_cdf(list(gender_weights.values())),
+            traits=list(trait_weights.keys()) or self.default_traits,
+            trait_weights=np.asarray(list(trait_weights.values()), dtype=np.float64) if trait_weights else None,
+            skill_names=list(skill_ranges.keys()),
+            skill_low=np.array([low for low, _ in skill_ranges.values()], dtype=np.int64),
+            skill_high=np.array([high for _, high in skill_ranges.values()], dtype=np.int64),
+            currency_range=tuple(data.get("currency_range", (10.0, 50.0))),
+            inventory_items=list(data.get("inventory_items", [])),
+            backstories=_backstories_by_gender(templates),
+            needs=need_modifier_fn(NpcNeeds(), data.get("need_modifiers", {})).dict()
+        )
+
+    def generate_rows(self,
+                      location_id: str,
+                      roles: Sequence[str],
+                      archetype_names: Sequence[str],
+                      rng: np.random.Generator) -> List[Dict[str, Any]]:
+        """
+        Generate DBNpc row dictionaries for a population.
+
+        Args:
+            location_id: Location the NPCs live in
+            roles: Economic role value of each NPC
+            archetype_names: Archetype name of each NPC
+            rng: Random generator; determines all sampled content
+
+        Returns:
+            One row dictionary per NPC, in input order
+        """
+        count = len(roles)
+        rows: List[Optional[Dict[str, Any]]] = [None] * count
+        names = self._sample_names(count, rng)
+        archetype_names = np.asarray(archetype_names, dtype=object)
+        now = datetime.utcnow()
+
+        for archetype_name in sorted(set(archetype_names)):
+            indices = np.flatnonzero(archetype_names == archetype_name)
+            archetype = self.archetypes[archetype_name]
+            for index, row in zip(indices, self._sample_archetype(archetype, names[indices], rng)):
+                row.update(
+                    id=f"npc-{uuid4().hex}",
+                    current_location_id=location_id,
+                    economic_role=roles[index],
+                    current_business_id=None,
+                    faction_id=None,
+                    relationships={},
+                    daily_schedule={},
+                    creation_date=now,
+                    last_updated=now,
+                    custom_data={}
+                )
+                rows[index] = row
+        return rows
+
+    def _sample_names(self, count: int, rng: np.random.Generator) -> np.ndarray:
+        first = self._sample_from_cultures(self.first_names, count, rng)
+        last = self._sample_from_cultures(self.last_names, count, rng)
+        return np.array([f"{first_name} {last_name}" for first_name, last_name in zip(first, last)], dtype=object)
+
+    @staticmethod
+    def _sample_from_cultures(compiled, count: int, rng: np.random.Generator) -> np.ndarray:
+        # Uniform culture, then a uniform name within it, as _generate_name does
+        flat, offsets, lengths = compiled
+        cultures = rng.integers(0, len(lengths), count)
+        within = (rng.random(count) * lengths[cultures]).astype(np.int64)
+        return flat[offsets[cultures] + within]
+
+    def _sample_archetype(self,
+                          archetype: CompiledArchetype,
+                          names: np.ndarray,
+                          rng: np.random.Generator) -> List[Dict[str, Any]]:
+        count = len(names)
+        ages = rng.integers(archetype.age_range[0], archetype.age_range[1] + 1, count)
+        genders = np.searchsorted(archetype.gender_cdf, rng.random(count), side="right")
+        genders = np.minimum(genders, len(archetype.genders) - 1)
+        traits = self._sample_traits(archetype, count, rng)
+        backstories = rng.integers(0, len(archetype.backstories[Gender.UNSPECIFIED.value]), count)
+        skills = rng.integers(archetype.skill_low, archetype.skill_high + 1, (count, len(archetype.skill_names)))
+        low, high = archetype.currency_range
+        currency = np.round(low + (high - low) * rng.random(count), 2)
+        inventories = self._sample_inventories(archetype, count, rng)
+
+        rows = []
+        for i in range(count):
+            gender = archetype.genders[genders[i]]
+            template = archetype.backstories.get(gender, archetype.backstories[Gender.UNSPECIFIED.value])[backstories[i]]
+            rows.append({
+                "name": names[i],
+                "age": int(ages[i]),
+                "gender": gender,
+                "personality_tags": [archetype.traits[t] for t in traits[i]],
+                "backstory_hook": template.replace("{name}", names[i]),
+                "skills": dict(zip(archetype.skill_names, skills[i].tolist())),
+                "currency": float(currency[i]),
+                "inventory": inventories[i],
+                "needs": dict(archetype.needs)
+            })
+        return rows
+
+    def _sample_traits(self, archetype: CompiledArchetype, count: int, rng: np.random.Generator) -> np.ndarray:
+        trait_count = min(TRAIT_COUNT, len(archetype.traits))
+        if trait_count == 0:
+            return np.empty((count, 0), dtype=np.int64)
+        keys = rng.random((count, len(archetype.traits)))
+        if archetype.trait_weights is not None:
+            # Weighted sampling without replacement: keep the largest u^(1/w)
+            keys = np.log(keys) / archetype.trait_weights
+        return np.argsort(-keys, axis=1)[:, :trait_count]
+
+    def _sample_inventories(self,
+                            archetype: CompiledArchetype,
+                            count: int,
+                            rng: np.random.Generator) -> List[Dict[str, Dict[str, Any]]]:
+        inventories: List[Dict[str, Dict[str, Any]]] = [{} for _ in range(count)]
+        for item_spec in archetype.inventory_items:
+            included = rng.random(count) <= item_spec.get("weight", 1.0)
+            quantity_low, quantity_high = item_spec.get("quantity_range", (1, 1))
+            quantities = rng.integers(quantity_low, quantity_high + 1, count)
+            suffixes = rng.integers(0, 2 ** 32, count)
+            item_type = item_spec.get("item_type", "unknown")
+            condition = item_spec.get("condition", 1.0)
+            for i in np.flatnonzero(included & (quantities > 0)):
+                item_id = f"{item_type}-{int(suffixes[i]):08x}"
+                inventories[i][item_id] = {
+                    "item_id": item_id,
+                    "quantity": int(quantities[i]),
+                    "condition": condition,
+                    "custom_data": {"item_type": item_type}
+                }
+        return inventories
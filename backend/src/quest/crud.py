@@ -6,8 +6,10 @@ operations for quest-related models.
 """
 
 from typing import List, Dict, Any, Optional, Union, Tuple
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.orm import Session
-from datetime import datetime
+from datetime import datetime, timedelta
+from enum import Enum
 from uuid import uuid4
 
 from backend.src.quest.models.pydantic_models import (
@@ -122,6 +124,7 @@ def create_player_quest(db: Session, player_id: str, quest_id: str) -> DBPlayerQ
     
     # Generate a new ID
     player_quest_id = f"pq-{uuid4().hex}"
+    started_at = datetime.utcnow()
     
     db_player_quest = DBPlayerQuest(
         id=player_quest_id,
@@ -129,8 +132,9 @@ def create_player_quest(db: Session, player_id: str, quest_id: str) -> DBPlayerQ
         quest_id=quest_id,
         status=QuestStatus.ACTIVE,
         current_objectives=quest.objectives,  # Copy objectives from quest
-        started_at=datetime.utcnow(),
+        started_at=started_at,
         completed_at=None,
+        expires_at=started_at + timedelta(seconds=quest.time_limit_seconds) if quest.time_limit_seconds else None,
         custom_data={}
     )
     db.add(db_player_quest)
@@ -460,34 +464,14 @@ def update_quest_objective_progress(db: Session, player_id: str, quest_id: str,
     
     # Update the objective
     objective = objectives[objective_index]
-    
-    if update_data.new_quantity is not None:
-        objective["current_quantity"] = update_data.new_quantity
-    
-    if update_data.increment_by is not None:
-        objective["current_quantity"] = objective.get("current_quantity", 0) + update_data.increment_by
-    
-    # Check if objective is completed based on quantity
-    if "required_quantity" in objective and objective.get("current_quantity", 0) >= objective.get("required_quantity", 1):
-        objective["is_completed"] = True
-    
-    # Directly set completed status if provided
-    if update_data.set_completed is not None:
-        objective["is_completed"] = update_data.set_completed
+    _apply_objective_progress(objective, update_data)
     
     # Update the objective in the list
     objectives[objective_index] = objective
     player_quest.current_objectives = objectives
     
-    # Check if all required objectives are completed
-    all_required_completed = True
-    for obj in objectives:
-        if not obj.get("optional", False) and not obj.get("is_completed", False):
-            all_required_completed = False
-            break
-    
     # Update quest status if all objectives are completed
-    if all_required_completed:
+    if _all_required_objectives_completed(objectives):
         player_quest.status = QuestStatus.COMPLETED_SUCCESS
         player_quest.completed_at = datetime.utcnow()
         
@@ -512,6 +496,234 @@ def update_quest_objective_progress(db: Session, player_id: str, quest_id: str,
     db.refresh(player_quest)
     return player_quest
 
+def apply_objective_progress_updates(db: Session, player_id: str, updates: List[QuestProgressUpdate]) -> List[DBPlayerQuest]:
+    """
+    Apply several objective progress updates for a player at once.
+    
+    All affected player quests are loaded in one query and written back in a
+    single batched UPDATE, with the resulting quest events inserted in one
+    batch, instead of one round trip per update.
+    
+    Args:
+        db: Database session
+        player_id: Player identifier
+        updates: Progress updates, possibly spanning several quests
+        
+    Returns:
+        The updated player quest database objects
+    """
+    quest_ids = list(dict.fromkeys(progress_update.quest_id for progress_update in updates))
+    if not quest_ids:
+        return []
+    
+    player_quests = db.query(DBPlayerQuest).filter(
+        DBPlayerQuest.player_id == player_id,
+        DBPlayerQuest.quest_id.in_(quest_ids)
+    ).all()
+    by_quest = {player_quest.quest_id: player_quest for player_quest in player_quests}
+    
+    now = datetime.utcnow()
+    changed: Dict[str, Dict[str, Any]] = {}
+    event_rows = []
+    for progress_update in updates:
+        player_quest = by_quest.get(progress_update.quest_id)
+        if player_quest is None:
+            continue
+        
+        row = changed.get(player_quest.id)
+        if row is None:
+            # Work on a copy so the JSON column is written as a new value
+            row = changed[player_quest.id] = {
+                "id": player_quest.id,
+                "current_objectives": [dict(objective) for objective in player_quest.current_objectives],
+                "status": player_quest.status,
+                "completed_at": player_quest.completed_at
+            }
+        
+        objective = next((obj for obj in row["current_objectives"] if obj.get("id") == progress_update.objective_id), None)
+        if objective is None:
+            continue
+        _apply_objective_progress(objective, progress_update)
+        event_rows.append({
+            "id": f"qe-{uuid4().hex}",
+            "player_id": player_id,
+            "quest_id": progress_update.quest_id,
+            "event_type": "objective_progress_updated",
+            "event_data": {
+                "objective_id": progress_update.objective_id,
+                "current_quantity": objective.get("current_quantity", 0),
+                "is_completed": objective.get("is_completed", False)
+            },
+            "timestamp": now
+        })
+    
+    if not changed:
+        return []
+    
+    completed_quest_ids = []
+    for player_quest in player_quests:
+        row = changed.get(player_quest.id)
+        if row is None or row["status"] == QuestStatus.COMPLETED_SUCCESS:
+            continue
+        if _all_required_objectives_completed(row["current_objectives"]):
+            row["status"] = QuestStatus.COMPLETED_SUCCESS
+            row["completed_at"] = now
+            completed_quest_ids.append(player_quest.quest_id)
+            event_rows.append({
+                "id": f"qe-{uuid4().hex}",
+                "player_id": player_id,
+                "quest_id": player_quest.quest_id,
+                "event_type": "quest_completed",
+                "event_data": {
+                    "player_id": player_id,
+                    "quest_id": player_quest.quest_id,
+                    "completed_at": now.isoformat()
+                },
+                "timestamp": now
+            })
+    
+    # Mirror update_quest_status for the quests that were just completed
+    if completed_quest_ids:
+        for db_quest in db.query(DBQuest).filter(DBQuest.id.in_(completed_quest_ids)).all():
+            old_status = db_quest.status
+            db_quest.status = QuestStatus.COMPLETED_SUCCESS
+            db_quest.completion_timestamp = now
+            event_rows.append({
+                "id": f"qe-{uuid4().hex}",
+                "player_id": player_id,
+                "quest_id": db_quest.id,
+                "event_type": "quest_status_changed",
+                "event_data": {
+                    "old_status": old_status.value if isinstance(old_status, Enum) else old_status,
+                    "new_status": QuestStatus.COMPLETED_SUCCESS.value
+                },
+                "timestamp": now
+            })
+    
+    db.execute(update(DBPlayerQuest), list(changed.values()))
+    db.execute(insert(DBQuestEvent), event_rows)
+    db.commit()
+    return [player_quest for player_quest in player_quests if player_quest.id in changed]
+
+def _apply_objective_progress(objective: Dict[str, Any], update_data: QuestProgressUpdate) -> None:
+    """Apply a progress update to an objective dict in place."""
+    if update_data.new_quantity is not None:
+        objective["current_quantity"] = update_data.new_quantity
+    
+    if update_data.increment_by is not None:
+        objective["current_quantity"] = objective.get("current_quantity", 0) + update_data.increment_by
+    
+    # Check if objective is completed based on quantity
+    if "required_quantity" in objective and objective.get("current_quantity", 0) >= objective.get("required_quantity", 1):
+        objective["is_completed"] = True
+    
+    # Directly set completed status if provided
+    if update_data.set_completed is not None:
+        objective["is_completed"] = update_data.set_completed
+
+def _all_required_objectives_completed(objectives: List[Dict[str, Any]]) -> bool:
+    """Check whether every non-optional objective is completed."""
+    for obj in objectives:
+        if not obj.get("optional", False) and not obj.get("is_completed", False):
+            return False
+    return True
+
+def backfill_player_quest_expiry(db: Session) -> int:
+    """
+    Set expires_at on active time-limited player quests that predate the column.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Number of player quests backfilled
+    """
+    rows = db.query(DBPlayerQuest.id, DBPlayerQuest.started_at, DBQuest.time_limit_seconds).join(
+        DBQuest, DBQuest.id == DBPlayerQuest.quest_id
+    ).filter(
+        DBPlayerQuest.status == QuestStatus.ACTIVE,
+        DBPlayerQuest.expires_at.is_(None),
+        DBQuest.time_limit_seconds.isnot(None),
+        DBQuest.time_limit_seconds > 0
+    ).all()
+    
+    if rows:
+        db.execute(update(DBPlayerQuest), [
+            {"id": row_id, "expires_at": started_at + timedelta(seconds=time_limit)}
+            for row_id, started_at, time_limit in rows
+        ])
+        db.commit()
+    return len(rows)
+
+def expire_due_player_quests(db: Session, now: Optional[datetime] = None) -> List[Tuple[str, str]]:
+    """
+    Expire every active player quest whose expires_at has passed.
+    
+    Due rows are found through the (status, expires_at) index and expired
+    with one bulk UPDATE, and their quest_expired events are inserted in one
+    batch.
+    
+    Args:
+        db: Database session
+        now: Current time (defaults to utcnow)
+        
+    Returns:
+        (player ID, quest ID) pairs of the expired player quests
+    """
+    now = now or datetime.utcnow()
+    due = (DBPlayerQuest.status == QuestStatus.ACTIVE) & (DBPlayerQuest.expires_at <= now)
+    values = {"status": QuestStatus.EXPIRED, "completed_at": now}
+    
+    if db.get_bind().dialect.update_returning:
+        expired = db.execute(
+            update(DBPlayerQuest).where(due).values(**values)
+            .returning(DBPlayerQuest.player_id, DBPlayerQuest.quest_id)
+            .execution_options(synchronize_session=False)
+        ).all()
+    else:
+        due_rows = db.execute(select(DBPlayerQuest.id, DBPlayerQuest.player_id, DBPlayerQuest.quest_id).where(due)).all()
+        if due_rows:
+            db.execute(
+                update(DBPlayerQuest).where(DBPlayerQuest.id.in_([row.id for row in due_rows])).values(**values)
+                .execution_options(synchronize_session=False)
+            )
+        expired = [(row.player_id, row.quest_id) for row in due_rows]
+    
+    if not expired:
+        return []
+    
+    db.execute(insert(DBQuestEvent), [
+        {
+            "id": f"qe-{uuid4().hex}",
+            "player_id": player_id,
+            "quest_id": quest_id,
+            "event_type": "quest_expired",
+            "event_data": {
+                "player_id": player_id,
+                "quest_id": quest_id,
+                "timestamp": now.isoformat()
+            },
+            "timestamp": now
+        }
+        for player_id, quest_id in expired
+    ])
+    db.commit()
+    return [(player_id, quest_id) for player_id, quest_id in expired]
+
+def get_next_player_quest_expiry(db: Session) -> Optional[datetime]:
+    """
+    Get the earliest expires_at among active player quests.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Earliest expiry time or None if no active quest is time-limited
+    """
+    return db.query(func.min(DBPlayerQuest.expires_at)).filter(
+        DBPlayerQuest.status == QuestStatus.ACTIVE
+    ).scalar()
+
 def update_quest_template(db: Session, template_id: str, template_data: Dict[str, Any]) -> Optional[DBQuestTemplate]:
     """
     Update a quest template's data.
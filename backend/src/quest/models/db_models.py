@@ -5,7 +5,7 @@ This module defines SQLAlchemy models for the quest generation system,
 providing database persistence for quests and related data.
 """
 
-from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, ForeignKey, JSON, Text, Enum
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, ForeignKey, JSON, Text, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -14,8 +14,13 @@ import enum
 from sqlalchemy.ext.declarative import declarative_base
 Base = declarative_base()
 
+
+def _enum_values(enum_class):
+    """Store enum values (as written by the Pydantic models) rather than member names."""
+    return [member.value for member in enum_class]
+
 # Enum for quest types
-class QuestType(enum.Enum):
+class QuestType(str, enum.Enum):
     FETCH_ITEM = "fetch_item"
     DELIVER_ITEM = "deliver_item"
     ESCORT_NPC = "escort_npc"
@@ -34,7 +39,7 @@ class QuestType(enum.Enum):
     FACTION_TASK = "faction_task"
 
 # Enum for quest statuses
-class QuestStatus(enum.Enum):
+class QuestStatus(str, enum.Enum):
     AVAILABLE = "available"
     ACTIVE = "active"
     COMPLETED_SUCCESS = "completed_success"
@@ -43,7 +48,7 @@ class QuestStatus(enum.Enum):
     CANCELLED = "cancelled"
 
 # Enum for objective types
-class ObjectiveType(enum.Enum):
+class ObjectiveType(str, enum.Enum):
     ACQUIRE_ITEM = "acquire_item"
     REACH_LOCATION = "reach_location"
     INTERACT_NPC = "interact_npc"
@@ -69,8 +74,8 @@ class DBQuest(Base):
     title = Column(String, nullable=False)
     description_template = Column(Text, nullable=False)
     generated_description = Column(Text, nullable=False)
-    quest_type = Column(Enum(QuestType), nullable=False)
-    status = Column(Enum(QuestStatus), default=QuestStatus.AVAILABLE, nullable=False)
+    quest_type = Column(Enum(QuestType, values_callable=_enum_values), nullable=False)
+    status = Column(Enum(QuestStatus, values_callable=_enum_values), default=QuestStatus.AVAILABLE, nullable=False)
     difficulty = Column(Integer, default=1, nullable=False)
     quest_giver_npc_id = Column(String, nullable=True)
     time_limit_seconds = Column(Integer, nullable=True)
@@ -104,7 +109,7 @@ class DBQuestTemplate(Base):
     
     id = Column(String, primary_key=True, index=True)
     name = Column(String, nullable=False)
-    quest_type = Column(Enum(QuestType), nullable=False)
+    quest_type = Column(Enum(QuestType, values_callable=_enum_values), nullable=False)
     title_format = Column(String, nullable=False)
     description_format = Column(Text, nullable=False)
     
@@ -131,7 +136,7 @@ class DBQuestTemplate(Base):
     last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     # Define relationships
-    quests = relationship("DBQuest", primaryjoin="DBQuestTemplate.id==DBQuest.template_id", viewonly=True)
+    quests = relationship("DBQuest", primaryjoin="DBQuestTemplate.id==foreign(DBQuest.template_id)", viewonly=True)
 
 class DBPlayerQuest(Base):
     """SQLAlchemy model for tracking player quest progress."""
@@ -140,19 +145,21 @@ class DBPlayerQuest(Base):
     id = Column(String, primary_key=True, index=True)
     player_id = Column(String, nullable=False, index=True)
     quest_id = Column(String, ForeignKey("quests.id"), nullable=False, index=True)
-    status = Column(Enum(QuestStatus), default=QuestStatus.ACTIVE, nullable=False)
+    status = Column(Enum(QuestStatus, values_callable=_enum_values), default=QuestStatus.ACTIVE, nullable=False)
     current_objectives = Column(JSON, default=list, nullable=False)
     started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     completed_at = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=True)  # started_at + the quest's time limit
     custom_data = Column(JSON, default=dict, nullable=False)
     
     # Define relationships
     quest = relationship("DBQuest", foreign_keys=[quest_id])
     
     # Indexes (these would be created via migrations)
-    # __table_args__ = (
-    #     Index('ix_player_quests_player_quest', 'player_id', 'quest_id', unique=True),
-    # )
+    __table_args__ = (
+        # Index('ix_player_quests_player_quest', 'player_id', 'quest_id', unique=True),
+        Index('ix_player_quests_status_expires_at', 'status', 'expires_at'),
+    )
 
 class DBQuestEvent(Base):
     """SQLAlchemy model for tracking quest-related events."""
@@ -198,6 +198,6 @@ class QuestProgressUpdate(BaseModel):
     @validator('new_quantity', 'increment_by', 'set_completed')
     def validate_update_values(cls, v, values):
         """Ensure at least one update value is provided."""
-        if all(values.get(field) is None for field in ['new_quantity', 'increment_by', 'set_completed']):
+        if v is None and all(values.get(field) is None for field in ['new_quantity', 'increment_by', 'set_completed']):
             raise ValueError("At least one of new_quantity, increment_by, or set_completed must be provided")
         return v
\ No newline at end of file
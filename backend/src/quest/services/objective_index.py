@@ -0,0 +1,174 @@
+"""
+Quest Objective Index
+
+This module provides an in-memory inverted index from game events to the
+active quest objectives they can advance, so that tracking an event only
+touches the objectives it actually targets instead of every active quest.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from backend.src.quest.models.pydantic_models import ObjectiveType, QuestStatus
+
+# Map event types to the objective types they advance
+EVENT_TO_OBJECTIVE = {
+    "item_acquired": ObjectiveType.ACQUIRE_ITEM,
+    "location_reached": ObjectiveType.REACH_LOCATION,
+    "npc_interacted": ObjectiveType.INTERACT_NPC,
+    "enemy_defeated": ObjectiveType.DEFEAT_TARGET,
+    "item_delivered": ObjectiveType.DELIVER_ITEM,
+    "skill_used": ObjectiveType.USE_SKILL,
+    "resource_gathered": ObjectiveType.GATHER_RESOURCE,
+    "item_crafted": ObjectiveType.CRAFT_ITEM
+}
+
+OBJECTIVE_TO_EVENT = {objective_type: event_type for event_type, objective_type in EVENT_TO_OBJECTIVE.items()}
+
+# Event data fields holding the target of each objective type
+EVENT_TARGET_FIELDS = {
+    ObjectiveType.ACQUIRE_ITEM: ("item_id",),
+    ObjectiveType.REACH_LOCATION: ("location_id",),
+    ObjectiveType.INTERACT_NPC: ("npc_id",),
+    ObjectiveType.DEFEAT_TARGET: ("enemy_id", "creature_type"),
+    ObjectiveType.DELIVER_ITEM: ("item_id",)
+}
+
+IndexKey = Tuple[str, str, str]
+ObjectiveRef = Tuple[str, str]
+
+
+def objective_target_keys(objective: Dict[str, Any]) -> List[str]:
+    """
+    Get the target values an objective is indexed under.
+
+    Objectives without a target, or of a type no event can target, are not
+    indexed (they can never match an event).
+    """
+    objective_type = objective.get("type")
+    target_id = objective.get("target_id")
+    if not target_id or objective_type not in EVENT_TARGET_FIELDS:
+        return []
+
+    keys = [target_id]
+    # Defeat objectives also match on the creature type, named by target_name
+    if objective_type == ObjectiveType.DEFEAT_TARGET and objective.get("target_name"):
+        keys.append(objective["target_name"])
+    return keys
+
+
+class ObjectiveIndex:
+    """
+    Inverted index of (player, event type, target) -> active objectives.
+
+    Players are loaded lazily: the first event tracked for a player after
+    startup populates the index from their active quests, after which it is
+    kept current as quests are accepted, progressed, completed and abandoned.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._entries: Dict[IndexKey, Set[ObjectiveRef]] = {}
+        self._quest_keys: Dict[Tuple[str, str], List[Tuple[IndexKey, ObjectiveRef]]] = {}
+        self._loaded_players: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def is_loaded(self, player_id: str) -> bool:
+        """Whether the player's active quests have been indexed."""
+        with self._lock:
+            return player_id in self._loaded_players
+
+    def load_player(self, player_id: str, player_quests: Iterable[Any]) -> None:
+        """
+        Index all of a player's active quests, replacing any existing entries.
+
+        Args:
+            player_id: Player identifier
+            player_quests: The player's active player quest records
+        """
+        with self._lock:
+            for (indexed_player, quest_id) in list(self._quest_keys):
+                if indexed_player == player_id:
+                    self._remove_locked(player_id, quest_id)
+            for player_quest in player_quests:
+                self._add_locked(player_id, player_quest.quest_id, player_quest.current_objectives)
+            self._loaded_players.add(player_id)
+
+    def sync_quest(self, player_quest: Any) -> None:
+        """
+        Re-index one player quest from its current state.
+
+        Completed objectives are dropped, and quests that are no longer active
+        are removed entirely. Players not yet loaded are left alone; they are
+        indexed in full on their first tracked event.
+        """
+        player_id = player_quest.player_id
+        with self._lock:
+            if player_id not in self._loaded_players:
+                return
+            self._remove_locked(player_id, player_quest.quest_id)
+            if player_quest.status == QuestStatus.ACTIVE:
+                self._add_locked(player_id, player_quest.quest_id, player_quest.current_objectives)
+
+    def remove_quest(self, player_id: str, quest_id: str) -> None:
+        """Remove all objectives of a player quest from the index."""
+        with self._lock:
+            self._remove_locked(player_id, quest_id)
+
+    def lookup(self, player_id: str, event_type: str, event_data: Dict[str, Any]) -> List[ObjectiveRef]:
+        """
+        Find the (quest ID, objective ID) pairs an event may advance.
+
+        Candidates still need the full target check (e.g. the recipient of a
+        delivery), but no other objective can match.
+        """
+        objective_type = EVENT_TO_OBJECTIVE.get(event_type)
+        fields = EVENT_TARGET_FIELDS.get(objective_type, ())
+        matches: Set[ObjectiveRef] = set()
+        with self._lock:
+            for field in fields:
+                target = event_data.get(field)
+                if target is None:
+                    continue
+                matches.update(self._entries.get((player_id, event_type, target), ()))
+        return sorted(matches)
+
+    def clear(self) -> None:
+        """Drop all entries (e.g. after quests were changed outside the service)."""
+        with self._lock:
+            self._entries.clear()
+            self._quest_keys.clear()
+            self._loaded_players.clear()
+
+    def _add_locked(self, player_id: str, quest_id: str, objectives: Optional[List[Dict[str, Any]]]) -> None:
+        refs = []
+        for objective in objectives or []:
+            if objective.get("is_completed", False):
+                continue
+            event_type = OBJECTIVE_TO_EVENT.get(objective.get("type"))
+            if event_type is None:
+                continue
+            ref = (quest_id, objective.get("id"))
+            for target in objective_target_keys(objective):
+                key = (player_id, event_type, target)
+                self._entries.setdefault(key, set()).add(ref)
+                refs.append((key, ref))
+        if refs:
+            self._quest_keys[(player_id, quest_id)] = refs
+
+    def _remove_locked(self, player_id: str, quest_id: str) -> None:
+        for key, ref in self._quest_keys.pop((player_id, quest_id), ()):
+            refs = self._entries.get(key)
+            if refs is None:
+                continue
+            refs.discard(ref)
+            if not refs:
+                del self._entries[key]
+
+
+_objective_index = ObjectiveIndex()
+
+
+def get_objective_index() -> ObjectiveIndex:
+    """Get the process-wide objective index shared by all quest manager instances."""
+    return _objective_index
@@ -15,13 +15,18 @@ from sqlalchemy.orm import Session
 
 # Import models
 from backend.src.quest.models.pydantic_models import (
-    QuestData, QuestStatus, QuestProgressUpdate, QuestReward, QuestObjective
+    QuestData, QuestStatus, QuestProgressUpdate, QuestReward, QuestObjective, ObjectiveType
 )
 from backend.src.quest.models.db_models import DBQuest, DBPlayerQuest, DBQuestEvent
 from backend.src.quest.crud import (
     create_quest, get_quest, update_quest, delete_quest,
     create_player_quest, get_player_quest, get_player_quests,
-    create_quest_event, update_quest_status, update_quest_objective_progress
+    create_quest_event, update_quest_status, update_quest_objective_progress,
+    apply_objective_progress_updates, backfill_player_quest_expiry,
+    expire_due_player_quests, get_next_player_quest_expiry
+)
+from backend.src.quest.services.objective_index import (
+    ObjectiveIndex, get_objective_index, EVENT_TO_OBJECTIVE
 )
 
 # Import integration with other systems (in a real implementation)
@@ -37,9 +42,17 @@ class QuestManagerService:
     Service for managing quest progression and player interactions with quests.
     """
     
-    def __init__(self):
-        """Initialize the Quest Manager Service."""
+    def __init__(self, objective_index: Optional[ObjectiveIndex] = None):
+        """
+        Initialize the Quest Manager Service.
+        
+        Args:
+            objective_index: Index of active objectives by event target
+                (defaults to the process-wide index)
+        """
         self.logger = logging.getLogger("QuestManagerService")
+        self.objective_index = objective_index or get_objective_index()
+        self._expiry_backfilled = False
         
         # Initialize related services
         # self.transaction_service = TransactionService()
@@ -96,6 +109,7 @@ class QuestManagerService:
             
             # Create player quest record
             player_quest = create_player_quest(db, player_id, quest_id)
+            self.objective_index.sync_quest(player_quest)
             
             # Publish event
             # self.event_bus.publish(Event(
@@ -137,6 +151,8 @@ class QuestManagerService:
             updated_player_quest = update_quest_objective_progress(db, player_id, progress_update.quest_id, progress_update)
             
             if updated_player_quest:
+                self.objective_index.sync_quest(updated_player_quest)
+                
                 # Check if all objectives are completed
                 all_completed = True
                 for objective in updated_player_quest.current_objectives:
@@ -194,6 +210,7 @@ class QuestManagerService:
             player_quest.completed_at = datetime.utcnow()
             db.commit()
             db.refresh(player_quest)
+            self.objective_index.remove_quest(player_id, quest_id)
             
             # If successful, grant rewards
             if success:
@@ -268,6 +285,7 @@ class QuestManagerService:
             })
             
             db.commit()
+            self.objective_index.remove_quest(player_id, quest_id)
             
             # Publish event
             # self.event_bus.publish(Event(
@@ -323,7 +341,7 @@ class QuestManagerService:
                         "related_location_ids": quest.related_location_ids,
                         "started_at": player_quest.started_at.isoformat() if player_quest.started_at else None,
                         "time_limit_seconds": quest.time_limit_seconds,
-                        "expiration_time": (player_quest.started_at + timedelta(seconds=quest.time_limit_seconds)).isoformat() if player_quest.started_at and quest.time_limit_seconds else None
+                        "expiration_time": player_quest.expires_at.isoformat() if player_quest.expires_at else (player_quest.started_at + timedelta(seconds=quest.time_limit_seconds)).isoformat() if player_quest.started_at and quest.time_limit_seconds else None
                     }
                     detailed_quests.append(detailed_quest)
             
@@ -448,12 +466,13 @@ class QuestManagerService:
             self.logger.error(f"Error getting available quests for player {player_id}: {e}")
             return []
     
-    def check_quest_expiration(self, db: Session) -> int:
+    def check_quest_expiration(self, db: Session, now: Optional[datetime] = None) -> int:
         """
         Check and update statuses of time-limited quests.
         
         Args:
             db: Database session
+            now: Current time (defaults to utcnow)
             
         Returns:
             Number of quests that expired
@@ -461,48 +480,42 @@ class QuestManagerService:
         self.logger.info("Checking for expired quests")
         
         try:
-            # Get all active player quests
-            active_player_quests = db.query(DBPlayerQuest).filter(DBPlayerQuest.status == QuestStatus.ACTIVE).all()
+            # Rows accepted before expires_at existed get it computed once
+            if not self._expiry_backfilled:
+                backfill_player_quest_expiry(db)
+                self._expiry_backfilled = True
             
-            expired_count = 0
-            current_time = datetime.utcnow()
+            expired = expire_due_player_quests(db, now)
+            for player_id, quest_id in expired:
+                self.objective_index.remove_quest(player_id, quest_id)
             
-            for player_quest in active_player_quests:
-                # Get the quest to check time limit
-                quest = get_quest(db, player_quest.quest_id)
-                if not quest or not quest.time_limit_seconds:
-                    continue
-                
-                # Calculate expiration time
-                expiration_time = player_quest.started_at + timedelta(seconds=quest.time_limit_seconds)
-                
-                # Check if quest has expired
-                if current_time > expiration_time:
-                    # Mark as expired
-                    player_quest.status = QuestStatus.EXPIRED
-                    player_quest.completed_at = current_time
-                    
-                    # Update the main quest record if no other players have it active
-                    # This would depend on the game design
-                    
-                    # Create expiration event
-                    create_quest_event(db, player_quest.player_id, player_quest.quest_id, "quest_expired", {
-                        "player_id": player_quest.player_id,
-                        "quest_id": player_quest.quest_id,
-                        "timestamp": current_time.isoformat()
-                    })
-                    
-                    expired_count += 1
-            
-            if expired_count > 0:
-                db.commit()
-                self.logger.info(f"Expired {expired_count} quests")
-            
-            return expired_count
+            if expired:
+                self.logger.info(f"Expired {len(expired)} quests")
+            
+            return len(expired)
         except Exception as e:
             self.logger.error(f"Error checking quest expiration: {e}")
             return 0
     
+    def next_quest_expiration(self, db: Session) -> Optional[datetime]:
+        """
+        Get when the next active quest expires.
+        
+        Lets a scheduler run check_quest_expiration exactly when it is due
+        instead of polling.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            Earliest expiry time or None if no active quest is time-limited
+        """
+        try:
+            return get_next_player_quest_expiry(db)
+        except Exception as e:
+            self.logger.error(f"Error getting next quest expiration: {e}")
+            return None
+    
     def track_quest_event(self, 
                        db: Session, 
                        player_id: str, 
@@ -523,21 +536,38 @@ class QuestManagerService:
         self.logger.info(f"Tracking quest event: {event_type} for player {player_id}")
         
         try:
-            # Get active quests for the player
-            active_quests = get_player_quests(db, player_id, QuestStatus.ACTIVE)
+            # Index the player's active quests on their first event
+            if not self.objective_index.is_loaded(player_id):
+                self.objective_index.load_player(player_id, get_player_quests(db, player_id, QuestStatus.ACTIVE))
             
-            progress_updates = []
+            # Only objectives targeted by this event are candidates
+            candidates = self.objective_index.lookup(player_id, event_type, event_data)
+            if not candidates:
+                return None
             
-            # For each active quest, check if this event affects any objectives
-            for player_quest in active_quests:
+            candidate_quest_ids = {quest_id for quest_id, _ in candidates}
+            player_quests = db.query(DBPlayerQuest).filter(
+                DBPlayerQuest.player_id == player_id,
+                DBPlayerQuest.quest_id.in_(candidate_quest_ids),
+                DBPlayerQuest.status == QuestStatus.ACTIVE
+            ).all()
+            
+            progress_updates = []
+            candidate_set = set(candidates)
+            for player_quest in player_quests:
                 updates = self._check_event_against_objectives(player_quest, event_type, event_data)
-                progress_updates.extend(updates)
+                progress_updates.extend(
+                    update for update in updates if (update.quest_id, update.objective_id) in candidate_set
+                )
             
-            # Apply updates
-            for update in progress_updates:
-                update_quest_objective_progress(db, player_id, update.quest_id, update)
+            if not progress_updates:
+                return None
+            
+            # Apply all updates in one batch and re-index the touched quests
+            for player_quest in apply_objective_progress_updates(db, player_id, progress_updates):
+                self.objective_index.sync_quest(player_quest)
             
-            return progress_updates if progress_updates else None
+            return progress_updates
         except Exception as e:
             self.logger.error(f"Error tracking quest event: {e}")
             return None
@@ -559,18 +589,6 @@ class QuestManagerService:
         """
         updates = []
         
-        # Map event types to objective types
-        event_to_objective = {
-            "item_acquired": ObjectiveType.ACQUIRE_ITEM,
-            "location_reached": ObjectiveType.REACH_LOCATION,
-            "npc_interacted": ObjectiveType.INTERACT_NPC,
-            "enemy_defeated": ObjectiveType.DEFEAT_TARGET,
-            "item_delivered": ObjectiveType.DELIVER_ITEM,
-            "skill_used": ObjectiveType.USE_SKILL,
-            "resource_gathered": ObjectiveType.GATHER_RESOURCE,
-            "item_crafted": ObjectiveType.CRAFT_ITEM
-        }
-        
         # For each objective in the quest
         for objective in player_quest.current_objectives:
             # Skip completed objectives
@@ -579,7 +597,7 @@ class QuestManagerService:
             
             # Check if event type matches objective type
             objective_type = objective.get("type")
-            if event_to_objective.get(event_type) != objective_type:
+            if EVENT_TO_OBJECTIVE.get(event_type) != objective_type:
                 continue
             
             # Check if target matches
@@ -0,0 +1,216 @@
+"""
+Hybrid Knowledge Retrieval
+
+This module puts an in-process BM25 inverted index next to the dense
+knowledge index, over the same chunks. Short queries that name an item or
+recipe outright are answered lexically without touching the embedder;
+everything else is ranked by fusing dense and BM25 results. A normalized
+query LRU cache sits in front of both retrievers.
+"""
+
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .knowledge_index import KnowledgeIndex, tokenize
+
+# Queries with at most this many meaningful terms may be answered lexically
+MAX_LEXICAL_TERMS = 4
+QUERY_CACHE_SIZE = 1024
+# Reciprocal rank fusion constant
+RRF_K = 60
+
+# Ignored when checking whether a query names a section heading
+_NAME_STOPWORDS = frozenset({"a", "an", "the", "of", "to", "for", "with", "and", "in", "on", "my", "some"})
+_NORMALIZE_PATTERN = re.compile(r"[^a-z0-9']+")
+
+
+def normalize_query(query: str) -> str:
+    """Case-fold and collapse punctuation/whitespace so trivial variants share a cache entry."""
+    return _NORMALIZE_PATTERN.sub(" ", query.lower()).strip()
+
+
+class BM25Index:
+    """
+    Okapi BM25 over a fixed set of documents.
+
+    Each term's posting list stores the finished BM25 weight of every
+    document containing it, so a query is a handful of array additions.
+    """
+
+    def __init__(self, texts: Sequence[str], k1: float = 1.5, b: float = 0.75):
+        self.size = len(texts)
+        tokenized = [tokenize(text) for text in texts]
+        lengths = np.array([len(tokens) for tokens in tokenized], dtype=np.float64)
+        average_length = lengths.mean() if self.size and lengths.mean() > 0 else 1.0
+        length_norm = k1 * (1 - b + b * lengths / average_length)
+
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for doc, tokens in enumerate(tokenized):
+            for term, count in Counter(tokens).items():
+                postings.setdefault(term, []).append((doc, count))
+
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for term, entries in postings.items():
+            docs = np.array([doc for doc, _ in entries], dtype=np.int64)
+            frequencies = np.array([count for _, count in entries], dtype=np.float64)
+            idf = math.log(1 + (self.size - len(entries) + 0.5) / (len(entries) + 0.5))
+            weights = idf * frequencies * (k1 + 1) / (frequencies + length_norm[docs])
+            self._postings[term] = (docs, weights)
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[int, float]]:
+        """
+        Rank documents against a query.
+
+        Returns:
+            Up to k (document index, score) pairs with a positive score, best first
+        """
+        scores = np.zeros(self.size, dtype=np.float64)
+        for term in set(tokenize(query)):
+            posting = self._postings.get(term)
+            if posting is not None:
+                scores[posting[0]] += posting[1]
+
+        matched = np.flatnonzero(scores)
+        if not len(matched):
+            return []
+        top = matched[np.argsort(-scores[matched], kind="stable")[:k]]
+        return [(int(doc), float(scores[doc])) for doc in top]
+
+
+class HybridRetriever:
+    """
+    Retrieval over the knowledge index using BM25, dense vectors, or both.
+
+    Results are dictionaries with id, source, heading, text, score and the
+    retriever that produced them ("lexical", "dense" or "hybrid"). Lexical
+    scores are normalized so the best match scores 1.0.
+    """
+
+    def __init__(self,
+                 knowledge_index: KnowledgeIndex,
+                 cache_size: int = QUERY_CACHE_SIZE,
+                 max_lexical_terms: int = MAX_LEXICAL_TERMS):
+        """
+        Initialize the retriever.
+
+        Args:
+            knowledge_index: Dense index whose chunks are also indexed lexically
+            cache_size: Number of normalized queries kept in the result cache
+            max_lexical_terms: Longest query (in non-stopword terms) answered lexically
+        """
+        self.index = knowledge_index
+        self.bm25 = BM25Index(knowledge_index.texts)
+        self.cache_size = cache_size
+        self.max_lexical_terms = max_lexical_terms
+        self._positions = {chunk_id: i for i, chunk_id in enumerate(knowledge_index.ids)}
+        self._title_terms = [
+            set(tokenize(metadata["heading"].split(" > ")[-1])) for metadata in knowledge_index.metadata
+        ]
+        self._cache: "OrderedDict[Tuple[str, int], List[Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"cache_hits": 0, "lexical_answers": 0, "dense_queries": 0}
+
+    def retrieve(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Retrieve the chunks most relevant to a query.
+
+        Args:
+            query: Query text
+            k: Number of results
+
+        Returns:
+            Results, best first
+        """
+        key = (normalize_query(query), k)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                return [dict(result) for result in cached]
+
+        results = self._retrieve_uncached(key[0], k)
+
+        with self._lock:
+            self._cache[key] = results
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return [dict(result) for result in results]
+
+    def retrieve_dense(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
+        """Dense-only retrieval, uncached (the baseline the hybrid path replaces)."""
+        self.stats["dense_queries"] += 1
+        return [dict(result, retriever="dense") for result in self.index.query(query, k)]
+
+    def clear_cache(self) -> None:
+        """Drop all cached results (e.g. after the knowledge index is reloaded)."""
+        with self._lock:
+            self._cache.clear()
+
+    def _retrieve_uncached(self, query: str, k: int) -> List[Dict[str, Any]]:
+        lexical = self.bm25.search(query, max(k, 1) * 2)
+        if lexical and self._names_section(query, lexical[0][0]):
+            self.stats["lexical_answers"] += 1
+            best = lexical[0][1]
+            return [self._result(doc, score / best, "lexical") for doc, score in lexical[:k]]
+
+        dense = self.retrieve_dense(query, max(k, 1) * 2)
+        if not lexical:
+            return dense[:k]
+
+        # Reciprocal rank fusion of both rankings
+        fused: Dict[int, float] = {}
+        dense_scores: Dict[int, float] = {}
+        for rank, result in enumerate(dense):
+            doc = self._positions[result["id"]]
+            dense_scores[doc] = result["score"]
+            fused[doc] = fused.get(doc, 0.0) + 1.0 / (RRF_K + rank + 1)
+        best = lexical[0][1]
+        lexical_scores = {}
+        for rank, (doc, score) in enumerate(lexical):
+            lexical_scores[doc] = score / best
+            fused[doc] = fused.get(doc, 0.0) + 1.0 / (RRF_K + rank + 1)
+
+        ranked = sorted(fused, key=lambda doc: (-fused[doc], doc))[:k]
+        return [
+            self._result(doc, dense_scores.get(doc, lexical_scores.get(doc, 0.0)), "hybrid")
+            for doc in ranked
+        ]
+
+    def _names_section(self, query: str, doc: int) -> bool:
+        """Whether a short query consists of words from the document's own heading."""
+        terms = [term for term in tokenize(query) if term not in _NAME_STOPWORDS]
+        if not terms or len(terms) > self.max_lexical_terms:
+            return False
+        return all(term in self._title_terms[doc] for term in terms)
+
+    def _result(self, doc: int, score: float, retriever: str) -> Dict[str, Any]:
+        return {
+            "id": self.index.ids[doc],
+            **self.index.metadata[doc],
+            "text": self.index.texts[doc],
+            "score": float(score),
+            "retriever": retriever
+        }
+
+
+def recall_at_k(results: Sequence[Sequence[Dict[str, Any]]], expected_ids: Sequence[str], k: int) -> float:
+    """Fraction of queries whose expected chunk appears in their top k results."""
+    if not expected_ids:
+        return 0.0
+    hits = sum(1 for ranked, expected in zip(results, expected_ids)
+               if expected in [result["id"] for result in ranked[:k]])
+    return hits / len(expected_ids)
+
+
+def build_retriever(knowledge_index: Optional[KnowledgeIndex]) -> Optional[HybridRetriever]:
+    """Create a hybrid retriever over an index, or None if there is no usable index."""
+    if knowledge_index is None or not len(knowledge_index):
+        return None
+    return HybridRetriever(knowledge_index)
@@ -0,0 +1,396 @@
+"""
+Knowledge Base Vector Index
+
+This module ingests the markdown knowledge base (data/knowledge_base/**.md)
+into a persistent local vector store and serves similarity queries from it.
+
+Documents are chunked by heading and each chunk's content is hashed, so
+re-ingestion only embeds chunks that were added or changed. The store is a
+single SQLite file that one ingestion run writes and every parser worker
+opens read-only, loading the embedding matrix once instead of re-embedding
+the knowledge base at startup.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger("text_parser.knowledge_index")
+
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_KNOWLEDGE_BASE_DIR = _REPO_ROOT / "data" / "knowledge_base"
+DEFAULT_INDEX_PATH = _REPO_ROOT / "data" / "knowledge_index" / "knowledge_base.sqlite3"
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Sections longer than this are split further at paragraph boundaries
+MAX_CHUNK_CHARS = 2000
+EMBED_BATCH_SIZE = 64
+
+_HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+_RULE_PATTERN = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+_TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+
+@dataclass
+class KnowledgeChunk:
+    """One heading section (or part of one) of a knowledge base document."""
+    id: str
+    source: str
+    heading: str
+    text: str
+    content_hash: str = ""
+
+    def __post_init__(self):
+        if not self.content_hash:
+            self.content_hash = hashlib.sha256(self.text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class IngestionReport:
+    """What an ingestion run changed."""
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+    @property
+    def embedded(self) -> int:
+        """Number of chunks sent to the embedder."""
+        return self.added + self.updated
+
+
+def _slug(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or "section"
+
+
+def _split_long_section(text: str, max_chars: int) -> List[str]:
+    if len(text) <= max_chars:
+        return [text]
+    parts, current = [], ""
+    for paragraph in re.split(r'\n\s*\n', text):
+        if current and len(current) + len(paragraph) + 2 > max_chars:
+            parts.append(current)
+            current = paragraph
+        else:
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current:
+        parts.append(current)
+    return parts
+
+
+def chunk_markdown(text: str, source: str, max_chars: int = MAX_CHUNK_CHARS) -> List[KnowledgeChunk]:
+    """
+    Split a markdown document into one chunk per heading section.
+
+    Each chunk's text starts with its heading breadcrumb (e.g. "Crafting
+    Recipes > Basic Metal Ingot Smelting > Smelt Copper Ingot") so the
+    section keeps its context when retrieved on its own. Chunk IDs are
+    derived from the source path and the breadcrumb, so they stay stable
+    when unrelated sections change.
+
+    Args:
+        text: Markdown content
+        source: Document path relative to the knowledge base root
+        max_chars: Sections longer than this are split at paragraph breaks
+
+    Returns:
+        Chunks in document order
+    """
+    sections = []
+    trail: List[str] = []
+    lines: List[str] = []
+    in_fence = False
+
+    def close_section():
+        body = "\n".join(line for line in lines if not _RULE_PATTERN.match(line)).strip()
+        if body:
+            sections.append((" > ".join(trail), body))
+        lines.clear()
+
+    for line in text.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_PATTERN.match(line)
+        if match:
+            close_section()
+            del trail[len(match.group(1)) - 1:]
+            trail.append(match.group(2))
+        else:
+            lines.append(line)
+    close_section()
+
+    chunks = []
+    seen_ids: Dict[str, int] = {}
+    for heading, body in sections:
+        for part in _split_long_section(body, max_chars):
+            base_id = f"{source}#{_slug(heading)}"
+            seen_ids[base_id] = seen_ids.get(base_id, 0) + 1
+            chunk_id = base_id if seen_ids[base_id] == 1 else f"{base_id}-{seen_ids[base_id]}"
+            chunk_text = f"{heading}\n\n{part}" if heading else part
+            chunks.append(KnowledgeChunk(id=chunk_id, source=source, heading=heading, text=chunk_text))
+    return chunks
+
+
+def load_knowledge_chunks(kb_dir: Path = DEFAULT_KNOWLEDGE_BASE_DIR,
+                          max_chars: int = MAX_CHUNK_CHARS) -> List[KnowledgeChunk]:
+    """Chunk every markdown document under the knowledge base directory."""
+    kb_dir = Path(kb_dir)
+    chunks = []
+    for path in sorted(kb_dir.rglob("*.md")):
+        source = path.relative_to(kb_dir).as_posix()
+        chunks.extend(chunk_markdown(path.read_text(encoding="utf-8"), source, max_chars))
+    return chunks
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, shared by the hashing embedder and lexical retrieval."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class HashingEmbedder:
+    """
+    Deterministic bag-of-words embedder using feature hashing.
+
+    Needs no model download, so tests and benchmarks can run offline; its
+    vectors only capture token overlap, not meaning.
+    """
+
+    def __init__(self, dimension: int = 256):
+        self.dimension = dimension
+        self.name = f"hashing-{dimension}"
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts as L2-normalized float32 rows."""
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in tokenize(text):
+                digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+                value = int.from_bytes(digest, "little")
+                vectors[row, value % self.dimension] += 1.0 if (value >> 63) else -1.0
+        return _normalize(vectors)
+
+
+class SentenceTransformerEmbedder:
+    """Embedder backed by a sentence-transformers model (loaded lazily)."""
+
+    def __init__(self, model_name: str = DEFAULT_EMBEDDING_MODEL, model: Any = None):
+        self.name = model_name
+        self._model = model
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts as L2-normalized float32 rows."""
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.name)
+        vectors = self._model.encode(list(texts), batch_size=EMBED_BATCH_SIZE, show_progress_bar=False)
+        return _normalize(np.asarray(vectors, dtype=np.float32))
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS chunks (
+    id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    heading TEXT NOT NULL,
+    text TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    embedding BLOB NOT NULL
+);
+"""
+
+
+class KnowledgeIngestionEngine:
+    """
+    Incrementally syncs the knowledge base into the persistent vector store.
+    """
+
+    def __init__(self,
+                 embedder: Any,
+                 index_path: Path = DEFAULT_INDEX_PATH,
+                 kb_dir: Path = DEFAULT_KNOWLEDGE_BASE_DIR):
+        """
+        Initialize the engine.
+
+        Args:
+            embedder: Object with a `name` and an `encode(texts) -> ndarray`
+            index_path: SQLite file holding the store
+            kb_dir: Knowledge base root directory
+        """
+        self.embedder = embedder
+        self.index_path = Path(index_path)
+        self.kb_dir = Path(kb_dir)
+
+    def ingest(self, chunks: Optional[Iterable[KnowledgeChunk]] = None) -> IngestionReport:
+        """
+        Bring the store in line with the knowledge base.
+
+        Only chunks whose content hash is new or changed are embedded; chunks
+        no longer present are deleted. Switching embedders re-embeds
+        everything, since vectors from different models are not comparable.
+
+        Args:
+            chunks: Chunks to ingest (defaults to loading kb_dir)
+
+        Returns:
+            Report of added, updated, unchanged and removed chunks
+        """
+        chunks = list(chunks) if chunks is not None else load_knowledge_chunks(self.kb_dir)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        report = IngestionReport()
+
+        connection = sqlite3.connect(self.index_path)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            with connection:
+                row = connection.execute("SELECT value FROM meta WHERE key = 'embedder'").fetchone()
+                if row is not None and row[0] != self.embedder.name:
+                    logger.info(f"Embedder changed from {row[0]} to {self.embedder.name}; re-embedding all chunks")
+                    connection.execute("DELETE FROM chunks")
+                connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('embedder', ?)",
+                                   (self.embedder.name,))
+
+                existing = dict(connection.execute("SELECT id, content_hash FROM chunks"))
+                current_ids = {chunk.id for chunk in chunks}
+                stale = [chunk for chunk in chunks if existing.get(chunk.id) != chunk.content_hash]
+                report.added = sum(1 for chunk in stale if chunk.id not in existing)
+                report.updated = len(stale) - report.added
+                report.unchanged = len(chunks) - len(stale)
+
+                for start in range(0, len(stale), EMBED_BATCH_SIZE):
+                    batch = stale[start:start + EMBED_BATCH_SIZE]
+                    vectors = self.embedder.encode([chunk.text for chunk in batch])
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO chunks (id, source, heading, text, content_hash, embedding) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        [(chunk.id, chunk.source, chunk.heading, chunk.text, chunk.content_hash,
+                          np.asarray(vector, dtype=np.float32).tobytes())
+                         for chunk, vector in zip(batch, vectors)]
+                    )
+
+                removed = [(chunk_id,) for chunk_id in existing if chunk_id not in current_ids]
+                connection.executemany("DELETE FROM chunks WHERE id = ?", removed)
+                report.removed = len(removed)
+        finally:
+            connection.close()
+
+        logger.info(f"Knowledge base ingested: {report.added} added, {report.updated} updated, "
+                    f"{report.unchanged} unchanged, {report.removed} removed")
+        return report
+
+
+class KnowledgeIndex:
+    """
+    Read-only, in-memory view of the persistent vector store.
+
+    The whole embedding matrix is loaded once; queries are a single
+    matrix-vector product.
+    """
+
+    def __init__(self,
+                 embedder: Any,
+                 ids: List[str],
+                 metadata: List[Dict[str, str]],
+                 texts: List[str],
+                 embeddings: np.ndarray):
+        self.embedder = embedder
+        self.ids = ids
+        self.metadata = metadata
+        self.texts = texts
+        self.embeddings = embeddings
+
+    @classmethod
+    def open(cls, embedder: Any, index_path: Path = DEFAULT_INDEX_PATH) -> "KnowledgeIndex":
+        """
+        Load the store without writing to it.
+
+        Raises:
+            FileNotFoundError: If the store has not been built
+            ValueError: If the store was built with a different embedder
+        """
+        index_path = Path(index_path)
+        if not index_path.exists():
+            raise FileNotFoundError(f"Knowledge index not found at {index_path}; run the ingestion first")
+
+        connection = sqlite3.connect(f"{index_path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            row = connection.execute("SELECT value FROM meta WHERE key = 'embedder'").fetchone()
+            if row is None or row[0] != embedder.name:
+                raise ValueError(f"Knowledge index was built with {row[0] if row else 'no embedder'}, "
+                                 f"not {embedder.name}")
+            rows = connection.execute(
+                "SELECT id, source, heading, text, embedding FROM chunks ORDER BY id"
+            ).fetchall()
+        finally:
+            connection.close()
+
+        embeddings = (np.vstack([np.frombuffer(row[4], dtype=np.float32) for row in rows])
+                      if rows else np.empty((0, 0), dtype=np.float32))
+        return cls(
+            embedder=embedder,
+            ids=[row[0] for row in rows],
+            metadata=[{"source": row[1], "heading": row[2]} for row in rows],
+            texts=[row[3] for row in rows],
+            embeddings=embeddings
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def query(self, text: str, k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Find the chunks most similar to a query.
+
+        Args:
+            text: Query text
+            k: Number of results
+
+        Returns:
+            Results with id, source, heading, text and cosine score, best first
+        """
+        if not self.ids:
+            return []
+        vector = self.embedder.encode([text])[0]
+        return self.query_embedding(vector, k)
+
+    def query_embedding(self, vector: np.ndarray, k: int = 5) -> List[Dict[str, Any]]:
+        """Find the chunks most similar to an already embedded query."""
+        if not self.ids:
+            return []
+        scores = self.embeddings @ np.asarray(vector, dtype=np.float32)
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            {"id": self.ids[i], **self.metadata[i], "text": self.texts[i], "score": float(scores[i])}
+            for i in top
+        ]
+
+
+def open_default_index(embedder: Any = None) -> Optional[KnowledgeIndex]:
+    """
+    Open the shared knowledge index, or return None if it is unavailable.
+
+    The path can be overridden with the KNOWLEDGE_INDEX_PATH environment
+    variable.
+    """
+    embedder = embedder or SentenceTransformerEmbedder()
+    index_path = Path(os.environ.get("KNOWLEDGE_INDEX_PATH", DEFAULT_INDEX_PATH))
+    try:
+        return KnowledgeIndex.open(embedder, index_path)
+    except (FileNotFoundError, ValueError, sqlite3.Error) as e:
+        logger.warning(f"Knowledge index unavailable: {e}")
+        return None
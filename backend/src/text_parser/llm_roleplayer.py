@@ -19,6 +19,12 @@ from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
 
+try:
+    from ..shared.metrics import timed
+except ImportError:
+    # text_parser imported as a top-level package (backend/src on sys.path)
+    from shared.metrics import timed
+
 from .intent_router import IntentResult, PrimaryIntent, SubIntent
 from .prompt_builder import PromptContext
 from .action_executor import ActionResult
@@ -193,7 +199,7 @@ class LLMRoleplayer:
     def _get_api_url(self) -> str:
         """Get the appropriate API URL based on provider."""
         if self.config.provider == LLMProvider.OPENROUTER:
-            return "https://openrouter.ai/api/v1/chat/completions"
+            return f"{os.environ.get('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1')}/chat/completions"
         elif self.config.provider == LLMProvider.OPENAI:
             return "https://api.openai.com/v1/chat/completions"
         elif self.config.provider == LLMProvider.ANTHROPIC:
@@ -464,7 +470,7 @@ class LLMRoleplayer:
         self.logger = logging.getLogger("text_parser.llm_roleplayer")
         self.api_key = api_key
         self.model = model
-        self.base_url = "https://openrouter.ai/api/v1"
+        self.base_url = os.environ.get('OPENROUTER_BASE_URL', "https://openrouter.ai/api/v1")
         self.logger.info(f"LLMRoleplayer initialized with model: {model}")
     
     # ============================================================================
@@ -632,6 +638,8 @@ class LLMRoleplayer:
     # RETRY AND ERROR HANDLING
     # ============================================================================
     
+    @timed("llm_request_seconds", "Upstream LLM request latency, including retries",
+           subsystem="llm_roleplayer", transport="async")
     async def _make_request_with_retries_async(self, prompt: str, model: str, mode: ResponseMode) -> LLMResponse:
         """Make API request with retry logic (async)."""
         last_error = None
@@ -660,6 +668,8 @@ class LLMRoleplayer:
             model, mode, 0.0
         )
     
+    @timed("llm_request_seconds", "Upstream LLM request latency, including retries",
+           subsystem="llm_roleplayer", transport="sync")
     def _make_request_with_retries(self, prompt: str, model: str, mode: ResponseMode) -> LLMResponse:
         """Make API request with retry logic (sync)."""
         last_error = None
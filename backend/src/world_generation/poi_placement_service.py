@@ -10,6 +10,7 @@ and world state.
 import random
 import logging
 import math
+from collections import Counter
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
@@ -17,7 +18,10 @@ from sqlalchemy.orm import Session
 from .world_model import (
     DBBiome, DBPointOfInterest, DBRegion,
     POIType, POIState, BiomeType,
-    RACIAL_CHARACTERISTICS
+    RACIAL_CHARACTERISTICS, get_biome_generation_rules
+)
+from .poi_spatial_index import (
+    POISpatialGrid, assign_poi_coordinates, distance_km, grid_cells_within_radius
 )
 
 logger = logging.getLogger(__name__)
@@ -63,7 +67,8 @@ class POIPlacementService:
         biome_id: str,
         area_size_km2: float = 100.0,
         player_context: Optional[Dict[str, Any]] = None,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        commit: bool = True
     ) -> List[DBPointOfInterest]:
         """
         Generate POIs for a specific biome based on its generation rules.
@@ -74,6 +79,8 @@ class POIPlacementService:
             area_size_km2: Size of the area in square kilometers
             player_context: Player exploration history and preferences
             seed: Random seed for deterministic generation
+            commit: Commit the POIs; if False they are only flushed and the
+                caller owns the transaction
             
         Returns:
             List of generated POI database objects
@@ -101,6 +108,11 @@ class POIPlacementService:
         self.logger.info(f"Generating {poi_count} POIs for biome {biome.name}")
         
         generated_pois = []
+        # POIs are placed in a square biome-local frame of the requested area
+        area_side_km = math.sqrt(area_size_km2)
+        spatial_grid = POISpatialGrid()
+        # Running type counts so each placement doesn't rescan every POI so far
+        type_counts: Counter = Counter()
         
         for i in range(poi_count):
             try:
@@ -108,7 +120,8 @@ class POIPlacementService:
                 poi_type = self._select_poi_type(
                     generation_rules["poi_types"],
                     generated_pois,
-                    biome
+                    biome,
+                    type_counts=type_counts
                 )
                 
                 # Generate POI data
@@ -117,18 +130,26 @@ class POIPlacementService:
                     poi_type=poi_type,
                     generation_rules=generation_rules,
                     existing_pois=generated_pois,
-                    biome=biome
+                    biome=biome,
+                    area_side_km=area_side_km,
+                    spatial_grid=spatial_grid,
+                    type_counts=type_counts
                 )
                 
                 if poi:
                     generated_pois.append(poi)
+                    spatial_grid.insert(poi)
+                    type_counts[poi_type] += 1
                     
             except Exception as e:
                 self.logger.error(f"Error generating POI {i} for biome {biome_id}: {e}")
         
         # Save POIs to database
-        for poi in generated_pois:
-            db.add(poi)
+        db.add_all(generated_pois)
+        
+        if not commit:
+            db.flush()
+            return generated_pois
         
         try:
             db.commit()
@@ -183,34 +204,40 @@ class POIPlacementService:
         self,
         allowed_types: List[POIType],
         existing_pois: List[DBPointOfInterest],
-        biome: DBBiome
+        biome: DBBiome,
+        type_counts: Optional[Counter] = None
     ) -> POIType:
         """
         Select a POI type based on biome rules and clustering logic.
+        
+        type_counts (POIType -> count of existing_pois) can be passed by callers
+        that maintain it incrementally.
         """
         if not allowed_types:
             return POIType.VILLAGE  # Default fallback
         
+        if type_counts is None:
+            type_counts = self._count_poi_types(existing_pois)
+        
         # Create weighted selection based on existing POIs
         type_weights = {}
         
         for poi_type in allowed_types:
             base_weight = 1.0
             
-            # Apply clustering rules
-            for existing_poi in existing_pois:
-                existing_type = POIType(existing_poi.poi_type)
+            # Apply clustering rules, once per existing POI of each type
+            for existing_type, count in type_counts.items():
+                clustering_rule = self.poi_clustering.get(existing_type)
+                if not clustering_rule or not count:
+                    continue
                 
-                if existing_type in self.poi_clustering:
-                    clustering_rule = self.poi_clustering[existing_type]
-                    
-                    # If this type is attracted to existing POI, increase weight
-                    if poi_type in clustering_rule.get("attracts", []):
-                        base_weight *= 1.5
-                    
-                    # If this type is repelled by existing POI, decrease weight
-                    if poi_type in clustering_rule.get("repels", []):
-                        base_weight *= 0.5
+                # If this type is attracted to existing POIs, increase weight
+                if poi_type in clustering_rule.get("attracts", []):
+                    base_weight *= self._repeated_factor(1.5, count)
+                
+                # If this type is repelled by existing POIs, decrease weight
+                if poi_type in clustering_rule.get("repels", []):
+                    base_weight *= 0.5 ** count
             
             # Apply biome-specific modifiers
             if biome.biome_type == BiomeType.VERDANT_FRONTIER.value:
@@ -240,13 +267,27 @@ class POIPlacementService:
         
         return random.choice(allowed_types)  # Fallback
     
+    def _count_poi_types(self, pois: List[DBPointOfInterest]) -> Counter:
+        """Count POIs by POIType."""
+        return Counter(POIType(poi.poi_type) for poi in pois)
+    
+    def _repeated_factor(self, factor: float, count: int) -> float:
+        """factor ** count, saturating to infinity like repeated multiplication would."""
+        try:
+            return factor ** count
+        except OverflowError:
+            return math.inf
+    
     def _generate_single_poi(
         self,
         biome_id: str,
         poi_type: POIType,
         generation_rules: Dict[str, Any],
         existing_pois: List[DBPointOfInterest],
-        biome: DBBiome
+        biome: DBBiome,
+        area_side_km: float = 10.0,
+        spatial_grid: Optional[POISpatialGrid] = None,
+        type_counts: Optional[Counter] = None
     ) -> Optional[DBPointOfInterest]:
         """
         Generate a single POI with appropriate attributes.
@@ -257,7 +298,7 @@ class POIPlacementService:
             
             # Determine discovery difficulty
             discovery_difficulty = self._calculate_discovery_difficulty(
-                poi_type, biome, existing_pois
+                poi_type, biome, existing_pois, type_counts=type_counts
             )
             
             # Generate location tags
@@ -281,12 +322,54 @@ class POIPlacementService:
                 generation_seed=generation_seed
             )
             
+            x_km, y_km = self._choose_poi_coordinates(poi_type, area_side_km, spatial_grid)
+            assign_poi_coordinates(poi, x_km, y_km)
+            
             return poi
             
         except Exception as e:
             self.logger.error(f"Error generating POI: {e}")
             return None
     
+    def _choose_poi_coordinates(
+        self,
+        poi_type: POIType,
+        area_side_km: float,
+        spatial_grid: Optional[POISpatialGrid] = None
+    ) -> Tuple[float, float]:
+        """
+        Choose biome-local coordinates for a new POI.
+        
+        Uniform over the biome, but a POI attracted to an already placed POI
+        (see poi_clustering) is sometimes placed within that POI's cluster distance.
+        """
+        x_km = random.uniform(0, area_side_km)
+        y_km = random.uniform(0, area_side_km)
+        
+        if not spatial_grid or random.random() >= 0.5:
+            return x_km, y_km
+        
+        for anchor_type, rule in self.poi_clustering.items():
+            if poi_type not in rule.get("attracts", []):
+                continue
+            
+            cluster_distance = rule.get("cluster_distance", 2.0)
+            # Only anchors near the uniform candidate are considered
+            anchors = [
+                poi for poi in spatial_grid.query_radius(x_km, y_km, cluster_distance * 4)
+                if poi.poi_type == anchor_type.value
+            ]
+            if anchors:
+                anchor = random.choice(anchors)
+                angle = random.uniform(0, 2 * math.pi)
+                offset = random.uniform(0, cluster_distance)
+                return (
+                    min(max(anchor.x_km + math.cos(angle) * offset, 0.0), area_side_km),
+                    min(max(anchor.y_km + math.sin(angle) * offset, 0.0), area_side_km)
+                )
+        
+        return x_km, y_km
+    
     def _generate_poi_name(
         self,
         poi_type: POIType,
@@ -341,7 +424,8 @@ class POIPlacementService:
         self,
         poi_type: POIType,
         biome: DBBiome,
-        existing_pois: List[DBPointOfInterest]
+        existing_pois: List[DBPointOfInterest],
+        type_counts: Optional[Counter] = None
     ) -> int:
         """
         Calculate the difficulty of discovering this POI.
@@ -370,7 +454,10 @@ class POIPlacementService:
             base_difficulty -= 2  # Open, well-traveled areas
         
         # Existing POIs might make others easier to find
-        nearby_pois = len([poi for poi in existing_pois if poi.poi_type == poi_type.value])
+        if type_counts is not None:
+            nearby_pois = type_counts[poi_type]
+        else:
+            nearby_pois = len([poi for poi in existing_pois if poi.poi_type == poi_type.value])
         if nearby_pois > 0:
             base_difficulty -= min(nearby_pois, 3)
         
@@ -482,26 +569,73 @@ class POIPlacementService:
             db.rollback()
             return False
     
+    def get_pois_within_radius(
+        self,
+        db: Session,
+        biome_id: str,
+        x_km: float,
+        y_km: float,
+        radius_km: float,
+        states: Optional[List[POIState]] = None
+    ) -> List[Tuple[DBPointOfInterest, float]]:
+        """
+        Get POIs of a biome within a radius of a point, nearest first.
+        
+        Only rows in grid cells overlapping the search circle are read, using the
+        (biome_id, grid_cell, current_state) index.
+        
+        Returns:
+            List of (POI, distance in km) tuples
+        """
+        query = db.query(DBPointOfInterest).filter(
+            DBPointOfInterest.biome_id == biome_id,
+            DBPointOfInterest.grid_cell.in_(grid_cells_within_radius(x_km, y_km, radius_km))
+        )
+        if states:
+            query = query.filter(DBPointOfInterest.current_state.in_([state.value for state in states]))
+        
+        nearby = []
+        for poi in query.all():
+            distance = distance_km(x_km, y_km, poi.x_km, poi.y_km)
+            if distance <= radius_km:
+                nearby.append((poi, distance))
+        
+        nearby.sort(key=lambda entry: entry[1])
+        return nearby
+    
     def get_discoverable_pois_near_location(
         self,
         db: Session,
         biome_id: str,
         player_awareness: int = 10,
-        search_radius_km: float = 10.0
+        search_radius_km: float = 10.0,
+        player_x_km: Optional[float] = None,
+        player_y_km: Optional[float] = None
     ) -> List[DBPointOfInterest]:
         """
         Get POIs that could be discovered by a player in a given area.
+        
+        When the player's biome-local position is known, only undiscovered POIs
+        within search_radius_km are considered. Without a position every
+        undiscovered POI in the biome is a candidate (legacy behaviour).
         """
-        # Get all undiscovered POIs in the biome
-        undiscovered_pois = db.query(DBPointOfInterest).filter(
-            DBPointOfInterest.biome_id == biome_id,
-            DBPointOfInterest.current_state == POIState.UNDISCOVERED.value
-        ).all()
+        if player_x_km is not None and player_y_km is not None:
+            candidates = [
+                poi for poi, _ in self.get_pois_within_radius(
+                    db, biome_id, player_x_km, player_y_km, search_radius_km,
+                    states=[POIState.UNDISCOVERED]
+                )
+            ]
+        else:
+            candidates = db.query(DBPointOfInterest).filter(
+                DBPointOfInterest.biome_id == biome_id,
+                DBPointOfInterest.current_state == POIState.UNDISCOVERED.value
+            ).all()
         
         discoverable = []
-        for poi in undiscovered_pois:
-            # Simple discovery check - in a real implementation, you'd factor in
-            # distance, terrain, weather, player skills, etc.
+        for poi in candidates:
+            # Simple discovery check - terrain, weather and player skills could
+            # further modify this chance
             discovery_chance = max(0, player_awareness - poi.discovery_difficulty + 10) / 20.0
             
             if random.random() < discovery_chance:
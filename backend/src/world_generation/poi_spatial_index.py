@@ -0,0 +1,93 @@
+"""
+POI Spatial Index - Grid-based spatial lookups for Points of Interest
+
+POIs carry biome-local coordinates in kilometres. Each POI is also assigned a
+grid cell key so proximity queries can be answered from an indexed column
+(only the cells overlapping the search circle are read) instead of scanning
+every POI in the biome. The same grid is available in memory for generation-
+time neighbour lookups.
+"""
+
+import math
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Edge length of a grid cell in kilometres. Searches of radius r touch roughly
+# (2r / POI_GRID_CELL_KM + 1)^2 cells.
+POI_GRID_CELL_KM = 5.0
+
+
+def grid_cell_coords(x_km: float, y_km: float, cell_km: float = POI_GRID_CELL_KM) -> Tuple[int, int]:
+    """Get the integer grid coordinates of the cell containing a point."""
+    return math.floor(x_km / cell_km), math.floor(y_km / cell_km)
+
+
+def grid_cell_key(x_km: float, y_km: float, cell_km: float = POI_GRID_CELL_KM) -> str:
+    """Get the grid cell key (as stored on DBPointOfInterest.grid_cell) for a point."""
+    cell_x, cell_y = grid_cell_coords(x_km, y_km, cell_km)
+    return f"{cell_x}:{cell_y}"
+
+
+def _cells_within_radius(
+    x_km: float, y_km: float, radius_km: float, cell_km: float
+) -> Iterator[Tuple[int, int]]:
+    min_x, min_y = grid_cell_coords(x_km - radius_km, y_km - radius_km, cell_km)
+    max_x, max_y = grid_cell_coords(x_km + radius_km, y_km + radius_km, cell_km)
+
+    for cell_x in range(min_x, max_x + 1):
+        for cell_y in range(min_y, max_y + 1):
+            # Skip corner cells whose closest point is outside the circle
+            nearest_x = min(max(x_km, cell_x * cell_km), (cell_x + 1) * cell_km)
+            nearest_y = min(max(y_km, cell_y * cell_km), (cell_y + 1) * cell_km)
+            if distance_km(x_km, y_km, nearest_x, nearest_y) <= radius_km:
+                yield cell_x, cell_y
+
+
+def grid_cells_within_radius(
+    x_km: float, y_km: float, radius_km: float, cell_km: float = POI_GRID_CELL_KM
+) -> List[str]:
+    """Get the keys of all grid cells that overlap a circle."""
+    return [f"{cell_x}:{cell_y}" for cell_x, cell_y in _cells_within_radius(x_km, y_km, radius_km, cell_km)]
+
+
+def distance_km(x1_km: float, y1_km: float, x2_km: float, y2_km: float) -> float:
+    """Euclidean distance between two biome-local points."""
+    return math.hypot(x2_km - x1_km, y2_km - y1_km)
+
+
+def assign_poi_coordinates(poi: Any, x_km: float, y_km: float, cell_km: float = POI_GRID_CELL_KM) -> None:
+    """Set a POI's coordinates and keep its grid cell key in sync."""
+    poi.x_km = x_km
+    poi.y_km = y_km
+    poi.grid_cell = grid_cell_key(x_km, y_km, cell_km)
+
+
+class POISpatialGrid:
+    """
+    In-memory uniform grid of POIs for radius queries.
+
+    Used during generation, where POIs are not yet in the database, so that
+    clustering rules only look at nearby POIs rather than every POI placed so far.
+    """
+
+    def __init__(self, cell_km: float = POI_GRID_CELL_KM):
+        self.cell_km = cell_km
+        self._cells: Dict[Tuple[int, int], List[Any]] = defaultdict(list)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def insert(self, poi: Any) -> None:
+        """Add a POI that has ``x_km``/``y_km`` set."""
+        self._cells[grid_cell_coords(poi.x_km, poi.y_km, self.cell_km)].append(poi)
+        self._count += 1
+
+    def query_radius(self, x_km: float, y_km: float, radius_km: float) -> List[Any]:
+        """Get POIs within ``radius_km`` of a point."""
+        nearby = []
+        for cell in _cells_within_radius(x_km, y_km, radius_km, self.cell_km):
+            for poi in self._cells.get(cell, ()):
+                if distance_km(x_km, y_km, poi.x_km, poi.y_km) <= radius_km:
+                    nearby.append(poi)
+        return nearby
@@ -0,0 +1,204 @@
+"""
+Region Generation Pipeline - Parallel, deterministic location detail generation
+
+Location detail generation is pure content generation once a POI's biome
+context is known. This module fans it out over a process pool: POIs are sent
+to workers as plain snapshots, each POI is generated under its own seed derived
+from its generation_seed, and the main process bulk-inserts the results. Since
+no POI's output depends on which worker produced it or what ran before it, a
+region generates identically with one worker or many.
+"""
+
+import hashlib
+import logging
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from .world_model import DBBiome, DBGeneratedLocationDetails, DBPointOfInterest
+from backend.src.location_generators.base_generator import build_biome_context
+from backend.src.location_generators.generator_factory import get_location_generator_factory
+
+logger = logging.getLogger(__name__)
+
+# POIs per task sent to a worker process
+DETAIL_GENERATION_CHUNK_SIZE = 200
+
+
+def derive_seed(generation_seed: str, *parts: Any) -> int:
+    """
+    Derive a stable 64-bit seed from a generation seed and a path of parts.
+
+    Unlike hash(), the result is the same in every process and every run.
+    """
+    key = "/".join([str(generation_seed)] + [str(part) for part in parts])
+    return int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest()[:8], "big")
+
+
+@dataclass(frozen=True)
+class POISnapshot:
+    """Plain copy of the POI attributes the location generators read."""
+    id: str
+    biome_id: str
+    poi_type: str
+    generated_name: str
+    relative_location_tags: Tuple[str, ...]
+    generation_seed: str
+
+    @classmethod
+    def from_db(cls, poi: DBPointOfInterest) -> "POISnapshot":
+        return cls(
+            id=poi.id,
+            biome_id=poi.biome_id,
+            poi_type=poi.poi_type,
+            generated_name=poi.generated_name,
+            relative_location_tags=tuple(poi.relative_location_tags or ()),
+            generation_seed=poi.generation_seed or poi.id
+        )
+
+
+@dataclass(frozen=True)
+class DetailGenerationTask:
+    """A POI and the context needed to generate its details."""
+    poi: POISnapshot
+    biome_context: Dict[str, Any]
+    generation_context: Optional[Dict[str, Any]] = None
+
+
+def generate_details_chunk(tasks: List[DetailGenerationTask]) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+    """
+    Generate details for a chunk of POIs. Runs inside worker processes.
+
+    The module-level random generator is reseeded per POI and restored
+    afterwards, so the chunk can also run in the calling process.
+
+    Returns:
+        List of (POI ID, details data or None) tuples in task order
+    """
+    factory = get_location_generator_factory()
+    results = []
+    saved_state = random.getstate()
+    try:
+        for task in tasks:
+            random.seed(derive_seed(task.poi.generation_seed, "details"))
+            results.append((
+                task.poi.id,
+                factory.build_location_details(task.poi, task.biome_context, task.generation_context)
+            ))
+    finally:
+        random.setstate(saved_state)
+    return results
+
+
+class RegionGenerationPipeline:
+    """
+    Generates location details for many POIs in parallel and saves them in bulk.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = DETAIL_GENERATION_CHUNK_SIZE):
+        """
+        Args:
+            max_workers: Worker processes (None = one per CPU, 1 = in-process)
+            chunk_size: POIs per worker task
+        """
+        self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+
+    def build_tasks(
+        self,
+        db: Session,
+        pois: Iterable[DBPointOfInterest],
+        generation_context: Optional[Dict[str, Any]] = None
+    ) -> List[DetailGenerationTask]:
+        """
+        Snapshot POIs that still need details, with one context per biome.
+        """
+        pending = [poi for poi in pois if not poi.details_generated]
+        biome_ids = {poi.biome_id for poi in pending}
+
+        biome_contexts = {}
+        if biome_ids:
+            for biome in db.query(DBBiome).filter(DBBiome.id.in_(biome_ids)).all():
+                context = build_biome_context(biome)
+                # The ORM object stays behind; workers only get plain data
+                context.pop("biome")
+                biome_contexts[biome.id] = context
+
+        return [
+            DetailGenerationTask(
+                poi=POISnapshot.from_db(poi),
+                biome_context=biome_contexts.get(poi.biome_id, {}),
+                generation_context=generation_context
+            )
+            for poi in pending
+        ]
+
+    def run(self, tasks: List[DetailGenerationTask]) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Generate details for all tasks, in task order.
+        """
+        chunks = [tasks[i:i + self.chunk_size] for i in range(0, len(tasks), self.chunk_size)]
+
+        if self.max_workers == 1 or len(chunks) <= 1:
+            results = [generate_details_chunk(chunk) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(generate_details_chunk, chunks))
+
+        return [result for chunk_results in results for result in chunk_results]
+
+    def generate_details(
+        self,
+        db: Session,
+        pois: Iterable[DBPointOfInterest],
+        generation_context: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Generate and save location details for POIs that do not have them yet.
+
+        Args:
+            db: Database session
+            pois: POIs to generate details for
+            generation_context: Optional context passed to every generator
+
+        Returns:
+            Number of POIs that got details
+        """
+        tasks = self.build_tasks(db, pois, generation_context)
+        results = self.run(tasks)
+
+        detail_rows = []
+        poi_updates = []
+        for poi_id, details_data in results:
+            if not details_data:
+                continue
+            detail_rows.append({
+                "point_of_interest_id": poi_id,
+                "description": details_data.get("description", ""),
+                "detailed_features": details_data.get("detailed_features", []),
+                "generated_npcs": details_data.get("generated_npcs", []),
+                "local_issues": details_data.get("local_issues", []),
+                "available_services": details_data.get("available_services", []),
+                "unique_items": details_data.get("unique_items", []),
+                "quest_hooks": details_data.get("quest_hooks", []),
+                "hidden_secrets": details_data.get("hidden_secrets", []),
+                "local_economy": details_data.get("local_economy", {}),
+                "generation_prompt": details_data.get("generation_prompt", "")
+            })
+            poi_updates.append({"id": poi_id, "details_generated": True})
+
+        try:
+            db.bulk_insert_mappings(DBGeneratedLocationDetails, detail_rows)
+            db.bulk_update_mappings(DBPointOfInterest, poi_updates)
+            db.commit()
+        except Exception as e:
+            self.logger.error(f"Error saving generated location details: {e}")
+            db.rollback()
+            raise
+
+        self.logger.info(f"Generated details for {len(detail_rows)} of {len(tasks)} locations")
+        return len(detail_rows)
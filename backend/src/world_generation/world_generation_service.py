@@ -8,17 +8,19 @@ biomes, POI placement, and location detail generation.
 
 import logging
 import random
+import uuid
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
 
-from world_model import (
+from .world_model import (
     DBRegion, DBBiome, DBPointOfInterest, POIType, POIState,
     BiomeType, LocationSize
 )
-from poi_placement_service import POIPlacementService
-from world_persistence_manager import WorldPersistenceManager
-from location_generators.generator_factory import get_location_generator_factory
+from .poi_placement_service import POIPlacementService
+from .world_persistence_manager import WorldPersistenceManager
+from .region_generation_pipeline import RegionGenerationPipeline, derive_seed
+from backend.src.location_generators.generator_factory import get_location_generator_factory
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +40,9 @@ class WorldGenerationService:
             "max_pois_per_biome": 50,
             "detail_generation_batch_size": 10,
             "discovery_simulation_enabled": True,
-            "auto_generate_details": True
+            "auto_generate_details": True,
+            "pipeline_max_workers": None,  # None = one worker per CPU
+            "pipeline_chunk_size": 200
         }
 
     def generate_complete_region(
@@ -101,6 +105,97 @@ class WorldGenerationService:
             db.rollback()
             raise
 
+    def generate_region_pipelined(
+        self,
+        db: Session,
+        region_data: Dict[str, Any],
+        generation_seed: Optional[str] = None,
+        generate_details: bool = True,
+        simulation_context: Optional[Dict[str, Any]] = None,
+        target_poi_count: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> DBRegion:
+        """
+        Generate a complete region with location details generated in parallel.
+
+        Biome and POI placement is seeded from generation_seed, and every POI
+        gets its own seed derived from it. Location details are generated in a
+        process pool and bulk-inserted by this process, so the output does not
+        depend on the number of workers.
+
+        Args:
+            db: Database session
+            region_data: Region configuration data
+            generation_seed: Seed for the whole region (defaults to
+                region_data["generation_seed"], or a random seed)
+            generate_details: Whether to generate detailed location content
+            simulation_context: Context for simulating player discovery
+            target_poi_count: Approximate number of POIs to spread over the
+                region's biomes instead of sizing biomes by type
+            max_workers: Worker processes for detail generation (1 = in-process)
+
+        Returns:
+            Created region with all generated content
+        """
+        generation_seed = generation_seed or region_data.get("generation_seed") or uuid.uuid4().hex
+        self.logger.info(f"Generating region {region_data['name']} (pipelined, seed {generation_seed})")
+
+        try:
+            region = self._create_region(db, region_data)
+
+            random.seed(derive_seed(generation_seed, "biomes"))
+            biomes_data = self._generate_biomes_for_region(region_data, region.id)
+
+            poi_count = 0
+            for biome_index, biome_data in enumerate(biomes_data):
+                biome = self._create_biome(db, biome_data)
+
+                if target_poi_count is None:
+                    area_size = self._calculate_biome_area(biome)
+                else:
+                    # Spread the target evenly; the extra half POI absorbs float truncation
+                    biome_share = target_poi_count // len(biomes_data) + (
+                        1 if biome_index < target_poi_count % len(biomes_data) else 0
+                    )
+                    area_size = (biome_share + 0.5) / biome.poi_density
+
+                pois = self.poi_service.generate_pois_for_biome(
+                    db,
+                    biome.id,
+                    area_size_km2=area_size,
+                    player_context=simulation_context,
+                    seed=derive_seed(generation_seed, "biome", biome_index),
+                    commit=False
+                )
+                # Per-POI seeds that depend only on the region seed and placement order
+                for poi_index, poi in enumerate(pois):
+                    poi.generation_seed = f"{generation_seed}/{biome_index}/{poi_index}"
+                poi_count += len(pois)
+
+            db.commit()
+
+            if generate_details:
+                pipeline = RegionGenerationPipeline(
+                    max_workers=max_workers or self.config["pipeline_max_workers"],
+                    chunk_size=self.config["pipeline_chunk_size"]
+                )
+                pipeline.generate_details(
+                    db,
+                    db.query(DBPointOfInterest).join(DBBiome).filter(DBBiome.region_id == region.id).all()
+                )
+
+            if simulation_context and self.config["discovery_simulation_enabled"]:
+                random.seed(derive_seed(generation_seed, "discovery"))
+                self._simulate_player_discovery(db, region.id, simulation_context)
+
+            self.logger.info(f"Successfully generated region {region.name} with {poi_count} POIs")
+            return region
+
+        except Exception as e:
+            self.logger.error(f"Error generating region {region_data['name']}: {e}")
+            db.rollback()
+            raise
+
     def _create_region(self, db: Session, region_data: Dict[str, Any]) -> DBRegion:
         """Create a region from data."""
         region = DBRegion(
@@ -313,15 +408,21 @@ class WorldGenerationService:
         db: Session,
         biome_id: str,
         player_awareness: int = 10,
-        search_radius_km: float = 10.0
+        search_radius_km: float = 10.0,
+        player_x_km: Optional[float] = None,
+        player_y_km: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """
         Get locations that a player could potentially discover.
 
+        When the player's biome-local position is given, only POIs within
+        search_radius_km of it are considered.
+
         Returns list of POI data with discovery information.
         """
         discoverable_pois = self.poi_service.get_discoverable_pois_near_location(
-            db, biome_id, player_awareness, search_radius_km
+            db, biome_id, player_awareness, search_radius_km,
+            player_x_km=player_x_km, player_y_km=player_y_km
         )
 
         result = []
@@ -333,6 +434,7 @@ class WorldGenerationService:
                 "discovery_difficulty": poi.discovery_difficulty,
                 "location_tags": poi.relative_location_tags,
                 "travel_time": poi.travel_time_from_major,
+                "coordinates": {"x_km": poi.x_km, "y_km": poi.y_km},
                 "has_details": poi.details_generated
             }
             result.append(poi_data)
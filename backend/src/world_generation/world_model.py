@@ -11,7 +11,7 @@ import json
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Union
 from enum import Enum
-from sqlalchemy import Column, String, Integer, Float, Boolean, Text, JSON, ForeignKey, DateTime
+from sqlalchemy import Column, String, Integer, Float, Boolean, Text, JSON, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from pydantic import BaseModel, Field
 
@@ -223,6 +223,11 @@ class DBPointOfInterest(Base):
     relative_location_tags = Column(JSON, default=list)  # "near_river", "mountain_peak", etc.
     travel_time_from_major = Column(Integer, default=1)  # Days from nearest major location
     
+    # Spatial placement (biome-local kilometres) and grid cell key for proximity queries
+    x_km = Column(Float, nullable=True)
+    y_km = Column(Float, nullable=True)
+    grid_cell = Column(String, nullable=True)  # "cell_x:cell_y", see poi_spatial_index
+    
     # Generated content reference
     details_generated = Column(Boolean, default=False)
     generation_seed = Column(String)  # For consistent regeneration
@@ -235,6 +240,10 @@ class DBPointOfInterest(Base):
     # Relationships
     biome = relationship("DBBiome", back_populates="points_of_interest")
     location_details = relationship("DBGeneratedLocationDetails", back_populates="point_of_interest")
+    
+    __table_args__ = (
+        Index("ix_poi_biome_cell_state", "biome_id", "grid_cell", "current_state"),
+    )
 
 class DBGeneratedLocationDetails(Base):
     """
@@ -332,6 +341,8 @@ class PointOfInterestData(BaseModel):
     discovery_difficulty: int = 10
     relative_location_tags: List[str] = Field(default_factory=list)
     travel_time_from_major: int = 1
+    x_km: Optional[float] = None
+    y_km: Optional[float] = None
     details_generated: bool = False
     generation_seed: Optional[str] = None
 
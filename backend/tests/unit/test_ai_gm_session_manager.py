@@ -0,0 +1,124 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from ai_gm_session_manager import SessionManager, SessionPoolSaturated
+from ai_gm_brain_custom import AIGMBrainCustom
+
+WORK_SECONDS = 0.1
+
+
+class SlowBrain(AIGMBrainCustom):
+    """Brain whose input handling blocks like a synchronous LLM call"""
+
+    def __init__(self, game_id, player_id="player_character_id"):
+        super().__init__(game_id=game_id, player_id=player_id)
+        self._active = 0
+        self._guard = threading.Lock()
+        self.max_overlap = 0
+
+    def process_player_input(self, input_string):
+        with self._guard:
+            self._active += 1
+            self.max_overlap = max(self.max_overlap, self._active)
+        time.sleep(WORK_SECONDS)
+        with self._guard:
+            self._active -= 1
+        return super().process_player_input(input_string)
+
+
+def make_manager(tmp_path, **kwargs):
+    kwargs.setdefault("brain_class", SlowBrain)
+    return SessionManager(snapshot_dir=str(tmp_path / "sessions"), **kwargs)
+
+
+def run_inputs(manager, player_ids):
+    async def main():
+        started = time.perf_counter()
+        results = await asyncio.gather(*(
+            manager.run(player_id, None, lambda brain: brain.process_player_input("look"))
+            for player_id in player_ids
+        ))
+        return results, time.perf_counter() - started
+    return asyncio.run(main())
+
+
+def test_throughput_scales_with_workers(tmp_path):
+    players = [f"player_{i}" for i in range(8)]
+
+    serial = make_manager(tmp_path / "serial", max_workers=1)
+    _, serial_elapsed = run_inputs(serial, players)
+    serial.shutdown()
+
+    pooled = make_manager(tmp_path / "pooled", max_workers=8)
+    results, pooled_elapsed = run_inputs(pooled, players)
+    pooled.shutdown()
+
+    assert all(result["success"] for result in results)
+    assert serial_elapsed >= len(players) * WORK_SECONDS
+    assert pooled_elapsed < serial_elapsed / 2
+
+
+def test_requests_for_one_player_are_serialized(tmp_path):
+    manager = make_manager(tmp_path, max_workers=4)
+    run_inputs(manager, ["alice"] * 4)
+    brain = manager._sessions["alice"].brain
+    assert brain.max_overlap == 1
+    assert brain.interaction_count == 4
+    assert not manager._session_locks and not manager._busy
+    manager.shutdown()
+
+
+def test_saturated_pool_rejects_requests(tmp_path):
+    manager = make_manager(tmp_path, max_workers=1, max_queue_depth=1)
+    with pytest.raises(SessionPoolSaturated):
+        run_inputs(manager, ["a", "b", "c"])
+    assert manager.stats["rejected"] == 1
+    manager.shutdown()
+
+
+def test_evicted_sessions_hibernate_and_rehydrate(tmp_path):
+    manager = make_manager(tmp_path, brain_class=AIGMBrainCustom, max_sessions=2, idle_ttl=3600)
+    run_inputs(manager, ["a"])
+    run_inputs(manager, ["a"])
+    run_inputs(manager, ["b"])
+    run_inputs(manager, ["c"])
+
+    listing = manager.list_sessions()
+    assert [session["player_id"] for session in listing["sessions"]] == ["b", "c"]
+    assert listing["hibernated"] == 1
+
+    run_inputs(manager, ["a"])
+    assert manager._sessions["a"].brain.interaction_count == 3
+    assert manager.stats["rehydrated"] == 1
+    assert [session["player_id"] for session in manager.list_sessions()["sessions"]] == ["c", "a"]
+
+    manager.idle_ttl = 0
+    assert manager.evict_idle() == 2
+    assert manager.list_sessions()["hibernated"] == 3
+    assert manager.clear("b") and not manager.clear("b")
+    manager.shutdown()
+
+
+def test_failed_rehydration_keeps_the_snapshot(tmp_path):
+    class BrokenSnapshotBrain(AIGMBrainCustom):
+        @classmethod
+        def from_snapshot(cls, snapshot):
+            raise ValueError("incompatible snapshot")
+
+    manager = make_manager(tmp_path, brain_class=BrokenSnapshotBrain, max_sessions=1, idle_ttl=3600)
+    run_inputs(manager, ["a"])
+    run_inputs(manager, ["b"])
+    path = manager._snapshot_path("a")
+    assert os.path.exists(path)
+
+    # A fresh session replaces the broken one; the snapshot survives as .bad
+    results, _ = run_inputs(manager, ["a"])
+    assert results[0]["success"]
+    assert manager._sessions["a"].brain.interaction_count == 1
+    assert manager.stats["rehydrated"] == 0
+    assert not os.path.exists(path) and os.path.exists(path + ".bad")
+    manager.shutdown()
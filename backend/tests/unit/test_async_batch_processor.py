@@ -0,0 +1,85 @@
+import asyncio
+
+from backend.src.ai_gm.optimizations.performance_optimizer import (
+    AsyncBatchProcessor,
+    LLMRoleplayerBatchBackend,
+    StubBatchBackend,
+)
+from backend.src.shared.metrics import MetricsRegistry
+
+
+class RecordingBackend:
+    def __init__(self, latency=0.01):
+        self.latency = latency
+        self.batches = []
+
+    async def process_batch(self, requests):
+        self.batches.append([request["prompt"] for request in requests])
+        await asyncio.sleep(self.latency)
+        return [{"echo": request["prompt"]} for request in requests]
+
+
+def test_burst_collapses_into_few_upstream_calls():
+    backend = RecordingBackend()
+    registry = MetricsRegistry()
+    processor = AsyncBatchProcessor(batch_size=10, batch_timeout=0.05, backend=backend, registry=registry)
+
+    async def scenario():
+        # 40 reactions to one player action, only 8 distinct prompts
+        requests = [{"prompt": f"react-{i % 8}", "target_entity": "npc_guard"} for i in range(40)]
+        return await asyncio.gather(*(processor.add_request(request) for request in requests))
+
+    results = asyncio.run(scenario())
+    assert results == [{"echo": f"react-{i % 8}"} for i in range(40)]
+    assert backend.batches == [[f"react-{i}" for i in range(8)]]
+    stats = processor.get_stats()
+    assert stats["deduplicated_requests"] == 32
+    assert stats["upstream_calls"] == 1
+    assert stats["batch_latency_seconds"]["count"] == 1
+    assert stats["batch_latency_seconds"]["p50"] >= backend.latency
+    assert stats["pending_requests"] == 0
+    assert registry.histogram("ai_gm_llm_batch_seconds", subsystem="ai_gm") is processor.batch_latency
+
+
+def test_full_batches_dispatch_without_waiting_for_timer():
+    backend = RecordingBackend(latency=0)
+    processor = AsyncBatchProcessor(batch_size=3, batch_timeout=10.0, backend=backend)
+
+    async def scenario():
+        return await asyncio.wait_for(
+            asyncio.gather(*(processor.add_request({"prompt": str(i)}) for i in range(6))), timeout=1.0
+        )
+
+    asyncio.run(scenario())
+    assert backend.batches == [["0", "1", "2"], ["3", "4", "5"]]
+    assert processor._flush_timer is None
+
+
+def test_backend_failure_propagates_to_every_waiter():
+    class FailingBackend:
+        async def process_batch(self, requests):
+            raise RuntimeError("upstream unavailable")
+
+    processor = AsyncBatchProcessor(batch_size=5, batch_timeout=0.01, backend=FailingBackend())
+
+    async def scenario():
+        return await asyncio.gather(processor.add_request({"prompt": "a"}), processor.add_request({"prompt": "a"}),
+                                    return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert processor.get_stats()["failed_batches"] == 1
+
+
+def test_roleplayer_backend_and_stub():
+    class FakeRoleplayer:
+        async def generate_response_async(self, prompt, mode=None, complexity="standard"):
+            return f"{prompt}:{complexity}"
+
+    backend = LLMRoleplayerBatchBackend(FakeRoleplayer())
+    results = asyncio.run(backend.process_batch([{"prompt": "hi"}, {"prompt": "yo", "complexity": "fast"}]))
+    assert results == ["hi:standard", "yo:fast"]
+
+    stub_results = asyncio.run(StubBatchBackend().process_batch([{"prompt": "x"}]))
+    assert stub_results[0]["result"] == "processed_0"
+
@@ -0,0 +1,133 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.src.business.models.db_models import (
+    Base, BusinessType, DBFinancialTransaction, DBPlayerBusinessProfile, DBStaffMemberContract
+)
+from backend.src.business.models.pydantic_models import TransactionType
+from backend.src.business.crud import record_financial_transactions_bulk
+from backend.src.business.services.player_business_daily_operations_service import (
+    PlayerBusinessDailyOperationsService
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _make_business(db, balance=1000.0, inventory=None):
+    business = DBPlayerBusinessProfile(
+        id=f"business-{uuid4().hex}",
+        player_character_id="player-1",
+        business_name_player_chosen="Test Forge",
+        business_type=BusinessType.BLACKSMITH,
+        current_balance=balance,
+        total_revenue=0.0,
+        total_expenses=0.0,
+        shop_ledger=[],
+        inventory=inventory or {}
+    )
+    db.add(business)
+    db.commit()
+    return business
+
+
+def _hire(db, business, npc_id, wage):
+    contract = DBStaffMemberContract(
+        id=f"contract-{uuid4().hex}",
+        npc_id=npc_id,
+        role_title="assistant",
+        agreed_wage_per_period=wage,
+        wage_payment_schedule="daily",
+        assigned_tasks_description="Sweep the floor",
+        work_schedule={"days": ["firstday"], "start_time": "08:00:00", "end_time": "16:00:00"},
+        contract_start_date=datetime(2025, 1, 1)
+    )
+    contract.business.append(business)
+    db.add(contract)
+    db.commit()
+    return contract
+
+
+def _count_commits(db):
+    commits = []
+    event.listen(db, "after_commit", lambda session: commits.append(1))
+    return commits
+
+
+def test_pay_staff_wages_posts_in_one_commit(db):
+    business = _make_business(db)
+    for index in range(3):
+        _hire(db, business, f"npc-{index}", 10.0)
+
+    commits = _count_commits(db)
+    results = PlayerBusinessDailyOperationsService().pay_staff_wages(db, business.id, datetime(2025, 2, 1))
+
+    assert results["total_wages_paid"] == 30.0
+    assert len(results["staff_payments"]) == 3
+    assert len(commits) == 1
+
+    db.expire_all()
+    updated = db.get(DBPlayerBusinessProfile, business.id)
+    assert updated.current_balance == 970.0
+    assert updated.total_expenses == 30.0
+    assert len(updated.shop_ledger) == 3
+    assert db.query(DBFinancialTransaction).count() == 3
+    assert all(contract.last_wage_payment_date == datetime(2025, 2, 1)
+               for contract in db.query(DBStaffMemberContract).all())
+
+
+def test_bulk_posting_is_all_or_nothing(db):
+    business = _make_business(db)
+
+    with pytest.raises(ValueError):
+        record_financial_transactions_bulk(db, [
+            {"business_id": business.id, "transaction_type": TransactionType.SALE,
+             "amount": 5.0, "description": "Sale", "is_income": True},
+            {"business_id": "business-missing", "transaction_type": TransactionType.SALE,
+             "amount": 5.0, "description": "Sale", "is_income": True},
+        ])
+
+    assert db.query(DBFinancialTransaction).count() == 0
+    db.expire_all()
+    assert db.get(DBPlayerBusinessProfile, business.id).current_balance == 1000.0
+
+
+def test_daily_operations_batch_covers_many_businesses(db):
+    expired = (datetime(2025, 2, 1) - timedelta(days=1)).isoformat()
+    first = _make_business(db, inventory={
+        "bread": {"name": "Bread", "quantity": 4, "purchase_price_per_unit": 2.5, "expiration_date": expired}
+    })
+    second = _make_business(db, balance=500.0)
+    _hire(db, first, "npc-a", 12.0)
+    _hire(db, second, "npc-b", 8.0)
+    _hire(db, second, "npc-c", 8.0)
+
+    commits = _count_commits(db)
+    results = PlayerBusinessDailyOperationsService().process_daily_operations_batch(
+        db,
+        [first.id, second.id],
+        processing_date=datetime(2025, 2, 1),
+        scheduled_payments={second.id: [{"payment_type": "tax", "amount": 20.0}]}
+    )
+
+    assert len(commits) == 1
+    assert results["transactions_posted"] == 5
+    assert results["total_wages_paid"] == 28.0
+    assert results["total_rent_and_taxes_paid"] == 20.0
+    assert results["total_spoilage_loss"] == 10.0
+
+    db.expire_all()
+    first_after = db.get(DBPlayerBusinessProfile, first.id)
+    second_after = db.get(DBPlayerBusinessProfile, second.id)
+    assert first_after.current_balance == 1000.0 - 12.0 - 10.0
+    assert second_after.current_balance == 500.0 - 16.0 - 20.0
+    assert first_after.inventory["bread"]["quantity"] == 0
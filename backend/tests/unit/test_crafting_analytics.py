@@ -0,0 +1,128 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Query, sessionmaker
+
+from backend.src.database.base import Base
+from backend.src.crafting.db import crud
+from backend.src.crafting.db.crud import crafting_log as crud_crafting_log
+from backend.src.crafting.db.crud import recipe_crafting_stats as crud_recipe_crafting_stats
+from backend.src.crafting.models.db_models import (
+    DBCraftingLog, DBRecipe, DBRecipeCraftingDailyStats, DBRecipeCraftingStats
+)
+from backend.src.crafting.services.crafting_analytics_service import CraftingAnalyticsService
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    for name in ("sword", "shield", "bow"):
+        session.add(DBRecipe(id=f"recipe-{name}", name=name, description=name, recipe_category="smithing",
+                             experience_gained=[], quality_range={"min": 1, "max": 3}))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _craft(db, recipe_id, quantity, success=True):
+    crud_crafting_log.create_crafting_log(
+        db=db, player_id="player-1", recipe_id=recipe_id, success=success,
+        quantity_attempted=quantity, quantity_produced=quantity if success else 0
+    )
+
+
+def test_counters_follow_crafting_logs(db):
+    _craft(db, "recipe-sword", 2)
+    _craft(db, "recipe-sword", 3)
+    _craft(db, "recipe-shield", 4)
+    _craft(db, "recipe-bow", 1, success=False)
+
+    leaderboard = CraftingAnalyticsService().get_popular_recipes(db, limit=10)
+
+    assert [(entry["name"], entry["times_crafted"]) for entry in leaderboard] == [("sword", 5), ("shield", 4)]
+    assert leaderboard[0]["successful_crafts"] == 2
+    assert db.get(DBRecipeCraftingStats, "recipe-bow").attempts == 1
+
+
+def test_windowed_leaderboards(db):
+    _craft(db, "recipe-sword", 1)
+    _craft(db, "recipe-shield", 2)
+    # Backdate the shield craft, then rebuild the counters from the log
+    service = CraftingAnalyticsService()
+    db.query(DBCraftingLog).filter(DBCraftingLog.recipe_id == "recipe-shield").update(
+        {DBCraftingLog.timestamp: datetime.utcnow() - timedelta(days=3)}
+    )
+    db.commit()
+    service.rebuild_counters(db)
+
+    assert [entry["name"] for entry in service.get_popular_recipes(db, window="day")] == ["sword"]
+    assert [entry["name"] for entry in service.get_popular_recipes(db, window="week")] == ["shield", "sword"]
+    with pytest.raises(ValueError):
+        service.get_popular_recipes(db, window="century")
+
+
+def test_log_group_by_matches_counters(db):
+    for quantity in (1, 2, 3):
+        _craft(db, "recipe-bow", quantity)
+    _craft(db, "recipe-sword", 4)
+
+    service = CraftingAnalyticsService()
+
+    assert service.get_popular_recipes_from_logs(db) == service.get_popular_recipes(db)
+
+
+@pytest.mark.parametrize("upsert", [True, False], ids=["on_conflict", "update_then_insert"])
+def test_counter_upserts_create_and_add_to_rows(db, monkeypatch, upsert):
+    if not upsert:
+        monkeypatch.setattr(crud, "_UPSERT_INSERTS", {})
+    today = datetime(2026, 3, 2, 12, 0)
+    # First crafts of a recipe and of a new day, several in one transaction
+    for timestamp, success in ((today - timedelta(days=1), True), (today, True), (today, False)):
+        crud_recipe_crafting_stats.record_craft(db=db, recipe_id="recipe-bow", success=success,
+                                                quantity_produced=2 if success else 0, timestamp=timestamp)
+    db.commit()
+
+    totals = db.get(DBRecipeCraftingStats, "recipe-bow")
+    assert (totals.attempts, totals.successes, totals.quantity_produced, totals.last_crafted_at) == (3, 2, 4, today)
+    daily = {row.day: (row.attempts, row.successes, row.quantity_produced)
+             for row in db.query(DBRecipeCraftingDailyStats).filter_by(recipe_id="recipe-bow")}
+    assert daily == {today.date() - timedelta(days=1): (1, 1, 2), today.date(): (2, 1, 2)}
+
+
+def test_fallback_retries_the_update_when_a_concurrent_insert_wins(db, monkeypatch):
+    monkeypatch.setattr(crud, "_UPSERT_INSERTS", {})
+    now = datetime(2026, 3, 2, 12, 0)
+    crud_recipe_crafting_stats.record_craft(db=db, recipe_id="recipe-bow", success=True,
+                                            quantity_produced=1, timestamp=now)
+    db.commit()
+
+    # The first UPDATE misses, as if the row was inserted just after it ran
+    original_update, missed = Query.update, []
+
+    def racing_update(query, values, **kwargs):
+        if not missed:
+            missed.append(True)
+            return 0
+        return original_update(query, values, **kwargs)
+
+    monkeypatch.setattr(Query, "update", racing_update)
+    crud_recipe_crafting_stats.record_craft(db=db, recipe_id="recipe-bow", success=True,
+                                            quantity_produced=1, timestamp=now)
+    db.commit()
+
+    assert db.get(DBRecipeCraftingStats, "recipe-bow").attempts == 2
+
+
+def test_counters_are_backfilled_on_first_use(db):
+    _craft(db, "recipe-sword", 2)
+    _craft(db, "recipe-shield", 1)
+    # Logs written before the counters existed
+    db.query(DBRecipeCraftingDailyStats).delete()
+    db.query(DBRecipeCraftingStats).delete()
+    db.commit()
+
+    service = CraftingAnalyticsService()
+    assert [entry["name"] for entry in service.get_popular_recipes(db)] == ["sword", "shield"]
+    assert [entry["name"] for entry in service.get_popular_recipes(db, window="day")] == ["sword", "shield"]
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+
+from backend.src.narrative_engine.event_bus import Event, EventBus
+
+
+def publish(bus, event_type, source, when):
+    event = Event(event_type, {"at": when.isoformat()}, source)
+    event.timestamp = when.isoformat()
+    bus.publish(event, async_processing=False)
+    return event
+
+
+def test_history_indexes_stay_consistent_through_eviction():
+    bus = EventBus(max_history_size=4)
+    start = datetime(2026, 1, 1)
+    events = [publish(bus, ["combat", "trade"][i % 2], f"npc_{i % 3}", start + timedelta(minutes=i))
+              for i in range(7)]
+
+    assert len(bus.event_history) == 4
+    assert bus.get_event_by_id(events[2].id) is None
+    assert bus.get_event_by_id(events[5].id) is events[5]
+    assert bus.get_recent_events(3) == [events[6], events[5], events[4]]
+    assert bus.get_events_by_type("combat") == [events[6], events[4]]
+    assert bus.get_events_by_type("trade", limit=1) == [events[5]]
+    assert bus.get_events_by_source("npc_0") == [events[6], events[3]]
+    assert bus.get_events_by_source("npc_9") == []
+
+    bus.clear_history()
+    assert bus.get_recent_events() == [] and bus.get_events_by_type("combat") == []
+
+
+def test_evicted_events_can_be_queried_by_time_range(tmp_path):
+    spill_path = tmp_path / "events" / "spill.jsonl"
+    bus = EventBus(max_history_size=3, history_spill_path=str(spill_path))
+    bus.event_history.spill_log.block_size = 2
+    start = datetime(2026, 1, 1)
+    events = [publish(bus, "quest", "quest_engine", start + timedelta(hours=i)) for i in range(8)]
+
+    in_range = bus.get_events_in_range(start + timedelta(hours=1), start + timedelta(hours=5, minutes=30))
+    assert [event.id for event in in_range] == [event.id for event in events[1:6]]
+    assert in_range[0].data == {"at": events[1].timestamp}
+    assert bus.get_events_in_range(start - timedelta(days=2), start - timedelta(days=1)) == []
+
+    # A new bus on the same log re-indexes what earlier runs spilled
+    bus.event_history.spill_log.close()
+    reopened = EventBus(max_history_size=3, history_spill_path=str(spill_path))
+    assert [event.id for event in reopened.get_events_in_range(start, start + timedelta(hours=2))] == [
+        event.id for event in events[:3]]
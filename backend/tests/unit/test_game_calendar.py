@@ -0,0 +1,82 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.models import DBGameTimeState, DBScheduledGameEvent
+from app.models.time_models import GameDateTime, GameTimeSettings, Season, TimeBlock
+from app.services.time_service import TimeService
+
+
+@pytest.fixture
+def settings():
+    return GameTimeSettings()
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[DBGameTimeState.__table__, DBScheduledGameEvent.__table__])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _dt(year, month, day, hour=0, minute=0):
+    return GameDateTime(year=year, month=month, day=day, hour=hour, minute=minute)
+
+
+def test_ordinal_round_trip_and_arithmetic(settings):
+    calendar = settings.calendar
+    assert calendar.days_per_year == 365
+
+    for ordinal in range(0, 3 * calendar.minutes_per_year, 7919):
+        assert calendar.to_ordinal(calendar.from_ordinal(ordinal)) == ordinal
+
+    assert _dt(1000, 12, 31, 23, 59).add_minutes(1, settings) == _dt(1001, 1, 1)
+    assert _dt(1000, 3, 1).add_minutes(-1, settings) == _dt(1000, 2, 28, 23, 59)
+    assert _dt(1000, 1, 1, 8).add_minutes(calendar.minutes_per_year * 250, settings) == _dt(1250, 1, 1, 8)
+    assert _dt(1000, 1, 1).minutes_until(_dt(1000, 2, 1), settings) == 31 * 24 * 60
+    # Overflowing days are normalized into the next month
+    assert _dt(1000, 4, 31).add_minutes(0, settings) == _dt(1000, 5, 1)
+
+
+def test_time_block_and_season_lookups(settings):
+    assert _dt(1000, 1, 1, 9).get_time_description(settings) == TimeBlock.MORNING.value
+    assert _dt(1000, 1, 15).get_season(settings) == Season.WINTER
+    assert _dt(1000, 3, 1).get_season(settings) == Season.SPRING
+    assert _dt(1000, 7, 4).get_season(settings) == Season.SUMMER
+    assert _dt(1000, 11, 30).get_season(settings) == Season.AUTUMN
+    assert _dt(1000, 12, 25).get_season(settings) == Season.WINTER
+
+    season, start, next_season, next_start = settings.calendar.season_bounds(_dt(1001, 1, 15))
+    assert (season, next_season) == (Season.WINTER, Season.SPRING)
+    assert settings.calendar.from_ordinal(start) == _dt(1000, 12, 1)
+    assert settings.calendar.from_ordinal(next_start) == _dt(1001, 3, 1)
+
+
+def test_calendar_is_rebuilt_when_settings_change(settings):
+    calendar = settings.calendar
+    assert settings.calendar is calendar
+    settings.year_zero_epoch = 900
+    assert settings.calendar is calendar
+
+    settings.days_per_month = {**settings.days_per_month, 2: 29}
+    assert settings.calendar is not calendar
+    assert settings.calendar.days_per_year == 366
+
+
+def test_time_service_year_jump_and_block_wrap(db, settings):
+    service = TimeService(db, settings, game_id="calendar-test")
+
+    new_datetime = service.advance_days(365)
+    assert new_datetime == _dt(settings.year_zero_epoch + 1, 1, 1, 8)
+
+    # At 21:00 on the last day of a 30-day month, the next dawn is in the next month
+    late = _dt(1001, 4, 30, 21)
+    assert service.calculate_time_until_block(TimeBlock.DAWN, late) == 9 * 60
+
+    progress = service.get_season_progress(_dt(1001, 4, 15))
+    assert progress["current_season"] == Season.SPRING
+    assert progress["next_season"] == Season.SUMMER
+    assert progress["days_remaining"] == 47
@@ -0,0 +1,90 @@
+import pytest
+
+from backend.src.text_parser.hybrid_retriever import BM25Index, HybridRetriever, normalize_query, recall_at_k
+from backend.src.text_parser.knowledge_index import HashingEmbedder, KnowledgeIndex, KnowledgeIngestionEngine, chunk_markdown
+
+RECIPES = """# Recipes
+
+## Smelting
+
+### Smelt Iron Ingot
+- Hematite Ore x1
+- Charcoal x1
+- Heat in a bloomery until the bloom forms.
+
+### Smelt Copper Ingot
+- Copper Ore x1
+- Charcoal x0.8
+
+## Weapons
+
+### Iron Longsword
+- Iron Ingot x3
+- Leather Strip x1
+- Quench the blade in oil for a tougher edge.
+"""
+
+
+class CountingEmbedder(HashingEmbedder):
+    def __init__(self):
+        super().__init__(dimension=64)
+        self.encoded = 0
+
+    def encode(self, texts):
+        self.encoded += len(texts)
+        return super().encode(texts)
+
+
+@pytest.fixture
+def retriever(tmp_path):
+    index_path = tmp_path / "index.sqlite3"
+    chunks = chunk_markdown(RECIPES, "crafting/recipes.md")
+    KnowledgeIngestionEngine(HashingEmbedder(dimension=64), index_path).ingest(chunks)
+    embedder = CountingEmbedder()
+    return HybridRetriever(KnowledgeIndex.open(embedder, index_path)), embedder
+
+
+def test_bm25_ranks_rare_terms_higher():
+    bm25 = BM25Index(["iron ingot", "iron sword iron", "copper ingot"])
+    assert [doc for doc, _ in bm25.search("copper ingot")] == [2, 0]
+    assert bm25.search("mithril") == []
+
+
+def test_exact_names_skip_the_embedder(retriever):
+    retriever, embedder = retriever
+    results = retriever.retrieve("Smelt Copper Ingot", k=2)
+    assert results[0]["heading"] == "Recipes > Smelting > Smelt Copper Ingot"
+    assert results[0]["retriever"] == "lexical"
+    assert results[0]["score"] == 1.0
+    assert embedder.encoded == 0
+
+    # Punctuation and case variants hit the cache
+    assert retriever.retrieve("  smelt copper ingot! ", k=2) == results
+    assert retriever.stats["cache_hits"] == 1
+
+
+def test_descriptive_queries_fuse_dense_and_lexical(retriever):
+    retriever, embedder = retriever
+    results = retriever.retrieve("how should I quench a blade in oil", k=3)
+    assert embedder.encoded == 1
+    assert results[0]["heading"] == "Recipes > Weapons > Iron Longsword"
+    assert {result["retriever"] for result in results} == {"hybrid"}
+
+
+def test_cache_is_bounded_and_returns_copies(retriever):
+    retriever, _ = retriever
+    retriever.cache_size = 2
+    first = retriever.retrieve("iron longsword")
+    first[0]["text"] = "mutated"
+    assert retriever.retrieve("iron longsword")[0]["text"] != "mutated"
+    retriever.retrieve("smelt iron ingot")
+    retriever.retrieve("copper ore charcoal heat")
+    assert len(retriever._cache) == 2
+    assert ("iron longsword", 5) not in retriever._cache
+
+
+def test_helpers():
+    assert normalize_query("  Iron-Ingot?? ") == "iron ingot"
+    ranked = [[{"id": "a"}, {"id": "b"}], [{"id": "c"}]]
+    assert recall_at_k(ranked, ["b", "d"], 1) == 0.0
+    assert recall_at_k(ranked, ["b", "c"], 2) == 1.0
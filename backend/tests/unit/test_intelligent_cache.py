@@ -0,0 +1,76 @@
+from backend.src.ai_gm.optimizations import performance_optimizer
+from backend.src.ai_gm.optimizations.performance_optimizer import IntelligentCache, PerformanceOptimizer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def test_lru_eviction_follows_access_order():
+    cache = IntelligentCache(max_size=3)
+    for key in "abc":
+        cache.set(key, key.upper())
+    assert cache.get("a") == "A"
+    cache.set("d", "D")
+    assert cache.get("b") is None
+    assert [key for key in cache.cache] == ["c", "a", "d"]
+
+
+def test_expired_entries_are_purged_before_lru(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(performance_optimizer.time, "monotonic", clock.monotonic)
+    cache = IntelligentCache(max_size=3, default_ttl=60)
+    cache.set("short", 1, ttl=5)
+    cache.set("long-1", 2)
+    cache.set("long-2", 3)
+
+    clock.now += 10
+    assert cache.get_stats()["expired_entries"] == 1
+    cache.set("new", 4)
+    assert set(cache.cache) == {"long-1", "long-2", "new"}
+    assert cache.get("long-1") == 2
+
+    # Re-setting a key leaves a stale heap record that must not evict the new value
+    cache.set("long-2", 30, ttl=100)
+    clock.now += 70
+    cache._clean_expired()
+    assert set(cache.cache) == {"long-2"}
+    assert cache.get("long-2") == 30
+
+
+def test_invalidate_tags_any_and_all():
+    cache = IntelligentCache()
+    cache.set("r1", 1, tags={"player:p1", "entity:npc_guard", "location:gate"})
+    cache.set("r2", 2, tags={"player:p1", "entity:npc_smith", "location:forge"})
+    cache.set("r3", 3, tags={"player:p2", "entity:npc_guard", "location:gate"})
+
+    assert cache.invalidate_tags(["player:p1", "entity:npc_guard"], match_all=True) == 1
+    assert set(cache.cache) == {"r2", "r3"}
+    assert cache.invalidate_tags(["location:forge", "location:gate"]) == 2
+    assert not cache.cache
+    assert cache.get_stats()["tags"] == 0
+
+
+def test_invalidate_pattern_matches_tags():
+    cache = IntelligentCache()
+    cache.set(cache._generate_key("wave", {"player_id": "p9"}, "npc_bard"), 1,
+              tags=IntelligentCache._generate_tags({"player_id": "p9"}, "npc_bard"))
+    cache.invalidate_pattern("player:p9")
+    assert not cache.cache
+
+
+def test_optimizer_invalidates_dependent_reactions():
+    optimizer = PerformanceOptimizer()
+    context = {"player_id": "p1", "current_location": "market"}
+    for entity in ("npc_guard", "npc_merchant"):
+        key = optimizer.cache._generate_key("steal apple", context, entity)
+        optimizer.cache.set(key, {"entity": entity}, tags=optimizer.cache._generate_tags(context, entity))
+
+    assert optimizer.invalidate_cached_reactions(player_id="p1", entity_ids=["npc_guard"]) == 1
+    remaining = [entry.data["entity"] for entry in optimizer.cache.cache.values()]
+    assert remaining == ["npc_merchant"]
+    assert optimizer.invalidate_cached_reactions(location="market") == 1
@@ -0,0 +1,94 @@
+import pytest
+
+from backend.src.text_parser.knowledge_index import (
+    HashingEmbedder,
+    KnowledgeIndex,
+    KnowledgeIngestionEngine,
+    chunk_markdown,
+)
+
+RECIPES = """# Recipes
+
+Intro text.
+
+## Smelting
+
+### Smelt Iron Ingot
+- Hematite Ore x1
+- Charcoal x1
+
+```
+# not a heading
+```
+
+### Smelt Copper Ingot
+- Copper Ore x1
+"""
+
+
+class CountingEmbedder(HashingEmbedder):
+    def __init__(self):
+        super().__init__(dimension=64)
+        self.encoded = 0
+
+    def encode(self, texts):
+        self.encoded += len(texts)
+        return super().encode(texts)
+
+
+@pytest.fixture
+def kb_dir(tmp_path):
+    kb = tmp_path / "kb"
+    (kb / "crafting").mkdir(parents=True)
+    (kb / "crafting" / "recipes.md").write_text(RECIPES, encoding="utf-8")
+    (kb / "lore.md").write_text("# Lore\n\nThe old kingdom fell to the wraiths.\n", encoding="utf-8")
+    return kb
+
+
+def test_chunks_follow_headings():
+    chunks = chunk_markdown(RECIPES, "crafting/recipes.md")
+    assert [chunk.heading for chunk in chunks] == [
+        "Recipes",
+        "Recipes > Smelting > Smelt Iron Ingot",
+        "Recipes > Smelting > Smelt Copper Ingot",
+    ]
+    assert chunks[1].id == "crafting/recipes.md#recipes-smelting-smelt-iron-ingot"
+    assert "# not a heading" in chunks[1].text
+    assert chunks[2].text.startswith("Recipes > Smelting > Smelt Copper Ingot\n\n- Copper Ore x1")
+
+
+def test_reingestion_embeds_only_changed_chunks(kb_dir, tmp_path):
+    index_path = tmp_path / "index.sqlite3"
+    embedder = CountingEmbedder()
+    engine = KnowledgeIngestionEngine(embedder, index_path, kb_dir)
+
+    first = engine.ingest()
+    assert (first.added, first.embedded) == (4, 4)
+
+    second = engine.ingest()
+    assert (second.unchanged, second.embedded) == (4, 0)
+    assert embedder.encoded == 4
+
+    recipes = kb_dir / "crafting" / "recipes.md"
+    recipes.write_text(RECIPES.replace("Copper Ore x1", "Copper Ore x2"), encoding="utf-8")
+    (kb_dir / "lore.md").unlink()
+    third = engine.ingest()
+    assert (third.updated, third.unchanged, third.removed, third.added) == (1, 2, 1, 0)
+    assert embedder.encoded == 5
+
+
+def test_index_opens_read_only_and_answers_queries(kb_dir, tmp_path):
+    index_path = tmp_path / "index.sqlite3"
+    embedder = HashingEmbedder(dimension=64)
+    KnowledgeIngestionEngine(embedder, index_path, kb_dir).ingest()
+    index_path.chmod(0o444)
+
+    index = KnowledgeIndex.open(HashingEmbedder(dimension=64), index_path)
+    assert len(index) == 4
+    results = index.query("copper ore", k=2)
+    assert results[0]["heading"] == "Recipes > Smelting > Smelt Copper Ingot"
+    assert results[0]["source"] == "crafting/recipes.md"
+    assert results[0]["score"] >= results[1]["score"]
+
+    with pytest.raises(ValueError):
+        KnowledgeIndex.open(HashingEmbedder(dimension=128), index_path)
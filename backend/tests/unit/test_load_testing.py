@@ -0,0 +1,113 @@
+import asyncio
+import json
+import time
+
+import aiohttp
+from aiohttp import web
+
+from backend.src.load_testing import (
+    OpenLoopScheduler,
+    PlayerSessionGenerator,
+    StubLLMConfig,
+    StubLLMServer,
+)
+from backend.src.load_testing.scenarios import AI_GM_COMMANDS
+
+
+async def start_app(app: web.Application):
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner, f"http://127.0.0.1:{runner.addresses[0][1]}"
+
+
+def fake_ai_gm_app(llm_base_url: str) -> web.Application:
+    """Stand-in for the AI GM server: every input costs one LLM call"""
+    async def health(request):
+        return web.json_response({"status": "healthy"})
+
+    async def process_input(request):
+        body = await request.json()
+        if body["input_text"] in AI_GM_COMMANDS["combat"]:
+            return web.json_response({"detail": "combat offline"}, status=503)
+        async with aiohttp.ClientSession() as http:
+            async with http.post(f"{llm_base_url}/chat/completions",
+                                 json={"model": "stub", "messages": [{"role": "user", "content": body["input_text"]}],
+                                       "max_tokens": 5}) as response:
+                completion = await response.json()
+        return web.json_response({"response_text": completion["choices"][0]["message"]["content"]})
+
+    app = web.Application()
+    app.router.add_get("/health", health)
+    app.router.add_post("/api/ai-gm/process-input", process_input)
+    return app
+
+
+def test_stub_llm_follows_latency_and_token_settings():
+    async def main():
+        stub = StubLLMServer(StubLLMConfig(ttft_median=0.05, ttft_sigma=0.0, tokens_per_second=100,
+                                           tokens_per_second_stddev=0.0, seed=1))
+        await stub.start()
+        try:
+            async with aiohttp.ClientSession() as http:
+                started = time.perf_counter()
+                async with http.post(f"{stub.base_url}/chat/completions",
+                                     json={"model": "m", "messages": [{"role": "user", "content": "hi there"}],
+                                           "max_tokens": 10}) as response:
+                    completion = await response.json()
+                elapsed = time.perf_counter() - started
+
+                stub.config.error_rate = 1.0
+                async with http.post(f"{stub.base_url}/chat/completions", json={"messages": []}) as response:
+                    failed_status = response.status
+        finally:
+            await stub.stop()
+        return completion, elapsed, failed_status
+
+    completion, elapsed, failed_status = asyncio.run(main())
+    assert completion["usage"] == {"prompt_tokens": 2, "completion_tokens": 10, "total_tokens": 12}
+    assert len(completion["choices"][0]["message"]["content"].split()) == 10
+    # 50 ms to first token + 10 tokens at 100 tokens/s
+    assert elapsed >= 0.15
+    assert failed_status == 500
+
+
+def test_game_api_sessions_capture_setup_values():
+    generator = PlayerSessionGenerator("game_api", seed=3)
+    session = generator.sessions(1)[0]
+    create, survival = session.setup_steps()
+    session.record_response(create, {"id": "char-42", "name": session.player_id})
+    assert survival.render(session.variables)[1] == {"character_id": "char-42"}
+    assert session.setup_steps() == []
+
+    categories = [session.next_step().name.split(":")[0] for _ in range(2000)]
+    share = categories.count("movement") / len(categories)
+    assert abs(share - generator.command_mix["movement"]) < 0.05
+    assert all("{" not in session.next_step().render(session.variables)[0] for _ in range(50))
+
+
+def test_open_loop_scheduler_reports_per_endpoint_stats():
+    async def main():
+        stub = StubLLMServer(StubLLMConfig(ttft_median=0.01, tokens_per_second=1000, seed=2))
+        await stub.start()
+        runner, base_url = await start_app(fake_ai_gm_app(stub.base_url))
+        try:
+            generator = PlayerSessionGenerator("ai_gm", seed=5, command_mix={"movement": 0.5, "combat": 0.5})
+            return await OpenLoopScheduler(base_url, generator, players=5, rate=100, duration=1.0, seed=5).run()
+        finally:
+            await runner.cleanup()
+            await stub.stop()
+
+    report = asyncio.run(main())
+    json.dumps(report)
+    summary = report["summary"]
+    assert 60 <= summary["requests"] <= 140
+    assert summary["dropped_arrivals"] == 0
+
+    steps = report["steps"]
+    assert steps["process-input:movement"]["error_rate"] == 0.0
+    assert steps["process-input:combat"]["status_counts"] == {"503": steps["process-input:combat"]["requests"]}
+    assert set(report["endpoints"]) == {"POST /api/ai-gm/process-input"}
+    latency = steps["process-input:movement"]["latency_ms"]
+    assert 0 < latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    assert abs(summary["error_rate"] - steps["process-input:combat"]["requests"] / summary["requests"]) < 1e-9
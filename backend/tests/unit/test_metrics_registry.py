@@ -0,0 +1,95 @@
+import asyncio
+import random
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.src.shared.metrics import Histogram, MetricsRegistry, instrument_app
+
+
+def test_histogram_quantiles_within_bucket_error():
+    histogram = Histogram()
+    rng = random.Random(7)
+    values = sorted(rng.lognormvariate(-4, 1.5) for _ in range(20000))
+    for value in values:
+        histogram.observe(value)
+
+    for q in (0.5, 0.95, 0.99):
+        exact = values[int(q * len(values)) - 1]
+        assert histogram.quantile(q) == pytest.approx(exact, rel=0.05)
+    assert histogram.count == len(values)
+    assert histogram.quantile(1.0) == histogram.max
+    assert len(histogram.buckets) < 300
+
+
+def test_histogram_clamps_out_of_range_values():
+    histogram = Histogram(lowest=1e-3, highest=1.0)
+    histogram.observe(0.0)
+    histogram.observe(50.0)
+    assert histogram.buckets[0] == 1 and histogram.buckets[-1] == 1
+    assert histogram.quantile(0.01) == 0.0
+    assert histogram.quantile(0.99) == 50.0
+    assert Histogram().summary()["p50"] == 0.0
+
+
+def test_series_are_keyed_by_labels():
+    registry = MetricsRegistry()
+    parser = registry.counter("requests_total", subsystem="text_parser")
+    assert registry.counter("requests_total", subsystem="text_parser") is parser
+    assert registry.counter("requests_total", subsystem="ai_gm") is not parser
+    with pytest.raises(ValueError):
+        registry.gauge("requests_total", subsystem="text_parser")
+    with pytest.raises(ValueError):
+        parser.inc(-1)
+
+
+def test_timed_decorates_sync_and_async_functions():
+    registry = MetricsRegistry()
+
+    @registry.timed("work_seconds", subsystem="ai_gm")
+    def work(fail=False):
+        if fail:
+            raise RuntimeError("boom")
+        return 1
+
+    @registry.timed("work_seconds", subsystem="llm_roleplayer")
+    async def async_work():
+        await asyncio.sleep(0.01)
+        return 2
+
+    assert work() == 1
+    with pytest.raises(RuntimeError):
+        work(fail=True)
+    assert asyncio.run(async_work()) == 2
+    with registry.timed("work_seconds", subsystem="ai_gm"):
+        pass
+
+    assert registry.histogram("work_seconds", subsystem="ai_gm").count == 3
+    assert registry.counter("work_errors_total", subsystem="ai_gm").value == 1
+    assert registry.histogram("work_seconds", subsystem="llm_roleplayer").min >= 0.01
+
+
+def test_render_text_and_metrics_endpoint():
+    registry = MetricsRegistry()
+    registry.gauge("sessions_active", "Live sessions", subsystem="ai_gm").set(3)
+    app = FastAPI()
+    instrument_app(app, subsystem="test_api", registry=registry)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str):
+        return {"id": item_id}
+
+    client = TestClient(app)
+    for item_id in ("a", "b"):
+        assert client.get(f"/items/{item_id}").status_code == 200
+    assert client.get("/missing").status_code == 404
+
+    text = client.get("/metrics").text
+    assert "# HELP sessions_active Live sessions\n# TYPE sessions_active gauge\n" in text
+    assert 'sessions_active{subsystem="ai_gm"} 3.0' in text
+    assert "# TYPE http_request_seconds summary" in text
+    labels = 'method="GET",route="/items/{item_id}",subsystem="test_api"'
+    assert f'http_request_seconds{{{labels},quantile="0.99"}}' in text
+    assert f"http_request_seconds_count{{{labels}}} 2" in text
+    assert 'http_responses_total{method="GET",route="unmatched",status="4xx",subsystem="test_api"} 1.0' in text
@@ -0,0 +1,129 @@
+import atexit
+import json
+import threading
+import time
+
+from backend.src.narrative_engine.narrative_context_manager import NarrativeContextManager
+
+
+class FakeStorage:
+    """Keeps saved contexts as JSON, the way a real store would"""
+
+    def __init__(self):
+        self.saved = {}
+        self.save_calls = 0
+
+    def save_narrative_context(self, context_id, context_dict):
+        self.save_calls += 1
+        self.saved[context_id] = json.dumps(context_dict)
+
+    def load_narrative_context(self, context_id):
+        data = self.saved.get(context_id)
+        return json.loads(data) if data else None
+
+
+def test_updates_are_coalesced_until_a_size_triggered_flush():
+    storage = FakeStorage()
+    manager = NarrativeContextManager(storage, flush_interval=60, max_pending_updates=102)
+    try:
+        contexts = [manager.create_context(f"session-{i}").id for i in range(2)]
+        for i in range(49):
+            manager.update_context(contexts[i % 2], lambda c: c.adjust_tension(0.01))
+            manager.add_event_to_context(contexts[0], {"type": "player_action", "n": i})
+        manager.update_context(contexts[1], lambda c: c.adjust_tension(0.01))
+        assert storage.save_calls == 0
+
+        # The 102nd update (counting both creations) triggers one save per context
+        manager.add_event_to_context(contexts[0], {"type": "player_action", "n": 49})
+        assert storage.save_calls == 2
+        assert len(json.loads(storage.saved["session-0"])["events"]) == 50
+        assert manager.stats["updates"] == 100
+    finally:
+        manager.close()
+
+
+def test_background_flush_evicts_idle_contexts_and_reloads_them():
+    storage = FakeStorage()
+    manager = NarrativeContextManager(storage, flush_interval=0.05, idle_ttl=0.0)
+    try:
+        manager.create_context("session-a")
+        manager.add_event_to_context("session-a", {"type": "discovery"})
+
+        deadline = time.monotonic() + 5
+        while "session-a" in manager.active_contexts and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "session-a" not in manager.active_contexts
+        assert storage.save_calls == 1
+
+        reloaded = manager.get_context("session-a")
+        assert [event["type"] for event in reloaded.events] == ["discovery"]
+    finally:
+        manager.close()
+
+
+def test_close_flushes_pending_updates_and_lru_bound_keeps_dirty_contexts():
+    storage = FakeStorage()
+    manager = NarrativeContextManager(storage, flush_interval=60, max_active_contexts=2)
+    for i in range(4):
+        manager.create_context(f"session-{i}")
+    manager.update_context("session-0", lambda c: c.set_pacing("fast"))
+    assert len(manager.active_contexts) == 4
+
+    manager.close()
+    assert storage.save_calls == 4
+    assert json.loads(storage.saved["session-0"])["pacing"] == "fast"
+    assert list(manager.active_contexts) == ["session-3", "session-0"]
+
+
+def test_contexts_evicted_mid_update_are_still_saved():
+    storage = FakeStorage()
+    manager = NarrativeContextManager(storage, flush_interval=60, max_active_contexts=1)
+    for context_id in ("a", "b"):
+        manager.create_context(context_id)
+    manager.flush()
+    assert list(manager.active_contexts) == ["b"]
+
+    evictor = None
+
+    def update(context):
+        nonlocal evictor
+        # Reloading "a" leaves "b" as the excess, least recently used context
+        manager.get_context("a")
+        evictor = threading.Thread(target=manager.evict_idle)
+        evictor.start()
+        evictor.join(0.1)
+        context.set_pacing("fast")
+
+    manager.update_context("b", update)
+    evictor.join()
+    assert "b" in manager.active_contexts
+
+    # A context changed after being evicted is cached again when marked dirty
+    context = manager.get_context("a")
+    manager.evict_idle()
+    assert "a" not in manager.active_contexts
+    context.set_pacing("slow")
+    manager.mark_dirty(context)
+
+    manager.close()
+    assert json.loads(storage.saved["b"])["pacing"] == "fast"
+    assert json.loads(storage.saved["a"])["pacing"] == "slow"
+    assert manager.stats["save_errors"] == 0
+
+
+def test_close_removes_the_exit_hook(monkeypatch):
+    hooks = []
+    monkeypatch.setattr(atexit, "register", hooks.append)
+    monkeypatch.setattr(atexit, "unregister", hooks.remove)
+    managers = [NarrativeContextManager(FakeStorage()) for _ in range(3)]
+    assert len(hooks) == 3
+    for manager in managers:
+        manager.close()
+    assert hooks == []
+
+    # Writes after close() restart flushing and get an exit flush again
+    storage = managers[0].storage_service
+    managers[0].create_context("late")
+    assert len(hooks) == 1
+    hooks[0]()
+    assert "late" in storage.saved
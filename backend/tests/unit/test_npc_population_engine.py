@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import Column, String, Table, create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.src.npc.models.db_models import Base, DBNpc
+from backend.src.npc.models.pydantic_models import EconomicRole
+from backend.src.npc.npc_generator_service import NpcGeneratorService
+
+
+@pytest.fixture
+def db():
+    # DBLocation is declared on the economy models' base; stand in for it here
+    locations = Table("locations", Base.metadata, Column("id", String, primary_key=True), extend_existing=True)
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[locations, DBNpc.__table__])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def service(tmp_path):
+    return NpcGeneratorService(data_dir=str(tmp_path))
+
+
+def _content(npcs):
+    return sorted(
+        (npc.name, npc.age, npc.gender, npc.economic_role, npc.backstory_hook, tuple(npc.personality_tags),
+         tuple(sorted(npc.skills.items())), npc.currency, tuple(sorted(npc.inventory)))
+        for npc in npcs
+    )
+
+
+def test_bulk_population_matches_role_counts_and_archetypes(db, service):
+    npcs = service.populate_location(db, "city", 2000, bulk=True, seed=7)
+
+    assert len(npcs) == 2000
+    assert db.query(DBNpc).filter(DBNpc.current_location_id == "city").count() == 2000
+    expected = service._get_role_counts(2000)
+    for role, count in expected.items():
+        assert sum(npc.economic_role == EconomicRole[role] for npc in npcs) == count
+
+    for npc in npcs:
+        if npc.economic_role == EconomicRole.ARTISAN_BLACKSMITH:
+            assert set(npc.skills) == {"smithing", "metalworking", "haggling"}
+            assert 5 <= npc.skills["smithing"] <= 10
+            assert 30 <= npc.age <= 60
+            assert 50.0 <= npc.currency <= 150.0
+            assert "hammer" in {slot["custom_data"]["item_type"] for slot in npc.inventory.values()}
+            assert len(set(npc.personality_tags)) == 3
+            assert set(npc.personality_tags) <= {"gruff", "hardworking", "honest", "proud"}
+        assert "{" not in npc.backstory_hook
+
+
+def test_bulk_population_is_reproducible_for_a_seed(db, service):
+    first = service.populate_location(db, "town-a", 300, bulk=True, seed=42)
+    second = service.populate_location(db, "town-b", 300, bulk=True, seed=42)
+    third = service.populate_location(db, "town-c", 300, bulk=True, seed=43)
+
+    assert _content(first) == _content(second)
+    assert _content(first) != _content(third)
+    assert not {npc.id for npc in first} & {npc.id for npc in second}
+
+
+def test_per_npc_population_accepts_role_names(db, service):
+    npcs = service.populate_location(db, "hamlet", 5, {"GUARD": 1.0})
+
+    assert [npc.economic_role for npc in npcs] == [EconomicRole.GUARD] * 5
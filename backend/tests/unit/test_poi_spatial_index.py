@@ -0,0 +1,77 @@
+import random
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from backend.src.world_generation.poi_placement_service import POIPlacementService
+from backend.src.world_generation.poi_spatial_index import (
+    POISpatialGrid, assign_poi_coordinates, distance_km, grid_cells_within_radius
+)
+from backend.src.world_generation.world_model import DBBiome, DBPointOfInterest, DBRegion, POIState
+
+
+class _Point:
+    def __init__(self, x_km, y_km):
+        self.x_km = x_km
+        self.y_km = y_km
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[
+        DBRegion.__table__, DBBiome.__table__, DBPointOfInterest.__table__
+    ])
+    session = sessionmaker(bind=engine)()
+    session.add(DBRegion(id="region-1", name="Region"))
+    session.add(DBBiome(id="biome-1", name="Forest", biome_type="verdant_frontier", region_id="region-1"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _poi(poi_id, x_km, y_km, state=POIState.UNDISCOVERED):
+    poi = DBPointOfInterest(
+        id=poi_id, generated_name=poi_id, poi_type="village", biome_id="biome-1",
+        current_state=state.value, discovery_difficulty=0
+    )
+    assign_poi_coordinates(poi, x_km, y_km)
+    return poi
+
+
+def test_grid_radius_query_matches_brute_force():
+    rng = random.Random(7)
+    points = [_Point(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(500)]
+    grid = POISpatialGrid()
+    for point in points:
+        grid.insert(point)
+
+    for x_km, y_km, radius_km in [(50, 50, 10), (0, 0, 7.5), (99, 3, 20)]:
+        expected = {id(p) for p in points if distance_km(x_km, y_km, p.x_km, p.y_km) <= radius_km}
+        assert {id(p) for p in grid.query_radius(x_km, y_km, radius_km)} == expected
+
+    # A 1 km circle in the middle of a cell touches only that cell
+    assert grid_cells_within_radius(2.5, 2.5, 1.0) == ["0:0"]
+
+
+def test_radius_query_reads_nearby_cells_only(db):
+    db.add_all([
+        _poi("near", 1.0, 1.0),
+        _poi("edge", 4.0, 4.0),
+        _poi("far", 40.0, 40.0),
+        _poi("found", 1.5, 1.5, state=POIState.DISCOVERED),
+    ])
+    db.commit()
+    service = POIPlacementService()
+
+    nearby = service.get_pois_within_radius(db, "biome-1", 0.0, 0.0, 6.0, states=[POIState.UNDISCOVERED])
+
+    assert [poi.id for poi, _ in nearby] == ["near", "edge"]
+    assert nearby[0][1] == pytest.approx(2 ** 0.5)
+
+    discoverable = service.get_discoverable_pois_near_location(
+        db, "biome-1", player_awareness=20, search_radius_km=6.0, player_x_km=0.0, player_y_km=0.0
+    )
+    assert {poi.id for poi in discoverable} == {"near", "edge"}
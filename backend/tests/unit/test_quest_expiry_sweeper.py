@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.src.quest.crud import create_player_quest
+from backend.src.quest.models.db_models import Base, DBPlayerQuest, DBQuest, DBQuestEvent
+from backend.src.quest.models.pydantic_models import QuestStatus, QuestType
+from backend.src.quest.services.objective_index import ObjectiveIndex
+from backend.src.quest.services.quest_manager_service import QuestManagerService
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _add_quest(db, quest_id, time_limit_seconds):
+    db.add(DBQuest(
+        id=quest_id, title=quest_id, description_template="", generated_description="",
+        quest_type=QuestType.FETCH_ITEM, time_limit_seconds=time_limit_seconds,
+        objectives=[{"id": "o", "type": "acquire_item", "target_id": "gem", "is_completed": False}]
+    ))
+    db.commit()
+
+
+def test_sweeper_expires_due_quests_in_bulk(db):
+    manager = QuestManagerService(objective_index=ObjectiveIndex())
+    for index in range(5):
+        _add_quest(db, f"timed-{index}", 60 * (index + 1))
+        create_player_quest(db, f"player-{index}", f"timed-{index}")
+    _add_quest(db, "untimed", None)
+    create_player_quest(db, "player-0", "untimed")
+
+    # A row written before expires_at existed is backfilled on the first sweep
+    legacy = db.query(DBPlayerQuest).filter(DBPlayerQuest.quest_id == "timed-4").one()
+    legacy.expires_at = None
+    db.commit()
+
+    started = db.query(DBPlayerQuest).filter(DBPlayerQuest.quest_id == "timed-0").one().started_at
+    assert manager.next_quest_expiration(db) == started + timedelta(seconds=60)
+
+    assert manager.check_quest_expiration(db, now=started + timedelta(seconds=150)) == 2
+    assert manager.check_quest_expiration(db, now=started + timedelta(seconds=150)) == 0
+    assert manager.check_quest_expiration(db, now=started + timedelta(days=1)) == 3
+
+    statuses = {pq.quest_id: pq.status for pq in db.query(DBPlayerQuest).all()}
+    assert statuses.pop("untimed") == QuestStatus.ACTIVE
+    assert set(statuses.values()) == {QuestStatus.EXPIRED}
+    assert db.query(DBQuestEvent).filter(DBQuestEvent.event_type == "quest_expired").count() == 5
+    assert manager.next_quest_expiration(db) is None
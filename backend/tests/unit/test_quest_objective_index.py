@@ -0,0 +1,81 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.src.quest.models.db_models import Base, DBQuest, DBQuestEvent
+from backend.src.quest.models.pydantic_models import QuestStatus, QuestType
+from backend.src.quest.services.objective_index import ObjectiveIndex
+from backend.src.quest.services.quest_manager_service import QuestManagerService
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def manager():
+    return QuestManagerService(objective_index=ObjectiveIndex())
+
+
+def _add_quest(db, quest_id, objectives):
+    db.add(DBQuest(
+        id=quest_id, title=quest_id, description_template="", generated_description="",
+        quest_type=QuestType.FETCH_ITEM, status=QuestStatus.AVAILABLE, objectives=objectives
+    ))
+    db.commit()
+
+
+def _objective(objective_id, objective_type, target_id, required_quantity=1, **extra):
+    return dict(id=objective_id, type=objective_type, target_id=target_id,
+                required_quantity=required_quantity, current_quantity=0, is_completed=False, **extra)
+
+
+def test_event_only_updates_targeted_objectives(db, manager):
+    _add_quest(db, "wolves", [_objective("pelts", "acquire_item", "wolf_pelt", 3),
+                              _objective("alpha", "defeat_target", "alpha_wolf", target_name="wolf")])
+    _add_quest(db, "herbs", [_objective("moss", "acquire_item", "moonmoss", 2)])
+    _add_quest(db, "more_herbs", [_objective("moss", "acquire_item", "moonmoss", 5)])
+    manager.accept_quest(db, "player-1", "wolves")
+    manager.accept_quest(db, "player-1", "herbs")
+    manager.accept_quest(db, "player-2", "more_herbs")
+
+    updates = manager.track_quest_event(db, "player-1", "item_acquired", {"item_id": "wolf_pelt", "quantity": 2})
+    assert [(u.quest_id, u.objective_id, u.increment_by) for u in updates] == [("wolves", "pelts", 2)]
+    assert manager.track_quest_event(db, "player-1", "item_acquired", {"item_id": "iron_ore"}) is None
+
+    # Creature type matches the defeat objective through its target name
+    manager.track_quest_event(db, "player-1", "enemy_defeated", {"enemy_id": "grey_wolf", "creature_type": "wolf"})
+    manager.track_quest_event(db, "player-1", "item_acquired", {"item_id": "wolf_pelt"})
+
+    wolves = manager.get_active_quests_for_player(db, "player-1")
+    assert [quest["quest_id"] for quest in wolves] == ["herbs"]
+    completed = manager.get_completed_quests_for_player(db, "player-1")
+    assert [quest["quest_id"] for quest in completed] == ["wolves"]
+    assert all(objective["is_completed"] for objective in completed[0]["objectives"])
+    assert db.query(DBQuestEvent).filter(DBQuestEvent.event_type == "quest_completed").count() == 1
+
+    # Completed objectives are no longer indexed; other players are untouched
+    assert manager.objective_index.lookup("player-1", "item_acquired", {"item_id": "wolf_pelt"}) == []
+    updates = manager.track_quest_event(db, "player-2", "item_acquired", {"item_id": "moonmoss"})
+    assert [(u.quest_id, u.objective_id) for u in updates] == [("more_herbs", "moss")]
+
+
+def test_index_is_rebuilt_from_database_and_follows_abandon(db, manager):
+    _add_quest(db, "courier", [_objective("parcel", "deliver_item", "parcel", recipient_id="npc-7")])
+    manager.accept_quest(db, "player-1", "courier")
+
+    # A fresh index (e.g. after a restart) loads the player's active quests lazily
+    restarted = QuestManagerService(objective_index=ObjectiveIndex())
+    assert restarted.track_quest_event(db, "player-1", "item_delivered",
+                                       {"item_id": "parcel", "recipient_id": "npc-1"}) is None
+    assert restarted.objective_index.lookup("player-1", "item_delivered", {"item_id": "parcel"}) == [("courier", "parcel")]
+
+    assert restarted.abandon_quest(db, "player-1", "courier")
+    assert restarted.objective_index.lookup("player-1", "item_delivered", {"item_id": "parcel"}) == []
+    assert restarted.track_quest_event(db, "player-1", "item_delivered",
+                                       {"item_id": "parcel", "recipient_id": "npc-7"}) is None
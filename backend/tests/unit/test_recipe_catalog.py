@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.src.database.base import Base
+from backend.src.crafting.models.db_models import DBPlayerKnownRecipe
+from backend.src.crafting.models.pydantic_models import (
+    Recipe, RecipeIngredient, RecipeOutput, SkillRequirement, AutoLearnSkillLevel
+)
+from backend.src.crafting.services.recipe_catalog import RecipeCatalog, invalidate_recipe_catalog
+from backend.src.crafting.services.recipe_service import RecipeService
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    invalidate_recipe_catalog()
+    yield session
+    session.close()
+    invalidate_recipe_catalog()
+
+
+def _recipe(name, skills=(), station=None, ingredients=(), unlock=None, auto_learn=None):
+    return Recipe(
+        id=f"recipe-{name}",
+        name=name,
+        description=f"Make a {name}",
+        primary_output=RecipeOutput(item_id=f"item-{name}"),
+        ingredients=[RecipeIngredient(item_id=item_id) for item_id in ingredients],
+        required_skills=[SkillRequirement(skill_name=skill, level=level) for skill, level in skills],
+        required_station_type=station,
+        unlock_conditions=unlock or {},
+        auto_learn_at_skill_level=AutoLearnSkillLevel(skill_name=auto_learn[0], level=auto_learn[1]) if auto_learn else None,
+        recipe_category="test"
+    )
+
+
+def test_learnable_recipes_use_sorted_thresholds():
+    catalog = RecipeCatalog([
+        _recipe("nail", skills=[("smithing", 1)]),
+        _recipe("sword", skills=[("smithing", 5)]),
+        _recipe("enchanted_sword", skills=[("smithing", 5), ("enchanting", 3)]),
+        _recipe("rope"),
+        _recipe("crown", skills=[("smithing", 2)], unlock={"min_character_level": 10}),
+    ])
+
+    assert catalog.learnable_recipe_ids({}) == ["recipe-rope"]
+    assert catalog.learnable_recipe_ids({"smithing": 5}) == ["recipe-nail", "recipe-sword", "recipe-rope"]
+    assert catalog.learnable_recipe_ids({"smithing": 5, "enchanting": 3, "character_level": 10}) == [
+        "recipe-nail", "recipe-sword", "recipe-enchanted_sword", "recipe-rope", "recipe-crown"
+    ]
+
+
+def test_indexes_by_ingredient_output_and_station():
+    catalog = RecipeCatalog([
+        _recipe("sword", station="forge", ingredients=["iron", "leather"]),
+        _recipe("shield", station="forge", ingredients=["iron", "wood"]),
+        _recipe("bow", station="workbench", ingredients=["wood"]),
+    ])
+
+    assert {r.name for r in catalog.recipes_using_ingredient("iron")} == {"sword", "shield"}
+    assert [r.name for r in catalog.recipes_producing("item-bow")] == ["bow"]
+    assert {r.name for r in catalog.recipes_for_station("forge")} == {"sword", "shield"}
+    assert catalog.recipes_for_station("loom") == []
+
+
+def test_service_bulk_auto_learns_and_rebuilds_after_writes(db):
+    service = RecipeService()
+    service.create_recipe(db, _recipe("nail", skills=[("smithing", 1)], auto_learn=("smithing", 1)))
+    service.create_recipe(db, _recipe("sword", skills=[("smithing", 5)]))
+
+    learnable = service.get_learnable_recipes_for_player(db, "player-1", {"smithing": 5})
+
+    assert [recipe["name"] for recipe in learnable] == ["sword"]
+    assert db.query(DBPlayerKnownRecipe).filter_by(player_id="player-1").count() == 1
+
+    catalog = service.get_catalog(db)
+    assert service.get_catalog(db) is catalog
+
+    service.create_recipe(db, _recipe("axe", skills=[("smithing", 2)]))
+    rebuilt = service.get_catalog(db)
+    assert rebuilt is not catalog
+    assert "recipe-axe" in rebuilt
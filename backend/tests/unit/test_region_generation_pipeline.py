@@ -0,0 +1,81 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from backend.src.world_generation.region_generation_pipeline import RegionGenerationPipeline, derive_seed
+from backend.src.world_generation.world_generation_service import WorldGenerationService
+from backend.src.world_generation.world_model import (
+    DBBiome, DBGeneratedLocationDetails, DBPointOfInterest, DBRegion
+)
+
+REGION_DATA = {"name": "Test Reach", "description": "Test region", "dominant_races": ["elf", "dwarf"]}
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'world.db'}")
+    Base.metadata.create_all(engine, tables=[
+        DBRegion.__table__, DBBiome.__table__, DBPointOfInterest.__table__, DBGeneratedLocationDetails.__table__
+    ])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _generated_content(db):
+    rows = (
+        db.query(DBPointOfInterest.generation_seed, DBGeneratedLocationDetails)
+        .join(DBGeneratedLocationDetails)
+        .order_by(DBPointOfInterest.generation_seed)
+        .all()
+    )
+    return [
+        (seed, details.description, details.generated_npcs, details.quest_hooks, details.hidden_secrets)
+        for seed, details in rows
+    ]
+
+
+def test_derive_seed_is_stable():
+    assert derive_seed("world", "biome", 1) == derive_seed("world", "biome", 1)
+    assert derive_seed("world", "biome", 1) != derive_seed("world", "biome", 2)
+
+
+def test_region_is_reproducible_from_its_seed(db):
+    service = WorldGenerationService()
+    first = service.generate_region_pipelined(db, REGION_DATA, generation_seed="seed-1", target_poi_count=40, max_workers=1)
+    second = service.generate_region_pipelined(db, REGION_DATA, generation_seed="seed-1", target_poi_count=40, max_workers=1)
+
+    def region_pois(region):
+        return [
+            (poi.generation_seed, poi.poi_type, poi.generated_name, poi.x_km, poi.y_km)
+            for poi in db.query(DBPointOfInterest).join(DBBiome).filter(DBBiome.region_id == region.id)
+            .order_by(DBPointOfInterest.generation_seed)
+        ]
+
+    assert len(region_pois(first)) == 40
+    assert region_pois(first) == region_pois(second)
+
+
+def test_details_are_identical_across_worker_counts(db):
+    WorldGenerationService().generate_region_pipelined(
+        db, REGION_DATA, generation_seed="seed-2", target_poi_count=60, generate_details=False
+    )
+    # Give every POI a type with a location generator
+    pois = db.query(DBPointOfInterest).order_by(DBPointOfInterest.generation_seed).all()
+    for index, poi in enumerate(pois):
+        poi.poi_type = ("village", "ruin", "cave")[index % 3]
+    db.commit()
+
+    assert RegionGenerationPipeline(max_workers=1).generate_details(db, pois) == 60
+    serial = _generated_content(db)
+
+    db.query(DBGeneratedLocationDetails).delete()
+    db.query(DBPointOfInterest).update({DBPointOfInterest.details_generated: False})
+    db.commit()
+
+    pipeline = RegionGenerationPipeline(max_workers=2, chunk_size=7)
+    assert pipeline.generate_details(db, db.query(DBPointOfInterest).all()) == 60
+
+    assert _generated_content(db) == serial
+    assert db.query(DBPointOfInterest).filter(DBPointOfInterest.details_generated.is_(False)).count() == 0
@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+
+from backend.src.ai_gm.world_reaction.reputation_manager import ActionSignificance, ReputationManager
+from backend.src.ai_gm.world_reaction.reputation_propagation import AffinityMatrix, ReputationPropagationEngine
+
+
+def city_affinities():
+    affinities = AffinityMatrix()
+    affinities.set_affinities([
+        ("faction_guard", "faction_merchants", 0.8),
+        ("faction_guard", "faction_thieves", -1.0),
+        ("faction_guard", "npc_captain", 1.0),
+    ])
+    affinities.set_affinity("faction_thieves", "npc_fence", 0.5, mutual=False)
+    return affinities
+
+
+def test_propagation_spreads_damped_deltas_to_allies_and_rivals():
+    engine = ReputationPropagationEngine(city_affinities(), damping=0.5)
+    assert engine.propagate({"faction_guard": 10}) == {
+        "faction_merchants": 4, "faction_thieves": -5, "npc_captain": 5}
+
+    # One hop only, and spillover below min_delta is dropped
+    assert engine.propagate({"faction_thieves": 1}) == {"faction_guard": -1}
+    assert engine.propagate({"npc_fence": 10, "npc_unknown": 5}) == {}
+
+    with pytest.raises(ValueError):
+        engine.affinities.set_affinity("faction_guard", "npc_captain", 1.5)
+
+
+def test_tick_sums_actions_per_player_and_respects_budget():
+    engine = ReputationPropagationEngine(city_affinities(), damping=0.5, max_actions_per_batch=2)
+    engine.submit("p1", {"faction_guard": 4}, "stopped a robbery")
+    engine.submit("p1", {"faction_guard": 6}, "returned a purse")
+    engine.submit("p2", {"faction_thieves": 10}, "fenced jewels")
+
+    # A zero budget still processes one batch and leaves the rest queued
+    first = engine.tick(time_budget=0.0)
+    assert [(r.player_id, r.deltas, r.reasons) for r in first] == [
+        ("p1", {"faction_merchants": 4, "faction_thieves": -5, "npc_captain": 5},
+         ["stopped a robbery", "returned a purse"])]
+    assert engine.pending_count == 1
+
+    second = engine.tick()
+    assert [(r.player_id, r.deltas) for r in second] == [("p2", {"faction_guard": -5, "npc_fence": 3})]
+    assert engine.pending_count == 0
+
+
+def test_reputation_manager_applies_propagated_changes():
+    manager = ReputationManager(propagation_engine=ReputationPropagationEngine(city_affinities()))
+    manager.record_significant_action("hero", "saved the watch house", ActionSignificance.MAJOR, "old town",
+                                      reputation_changes={"faction_guard": 12})
+    assert manager.get_reputation_with_entity("hero", "faction_merchants").reputation_score == 0
+
+    assert manager.propagate_pending() == 3
+    merchants = manager.get_reputation_with_entity("hero", "faction_merchants")
+    assert merchants.reputation_score == 5
+    assert merchants.reasons == ["Word spread of: saved the watch house"]
+    assert manager.get_reputation_with_entity("hero", "faction_thieves").reputation_score == -6
+    assert manager.get_reputation_with_entity("hero", "faction_guard").reputation_score == 12
+    assert manager.propagate_pending() == 0
+
+
+def test_concurrent_propagate_pending_applies_each_result_once():
+    manager = ReputationManager(propagation_engine=ReputationPropagationEngine(city_affinities(),
+                                                                               max_actions_per_batch=7))
+    for i in range(200):
+        manager.propagation_engine.submit(f"player_{i}", {"faction_guard": 10}, "kept the peace")
+
+    totals = []
+    threads = [threading.Thread(target=lambda: totals.append(manager.propagate_pending())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(totals) == 200 * 3
+    assert {manager.get_reputation_with_entity(f"player_{i}", "npc_captain").reputation_score
+            for i in range(200)} == {5}
+
+
+def test_propagation_pass_runs_outside_the_manager_lock():
+    lock_free_during_pass = []
+
+    def try_lock():
+        acquired = manager._lock.acquire(timeout=1)
+        if acquired:
+            manager._lock.release()
+        lock_free_during_pass.append(acquired)
+
+    class ObservedEngine(ReputationPropagationEngine):
+        def propagate_batch(self, batch):
+            # Another thread (e.g. a reputation lookup) can take the manager lock meanwhile
+            probe = threading.Thread(target=try_lock)
+            probe.start()
+            probe.join()
+            return super().propagate_batch(batch)
+
+    manager = ReputationManager(propagation_engine=ObservedEngine(city_affinities()))
+    manager.propagation_engine.submit("hero", {"faction_guard": 10}, "kept the peace")
+    assert manager.propagate_pending() == 3
+    assert lock_free_during_pass == [True]
@@ -0,0 +1,108 @@
+import threading
+from datetime import datetime
+
+from backend.src.ai_gm.world_reaction.reputation_manager import (
+    ActionSignificance,
+    ReputationEntry,
+    ReputationLevel,
+    ReputationManager,
+)
+
+
+class FakeReputationDB:
+    """Stores reputations per player and counts batch queries"""
+
+    def __init__(self, records=None):
+        self.records = records or {}
+        self.batch_calls = []
+
+    def load_reputations(self, player_id, entity_ids):
+        self.batch_calls.append((player_id, list(entity_ids)))
+        stored = self.records.get(player_id, {})
+        return {entity_id: stored[entity_id] for entity_id in entity_ids if entity_id in stored}
+
+
+def reputation_record(entity_id, score, level):
+    return {
+        "entity_id": entity_id,
+        "entity_name": entity_id.title(),
+        "entity_type": "npc",
+        "reputation_level": level,
+        "reputation_score": score,
+        "last_updated": datetime.utcnow(),
+    }
+
+
+def test_relevant_reputations_load_in_one_batch_and_cache_misses():
+    db = FakeReputationDB({"p1": {"npc_guard": reputation_record("npc_guard", 12, ReputationLevel.RESPECTED)}})
+    manager = ReputationManager(db_service=db)
+    context = {"current_location": "market", "active_factions": ["thieves"],
+               "active_npcs": ["guard", "merchant"]}
+
+    relevant = manager.get_relevant_reputations("p1", context)
+    assert [rep.entity_id for rep in relevant] == ["global", "npc_guard"]
+    assert db.batch_calls == [("p1", ["global", "location_market", "faction_thieves", "npc_guard", "npc_merchant"])]
+
+    # Entities the database had no record of are not queried again
+    manager.get_relevant_reputations("p1", context)
+    manager.load_many("p1", ["npc_guard", "npc_smith"])
+    assert db.batch_calls[1:] == [("p1", ["npc_smith"])]
+
+
+def test_a_slow_database_read_does_not_overwrite_a_newer_cached_entry():
+    query_started, release_query = threading.Event(), threading.Event()
+
+    class SlowReputationDB(FakeReputationDB):
+        def load_reputations(self, player_id, entity_ids):
+            records = super().load_reputations(player_id, entity_ids)
+            query_started.set()
+            release_query.wait(5)
+            return records
+
+    db = SlowReputationDB({"p1": {"npc_guard": reputation_record("npc_guard", 2, ReputationLevel.NEUTRAL)}})
+    manager = ReputationManager(db_service=db)
+    reader = threading.Thread(target=manager.load_many, args=("p1", ["npc_guard"]))
+    reader.start()
+    query_started.wait(5)
+
+    # Cached while the reader's query is in flight
+    manager._partition("p1").put("npc_guard", ReputationEntry(**reputation_record("npc_guard", 7, ReputationLevel.LIKED)))
+    release_query.set()
+    reader.join()
+
+    assert manager.get_reputation_with_entity("p1", "npc_guard").reputation_score == 7
+
+
+def test_player_partitions_are_bounded_and_evicted_whole():
+    db = FakeReputationDB()
+    manager = ReputationManager(db_service=db, max_players=2, max_entries_per_player=3)
+    manager.load_many("a", ["npc_1", "npc_2", "npc_3", "npc_4"])
+    assert list(manager._partitions["a"].entries) == ["npc_2", "npc_3", "npc_4"]
+
+    manager.load_many("b", ["npc_1"])
+    manager.load_many("a", ["npc_2"])
+    manager.load_many("c", ["npc_1"])
+    assert list(manager._partitions) == ["a", "c"]
+
+    db.batch_calls.clear()
+    manager.load_many("b", ["npc_1"])
+    assert db.batch_calls == [("b", ["npc_1"])]
+
+
+def test_recent_actions_are_kept_per_player():
+    manager = ReputationManager(max_recent_actions=3)
+    for i in range(5):
+        manager.record_significant_action("hero", f"hero deed {i}", ActionSignificance.MINOR, "town",
+                                          reputation_changes={"npc_mayor": 2})
+    manager.record_significant_action("villain", "burned the mill", ActionSignificance.MAJOR, "town")
+
+    hero_actions = manager.get_recent_significant_actions("hero", max_actions=10)
+    assert sorted(action.action_description for action in hero_actions) == [
+        "hero deed 2", "hero deed 3", "hero deed 4"]
+    assert [action.action_description for action in manager.get_recent_significant_actions("villain")] == [
+        "burned the mill"]
+
+    mayor = manager.get_reputation_with_entity("hero", "npc_mayor")
+    assert mayor.reputation_score == 10
+    assert mayor.reputation_level == ReputationLevel.RESPECTED
+    assert manager.get_reputation_with_entity("villain", "npc_mayor").reputation_score == 0
@@ -0,0 +1,139 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.crud import scheduled_game_event_crud
+from app.db.models import DBGameTimeState, DBScheduledGameEvent
+from app.events.event_bus import event_bus, EventType
+from app.models.time_models import CatchUpPolicy, GameDateTime, GameTimeSettings, ScheduledGameEvent
+from app.services.scheduled_event_queue import reset_event_queues
+from app.services.time_service import TimeService
+
+
+@pytest.fixture
+def db():
+    reset_event_queues()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[DBGameTimeState.__table__, DBScheduledGameEvent.__table__])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    reset_event_queues()
+
+
+@pytest.fixture
+def triggered():
+    events = []
+    callback = events.append
+    event_bus.subscribe(EventType.SCHEDULED_EVENT_TRIGGERED, callback)
+    yield events
+    event_bus.unsubscribe(EventType.SCHEDULED_EVENT_TRIGGERED, callback)
+
+
+@pytest.fixture
+def service(db):
+    return TimeService(db, GameTimeSettings(), game_id="queue-test")
+
+
+def _dt(year, month, day, hour=0, minute=0):
+    return GameDateTime(year=year, month=month, day=day, hour=hour, minute=minute)
+
+
+def test_year_skip_fires_every_recurrence_in_order(service, triggered):
+    start = service.get_current_datetime()
+    service.schedule_event(start.add_minutes(24 * 60, service.settings), "daily_upkeep", {},
+                           is_recurring=True, recurrence_interval_minutes=24 * 60)
+    service.schedule_event(start.add_minutes(90, service.settings), "courier_arrives", {})
+
+    service.advance_days(365)
+
+    daily = [event for event in triggered if event.context["event_type"] == "daily_upkeep"]
+    assert len(daily) == 365
+    assert all(event.context["occurrence_count"] == 1 for event in daily)
+    assert triggered[0].context["event_type"] == "courier_arrives"
+
+    ordinals = [
+        GameDateTime(**event.context["trigger_datetime"]).to_minutes(service.settings) for event in triggered
+    ]
+    assert ordinals == sorted(ordinals)
+
+    # The one-time event is removed, the recurring one moved past the current time
+    remaining = scheduled_game_event_crud.get_by_game_id(service.db, "queue-test")
+    assert [event.event_type for event in remaining] == ["daily_upkeep"]
+    assert remaining[0].trigger_ordinal > service.get_current_datetime().to_minutes(service.settings)
+
+
+def test_coalesce_policy_fires_once_with_count(service, triggered):
+    start = service.get_current_datetime()
+    service.schedule_event(start.add_minutes(60, service.settings), "hourly_patrol", {},
+                           is_recurring=True, recurrence_interval_minutes=60,
+                           catch_up_policy=CatchUpPolicy.COALESCE)
+
+    service.advance_days(10)
+
+    assert len(triggered) == 1
+    assert triggered[0].context["occurrence_count"] == 240
+    assert GameDateTime(**triggered[0].context["trigger_datetime"]) == service.get_current_datetime()
+
+
+def test_due_query_reads_only_due_rows_and_queue_skips_idle_advances(service, triggered, monkeypatch):
+    start = service.get_current_datetime()
+    for hours in (1, 2, 50):
+        service.schedule_event(start.add_minutes(hours * 60, service.settings), f"event_{hours}", {})
+
+    due = scheduled_game_event_crud.get_events_due(
+        service.db, "queue-test", start.add_minutes(120, service.settings), settings=service.settings
+    )
+    assert [event.event_type for event in due] == ["event_1", "event_2"]
+
+    service.advance_time(120)
+    assert [event.context["event_type"] for event in triggered] == ["event_1", "event_2"]
+
+    # Nothing is due before hour 50, so further advances never query the database
+    queries = []
+    original = scheduled_game_event_crud.get_events_due
+    monkeypatch.setattr(scheduled_game_event_crud, "get_events_due",
+                        lambda *args, **kwargs: queries.append(args) or original(*args, **kwargs))
+    for _ in range(10):
+        service.advance_time(60)
+    assert queries == []
+
+    service.advance_days(2)
+    assert len(queries) == 1
+    assert triggered[-1].context["event_type"] == "event_50"
+
+
+def test_legacy_events_get_ordinals_once_at_startup(service, triggered, monkeypatch):
+    start = service.get_current_datetime()
+    service.schedule_event(start.add_minutes(30, service.settings), "legacy_event", {})
+    service.db.query(DBScheduledGameEvent).update({DBScheduledGameEvent.trigger_ordinal: None})
+    service.db.commit()
+
+    reset_event_queues()
+    restarted = TimeService(service.db, GameTimeSettings(), game_id="queue-test")
+    assert service.db.query(DBScheduledGameEvent.trigger_ordinal).scalar() == (
+        start.add_minutes(30, service.settings).to_minutes(service.settings))
+
+    backfills = []
+    monkeypatch.setattr(scheduled_game_event_crud, "backfill_trigger_ordinals",
+                        lambda *args, **kwargs: backfills.append(args) or 0)
+    restarted.advance_time(60)
+    assert [event.context["event_type"] for event in triggered] == ["legacy_event"]
+    assert backfills == []
+
+
+def test_events_created_outside_the_time_service_still_fire(service, triggered):
+    start = service.get_current_datetime()
+    service.advance_time(1)
+    assert service._event_queue.loaded
+
+    # Scheduled by another worker process, straight through the crud
+    event = ScheduledGameEvent(event_id="raid-1", trigger_datetime=start.add_minutes(30, service.settings),
+                               event_type="raid")
+    scheduled_game_event_crud.create_event(service.db, game_id="queue-test", event=event, settings=service.settings)
+
+    service.advance_time(10)
+    assert triggered == []
+    service.advance_time(30)
+    assert [event.context["event_type"] for event in triggered] == ["raid"]
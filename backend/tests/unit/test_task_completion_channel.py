@@ -0,0 +1,236 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from backend.src.ai_gm.tasks.completion_channel import (
+    InProcessCompletionChannel,
+    RedisCompletionChannel,
+    get_completion_channel,
+    set_completion_channel,
+)
+from backend.src.ai_gm.tasks.result_handler import TaskResultHandler
+
+
+@pytest.fixture
+def channel():
+    channel = InProcessCompletionChannel()
+    set_completion_channel(channel)
+    yield channel
+    set_completion_channel(None)
+
+
+def test_one_publish_resumes_all_waiters(channel):
+    async def scenario():
+        waiters = [asyncio.ensure_future(channel.wait("task-1", timeout=5)) for _ in range(50)]
+        await asyncio.sleep(0)
+        assert channel.pending_waiters() == 50
+
+        started = time.monotonic()
+        threading.Timer(0.05, channel.publish, args=("task-1", {"text": "done"})).start()
+        results = await asyncio.gather(*waiters)
+        return results, time.monotonic() - started
+
+    results, elapsed = asyncio.run(scenario())
+    assert results == [(True, {"text": "done"})] * 50
+    assert elapsed < 0.5
+    assert channel.pending_waiters() == 0
+
+
+def test_executor_result_reaches_task_result_handler(channel):
+    async def scenario():
+        task_id = channel.submit(lambda value: {"value": value * 2}, 21)
+        return await TaskResultHandler.wait_for_task_completion(task_id, max_wait=5)
+
+    assert asyncio.run(scenario()) == {"value": 42}
+
+
+def test_late_waiter_and_failed_task(channel):
+    channel.publish("finished", {"ok": True})
+    task_id = channel.submit(lambda: 1 / 0)
+
+    async def scenario():
+        return (await TaskResultHandler.wait_for_task_completion("finished", max_wait=1),
+                await TaskResultHandler.wait_for_task_completion(task_id, max_wait=5))
+
+    assert asyncio.run(scenario()) == ({"ok": True}, None)
+
+
+def test_timeout_returns_none_and_drops_waiter(channel):
+    result = asyncio.run(TaskResultHandler.wait_for_task_completion("never", max_wait=0.05))
+    assert result is None
+    assert channel.pending_waiters() == 0
+
+
+def test_waiter_sees_completions_published_by_another_process(channel, monkeypatch):
+    # The worker's channel is a separate instance, as in a Celery worker process
+    worker_channel = InProcessCompletionChannel()
+    results_backend = {}
+
+    async def get_task_result(task_id, timeout=None):
+        return results_backend.get(task_id)
+
+    monkeypatch.setattr(TaskResultHandler, "get_task_result", staticmethod(get_task_result))
+
+    def finish():
+        results_backend["remote"] = {"text": "done"}
+        worker_channel.publish("remote", {"text": "done"})
+
+    threading.Timer(0.05, finish).start()
+    started = time.monotonic()
+    result = asyncio.run(TaskResultHandler.wait_for_task_completion("remote", max_wait=10))
+    assert result == {"text": "done"}
+    assert time.monotonic() - started < 2
+
+
+def test_default_channel_uses_redis_when_a_broker_is_configured(monkeypatch):
+    monkeypatch.delenv("TASK_COMPLETION_BACKEND", raising=False)
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+    set_completion_channel(None)
+    try:
+        assert isinstance(get_completion_channel(), RedisCompletionChannel)
+    finally:
+        set_completion_channel(None)
+
+    monkeypatch.delenv("REDIS_URL")
+    monkeypatch.setenv("CELERY_BROKER_URL", "redis://broker:6380/3")
+    try:
+        connection = get_completion_channel().redis.connection_pool.connection_kwargs
+        assert (connection["host"], connection["port"], connection["db"]) == ("broker", 6380, 3)
+    finally:
+        set_completion_channel(None)
+
+    # Brokers on other transports don't carry completions
+    monkeypatch.setenv("CELERY_BROKER_URL", "amqp://guest@rabbitmq//")
+    try:
+        assert isinstance(get_completion_channel(), InProcessCompletionChannel)
+    finally:
+        set_completion_channel(None)
+
+    monkeypatch.delenv("CELERY_BROKER_URL")
+    try:
+        assert isinstance(get_completion_channel(), InProcessCompletionChannel)
+    finally:
+        set_completion_channel(None)
+
+
+class FakePubSub:
+    def __init__(self, broker):
+        self.broker = broker
+        self.messages = []
+        self.lock = threading.Lock()
+
+    def subscribe(self, channel_name):
+        self.broker.subscriptions.append((channel_name, self))
+
+    def get_message(self, timeout=None):
+        deadline = time.monotonic() + (timeout or 0)
+        while time.monotonic() < deadline:
+            if self.broker.drop_connection.is_set():
+                self.broker.drop_connection.clear()
+                self.broker.subscriptions = [s for s in self.broker.subscriptions if s[1] is not self]
+                raise ConnectionError("connection reset")
+            with self.lock:
+                if self.messages:
+                    return self.messages.pop(0)
+            time.sleep(0.005)
+        return None
+
+    def close(self):
+        pass
+
+
+class FakeRedis:
+    def __init__(self):
+        self.subscriptions = []
+        self.drop_connection = threading.Event()
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self)
+
+    def publish(self, channel_name, data):
+        for subscribed_name, pubsub in self.subscriptions:
+            if subscribed_name == channel_name:
+                with pubsub.lock:
+                    pubsub.messages.append({"type": "message", "data": data})
+
+
+def test_redis_channel_shares_one_subscription():
+    redis_client = FakeRedis()
+    channel = RedisCompletionChannel(redis_client=redis_client)
+
+    async def scenario():
+        waiters = [asyncio.ensure_future(channel.wait(f"task-{i % 5}", timeout=5)) for i in range(100)]
+        while not redis_client.subscriptions:
+            await asyncio.sleep(0.01)
+        for i in range(5):
+            channel.publish(f"task-{i}", {"n": i})
+        return await asyncio.gather(*waiters)
+
+    try:
+        results = asyncio.run(scenario())
+    finally:
+        channel.close()
+
+    assert len(redis_client.subscriptions) == 1
+    assert results == [(True, {"n": i % 5}) for i in range(100)]
+    channel._handle_message(json.dumps({"task_id": "failed", "status": "FAILURE", "result": "boom"}))
+    assert channel._recent["failed"] is None
+
+
+def test_redis_channel_reprobes_waiters_after_resubscribing():
+    redis_client = FakeRedis()
+    channel = RedisCompletionChannel(redis_client=redis_client)
+    results_backend = {}
+
+    async def probe():
+        return results_backend.get("task-1")
+
+    async def scenario():
+        waiter = asyncio.ensure_future(channel.wait("task-1", timeout=5, probe=probe))
+        # The subscription is in place before the waiter first probes
+        await asyncio.sleep(0.05)
+        assert redis_client.subscriptions and not waiter.done()
+
+        redis_client.drop_connection.set()
+        while channel._subscribed.is_set():
+            await asyncio.sleep(0.01)
+        # Published while resubscribing, so only the result backend has it
+        results_backend["task-1"] = {"ok": True}
+        channel.publish("task-1", {"ok": True})
+        return await waiter
+
+    try:
+        assert asyncio.run(scenario()) == (True, {"ok": True})
+    finally:
+        channel.close()
+    assert len(redis_client.subscriptions) == 1
+
+
+def test_waiters_poll_while_redis_is_unreachable(monkeypatch):
+    class UnreachableRedis(FakeRedis):
+        def pubsub(self, ignore_subscribe_messages=False):
+            raise ConnectionError("connection refused")
+
+    channel = RedisCompletionChannel(redis_client=UnreachableRedis())
+    set_completion_channel(channel)
+    results_backend = {}
+
+    async def get_task_result(task_id, timeout=None):
+        return results_backend.get(task_id)
+
+    monkeypatch.setattr(TaskResultHandler, "get_task_result", staticmethod(get_task_result))
+    threading.Timer(0.1, results_backend.update, args=({"task-1": {"ok": True}, "task-2": {"ok": 2}},)).start()
+
+    async def scenario():
+        return await asyncio.gather(TaskResultHandler.wait_for_task_completion("task-1", max_wait=10),
+                                    TaskResultHandler.wait_for_task_completion("task-2", max_wait=10))
+
+    started = time.monotonic()
+    try:
+        assert asyncio.run(scenario()) == [{"ok": True}, {"ok": 2}]
+    finally:
+        set_completion_channel(None)
+    assert time.monotonic() - started < 2
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from backend.src.narrative_engine.template_compiler import UncompilableTemplate, compile_template
+from backend.src.narrative_engine.template_processor import TemplateProcessor
+
+TEMPLATES = [
+    "{actor.name} strikes {target.name} for {damage} damage.",
+    "[[if damage > 10]]A crushing blow![[else]]A glancing hit.[[endif]] {actor.name} presses on.",
+    "[[if weather == \"rain\"]]Rain lashes the {location}.[[else]]The {location} is {weather}.[[endif]]",
+    "[[if exists ally]]{ally} flanks the foe.[[else]]Alone, {actor.name} fights on.[[endif]]",
+    "[[if hp < max_hp]]{actor.name} is wounded.[[else]]{actor.name} is unhurt.[[endif]]",
+    "[[if actor.class != \"rogue\"]]No tricks here.[[else]]A feint![[endif]]",
+    "[[variation]]\nThe wind howls through the {location}.\n  Birds wheel over the {location}.  \n\nSilence.\n[[endvariation]] {missing.path}{missing}",
+    "[[if weather == rain]][[variation]]\nDrip.\nDrop.\n[[endvariation]][[else]][[variation]]\nDust.\n{weather} air.\n[[endvariation]][[endif]] done",
+    "[[if mystery]]never[[else]]always[[endif]]",
+    "No markup at all.",
+]
+
+VARIABLE_SETS = [
+    {"actor": {"name": "Kael", "class": "rogue"}, "target": {"name": "the ogre"}, "damage": 14,
+     "location": "marsh", "weather": "rain", "hp": 4, "max_hp": 10, "ally": "Mira"},
+    {"actor": {"name": "Ysolde", "class": "knight"}, "target": {"name": "a bandit"}, "damage": 3,
+     "location": "pass", "weather": "clear", "hp": 10, "max_hp": 10},
+    {"damage": 0, "hp": 1, "max_hp": 1},
+]
+
+
+@pytest.mark.parametrize("template", TEMPLATES)
+def test_compiled_render_matches_regex_passes(template):
+    processor = TemplateProcessor()
+    for variables in VARIABLE_SETS:
+        for seed in range(5):
+            random.seed(seed)
+            expected = processor._process_template_uncompiled(template, variables)
+            random.seed(seed)
+            assert processor.process_template(template, variables) == expected
+    assert processor.compile_template(template) is not None
+
+
+def test_straddling_sections_fall_back_to_regex_passes():
+    template = "[[variation]]\n[[if a == 1]]one[[else]]other[[endif]]\nplain\n[[endvariation]] {{a}}"
+    with pytest.raises(UncompilableTemplate):
+        compile_template(template)
+
+    processor = TemplateProcessor()
+    random.seed(3)
+    expected = processor._process_template_uncompiled(template, {"a": 1})
+    random.seed(3)
+    assert processor.process_template(template, {"a": 1}) == expected
+    assert processor.compile_template(template) is None
+
+
+def test_compiled_templates_are_cached():
+    processor = TemplateProcessor()
+    processor.load_templates_from_dict({"hit": "{actor} hits."})
+
+    assert processor.process_cached_template("hit", {"actor": "Kael"}) == "Kael hits."
+    assert processor.compile_template("{actor} hits.") is processor.compile_template("{actor} hits.")
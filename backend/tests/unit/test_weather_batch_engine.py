@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.models import DBGameTimeState, DBScheduledGameEvent
+from app.events.event_bus import event_bus, EventType
+from app.models.time_models import GameTimeSettings, TimeBlock
+from app.models.weather_models import DBActiveWeatherEffect, DBWeatherCondition, DBWeatherPattern
+from app.services.time_service import TimeService
+from app.services.weather_batch_engine import WEATHER_TYPES, WeatherBatch, WeatherBatchEngine
+from app.services.weather_forecast import reset_weather_forecasts
+from app.services.weather_service import WeatherService
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[
+        DBGameTimeState.__table__, DBScheduledGameEvent.__table__, DBWeatherPattern.__table__,
+        DBWeatherCondition.__table__, DBActiveWeatherEffect.__table__
+    ])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def weather_service(db):
+    reset_weather_forecasts()
+    service = WeatherService(db, TimeService(db, GameTimeSettings(), game_id="weather-test"), seed=7)
+    yield service
+    event_bus.unsubscribe(EventType.TIME_BLOCK_CHANGED, service._handle_time_block_changed)
+    event_bus.unsubscribe(EventType.SEASON_CHANGED, service._handle_season_changed)
+
+
+def _patterns(service, count, season="WINTER"):
+    return [DBWeatherPattern(**service._default_weather_pattern_data(f"region_{i}", season)) for i in range(count)]
+
+
+def test_engine_follows_transitions_and_pattern_bounds(weather_service):
+    patterns = _patterns(weather_service, 500)
+    for pattern in patterns:
+        # Every type transitions to itself
+        types = list(pattern.weather_type_probabilities)
+        pattern.transition_matrices = {
+            from_type: [1.0 if to_type == from_type else 0.0 for to_type in types] for from_type in types
+        }
+    engine = WeatherBatchEngine(patterns)
+    rng = np.random.default_rng(1)
+
+    first = engine.step(WeatherBatch.empty(len(patterns)), TimeBlock.MORNING, rng)
+    sampled_types = {WEATHER_TYPES[index] for index in first.weather_type}
+    assert sampled_types <= set(patterns[0].weather_type_probabilities)
+    assert len(sampled_types) > 3
+
+    second = engine.step(first, TimeBlock.AFTERNOON, rng)
+    assert np.array_equal(first.weather_type, second.weather_type)
+    assert np.all((second.humidity >= 0) & (second.humidity <= 1))
+    assert np.all((second.cloud_cover >= 0) & (second.cloud_cover <= 1))
+    assert np.all((second.precipitation_intensity >= 0) & (second.precipitation_intensity <= 1))
+    assert np.all(second.expected_duration_hours >= 0.5)
+    # Winter temperatures stay within the pattern's range plus the modifier spread
+    assert np.all((second.temperature >= -13.0) & (second.temperature <= 5.0))
+
+    # Wind direction drifts by at most one step when it persists
+    drift = (second.wind_direction - first.wind_direction) % 8
+    assert np.mean(np.isin(drift, [0, 1, 7])) > 0.7
+
+
+def test_update_all_regions_is_batched(db, weather_service):
+    db.bulk_insert_mappings(DBWeatherPattern, [
+        weather_service._default_weather_pattern_data(f"region_{i}", season)
+        for i in range(50) for season in ("SPRING", "SUMMER", "AUTUMN", "WINTER")
+    ])
+    db.commit()
+
+    first = weather_service.update_weather_for_all_regions()
+    assert sorted(first) == sorted(f"region_{i}" for i in range(50))
+    assert db.query(DBWeatherCondition).count() == 50
+    assert db.query(DBActiveWeatherEffect).count() > 0
+
+    second = weather_service.update_weather_for_all_regions()
+    assert db.query(DBWeatherCondition).count() == 100
+
+    # The latest condition per region is the second batch, and older effects were ended
+    latest = weather_service._get_current_weather_for_regions(list(second))
+    assert {region_id: condition.id for region_id, condition in latest.items()} == {
+        region_id: condition.id for region_id, condition in second.items()
+    }
+    second_timestamp = next(iter(second.values())).timestamp
+    first_ids = [condition.id for condition in first.values()]
+    assert db.query(DBActiveWeatherEffect).filter(
+        DBActiveWeatherEffect.weather_condition_id.in_(first_ids),
+        DBActiveWeatherEffect.calculated_end_time > second_timestamp
+    ).count() == 0
+    assert weather_service.get_current_weather("region_3").id == second["region_3"].id
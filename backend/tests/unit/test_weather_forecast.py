@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.models import DBGameTimeState, DBScheduledGameEvent
+from app.events.event_bus import event_bus, EventType
+from app.models.time_models import GameTimeSettings, TimeBlock
+from app.models.weather_models import DBActiveWeatherEffect, DBWeatherCondition, DBWeatherPattern
+from app.services.time_service import TimeService
+from app.services.weather_forecast import WeatherForecast, reset_weather_forecasts
+from app.services.weather_service import WeatherService
+
+
+class DictRedis:
+    """Minimal in-memory stand-in for the Redis commands the weather system uses."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+@pytest.fixture
+def db():
+    reset_weather_forecasts()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[
+        DBGameTimeState.__table__, DBScheduledGameEvent.__table__, DBWeatherPattern.__table__,
+        DBWeatherCondition.__table__, DBActiveWeatherEffect.__table__
+    ])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    reset_weather_forecasts()
+
+
+@pytest.fixture
+def make_service(db):
+    services = []
+
+    def make(**kwargs):
+        service = WeatherService(db, TimeService(db, GameTimeSettings(), game_id="forecast-test"), **kwargs)
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        event_bus.unsubscribe(EventType.TIME_BLOCK_CHANGED, service._handle_time_block_changed)
+        event_bus.unsubscribe(EventType.SEASON_CHANGED, service._handle_season_changed)
+
+
+def _add_patterns(db, service, count):
+    db.bulk_insert_mappings(DBWeatherPattern, [
+        service._default_weather_pattern_data(f"region_{i}", season)
+        for i in range(count) for season in ("SPRING", "SUMMER", "AUTUMN", "WINTER")
+    ])
+    db.commit()
+
+
+def test_forecast_is_deterministic_and_round_trips(db, make_service):
+    service = make_service(seed=3, forecast_days=3)
+    _add_patterns(db, service, 20)
+    start = service.time_service.get_current_datetime()
+
+    first = service.forecaster.generate(start)
+    second = service.forecaster.generate(start)
+    assert first.fingerprint == second.fingerprint
+    for name, column in first.columns.items():
+        assert np.array_equal(column, second.columns[name])
+
+    # One step per time block: 8 blocks a day
+    assert len(first.step_ordinals) in (24, 25)
+    assert first.columns["weather_type"].dtype == np.int8
+
+    restored = WeatherForecast.from_bytes(first.to_bytes())
+    ordinal = first.start_ordinal + 30 * 60
+    assert restored.condition_at("region_5", ordinal) == first.condition_at("region_5", ordinal)
+
+
+def test_ticks_apply_the_forecast_and_lookups_skip_the_database(db, make_service, monkeypatch):
+    service = make_service(seed=5)
+    _add_patterns(db, service, 10)
+
+    applied = service.update_weather_for_all_regions()
+    now = service.time_service.get_current_datetime()
+    for region_id, condition in applied.items():
+        forecast = service.get_forecast_condition(region_id, now)
+        assert forecast["weather_type"] == condition.weather_type.value
+        assert forecast["temperature"] == condition.temperature
+        assert forecast["humidity"] == condition.humidity
+
+    def no_queries(*args, **kwargs):
+        raise AssertionError("forecast lookups must not query the database")
+
+    monkeypatch.setattr(db, "query", no_queries)
+    entries = service.get_weather_forecast("region_2", now)
+    assert len(entries) >= 7 * 8
+    assert entries[1]["start"].to_minutes(service.time_service.settings) > now.to_minutes(service.time_service.settings)
+    assert service.time_service.settings.calendar.time_block_for_hour(entries[1]["start"].hour) != \
+        service.time_service.settings.calendar.time_block_for_hour(entries[0]["start"].hour)
+
+
+def test_forecast_regenerates_when_patterns_change(db, make_service):
+    redis = DictRedis()
+    service = make_service(seed=1, redis_client=redis)
+    _add_patterns(db, service, 5)
+
+    forecast = service.forecaster.get_forecast()
+    assert redis.values
+    assert service.forecaster.get_forecast() is forecast
+
+    # A second process picks the forecast up from Redis
+    reset_weather_forecasts()
+    assert service.forecaster.get_forecast().fingerprint == forecast.fingerprint
+
+    # A stale Redis forecast is ignored once the patterns change
+    reset_weather_forecasts()
+    pattern = db.query(DBWeatherPattern).filter_by(region_id="region_0").first()
+    pattern.temperature_base_max += 10
+    db.commit()
+    assert service.forecaster.get_forecast().fingerprint != forecast.fingerprint
+
+    service.forecaster.invalidate()
+    assert not redis.values